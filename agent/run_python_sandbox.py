@@ -1,25 +1,214 @@
+"""Long-lived sandbox worker leased by the `python_exec` tool.
+
+The worker pre-imports the heavy numerical libraries once, then serves execution
+requests over its stdin/stdout pipes until the parent closes stdin. Every snippet
+runs in a child process forked from the warm worker, so it starts from the worker's
+clean, pre-imported state and nothing it changes (module attributes, the `decimal`
+context, random seeds, library options, background threads) reaches later snippets.
+Every frame is a 4-byte big-endian length followed by a UTF-8 JSON document.
+"""
+
 from __future__ import annotations
 
+import argparse
+import builtins
+import contextlib
+import io
+import json
 import os
-import subprocess
+import select
+import signal
+import struct
 import sys
+import time
+import traceback
+from collections.abc import Iterable
 from tempfile import TemporaryDirectory
+from typing import Any, BinaryIO, Final
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no rlimits
+    resource = None
 
-def main() -> None:
-    code = sys.stdin.read()
+PRELOADED_MODULES: Final[tuple[str, ...]] = ('numpy', 'pandas')
+
+_HEADER: Final[struct.Struct] = struct.Struct('>I')
+_MAX_FRAME_BYTES: Final[int] = 64 * 1024 * 1024
+
+
+def write_frame(stream: BinaryIO, message: dict[str, Any]) -> None:
+    """Serialize `message` and write it as a single length-prefixed frame."""
+    body = json.dumps(message).encode('utf-8')
+    stream.write(_HEADER.pack(len(body)) + body)
+    stream.flush()
+
+
+def read_frame(stream: BinaryIO) -> dict[str, Any] | None:
+    """Read a single frame, returning `None` when the stream is closed."""
+    header = _read_exact(stream, _HEADER.size)
+    if header is None:
+        return None
+    (length,) = _HEADER.unpack(header)
+    if length > _MAX_FRAME_BYTES:
+        raise ValueError(f'Sandbox frame of {length} bytes exceeds the {_MAX_FRAME_BYTES} byte limit.')
+    body = _read_exact(stream, length)
+    if body is None:
+        return None
+    return json.loads(body)
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes | None:
+    chunks: list[bytes] = []
+    remaining = size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def _preload_modules() -> None:
+    # Keep the numerical libraries single-threaded, so the worker has no helper threads when it forks.
+    for variable in ('OPENBLAS_NUM_THREADS', 'OMP_NUM_THREADS', 'MKL_NUM_THREADS'):
+        os.environ.setdefault(variable, '1')
+    for name in PRELOADED_MODULES:
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+
+
+def _apply_memory_limit(memory_mb: int | None) -> None:
+    if resource is None or not memory_mb:
+        return
+    limit = memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _apply_cpu_limit(cpu_seconds: int | None) -> None:
+    """Limit the current process to `cpu_seconds`; exceeding it delivers `SIGXCPU` and terminates it."""
+    if resource is None or not cpu_seconds:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = cpu_seconds if hard == resource.RLIM_INFINITY else min(cpu_seconds, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _execute(code: str) -> dict[str, str]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    namespace: dict[str, Any] = {'__name__': '__main__', '__builtins__': builtins}
     with TemporaryDirectory() as tmp_dir:
         os.chdir(tmp_dir)
         os.environ.clear()
         os.environ['PYTHONIOENCODING'] = 'utf-8'
-        proc = subprocess.run(
-            [sys.executable, '-c', code],
-            capture_output=True,
-            text=True,
-            timeout=2,
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                exec(compile(code, '<string>', 'exec'), namespace)
+        except SystemExit as exc:
+            if exc.code not in (None, 0):
+                stderr.write(f'{exc.code}\n')
+        except BaseException as exc:
+            # Drop this frame so the traceback starts at the user's code, as it would under `python -c`.
+            stderr.write(''.join(traceback.format_exception(type(exc), exc, exc.__traceback__.tb_next)))
+    return {'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+
+def _execute_in_child(
+    code: str, *, cpu_seconds: int | None, timeout_s: float | None, inherited: Iterable[BinaryIO]
+) -> dict[str, str]:
+    """Run `code` in a forked child process and return its output.
+
+    The child inherits the worker's imported modules copy-on-write and exits as soon as
+    it has sent its result, so any state the snippet changed dies with it.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        try:
+            os.close(read_fd)
+            for stream in inherited:
+                stream.close()
+            _apply_cpu_limit(cpu_seconds)
+            result = json.dumps(_execute(code)).encode('utf-8')
+            with os.fdopen(write_fd, 'wb') as out:
+                out.write(result)
+        finally:
+            # Skip interpreter shutdown, which would wait for any threads the snippet started.
+            os._exit(0)
+
+    os.close(write_fd)
+    try:
+        body = _read_until_eof(read_fd, timeout_s)
+    finally:
+        os.close(read_fd)
+    if body is None:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        assert timeout_s is not None
+        return {'stdout': '', 'stderr': f'TimeoutError: execution exceeded {timeout_s * 1000:.0f} ms'}
+
+    _, status = os.waitpid(pid, 0)
+    if body:
+        return json.loads(body)
+    exit_code = os.waitstatus_to_exitcode(status)
+    if exit_code < 0:
+        return {'stdout': '', 'stderr': f'sandbox execution was killed by {signal.Signals(-exit_code).name}'}
+    return {'stdout': '', 'stderr': f'sandbox execution exited with code {exit_code}'}
+
+
+def _read_until_eof(fd: int, timeout_s: float | None) -> bytes | None:
+    """Read `fd` until every writer has closed it, returning `None` if that takes longer than `timeout_s`."""
+    deadline = None if timeout_s is None else time.monotonic() + timeout_s
+    chunks: list[bytes] = []
+    while True:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            return None
+        readable, _, _ = select.select([fd], [], [], remaining)
+        if not readable:
+            return None
+        if not (chunk := os.read(fd, 1024 * 1024)):
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+
+def serve(*, cpu_seconds: int | None, memory_mb: int | None) -> None:
+    """Answer execution requests until the parent closes the pipe."""
+    # Keep private copies of the protocol pipes so stray writes to fd 0/1/2 from
+    # user code or C extensions cannot corrupt the frame stream.
+    requests = os.fdopen(os.dup(sys.stdin.fileno()), 'rb', buffering=0)
+    responses = os.fdopen(os.dup(sys.stdout.fileno()), 'wb', buffering=0)
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    _preload_modules()
+    _apply_memory_limit(memory_mb)
+    write_frame(responses, {'ready': True})
+
+    while (request := read_frame(requests)) is not None:
+        if not hasattr(os, 'fork'):  # pragma: no cover
+            # Without `fork` the snippet runs in the worker itself, so the worker serves a single request.
+            write_frame(responses, _execute(request['code']))
+            break
+        response = _execute_in_child(
+            request['code'],
+            cpu_seconds=cpu_seconds,
+            timeout_s=request.get('timeout_s'),
+            inherited=(requests, responses),
         )
-        sys.stdout.write(proc.stdout)
-        sys.stderr.write(proc.stderr)
+        write_frame(responses, response)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--cpu-seconds', type=int, default=None)
+    parser.add_argument('--memory-mb', type=int, default=None)
+    args = parser.parse_args()
+    serve(cpu_seconds=args.cpu_seconds, memory_mb=args.memory_mb)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from run_python_sandbox import read_frame, write_frame
+
+_ENTRYPOINT = Path(__file__).with_name('run_python_sandbox.py')
+
+
+@pytest.fixture
+def worker() -> Iterator[subprocess.Popen[bytes]]:
+    proc = subprocess.Popen(
+        [sys.executable, str(_ENTRYPOINT), '--cpu-seconds=5'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdout is not None
+    assert read_frame(proc.stdout) == {'ready': True}
+    yield proc
+    proc.kill()
+    proc.wait()
+
+
+def _run(proc: subprocess.Popen[bytes], code: str, timeout_s: float = 5) -> dict[str, object] | None:
+    assert proc.stdin is not None and proc.stdout is not None
+    write_frame(proc.stdin, {'code': code, 'timeout_s': timeout_s})
+    return read_frame(proc.stdout)
+
+
+@pytest.mark.parametrize(
+    'first, second, expected',
+    [
+        pytest.param('x = 1', 'print("x" in globals())', 'False\n', id='namespace'),
+        pytest.param('import builtins\nbuiltins.print = None', 'print("ok")', 'ok\n', id='builtins'),
+        pytest.param('import math\nmath.pi = 3', 'import math\nprint(math.pi)', '3.141592653589793\n', id='module'),
+        pytest.param(
+            'import decimal\ndecimal.getcontext().prec = 3',
+            'from decimal import Decimal\nprint(Decimal(1) / Decimal(7))',
+            '0.1428571428571428571428571429\n',
+            id='decimal',
+        ),
+        pytest.param(
+            'import threading, time\n'
+            'def leak():\n'
+            '    time.sleep(0.2)\n'
+            '    print("LEAK")\n'
+            'threading.Thread(target=leak).start()',
+            'import time\ntime.sleep(0.5)\nprint("ok")',
+            'ok\n',
+            id='thread',
+        ),
+        pytest.param('import os\nos.chdir("/")', 'import os\nprint(os.getcwd() == "/")', 'False\n', id='cwd'),
+    ],
+)
+def test_executions_are_isolated(worker: subprocess.Popen[bytes], first: str, second: str, expected: str):
+    assert _run(worker, first) == {'stdout': '', 'stderr': ''}
+    assert _run(worker, second) == {'stdout': expected, 'stderr': ''}
+
+
+def test_timeout_keeps_worker(worker: subprocess.Popen[bytes]):
+    assert _run(worker, 'while True:\n    pass', timeout_s=0.2) == {
+        'stdout': '',
+        'stderr': 'TimeoutError: execution exceeded 200 ms',
+    }
+    assert _run(worker, 'print("ok")') == {'stdout': 'ok\n', 'stderr': ''}
+
+
+def test_child_exit_is_reported(worker: subprocess.Popen[bytes]):
+    assert _run(worker, 'import os\nos._exit(3)') == {
+        'stdout': '',
+        'stderr': 'sandbox execution exited with code 3',
+    }
+    assert _run(worker, 'print("ok")') == {'stdout': 'ok\n', 'stderr': ''}
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import atexit
+import os
+import signal
 import subprocess
 import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from time import perf_counter
-from typing import Callable, Final, TypedDict
+from typing import Any, Callable, Final, TypedDict
 
 from ddgs import DDGS
 from pydantic import BaseModel
 from pydantic_ai.common_tools.duckduckgo import DuckDuckGoSearchTool
 from pydantic_ai.tools import Tool
 
+from run_python_sandbox import read_frame, write_frame
+
 ToolRecorder = Callable[[str, float], None]
 
 _DUCK_TOOL_NAME: Final[str] = 'duckduckgo_search'
@@ -61,20 +69,165 @@ class PythonExecResult(TypedDict):
 _PYTHON_TOOL_NAME: Final[str] = 'python_exec'
 _PYTHON_TOOL_DESCRIPTION: Final[str] = 'Run short Python snippets in an isolated subprocess.'
 _SANDBOX_ENTRYPOINT: Final[Path] = Path(__file__).with_name('run_python_sandbox.py')
+_SANDBOX_POOL_SIZE: Final[int] = 2
+_SANDBOX_MAX_EXECUTIONS: Final[int] = 50
+_SANDBOX_CPU_SECONDS: Final[int] = 5
+_SANDBOX_MEMORY_MB: Final[int] = 1024
+_SANDBOX_STARTUP_TIMEOUT_S: Final[float] = 30.0
+_SANDBOX_RESPONSE_GRACE_S: Final[float] = 5.0
+
+
+class _SandboxWorker:
+    """A warm `run_python_sandbox.py` process speaking the length-prefixed pipe protocol."""
+
+    def __init__(self, *, cpu_seconds: int, memory_mb: int) -> None:
+        self.executions = 0
+        self.healthy = True
+        self._ready = False
+        self._proc = subprocess.Popen(
+            [
+                sys.executable,
+                str(_SANDBOX_ENTRYPOINT),
+                f'--cpu-seconds={cpu_seconds}',
+                f'--memory-mb={memory_mb}',
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            # A process group of its own, so killing the worker also kills the snippet it has forked.
+            start_new_session=True,
+        )
+
+    def execute(self, code: str, timeout_s: float) -> PythonExecResult:
+        if not self._ready:
+            if self._receive(_SANDBOX_STARTUP_TIMEOUT_S) is None:
+                return self._fail('sandbox worker failed to start')
+            self._ready = True
+
+        self.executions += 1
+        try:
+            assert self._proc.stdin is not None
+            write_frame(self._proc.stdin, {'code': code, 'timeout_s': timeout_s})
+        except OSError:
+            return self._fail('sandbox worker is not accepting requests')
+
+        # The worker enforces the timeout itself; this only catches a worker that has stopped responding.
+        response = self._receive(timeout_s + _SANDBOX_RESPONSE_GRACE_S)
+        if response is None:
+            return self._fail(f'sandbox worker stopped responding (exit code {self._proc.wait()})')
+        return {'stdout': response['stdout'], 'stderr': response['stderr']}
+
+    def close(self) -> None:
+        if self._proc.stdin is not None:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+        try:
+            self._proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self._kill()
+            self._proc.wait()
+
+    def _receive(self, timeout_s: float) -> dict[str, Any] | None:
+        # Pipes cannot be polled portably, so the blocking read happens on a helper
+        # thread; killing the worker on timeout closes the pipe and unblocks it.
+        result: list[dict[str, Any] | None] = [None]
+
+        def read() -> None:
+            assert self._proc.stdout is not None
+            try:
+                result[0] = read_frame(self._proc.stdout)
+            except (OSError, ValueError):
+                pass
+
+        reader = threading.Thread(target=read, daemon=True)
+        reader.start()
+        reader.join(timeout_s)
+        if reader.is_alive():
+            self._kill()
+            reader.join()
+        return result[0]
+
+    def _kill(self) -> None:
+        if hasattr(os, 'killpg'):
+            try:
+                os.killpg(self._proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        else:  # pragma: no cover
+            self._proc.kill()
+
+    def _fail(self, message: str) -> PythonExecResult:
+        self.healthy = False
+        return {'stdout': '', 'stderr': message}
+
+
+class _SandboxPool:
+    """Pre-forked sandbox workers leased one call at a time.
+
+    Every call runs in a fresh process forked from the leased worker. Workers are
+    replaced after `max_executions` calls, or immediately after they crash or stop
+    responding, so the replacement warms up while the next call runs. Without `fork`,
+    a worker runs snippets in its own interpreter and is replaced after every call.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = _SANDBOX_POOL_SIZE,
+        max_executions: int = _SANDBOX_MAX_EXECUTIONS if hasattr(os, 'fork') else 1,
+        cpu_seconds: int = _SANDBOX_CPU_SECONDS,
+        memory_mb: int = _SANDBOX_MEMORY_MB,
+    ) -> None:
+        self._max_executions = max_executions
+        self._cpu_seconds = cpu_seconds
+        self._memory_mb = memory_mb
+        self._condition = threading.Condition()
+        self._idle = [self._spawn() for _ in range(size)]
+        self._closed = False
+        atexit.register(self.close)
+
+    @contextmanager
+    def lease(self) -> Iterator[_SandboxWorker]:
+        with self._condition:
+            self._condition.wait_for(lambda: self._idle or self._closed)
+            if self._closed:
+                raise RuntimeError('The python sandbox pool has been closed.')
+            worker = self._idle.pop()
+        try:
+            yield worker
+        finally:
+            if not worker.healthy or worker.executions >= self._max_executions:
+                worker.close()
+                worker = self._spawn()
+            with self._condition:
+                if self._closed:
+                    worker.close()
+                else:
+                    self._idle.append(worker)
+                    self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for worker in idle:
+            worker.close()
+
+    def _spawn(self) -> _SandboxWorker:
+        return _SandboxWorker(cpu_seconds=self._cpu_seconds, memory_mb=self._memory_mb)
 
 
 def _build_python_exec_tool(record_duration: ToolRecorder) -> Tool[None]:
+    pool = _SandboxPool()
+
     def run_python(payload: PythonExecPayload) -> PythonExecResult:
         start = perf_counter()
         try:
-            proc = subprocess.run(
-                [sys.executable, str(_SANDBOX_ENTRYPOINT)],
-                input=payload.code,
-                capture_output=True,
-                text=True,
-                timeout=(payload.timeout_ms or 2000) / 1000,
-            )
-            return {'stdout': proc.stdout, 'stderr': proc.stderr}
+            with pool.lease() as worker:
+                return worker.execute(payload.code, (payload.timeout_ms or 2000) / 1000)
         finally:
             record_duration(_PYTHON_TOOL_NAME, (perf_counter() - start) * 1_000)
 
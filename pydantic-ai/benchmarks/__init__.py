@@ -0,0 +1,32 @@
+"""Benchmarks for the overhead Pydantic AI adds on top of model and tool latency.
+
+Every scenario runs against [`TestModel`][pydantic_ai.models.test.TestModel] or
+[`FunctionModel`][pydantic_ai.models.function.FunctionModel], so the time measured is spent in the framework itself:
+graph node transitions, tool preparation, message history cleaning, output validation, streaming and instrumentation.
+
+Run `python -m benchmarks --help` from the repository root for usage.
+"""
+
+from .runner import (
+    AllocationStats,
+    Benchmark,
+    BenchmarkFunc,
+    BenchmarkResult,
+    StepTimer,
+    TimingStats,
+    compare_reports,
+    run_benchmark,
+    run_benchmarks,
+)
+
+__all__ = (
+    'AllocationStats',
+    'Benchmark',
+    'BenchmarkFunc',
+    'BenchmarkResult',
+    'StepTimer',
+    'TimingStats',
+    'compare_reports',
+    'run_benchmark',
+    'run_benchmarks',
+)
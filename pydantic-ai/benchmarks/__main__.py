@@ -0,0 +1,71 @@
+"""Command line entry point: `python -m benchmarks`."""
+
+from __future__ import annotations as _annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from .runner import BenchmarkResult, compare_reports, run_benchmarks
+from .scenarios import all_benchmarks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Measure the overhead of the Pydantic AI agent loop and its internals.',
+    )
+    parser.add_argument('-k', '--filter', action='append', help='Only run benchmarks whose name contains this string.')
+    parser.add_argument('-n', '--iterations', type=int, default=100, help='Timed runs per benchmark (default: 100).')
+    parser.add_argument('--warmup', type=int, default=10, help='Untimed runs per benchmark (default: 10).')
+    parser.add_argument('--no-allocations', action='store_true', help='Skip the tracemalloc allocation run.')
+    parser.add_argument('-o', '--output', type=Path, help='Write the JSON report to this file instead of stdout.')
+    parser.add_argument('--compare', type=Path, help='Compare throughput against a previously written JSON report.')
+    parser.add_argument('--list', action='store_true', help='List the benchmark names and exit.')
+    args = parser.parse_args(argv)
+
+    benchmarks = all_benchmarks()
+    if args.filter:
+        benchmarks = [b for b in benchmarks if any(f in b.name for f in args.filter)]
+    if args.list:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        return 0
+
+    report = asyncio.run(
+        run_benchmarks(
+            benchmarks,
+            iterations=args.iterations,
+            warmup=args.warmup,
+            measure_allocations=not args.no_allocations,
+            on_result=_print_result,
+        )
+    )
+
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(report_json + '\n')
+    else:
+        print(report_json)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        print(f'\ncompared to {args.compare} (pydantic-ai {baseline["meta"]["pydantic_ai_version"]}):', file=sys.stderr)
+        for name, before, after, change in compare_reports(baseline, report):
+            print(f'  {name:<60} {before:>12.1f} -> {after:>12.1f} ops/s  {change:+.1%}', file=sys.stderr)
+    return 0
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    steps = ', '.join(f'{name} p50={stats.p50_us:.1f}us' for name, stats in result.steps.items())
+    print(
+        f'{result.name:<60} {result.ops_per_sec:>12.1f} ops/s  p50={result.total.p50_us:.1f}us '
+        f'p99={result.total.p99_us:.1f}us' + (f'  ({steps})' if steps else ''),
+        file=sys.stderr,
+    )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
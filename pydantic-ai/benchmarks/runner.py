@@ -0,0 +1,248 @@
+from __future__ import annotations as _annotations
+
+import gc
+import platform
+import sys
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from time import perf_counter_ns
+from typing import Any
+
+import pydantic_ai
+
+__all__ = (
+    'AllocationStats',
+    'Benchmark',
+    'BenchmarkFunc',
+    'BenchmarkResult',
+    'StepTimer',
+    'TimingStats',
+    'compare_reports',
+    'run_benchmark',
+    'run_benchmarks',
+)
+
+
+class StepTimer:
+    """Collects the duration of each named step within a benchmark operation."""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, list[int]] = defaultdict(list)
+        """Step durations in nanoseconds, keyed by step name."""
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time the body of the `with` block as one occurrence of the step `name`."""
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.durations[name].append(perf_counter_ns() - start)
+
+
+BenchmarkFunc = Callable[[StepTimer], Awaitable[None]]
+"""A single benchmark operation, which may report per-step timings to the `StepTimer` it's given."""
+
+
+@dataclass
+class Benchmark:
+    """A parameterized benchmark scenario."""
+
+    group: str
+    """The scenario name, shared by all parameterizations of the scenario."""
+    setup: Callable[[], BenchmarkFunc]
+    """Build the operation to benchmark. Setup cost is not included in the measurements."""
+    params: dict[str, Any] = field(default_factory=dict)
+    """The parameters this instance of the scenario was built with."""
+    max_iterations: int | None = None
+    """A cap on the number of timed and warmup runs, for operations too slow to run the default number of times."""
+
+    @property
+    def name(self) -> str:
+        """A unique name for this parameterization, e.g. `agent_run.history[messages=100]`."""
+        if not self.params:
+            return self.group
+        params = ','.join(f'{k}={v}' for k, v in self.params.items())
+        return f'{self.group}[{params}]'
+
+
+@dataclass
+class TimingStats:
+    """Summary statistics for a set of durations, in microseconds."""
+
+    count: int
+    mean_us: float
+    p50_us: float
+    p99_us: float
+    min_us: float
+    max_us: float
+
+    @classmethod
+    def from_ns(cls, durations: Sequence[int]) -> TimingStats:
+        ordered = sorted(durations)
+        return cls(
+            count=len(ordered),
+            mean_us=sum(ordered) / len(ordered) / 1000,
+            p50_us=_percentile(ordered, 50) / 1000,
+            p99_us=_percentile(ordered, 99) / 1000,
+            min_us=ordered[0] / 1000,
+            max_us=ordered[-1] / 1000,
+        )
+
+
+@dataclass
+class AllocationStats:
+    """Memory allocated by a single benchmark operation.
+
+    CPython doesn't expose a cumulative allocation counter, so these are measured with `tracemalloc` and
+    `sys.getallocatedblocks()` over one extra, untimed run of the operation.
+    """
+
+    peak_bytes: int
+    """The peak memory allocated while the operation was running, above the level before it started."""
+    net_bytes: int
+    """The memory still allocated once the operation finished."""
+    net_blocks: int
+    """The number of memory blocks still allocated once the operation finished."""
+
+
+@dataclass
+class BenchmarkResult:
+    """The measurements for one parameterization of a benchmark scenario."""
+
+    name: str
+    group: str
+    params: dict[str, Any]
+    iterations: int
+    ops_per_sec: float
+    total: TimingStats
+    """Statistics for the whole operation."""
+    steps: dict[str, TimingStats]
+    """Statistics for each step reported to the [`StepTimer`][benchmarks.runner.StepTimer]."""
+    allocations: AllocationStats | None = None
+
+
+async def run_benchmark(
+    benchmark: Benchmark, *, iterations: int = 100, warmup: int = 10, measure_allocations: bool = True
+) -> BenchmarkResult:
+    """Run a benchmark and summarize its timings and allocations.
+
+    Args:
+        benchmark: The benchmark to run.
+        iterations: The number of timed runs of the operation.
+        warmup: The number of untimed runs before measuring, to populate caches and let the interpreter specialize.
+        measure_allocations: Whether to run the operation once more under `tracemalloc` to measure allocations.
+            Tracing slows execution down a lot, so this run is never included in the timings.
+    """
+    if benchmark.max_iterations is not None:
+        iterations = min(iterations, benchmark.max_iterations)
+        warmup = min(warmup, benchmark.max_iterations)
+
+    func = benchmark.setup()
+    for _ in range(warmup):
+        await func(StepTimer())
+
+    timer = StepTimer()
+    totals: list[int] = []
+    gc.collect()
+    for _ in range(iterations):
+        start = perf_counter_ns()
+        await func(timer)
+        totals.append(perf_counter_ns() - start)
+
+    allocations = await _measure_allocations(func) if measure_allocations else None
+
+    return BenchmarkResult(
+        name=benchmark.name,
+        group=benchmark.group,
+        params=benchmark.params,
+        iterations=iterations,
+        ops_per_sec=iterations / (sum(totals) / 1e9),
+        total=TimingStats.from_ns(totals),
+        steps={name: TimingStats.from_ns(durations) for name, durations in timer.durations.items()},
+        allocations=allocations,
+    )
+
+
+async def run_benchmarks(
+    benchmarks: Sequence[Benchmark],
+    *,
+    iterations: int = 100,
+    warmup: int = 10,
+    measure_allocations: bool = True,
+    on_result: Callable[[BenchmarkResult], None] | None = None,
+) -> dict[str, Any]:
+    """Run several benchmarks and build a JSON-serializable report, including details of the environment.
+
+    `on_result` is called as each benchmark finishes, e.g. to print progress.
+    """
+    results: list[dict[str, Any]] = []
+    for benchmark in benchmarks:
+        result = await run_benchmark(
+            benchmark, iterations=iterations, warmup=warmup, measure_allocations=measure_allocations
+        )
+        if on_result is not None:
+            on_result(result)
+        results.append(asdict(result))
+    return {
+        'meta': {
+            'pydantic_ai_version': pydantic_ai.__version__,
+            'python_version': platform.python_version(),
+            'python_implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now(tz=timezone.utc).isoformat(),
+            'iterations': iterations,
+            'warmup': warmup,
+        },
+        'benchmarks': results,
+    }
+
+
+def compare_reports(baseline: dict[str, Any], current: dict[str, Any]) -> list[tuple[str, float, float, float]]:
+    """Compare throughput between two reports produced by [`run_benchmarks`][benchmarks.runner.run_benchmarks].
+
+    Returns:
+        A `(name, baseline_ops_per_sec, current_ops_per_sec, change)` tuple for each benchmark present in both
+        reports, where `change` is the relative change in throughput, e.g. `-0.1` for 10% slower.
+    """
+    baseline_ops = {result['name']: result['ops_per_sec'] for result in baseline['benchmarks']}
+    rows: list[tuple[str, float, float, float]] = []
+    for result in current['benchmarks']:
+        if (before := baseline_ops.get(result['name'])) is not None:
+            after = result['ops_per_sec']
+            rows.append((result['name'], before, after, after / before - 1))
+    return rows
+
+
+async def _measure_allocations(func: BenchmarkFunc) -> AllocationStats:
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        start_blocks = sys.getallocatedblocks()
+        await func(StepTimer())
+        end_blocks = sys.getallocatedblocks()
+        end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    return AllocationStats(
+        peak_bytes=peak_bytes - start_bytes,
+        net_bytes=end_bytes - start_bytes,
+        net_blocks=end_blocks - start_blocks,
+    )
+
+
+def _percentile(ordered: Sequence[int], percent: float) -> float:
+    """The percentile of sorted values, interpolating linearly between the closest ranks."""
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
@@ -0,0 +1,312 @@
+"""Benchmark scenarios covering the agent loop end-to-end and its hot internals in isolation."""
+
+from __future__ import annotations as _annotations
+
+import itertools
+import json
+import sys
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+from opentelemetry.sdk.trace import TracerProvider
+from pydantic import BaseModel
+
+from pydantic_ai import Agent, RunContext, Tool
+from pydantic_ai._agent_graph import _clean_message_history  # pyright: ignore[reportPrivateUsage]
+from pydantic_ai._output import ObjectOutputProcessor
+from pydantic_ai._parts_manager import ModelResponsePartsManager
+from pydantic_ai._tool_manager import ToolManager
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, DeltaToolCalls, FunctionModel
+from pydantic_ai.models.instrumented import InstrumentationSettings
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.toolsets import FunctionToolset
+from pydantic_ai.usage import RunUsage
+from pydantic_graph import BaseNode, End, Graph, GraphRunContext
+
+from .runner import Benchmark, BenchmarkFunc, StepTimer
+
+__all__ = ('all_benchmarks',)
+
+
+class Item(BaseModel):
+    name: str
+    value: float
+
+
+class Items(BaseModel):
+    items: list[Item]
+
+
+def lookup(ticker: str, period: int = 30) -> str:
+    """Look up the price history of a ticker."""
+    return f'{ticker}: {period} days'
+
+
+def all_benchmarks() -> list[Benchmark]:
+    """Every parameterization of every scenario, agent-loop scenarios first."""
+    return [
+        *_parameterize('agent_run.history', _agent_history, messages=[0, 100, 1000]),
+        *_parameterize('agent_run.tools', _agent_tools, tools=[1, 50, 200]),
+        *_parameterize('agent_run.fan_out', _agent_fan_out, calls=[1, 10, 100]),
+        *_parameterize('agent_run.stream', _agent_stream, chunks=[10, 1000], output=['text', 'structured']),
+        *_parameterize('agent_run.instrumented', _agent_instrumented, instrument=[False, True]),
+        *_parameterize('graph.deep', _graph_deep, depth=[10, 100, 1000]),
+        *_parameterize('clean_message_history', _clean_history, messages=[10, 100, 1000]),
+        *_parameterize('tool_manager.for_run_step', _tool_manager_for_run_step, tools=[10, 100, 500]),
+        *_parameterize('output_validation', _output_validation, items=[10, 1000], partial=[False, True]),
+        *_parameterize('parts_manager', _parts_manager, deltas=[100, 10_000], kind=['text', 'tool_call']),
+        *_parameterize(
+            'import_time',
+            _import_time,
+            max_iterations=10,
+            statement=['import pydantic_ai', 'from pydantic_ai import Agent', 'import pydantic_ai._cli'],
+        ),
+    ]
+
+
+def _parameterize(
+    group: str, factory: Callable[..., BenchmarkFunc], *, max_iterations: int | None = None, **params: Sequence[Any]
+) -> list[Benchmark]:
+    benchmarks: list[Benchmark] = []
+    for values in itertools.product(*params.values()):
+        kwargs = dict(zip(params, values))
+        benchmarks.append(
+            Benchmark(
+                group=group,
+                setup=lambda kwargs=kwargs: factory(**kwargs),
+                params=kwargs,
+                max_iterations=max_iterations,
+            )
+        )
+    return benchmarks
+
+
+async def _run_agent(
+    agent: Agent[None, Any],
+    timer: StepTimer,
+    *,
+    message_history: list[ModelMessage] | None = None,
+    stream: bool = False,
+) -> None:
+    """Run an agent to completion, timing setup, each graph node, and teardown as separate steps."""
+    async with AsyncExitStack() as stack:
+        with timer.step('setup'):
+            agent_run = await stack.enter_async_context(agent.iter('Hello', message_history=message_history))
+        node = agent_run.next_node
+        while not isinstance(node, End):
+            with timer.step(type(node).__name__):
+                if stream and Agent.is_model_request_node(node):
+                    async with node.stream(agent_run.ctx) as response_stream:
+                        async for _ in response_stream:
+                            pass
+                node = await agent_run.next(node)
+        with timer.step('teardown'):
+            await stack.aclose()
+
+
+def _agent_history(messages: int) -> BenchmarkFunc:
+    agent = Agent(TestModel(custom_output_text='done'))
+    history = _message_history(messages)
+
+    async def run(timer: StepTimer) -> None:
+        await _run_agent(agent, timer, message_history=history)
+
+    return run
+
+
+def _agent_tools(tools: int) -> BenchmarkFunc:
+    agent = Agent(
+        TestModel(call_tools=[], custom_output_text='done'),
+        tools=[Tool(lookup, name=f'lookup_{i}') for i in range(tools)],
+    )
+
+    async def run(timer: StepTimer) -> None:
+        await _run_agent(agent, timer)
+
+    return run
+
+
+def _agent_fan_out(calls: int) -> BenchmarkFunc:
+    def model_function(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        if any(isinstance(part, ToolReturnPart) for part in messages[-1].parts):
+            return ModelResponse(parts=[TextPart('done')])
+        return ModelResponse(
+            parts=[
+                ToolCallPart('lookup', {'ticker': f'T{i}', 'period': i}, tool_call_id=f'call_{i}') for i in range(calls)
+            ]
+        )
+
+    agent = Agent(FunctionModel(model_function), tools=[lookup])
+
+    async def run(timer: StepTimer) -> None:
+        await _run_agent(agent, timer)
+
+    return run
+
+
+def _agent_stream(chunks: int, output: str) -> BenchmarkFunc:
+    if output == 'text':
+        pieces = [f'token{i} ' for i in range(chunks)]
+
+        async def stream_text(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+            for piece in pieces:
+                yield piece
+
+        agent: Agent[None, Any] = Agent(FunctionModel(stream_function=stream_text))
+    else:
+        document = Items(items=[Item(name=f'item{i}', value=i) for i in range(chunks)]).model_dump_json()
+        size = max(len(document) // chunks, 1)
+        pieces = [document[i : i + size] for i in range(0, len(document), size)]
+
+        async def stream_tool_calls(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[DeltaToolCalls]:
+            name = info.output_tools[0].name
+            for i, piece in enumerate(pieces):
+                yield {0: DeltaToolCall(name=name if i == 0 else None, json_args=piece)}
+
+        agent = Agent(FunctionModel(stream_function=stream_tool_calls), output_type=Items)
+
+    async def run(timer: StepTimer) -> None:
+        await _run_agent(agent, timer, stream=True)
+
+    return run
+
+
+def _agent_instrumented(instrument: bool) -> BenchmarkFunc:
+    # A real tracer provider without exporters, so spans and their attributes are built but not sent anywhere.
+    settings = InstrumentationSettings(tracer_provider=TracerProvider()) if instrument else False
+    agent = Agent(
+        TestModel(custom_output_text='done'),
+        tools=[Tool(lookup, name=f'lookup_{i}') for i in range(5)],
+        instrument=settings,
+    )
+
+    async def run(timer: StepTimer) -> None:
+        await _run_agent(agent, timer)
+
+    return run
+
+
+@dataclass
+class _CountdownState:
+    remaining: int
+
+
+@dataclass
+class _Countdown(BaseNode[_CountdownState, None, int]):
+    async def run(self, ctx: GraphRunContext[_CountdownState]) -> _Countdown | End[int]:
+        ctx.state.remaining -= 1
+        if ctx.state.remaining <= 0:
+            return End(0)
+        return _Countdown()
+
+
+_countdown_graph = Graph(nodes=[_Countdown], name='countdown')
+
+
+def _graph_deep(depth: int) -> BenchmarkFunc:
+    async def run(timer: StepTimer) -> None:
+        async with _countdown_graph.iter(_Countdown(), state=_CountdownState(depth)) as graph_run:
+            node = graph_run.next_node
+            while not isinstance(node, End):
+                with timer.step('transition'):
+                    node = await graph_run.next(node)
+
+    return run
+
+
+def _clean_history(messages: int) -> BenchmarkFunc:
+    history = _message_history(messages)
+
+    async def run(timer: StepTimer) -> None:
+        _clean_message_history(history)
+
+    return run
+
+
+def _tool_manager_for_run_step(tools: int) -> BenchmarkFunc:
+    toolset = FunctionToolset[None]([Tool(lookup, name=f'lookup_{i}') for i in range(tools)])
+    run_steps = itertools.count(1)
+
+    async def run(timer: StepTimer) -> None:
+        ctx = RunContext[None](deps=None, model=TestModel(), usage=RunUsage(), run_step=next(run_steps))
+        await ToolManager[None](toolset).for_run_step(ctx)
+
+    return run
+
+
+def _output_validation(items: int, partial: bool) -> BenchmarkFunc:
+    processor = ObjectOutputProcessor(Items)
+    data = Items(items=[Item(name=f'item{i}', value=i) for i in range(items)]).model_dump_json()
+    if partial:
+        # Cut the document off after an item halfway through, as it would be while the output is being streamed.
+        data = data[: data.index('},', len(data) // 2) + 1]
+    ctx = RunContext[None](deps=None, model=TestModel(), usage=RunUsage())
+
+    async def run(timer: StepTimer) -> None:
+        await processor.process(data, ctx, allow_partial=partial)
+
+    return run
+
+
+def _parts_manager(deltas: int, kind: str) -> BenchmarkFunc:
+    if kind == 'text':
+
+        def feed(manager: ModelResponsePartsManager) -> None:
+            for i in range(deltas):
+                manager.handle_text_delta(vendor_part_id='content', content=f'token{i} ')
+
+    else:
+        document = json.dumps({'ticker': 'x' * deltas})
+        size = max(len(document) // deltas, 1)
+        pieces = [document[i : i + size] for i in range(0, len(document), size)]
+
+        def feed(manager: ModelResponsePartsManager) -> None:
+            manager.handle_tool_call_delta(vendor_part_id='call', tool_name='lookup', tool_call_id='call_0')
+            for piece in pieces:
+                manager.handle_tool_call_delta(vendor_part_id='call', args=piece)
+
+    async def run(timer: StepTimer) -> None:
+        manager = ModelResponsePartsManager()
+        with timer.step('deltas'):
+            feed(manager)
+        with timer.step('get_parts'):
+            manager.get_parts()
+
+    return run
+
+
+def _import_time(statement: str) -> BenchmarkFunc:
+    """Run `statement` in a fresh interpreter, timing the import itself separately from interpreter startup."""
+    code = f'import time; start = time.perf_counter_ns(); {statement}; print(time.perf_counter_ns() - start)'
+
+    async def run(timer: StepTimer) -> None:
+        result = await anyio.run_process([sys.executable, '-c', code])
+        timer.durations['import'].append(int(result.stdout))
+
+    return run
+
+
+def _message_history(messages: int) -> list[ModelMessage]:
+    """A history of tool-calling turns, including consecutive requests that message history cleaning will merge."""
+    history: list[ModelMessage] = []
+    for i in itertools.count():
+        if len(history) >= messages:
+            break
+        history.append(ModelRequest(parts=[UserPromptPart(f'Question {i}')]))
+        history.append(ModelResponse(parts=[ToolCallPart('lookup', {'ticker': f'T{i}'}, tool_call_id=f'call_{i}')]))
+        history.append(ModelRequest(parts=[ToolReturnPart('lookup', f'T{i}: 30 days', tool_call_id=f'call_{i}')]))
+        history.append(ModelRequest(parts=[UserPromptPart('Keep going')]))
+        history.append(ModelResponse(parts=[TextPart(f'Answer {i}')]))
+    return history[:messages]
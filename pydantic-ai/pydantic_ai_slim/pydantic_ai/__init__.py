@@ -1,113 +1,127 @@
+from importlib import import_module as _import_module
 from importlib.metadata import version as _metadata_version
+from typing import TYPE_CHECKING, Any
 
-from .agent import (
-    Agent,
-    CallToolsNode,
-    EndStrategy,
-    InstrumentationSettings,
-    ModelRequestNode,
-    UserPromptNode,
-    capture_run_messages,
-)
-from .builtin_tools import (
-    CodeExecutionTool,
-    ImageGenerationTool,
-    MCPServerTool,
-    MemoryTool,
-    UrlContextTool,
-    WebSearchTool,
-    WebSearchUserLocation,
-)
-from .exceptions import (
-    AgentRunError,
-    ApprovalRequired,
-    CallDeferred,
-    FallbackExceptionGroup,
-    IncompleteToolCall,
-    ModelHTTPError,
-    ModelRetry,
-    UnexpectedModelBehavior,
-    UsageLimitExceeded,
-    UserError,
-)
-from .format_prompt import format_as_xml
-from .messages import (
-    AgentStreamEvent,
-    AudioFormat,
-    AudioMediaType,
-    AudioUrl,
-    BaseToolCallPart,
-    BaseToolReturnPart,
-    BinaryContent,
-    BinaryImage,
-    BuiltinToolCallPart,
-    BuiltinToolReturnPart,
-    DocumentFormat,
-    DocumentMediaType,
-    DocumentUrl,
-    FilePart,
-    FileUrl,
-    FinalResultEvent,
-    FinishReason,
-    FunctionToolCallEvent,
-    FunctionToolResultEvent,
-    HandleResponseEvent,
-    ImageFormat,
-    ImageMediaType,
-    ImageUrl,
-    ModelMessage,
-    ModelMessagesTypeAdapter,
-    ModelRequest,
-    ModelRequestPart,
-    ModelResponse,
-    ModelResponsePart,
-    ModelResponsePartDelta,
-    ModelResponseStreamEvent,
-    MultiModalContent,
-    PartDeltaEvent,
-    PartStartEvent,
-    RetryPromptPart,
-    SystemPromptPart,
-    TextPart,
-    TextPartDelta,
-    ThinkingPart,
-    ThinkingPartDelta,
-    ToolCallPart,
-    ToolCallPartDelta,
-    ToolReturn,
-    ToolReturnPart,
-    UserContent,
-    UserPromptPart,
-    VideoFormat,
-    VideoMediaType,
-    VideoUrl,
-)
-from .output import NativeOutput, PromptedOutput, StructuredDict, TextOutput, ToolOutput
-from .profiles import (
-    DEFAULT_PROFILE,
-    InlineDefsJsonSchemaTransformer,
-    JsonSchemaTransformer,
-    ModelProfile,
-    ModelProfileSpec,
-)
-from .run import AgentRun, AgentRunResult, AgentRunResultEvent
-from .settings import ModelSettings
-from .tools import DeferredToolRequests, DeferredToolResults, RunContext, Tool, ToolApproved, ToolDefinition, ToolDenied
-from .toolsets import (
-    AbstractToolset,
-    ApprovalRequiredToolset,
-    CombinedToolset,
-    ExternalToolset,
-    FilteredToolset,
-    FunctionToolset,
-    PrefixedToolset,
-    PreparedToolset,
-    RenamedToolset,
-    ToolsetFunc,
-    ToolsetTool,
-    WrapperToolset,
-)
-from .usage import RequestUsage, RunUsage, UsageLimits
+if TYPE_CHECKING:
+    from .agent import (
+        Agent,
+        CallToolsNode,
+        EndStrategy,
+        InstrumentationSettings,
+        ModelRequestNode,
+        UserPromptNode,
+        append_only_history_processor,
+        capture_run_messages,
+    )
+    from .builtin_tools import (
+        CodeExecutionTool,
+        ImageGenerationTool,
+        MCPServerTool,
+        MemoryTool,
+        UrlContextTool,
+        WebSearchTool,
+        WebSearchUserLocation,
+    )
+    from .exceptions import (
+        AgentRunError,
+        ApprovalRequired,
+        CallDeferred,
+        FallbackExceptionGroup,
+        IncompleteToolCall,
+        ModelHTTPError,
+        ModelRetry,
+        UnexpectedModelBehavior,
+        UsageLimitExceeded,
+        UserError,
+    )
+    from .format_prompt import format_as_xml
+    from .messages import (
+        AgentStreamEvent,
+        AudioFormat,
+        AudioMediaType,
+        AudioUrl,
+        BaseToolCallPart,
+        BaseToolReturnPart,
+        BinaryContent,
+        BinaryImage,
+        BuiltinToolCallPart,
+        BuiltinToolReturnPart,
+        CachePoint,
+        DocumentFormat,
+        DocumentMediaType,
+        DocumentUrl,
+        FilePart,
+        FileUrl,
+        FinalResultEvent,
+        FinishReason,
+        FunctionToolCallEvent,
+        FunctionToolResultEvent,
+        HandleResponseEvent,
+        ImageFormat,
+        ImageMediaType,
+        ImageUrl,
+        ModelMessage,
+        ModelMessagesTypeAdapter,
+        ModelRequest,
+        ModelRequestPart,
+        ModelResponse,
+        ModelResponsePart,
+        ModelResponsePartDelta,
+        ModelResponseStreamEvent,
+        MultiModalContent,
+        PartDeltaEvent,
+        PartStartEvent,
+        RetryPromptPart,
+        SystemPromptPart,
+        TextPart,
+        TextPartDelta,
+        ThinkingPart,
+        ThinkingPartDelta,
+        ToolCallPart,
+        ToolCallPartDelta,
+        ToolReturn,
+        ToolReturnPart,
+        UserContent,
+        UserPromptPart,
+        VideoFormat,
+        VideoMediaType,
+        VideoUrl,
+    )
+    from .output import NativeOutput, PromptedOutput, StructuredDict, TextOutput, ToolOutput
+    from .profiles import (
+        DEFAULT_PROFILE,
+        InlineDefsJsonSchemaTransformer,
+        JsonSchemaTransformer,
+        ModelProfile,
+        ModelProfileSpec,
+    )
+    from .run import AgentRun, AgentRunResult, AgentRunResultEvent
+    from .settings import ModelSettings
+    from .tools import (
+        DeferredToolRequests,
+        DeferredToolResults,
+        RunContext,
+        Tool,
+        ToolApproved,
+        ToolDefinition,
+        ToolDenied,
+    )
+    from .toolsets import (
+        AbstractToolset,
+        ApprovalRequiredToolset,
+        CombinedToolset,
+        ConcurrencyLimitedToolset,
+        ExternalToolset,
+        FilteredToolset,
+        FunctionToolset,
+        PrefixedToolset,
+        PreparedToolset,
+        RenamedToolset,
+        ToolsetFunc,
+        ToolsetTool,
+        WrapperToolset,
+    )
+    from .usage import RequestUsage, RunUsage, UsageLimits
 
 __all__ = (
     '__version__',
@@ -118,6 +132,7 @@ __all__ = (
     'ModelRequestNode',
     'UserPromptNode',
     'capture_run_messages',
+    'append_only_history_processor',
     'InstrumentationSettings',
     # exceptions
     'AgentRunError',
@@ -154,6 +169,7 @@ __all__ = (
     'ImageMediaType',
     'ImageUrl',
     'BinaryImage',
+    'CachePoint',
     'ModelMessage',
     'ModelMessagesTypeAdapter',
     'ModelRequest',
@@ -198,6 +214,7 @@ __all__ = (
     'AbstractToolset',
     'ApprovalRequiredToolset',
     'CombinedToolset',
+    'ConcurrencyLimitedToolset',
     'ExternalToolset',
     'FilteredToolset',
     'FunctionToolset',
@@ -235,3 +252,139 @@ __all__ = (
     'AgentRunResultEvent',
 )
 __version__ = _metadata_version('pydantic_ai_slim')
+
+# Importing `pydantic_ai` only imports the submodules a name comes from once it's first used, so short-lived
+# processes like the CLI don't pay for the whole framework (and its dependencies) up front.
+_dynamic_imports: dict[str, str] = {
+    'Agent': '.agent',
+    'CallToolsNode': '.agent',
+    'EndStrategy': '.agent',
+    'InstrumentationSettings': '.agent',
+    'ModelRequestNode': '.agent',
+    'UserPromptNode': '.agent',
+    'append_only_history_processor': '.agent',
+    'capture_run_messages': '.agent',
+    'CodeExecutionTool': '.builtin_tools',
+    'ImageGenerationTool': '.builtin_tools',
+    'MCPServerTool': '.builtin_tools',
+    'MemoryTool': '.builtin_tools',
+    'UrlContextTool': '.builtin_tools',
+    'WebSearchTool': '.builtin_tools',
+    'WebSearchUserLocation': '.builtin_tools',
+    'AgentRunError': '.exceptions',
+    'ApprovalRequired': '.exceptions',
+    'CallDeferred': '.exceptions',
+    'FallbackExceptionGroup': '.exceptions',
+    'IncompleteToolCall': '.exceptions',
+    'ModelHTTPError': '.exceptions',
+    'ModelRetry': '.exceptions',
+    'UnexpectedModelBehavior': '.exceptions',
+    'UsageLimitExceeded': '.exceptions',
+    'UserError': '.exceptions',
+    'format_as_xml': '.format_prompt',
+    'AgentStreamEvent': '.messages',
+    'AudioFormat': '.messages',
+    'AudioMediaType': '.messages',
+    'AudioUrl': '.messages',
+    'BaseToolCallPart': '.messages',
+    'BaseToolReturnPart': '.messages',
+    'BinaryContent': '.messages',
+    'BinaryImage': '.messages',
+    'BuiltinToolCallPart': '.messages',
+    'BuiltinToolReturnPart': '.messages',
+    'CachePoint': '.messages',
+    'DocumentFormat': '.messages',
+    'DocumentMediaType': '.messages',
+    'DocumentUrl': '.messages',
+    'FilePart': '.messages',
+    'FileUrl': '.messages',
+    'FinalResultEvent': '.messages',
+    'FinishReason': '.messages',
+    'FunctionToolCallEvent': '.messages',
+    'FunctionToolResultEvent': '.messages',
+    'HandleResponseEvent': '.messages',
+    'ImageFormat': '.messages',
+    'ImageMediaType': '.messages',
+    'ImageUrl': '.messages',
+    'ModelMessage': '.messages',
+    'ModelMessagesTypeAdapter': '.messages',
+    'ModelRequest': '.messages',
+    'ModelRequestPart': '.messages',
+    'ModelResponse': '.messages',
+    'ModelResponsePart': '.messages',
+    'ModelResponsePartDelta': '.messages',
+    'ModelResponseStreamEvent': '.messages',
+    'MultiModalContent': '.messages',
+    'PartDeltaEvent': '.messages',
+    'PartStartEvent': '.messages',
+    'RetryPromptPart': '.messages',
+    'SystemPromptPart': '.messages',
+    'TextPart': '.messages',
+    'TextPartDelta': '.messages',
+    'ThinkingPart': '.messages',
+    'ThinkingPartDelta': '.messages',
+    'ToolCallPart': '.messages',
+    'ToolCallPartDelta': '.messages',
+    'ToolReturn': '.messages',
+    'ToolReturnPart': '.messages',
+    'UserContent': '.messages',
+    'UserPromptPart': '.messages',
+    'VideoFormat': '.messages',
+    'VideoMediaType': '.messages',
+    'VideoUrl': '.messages',
+    'NativeOutput': '.output',
+    'PromptedOutput': '.output',
+    'StructuredDict': '.output',
+    'TextOutput': '.output',
+    'ToolOutput': '.output',
+    'DEFAULT_PROFILE': '.profiles',
+    'InlineDefsJsonSchemaTransformer': '.profiles',
+    'JsonSchemaTransformer': '.profiles',
+    'ModelProfile': '.profiles',
+    'ModelProfileSpec': '.profiles',
+    'AgentRun': '.run',
+    'AgentRunResult': '.run',
+    'AgentRunResultEvent': '.run',
+    'ModelSettings': '.settings',
+    'DeferredToolRequests': '.tools',
+    'DeferredToolResults': '.tools',
+    'RunContext': '.tools',
+    'Tool': '.tools',
+    'ToolApproved': '.tools',
+    'ToolDefinition': '.tools',
+    'ToolDenied': '.tools',
+    'AbstractToolset': '.toolsets',
+    'ApprovalRequiredToolset': '.toolsets',
+    'CombinedToolset': '.toolsets',
+    'ConcurrencyLimitedToolset': '.toolsets',
+    'ExternalToolset': '.toolsets',
+    'FilteredToolset': '.toolsets',
+    'FunctionToolset': '.toolsets',
+    'PrefixedToolset': '.toolsets',
+    'PreparedToolset': '.toolsets',
+    'RenamedToolset': '.toolsets',
+    'ToolsetFunc': '.toolsets',
+    'ToolsetTool': '.toolsets',
+    'WrapperToolset': '.toolsets',
+    'RequestUsage': '.usage',
+    'RunUsage': '.usage',
+    'UsageLimits': '.usage',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if (module_name := _dynamic_imports.get(name)) is not None:
+        value = getattr(_import_module(module_name, __name__), name)
+    else:
+        try:
+            value = _import_module(f'.{name}', __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_dynamic_imports]
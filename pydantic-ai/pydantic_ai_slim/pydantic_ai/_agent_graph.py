@@ -6,7 +6,7 @@ import inspect
 from asyncio import Task
 from collections import defaultdict, deque
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
-from contextlib import asynccontextmanager, contextmanager
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 from contextvars import ContextVar
 from copy import deepcopy
 from dataclasses import field, replace
@@ -51,6 +51,7 @@ __all__ = (
     'build_run_context',
     'capture_run_messages',
     'HistoryProcessor',
+    'append_only_history_processor',
 )
 
 
@@ -83,6 +84,36 @@ HistoryProcessor = (
 Can optionally accept a `RunContext` as a parameter.
 """
 
+HistoryProcessorT = TypeVar('HistoryProcessorT', bound=HistoryProcessor[Any])
+
+_APPEND_ONLY_ATTR = '__pydantic_ai_append_only__'
+
+
+def append_only_history_processor(processor: HistoryProcessorT) -> HistoryProcessorT:
+    """Mark a history processor as append-only, so it only receives messages it hasn't processed before.
+
+    An append-only processor promises that its output for a message doesn't depend on the messages that were
+    already processed in an earlier step of the run, and that it never needs to revisit them. The agent
+    then keeps the processed history between model requests and only passes the newly appended messages to
+    the processor, splicing its output onto the end of the already processed history.
+
+    This turns per-step history processing from O(n) into O(new messages), which matters for long runs.
+    Processors that look at the whole history, like ones that truncate or summarize it, must not be marked
+    append-only.
+
+    Usage:
+
+        @append_only_history_processor
+        def redact_tool_returns(messages: list[ModelMessage]) -> list[ModelMessage]:
+            ...
+    """
+    setattr(processor, _APPEND_ONLY_ATTR, True)
+    return processor
+
+
+def _is_append_only(processor: HistoryProcessor[Any]) -> bool:
+    return getattr(processor, _APPEND_ONLY_ATTR, False)
+
 
 @dataclasses.dataclass(kw_only=True)
 class GraphAgentState:
@@ -151,6 +182,10 @@ class GraphAgentDeps(Generic[DepsT, OutputDataT]):
     tracer: Tracer
     instrumentation_settings: InstrumentationSettings | None
 
+    message_history_cache: _MessageHistoryCache = dataclasses.field(
+        default_factory=lambda: _MessageHistoryCache(), repr=False
+    )
+
 
 class AgentNode(BaseNode[GraphAgentState, GraphAgentDeps[DepsT, Any], result.FinalResult[NodeRunEndT]]):
     """The base class for all agent nodes.
@@ -473,17 +508,24 @@ class ModelRequestNode(AgentNode[DepsT, NodeRunEndT]):
         # This will raise errors for any tool name conflicts
         ctx.deps.tool_manager = await ctx.deps.tool_manager.for_run_step(run_context)
 
-        original_history = ctx.state.message_history[:]
-        message_history = await _process_message_history(original_history, ctx.deps.history_processors, run_context)
-        # `ctx.state.message_history` is the same list used by `capture_run_messages`, so we should replace its contents, not the reference
-        ctx.state.message_history[:] = message_history
-        # Update the new message index to ensure `result.new_messages()` returns the correct messages
-        ctx.deps.new_message_index -= len(original_history) - len(message_history)
+        cache = ctx.deps.message_history_cache
+        if ctx.deps.history_processors:
+            # Only the messages after `processed_count` haven't been through the history processors yet,
+            # but unless every processor is append-only we need to run them over the whole history
+            start = cache.unprocessed_start(ctx.state.message_history, ctx.deps.history_processors)
+            original_history = ctx.state.message_history[start:]
+            processed = await _process_message_history(original_history, ctx.deps.history_processors, run_context)
+            # `ctx.state.message_history` is the same list used by `capture_run_messages`, so we should replace its contents, not the reference
+            ctx.state.message_history[start:] = processed
+            # Update the new message index to ensure `result.new_messages()` returns the correct messages
+            ctx.deps.new_message_index -= len(original_history) - len(processed)
+            _check_processed_history(ctx.state.message_history)
+            cache.mark_processed(ctx.state.message_history)
 
         # Merge possible consecutive trailing `ModelRequest`s into one, with tool call parts before user parts,
         # but don't store it in the message history on state. This is just for the benefit of model classes that want clear user/assistant boundaries.
         # See `tests/test_tools.py::test_parallel_tool_return_with_deferred` for an example where this is necessary
-        message_history = _clean_message_history(message_history)
+        message_history = cache.clean(ctx.state.message_history)
 
         model_request_parameters = await _prepare_request_parameters(ctx)
         model_request_parameters = ctx.deps.model.customize_request_parameters(model_request_parameters)
@@ -928,7 +970,7 @@ async def process_tool_calls(  # noqa: C901
         output_final_result.append(final_result)
 
 
-async def _call_tools(
+async def _call_tools(  # noqa: C901
     tool_manager: ToolManager[DepsT],
     tool_calls: list[_messages.ToolCallPart],
     tool_call_results: dict[str, DeferredToolResult],
@@ -938,9 +980,10 @@ async def _call_tools(
     output_parts: list[_messages.ModelRequestPart],
     output_deferred_calls: dict[Literal['external', 'unapproved'], list[_messages.ToolCallPart]],
 ) -> AsyncIterator[_messages.HandleResponseEvent]:
-    tool_parts_by_index: dict[int, _messages.ModelRequestPart] = {}
-    user_parts_by_index: dict[int, _messages.UserPromptPart] = {}
-    deferred_calls_by_index: dict[int, Literal['external', 'unapproved']] = {}
+    # Results are stored by the index of their call, so they can be output in a consistent order without sorting
+    tool_parts_by_index: list[_messages.ModelRequestPart | None] = [None] * len(tool_calls)
+    user_parts_by_index: list[_messages.UserPromptPart | None] = [None] * len(tool_calls)
+    deferred_calls_by_index: list[Literal['external', 'unapproved'] | None] = [None] * len(tool_calls)
 
     if usage_limits.tool_calls_limit is not None:
         projected_usage = deepcopy(usage)
@@ -995,29 +1038,54 @@ async def _call_tools(
                     yield event
 
         else:
-            tasks = [
+            limiter = _ToolCallLimiter(tool_manager)
+            task_indices = {
                 asyncio.create_task(
-                    _call_tool(tool_manager, call, tool_call_results.get(call.tool_call_id)),
+                    limiter.call_tool(call, tool_call_results.get(call.tool_call_id)),
                     name=call.tool_name,
-                )
-                for call in tool_calls
-            ]
+                ): index
+                for index, call in enumerate(tool_calls)
+            }
 
-            pending = tasks
+            pending: set[Task[Any]] = set(task_indices)
             while pending:
                 done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
                 for task in done:
-                    index = tasks.index(task)
-                    if event := await handle_call_or_result(coro_or_task=task, index=index):
+                    if event := await handle_call_or_result(coro_or_task=task, index=task_indices[task]):
                         yield event
 
     # We append the results at the end, rather than as they are received, to retain a consistent ordering
     # This is mostly just to simplify testing
-    output_parts.extend([tool_parts_by_index[k] for k in sorted(tool_parts_by_index)])
-    output_parts.extend([user_parts_by_index[k] for k in sorted(user_parts_by_index)])
+    output_parts.extend([part for part in tool_parts_by_index if part is not None])
+    output_parts.extend([part for part in user_parts_by_index if part is not None])
+
+    for call, deferred_kind in zip(tool_calls, deferred_calls_by_index):
+        if deferred_kind is not None:
+            output_deferred_calls[deferred_kind].append(call)
+
 
-    for k in sorted(deferred_calls_by_index):
-        output_deferred_calls[deferred_calls_by_index[k]].append(tool_calls[k])
+class _ToolCallLimiter(Generic[DepsT]):
+    """Applies the agent-wide and per-tool concurrency limits to tool calls run in parallel."""
+
+    def __init__(self, tool_manager: ToolManager[DepsT]):
+        self._tool_manager = tool_manager
+        self._semaphore = asyncio.Semaphore(tool_manager.max_concurrency) if tool_manager.max_concurrency else None
+        self._tool_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def call_tool(
+        self, call: _messages.ToolCallPart, tool_call_result: DeferredToolResult | None
+    ) -> tuple[_messages.ToolReturnPart | _messages.RetryPromptPart, str | Sequence[_messages.UserContent] | None]:
+        # The tool's own limit is acquired first, so calls waiting on it don't hold on to one of the agent-wide slots
+        async with self._get_tool_semaphore(call.tool_name) or nullcontext(), self._semaphore or nullcontext():
+            return await _call_tool(self._tool_manager, call, tool_call_result)
+
+    def _get_tool_semaphore(self, tool_name: str) -> asyncio.Semaphore | None:
+        if (semaphore := self._tool_semaphores.get(tool_name)) is None:
+            tool_def = self._tool_manager.get_tool_def(tool_name)
+            if tool_def is None or not tool_def.max_concurrency:
+                return None
+            semaphore = self._tool_semaphores[tool_name] = asyncio.Semaphore(tool_def.max_concurrency)
+        return semaphore
 
 
 async def _call_tool(
@@ -1214,18 +1282,72 @@ async def _process_message_history(
                 sync_processor = cast(_HistoryProcessorSync, processor)
                 messages = await run_in_executor(sync_processor, messages)
 
+    return messages
+
+
+def _check_processed_history(messages: list[_messages.ModelMessage]) -> None:
     if len(messages) == 0:
         raise exceptions.UserError('Processed history cannot be empty.')
 
     if not isinstance(messages[-1], _messages.ModelRequest):
         raise exceptions.UserError('Processed history must end with a `ModelRequest`.')
 
-    return messages
 
+@dataclasses.dataclass
+class _MessageHistoryCache:
+    """Remembers which part of the message history has already been processed and cleaned during a run.
+
+    Messages are only ever appended to the history between model requests, so the history processors and
+    `_clean_message_history` only need to look at the messages that were added since the previous request.
+    If the history was changed in any other way, everything is processed again.
+    """
 
-def _clean_message_history(messages: list[_messages.ModelMessage]) -> list[_messages.ModelMessage]:
-    """Clean the message history by merging consecutive messages of the same type."""
-    clean_messages: list[_messages.ModelMessage] = []
+    processed: list[_messages.ModelMessage] = dataclasses.field(default_factory=list)
+    """The message history as it was after the history processors ran last."""
+
+    cleaned_source: list[_messages.ModelMessage] = dataclasses.field(default_factory=list)
+    """The message history that `cleaned` was built from."""
+    cleaned: list[_messages.ModelMessage] = dataclasses.field(default_factory=list)
+    """The result of cleaning `cleaned_source`."""
+
+    def unprocessed_start(
+        self, messages: list[_messages.ModelMessage], processors: Sequence[HistoryProcessor[Any]]
+    ) -> int:
+        """Return the index of the first message that still needs to be passed to the history processors."""
+        if not all(_is_append_only(processor) for processor in processors):
+            return 0
+        return len(self.processed) if _has_prefix(messages, self.processed) else 0
+
+    def mark_processed(self, messages: list[_messages.ModelMessage]) -> None:
+        self.processed = messages[:]
+
+    def clean(self, messages: list[_messages.ModelMessage]) -> list[_messages.ModelMessage]:
+        """Clean the message history, reusing the result for the part that was cleaned before."""
+        if self.cleaned and _has_prefix(messages, self.cleaned_source):
+            # Only the last cleaned message can be merged with the new messages, so that's where we pick up
+            clean_messages = _clean_message_history(
+                messages[len(self.cleaned_source) :], clean_messages=self.cleaned[:]
+            )
+        else:
+            clean_messages = _clean_message_history(messages)
+        self.cleaned_source = messages[:]
+        self.cleaned = clean_messages
+        return clean_messages[:]
+
+
+def _has_prefix(messages: list[_messages.ModelMessage], prefix: list[_messages.ModelMessage]) -> bool:
+    # List equality checks identity before falling back to `__eq__`, so this is cheap for unchanged messages
+    return len(messages) >= len(prefix) and messages[: len(prefix)] == prefix
+
+
+def _clean_message_history(
+    messages: list[_messages.ModelMessage], clean_messages: list[_messages.ModelMessage] | None = None
+) -> list[_messages.ModelMessage]:
+    """Clean the message history by merging consecutive messages of the same type.
+
+    If `clean_messages` is provided, `messages` are merged onto the end of that already clean history.
+    """
+    clean_messages = clean_messages if clean_messages is not None else []
     for message in messages:
         last_message = clean_messages[-1] if len(clean_messages) > 0 else None
 
@@ -3,6 +3,7 @@ from __future__ import annotations as _annotations
 import argparse
 import asyncio
 import importlib
+import importlib.util
 import os
 import sys
 from asyncio import CancelledError
@@ -25,11 +26,6 @@ from .output import OutputDataT
 try:
     import argcomplete
     import pyperclip
-    from prompt_toolkit import PromptSession
-    from prompt_toolkit.auto_suggest import AutoSuggestFromHistory, Suggestion
-    from prompt_toolkit.buffer import Buffer
-    from prompt_toolkit.document import Document
-    from prompt_toolkit.history import FileHistory
     from rich.console import Console, ConsoleOptions, RenderResult
     from rich.live import Live
     from rich.markdown import CodeBlock, Heading, Markdown
@@ -37,6 +33,10 @@ try:
     from rich.style import Style
     from rich.syntax import Syntax
     from rich.text import Text
+
+    # `prompt_toolkit` is slow to import and only needed for interactive mode, so it's imported when that starts
+    if importlib.util.find_spec('prompt_toolkit') is None:
+        raise ImportError('prompt_toolkit')
 except ImportError as _import_error:
     raise ImportError(
         'Please install `rich`, `prompt-toolkit`, `pyperclip` and `argcomplete` to use the Pydantic AI CLI, '
@@ -230,6 +230,11 @@ async def run_chat(
     deps: AgentDepsT = None,
     message_history: Sequence[ModelMessage] | None = None,
 ) -> int:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import FileHistory
+
+    from ._cli_prompt import CustomAutoSuggest
+
     prompt_history_path = (config_dir or PYDANTIC_AI_HOME) / PROMPT_HISTORY_FILENAME
     prompt_history_path.parent.mkdir(parents=True, exist_ok=True)
     prompt_history_path.touch(exist_ok=True)
@@ -299,23 +304,6 @@ async def ask_agent(
         return agent_run.result.all_messages()
 
 
-class CustomAutoSuggest(AutoSuggestFromHistory):
-    def __init__(self, special_suggestions: list[str] | None = None):
-        super().__init__()
-        self.special_suggestions = special_suggestions or []
-
-    def get_suggestion(self, buffer: Buffer, document: Document) -> Suggestion | None:  # pragma: no cover
-        # Get the suggestion from history
-        suggestion = super().get_suggestion(buffer, document)
-
-        # Check for custom suggestions
-        text = document.text_before_cursor.strip()
-        for special in self.special_suggestions:
-            if special.startswith(text):
-                return Suggestion(special[len(text) :])
-        return suggestion
-
-
 def handle_slash_command(
     ident_prompt: str, messages: list[ModelMessage], multiline: bool, console: Console, code_theme: str
 ) -> tuple[int | None, bool]:
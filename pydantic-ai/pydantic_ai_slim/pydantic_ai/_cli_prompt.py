@@ -0,0 +1,26 @@
+"""Interactive prompt helpers for the CLI, kept separate so `prompt_toolkit` is only imported for interactive mode."""
+
+from __future__ import annotations as _annotations
+
+from prompt_toolkit.auto_suggest import AutoSuggestFromHistory, Suggestion
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.document import Document
+
+__all__ = ('CustomAutoSuggest',)
+
+
+class CustomAutoSuggest(AutoSuggestFromHistory):
+    def __init__(self, special_suggestions: list[str] | None = None):
+        super().__init__()
+        self.special_suggestions = special_suggestions or []
+
+    def get_suggestion(self, buffer: Buffer, document: Document) -> Suggestion | None:  # pragma: no cover
+        # Get the suggestion from history
+        suggestion = super().get_suggestion(buffer, document)
+
+        # Check for custom suggestions
+        text = document.text_before_cursor.strip()
+        for special in self.special_suggestions:
+            if special.startswith(text):
+                return Suggestion(special[len(text) :])
+        return suggestion
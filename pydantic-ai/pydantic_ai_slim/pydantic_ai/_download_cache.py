@@ -0,0 +1,240 @@
+from __future__ import annotations as _annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple
+
+import anyio.to_thread
+import httpx
+
+from ._utils import atomic_write
+
+__all__ = 'CachedDownload', 'DownloadCache', 'DownloadCacheInfo'
+
+_MAX_AGE_RE = re.compile(r'(?:^|,)\s*max-age\s*=\s*"?(\d+)"?', re.IGNORECASE)
+
+
+class DownloadCacheInfo(NamedTuple):
+    """Statistics about a [`DownloadCache`][pydantic_ai.models.DownloadCache]."""
+
+    hits: int
+    """Downloads served from the cache without contacting the server, because the cached response was still fresh."""
+    revalidations: int
+    """Downloads served from the cache after the server confirmed with `304 Not Modified` that they were unchanged."""
+    misses: int
+    """Downloads that had to fetch the full content."""
+    max_size_bytes: int
+    currsize_bytes: int
+
+
+@dataclass(eq=False)
+class CachedDownload:
+    """Downloaded content, shared by every URL that served the same bytes."""
+
+    data: bytes
+    """The raw content."""
+    sha256: str
+    """The SHA-256 hex digest of `data`, which identifies the content in the cache."""
+    encoded: dict[str, str] = field(default_factory=dict, repr=False)
+    """Encoded forms of `data` (e.g. base64) that have already been computed, keyed by format."""
+
+    @property
+    def size(self) -> int:
+        return len(self.data) + sum(len(value) for value in self.encoded.values())
+
+
+@dataclass
+class _UrlEntry:
+    sha256: str
+    content_type: str | None
+    etag: str | None
+    last_modified: str | None
+    expires_at: float | None
+    """Wall clock time until which the response is fresh and can be used without revalidation."""
+
+
+class DownloadCache:
+    """A content-addressed cache of files downloaded by [`download_item`][pydantic_ai.models.download_item].
+
+    Message history is sent to the model again on every step of an agent run, so without a cache, file URLs the
+    model can't fetch itself are downloaded and re-encoded on every request.
+
+    Contents are kept in a bounded in-memory LRU keyed by the SHA-256 of the bytes, along with the encoded forms
+    (like base64) that have been requested, so URLs serving identical content share an entry. Each URL remembers
+    which content it last served and the response's `ETag`, `Last-Modified` and `Cache-Control: max-age` headers:
+
+    * While the response is fresh according to `max-age`, it's served without contacting the server.
+    * Otherwise, if the response had an `ETag` or `Last-Modified`, a conditional request is sent and the cached
+      content is reused when the server answers `304 Not Modified`.
+    * Otherwise, the content is downloaded again.
+
+    Responses with `Cache-Control: no-store` are never cached.
+
+    If `directory` is set, raw contents and URL metadata are also written there, so they survive restarts and can
+    be shared between processes. The directory is not pruned automatically.
+    """
+
+    def __init__(self, max_size_bytes: int = 128 * 1024 * 1024, directory: Path | str | None = None):
+        """Create a download cache.
+
+        Args:
+            max_size_bytes: The maximum total size of the contents and encoded forms kept in memory.
+                Set to `0` to disable the in-memory cache.
+            directory: An optional directory to also cache contents in on disk.
+        """
+        self.max_size_bytes = max_size_bytes
+        self.directory = Path(directory) if directory is not None else None
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._urls: dict[str, _UrlEntry] = {}
+        self._contents: OrderedDict[str, CachedDownload] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    async def download(self, client: httpx.AsyncClient, url: str) -> tuple[CachedDownload, str | None]:
+        """Download `url` using `client`, or reuse the cached content if it's still valid.
+
+        Returns:
+            The content and the content type from the response headers, if any.
+
+        Raises:
+            httpx.HTTPStatusError: If the server responds with an error status.
+        """
+        entry = self._urls.get(url) or await self._load_url_entry(url)
+        content = await self._get_content(entry.sha256) if entry is not None else None
+
+        headers: dict[str, str] = {}
+        if entry is not None and content is not None:
+            if entry.expires_at is not None and time.time() < entry.expires_at:
+                self.hits += 1
+                return content, entry.content_type
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        response = await client.get(url, follow_redirects=True, headers=headers)
+        if response.status_code == 304 and entry is not None and content is not None:
+            self.revalidations += 1
+            if (expires_at := _expires_at(response)) is not None:
+                entry.expires_at = expires_at
+            return content, entry.content_type
+        response.raise_for_status()
+
+        self.misses += 1
+        data = response.content
+        content_type = response.headers.get('content-type')
+        content = CachedDownload(data=data, sha256=hashlib.sha256(data).hexdigest())
+        if 'no-store' in response.headers.get('cache-control', '').lower():
+            return content, content_type
+
+        entry = _UrlEntry(
+            sha256=content.sha256,
+            content_type=content_type,
+            etag=response.headers.get('etag'),
+            last_modified=response.headers.get('last-modified'),
+            expires_at=_expires_at(response),
+        )
+        content = self._store_content(content)
+        self._urls[url] = entry
+        if self.directory is not None:
+            await anyio.to_thread.run_sync(self._write_to_disk, url, entry, content)
+        return content, content_type
+
+    def encode(self, content: CachedDownload, key: str, encoder: Callable[[bytes], str]) -> str:
+        """Return the encoded form of `content` identified by `key`, computing it with `encoder` the first time."""
+        if (encoded := content.encoded.get(key)) is not None:
+            return encoded
+        encoded = encoder(content.data)
+        with self._lock:
+            if key in content.encoded:  # pragma: no cover
+                return content.encoded[key]
+            content.encoded[key] = encoded
+            if self._contents.get(content.sha256) is content:
+                self._size += len(encoded)
+                self._evict()
+        return encoded
+
+    def cache_info(self) -> DownloadCacheInfo:
+        return DownloadCacheInfo(self.hits, self.revalidations, self.misses, self.max_size_bytes, self._size)
+
+    def clear(self) -> None:
+        """Clear the in-memory cache and reset the statistics. Files in `directory` are left in place."""
+        with self._lock:
+            self._urls.clear()
+            self._contents.clear()
+            self._size = 0
+            self.hits = 0
+            self.revalidations = 0
+            self.misses = 0
+
+    def _store_content(self, content: CachedDownload) -> CachedDownload:
+        with self._lock:
+            if (existing := self._contents.get(content.sha256)) is not None:
+                self._contents.move_to_end(content.sha256)
+                return existing
+            if content.size <= self.max_size_bytes:
+                self._contents[content.sha256] = content
+                self._size += content.size
+                self._evict()
+        return content
+
+    def _evict(self) -> None:
+        while self._size > self.max_size_bytes and self._contents:
+            _, evicted = self._contents.popitem(last=False)
+            self._size -= evicted.size
+
+    async def _get_content(self, sha256: str) -> CachedDownload | None:
+        with self._lock:
+            if (content := self._contents.get(sha256)) is not None:
+                self._contents.move_to_end(sha256)
+                return content
+        if self.directory is None:
+            return None
+        path = self.directory / 'contents' / sha256
+        try:
+            data = await anyio.to_thread.run_sync(path.read_bytes)
+        except FileNotFoundError:
+            return None
+        return self._store_content(CachedDownload(data=data, sha256=sha256))
+
+    async def _load_url_entry(self, url: str) -> _UrlEntry | None:
+        if self.directory is None:
+            return None
+        path = self.directory / 'urls' / f'{_url_key(url)}.json'
+        try:
+            raw = await anyio.to_thread.run_sync(path.read_text)
+            entry = _UrlEntry(**json.loads(raw)['entry'])
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None
+        self._urls[url] = entry
+        return entry
+
+    def _write_to_disk(self, url: str, entry: _UrlEntry, content: CachedDownload) -> None:
+        assert self.directory is not None
+        content_path = self.directory / 'contents' / content.sha256
+        if not content_path.exists():
+            atomic_write(content_path, content.data)
+        url_record = {'url': url, 'entry': entry.__dict__}
+        atomic_write(self.directory / 'urls' / f'{_url_key(url)}.json', json.dumps(url_record).encode())
+
+
+def _expires_at(response: httpx.Response) -> float | None:
+    cache_control = response.headers.get('cache-control', '')
+    if 'no-cache' in cache_control.lower():
+        return None
+    if match := _MAX_AGE_RE.search(cache_control):
+        return time.time() + int(match.group(1))
+    return None
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()
@@ -7,7 +7,7 @@ from __future__ import annotations as _annotations
 
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from inspect import Parameter, signature
+from inspect import Parameter, Signature, signature
 from typing import TYPE_CHECKING, Any, Concatenate, cast, get_origin
 
 from pydantic import ConfigDict
@@ -27,7 +27,7 @@ if TYPE_CHECKING:
     from .tools import DocstringFormat, ObjectJsonSchema
 
 
-__all__ = ('function_schema',)
+__all__ = ('check_function', 'function_schema')
 
 
 @dataclass(kw_only=True)
@@ -114,17 +114,8 @@ def function_schema(  # noqa: C901
 
     description, field_descriptions = doc_descriptions(function, sig, docstring_format=docstring_format)
 
-    if require_parameter_descriptions:
-        if takes_ctx:
-            parameters_without_ctx = set(
-                name for name in sig.parameters if not _is_call_ctx(sig.parameters[name].annotation)
-            )
-            missing_params = parameters_without_ctx - set(field_descriptions)
-        else:
-            missing_params = set(sig.parameters) - set(field_descriptions)
-
-        if missing_params:
-            errors.append(f'Missing parameter descriptions for {", ".join(missing_params)}')
+    if require_parameter_descriptions and (missing_params := _missing_descriptions(sig, field_descriptions, takes_ctx)):
+        errors.append(f'Missing parameter descriptions for {", ".join(missing_params)}')
 
     for index, (name, p) in enumerate(sig.parameters.items()):
         if p.annotation is sig.empty:
@@ -136,15 +127,9 @@ def function_schema(  # noqa: C901
         else:
             annotation = type_hints[name]
 
-            if index == 0 and takes_ctx:
-                if not _is_call_ctx(annotation):
-                    errors.append('First parameter of tools that take context must be annotated with RunContext[...]')
-                continue
-            elif not takes_ctx and _is_call_ctx(annotation):
-                errors.append('RunContext annotations can only be used with tools that take context')
-                continue
-            elif index != 0 and _is_call_ctx(annotation):
-                errors.append('RunContext annotations can only be used as the first argument')
+            if (index == 0 and takes_ctx) or _is_call_ctx(annotation):
+                if error := _ctx_error(index, annotation, takes_ctx):
+                    errors.append(error)
                 continue
 
         field_name = p.name
@@ -178,11 +163,7 @@ def function_schema(  # noqa: C901
             elif p.kind == Parameter.VAR_POSITIONAL:
                 var_positional_field = field_name
 
-    if errors:
-        from .exceptions import UserError
-
-        error_details = '\n  '.join(errors)
-        raise UserError(f'Error generating schema for {function.__qualname__}:\n  {error_details}')
+    _raise_errors(function, errors)
 
     core_config = config_wrapper.core_config(None)
     # noinspection PyTypedDict
@@ -225,6 +206,75 @@ def function_schema(  # noqa: C901
     )
 
 
+def check_function(
+    function: Callable[..., Any],
+    takes_ctx: bool | None = None,
+    docstring_format: DocstringFormat = 'auto',
+    require_parameter_descriptions: bool = False,
+) -> bool:
+    """Check a tool function's signature without building its schema.
+
+    This raises the same errors about the signature as [`function_schema`][pydantic_ai._function_schema.function_schema],
+    so they're reported when a tool is registered, even though its schema is only built when it's first needed.
+    The docstring is only parsed if `require_parameter_descriptions` is set.
+
+    Returns:
+        Whether the function takes a `RunContext` first argument.
+    """
+    if takes_ctx is None:
+        takes_ctx = _takes_ctx(function)
+
+    errors: list[str] = []
+    try:
+        sig = signature(function)
+    except ValueError as e:
+        errors.append(str(e))
+        sig = signature(lambda: None)
+
+    if require_parameter_descriptions:
+        _, field_descriptions = doc_descriptions(function, sig, docstring_format=docstring_format)
+        if missing_params := _missing_descriptions(sig, field_descriptions, takes_ctx):
+            errors.append(f'Missing parameter descriptions for {", ".join(missing_params)}')
+
+    if any(p.annotation is not sig.empty for p in sig.parameters.values()):
+        type_hints = _typing_extra.get_function_type_hints(function)
+        for index, (name, p) in enumerate(sig.parameters.items()):
+            if p.annotation is not sig.empty and (error := _ctx_error(index, type_hints[name], takes_ctx)):
+                errors.append(error)
+
+    _raise_errors(function, errors)
+    return takes_ctx
+
+
+def _ctx_error(index: int, annotation: Any, takes_ctx: bool) -> str | None:
+    """Return the error for an annotated parameter that is, or should be, the `RunContext` argument."""
+    if index == 0 and takes_ctx:
+        if not _is_call_ctx(annotation):
+            return 'First parameter of tools that take context must be annotated with RunContext[...]'
+    elif not takes_ctx and _is_call_ctx(annotation):
+        return 'RunContext annotations can only be used with tools that take context'
+    elif index != 0 and _is_call_ctx(annotation):
+        return 'RunContext annotations can only be used as the first argument'
+    return None
+
+
+def _missing_descriptions(sig: Signature, field_descriptions: dict[str, str], takes_ctx: bool) -> set[str]:
+    if takes_ctx:
+        parameters_without_ctx = set(
+            name for name in sig.parameters if not _is_call_ctx(sig.parameters[name].annotation)
+        )
+        return parameters_without_ctx - set(field_descriptions)
+    return set(sig.parameters) - set(field_descriptions)
+
+
+def _raise_errors(function: Callable[..., Any], errors: list[str]) -> None:
+    if errors:
+        from .exceptions import UserError
+
+        error_details = '\n  '.join(errors)
+        raise UserError(f'Error generating schema for {function.__qualname__}:\n  {error_details}')
+
+
 P = ParamSpec('P')
 R = TypeVar('R')
 
@@ -7,9 +7,9 @@ from contextlib import contextmanager
 from inspect import Signature
 from typing import TYPE_CHECKING, Any, Literal, cast
 
-from griffe import Docstring, DocstringSectionKind, Object as GriffeObject
-
 if TYPE_CHECKING:
+    from griffe import Object as GriffeObject
+
     from .tools import DocstringFormat
 
 DocstringStyle = Literal['google', 'numpy', 'sphinx']
@@ -38,8 +38,11 @@ def doc_descriptions(
     if doc is None:
         return None, {}
 
+    # griffe is slow to import, so it's only imported once a docstring needs parsing
+    from griffe import Docstring, DocstringSectionKind
+
     # see https://github.com/mkdocstrings/griffe/issues/293
-    parent = cast(GriffeObject, sig)
+    parent = cast('GriffeObject', sig)
 
     docstring_style = _infer_docstring_style(doc) if docstring_format == 'auto' else docstring_format
     docstring = Docstring(
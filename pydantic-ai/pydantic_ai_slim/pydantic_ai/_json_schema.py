@@ -1,10 +1,13 @@
 from __future__ import annotations as _annotations
 
+import json
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Literal
+from typing import Any, Literal, NamedTuple
 
 from .exceptions import UserError
 
@@ -188,3 +191,71 @@ class InlineDefsJsonSchemaTransformer(JsonSchemaTransformer):
 
     def transform(self, schema: JsonSchema) -> JsonSchema:
         return schema
+
+
+class JsonSchemaTransformCacheInfo(NamedTuple):
+    """Statistics about a [`JsonSchemaTransformCache`][pydantic_ai._json_schema.JsonSchemaTransformCache]."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class JsonSchemaTransformCache:
+    """A bounded LRU cache of JSON schemas walked by a [`JsonSchemaTransformer`][pydantic_ai._json_schema.JsonSchemaTransformer].
+
+    Entries are keyed by the transformer class, the `strict` flag and the serialized schema, so tool definitions
+    that don't change between run steps are only transformed once. The cached schemas are shared between callers
+    and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[tuple[type[JsonSchemaTransformer], bool | None, str], tuple[JsonSchema, bool]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def transform(
+        self, transformer: type[JsonSchemaTransformer], schema: JsonSchema, *, strict: bool | None
+    ) -> tuple[JsonSchema, bool]:
+        """Walk `schema` with `transformer`, returning the transformed schema and whether it is strict-compatible."""
+        try:
+            key = (transformer, strict, json.dumps(schema))
+        except (TypeError, ValueError):  # pragma: no cover
+            # Not JSON serializable, so we can't key on it
+            return self._transform(transformer, schema, strict=strict)
+
+        with self._lock:
+            if (cached := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        result = self._transform(transformer, schema, strict=strict)
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return result
+
+    def cache_info(self) -> JsonSchemaTransformCacheInfo:
+        return JsonSchemaTransformCacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def _transform(
+        transformer: type[JsonSchemaTransformer], schema: JsonSchema, *, strict: bool | None
+    ) -> tuple[JsonSchema, bool]:
+        # `$defs` are handled in place, so we copy the schema to not modify one that's in the cache
+        schema_transformer = transformer(deepcopy(schema), strict=strict)
+        return schema_transformer.walk(), schema_transformer.is_strict_compatible
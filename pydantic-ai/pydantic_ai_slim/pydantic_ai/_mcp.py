@@ -93,6 +93,9 @@ def map_from_pai_messages(pai_messages: list[messages.ModelMessage]) -> tuple[st
                                         mimeType=chunk.media_type,
                                     ),
                                 )
+                            elif isinstance(chunk, messages.CachePoint):
+                                # MCP sampling has no notion of prompt caching
+                                pass
                             # TODO(Marcelo): Add support for audio content.
                             else:
                                 raise NotImplementedError(f'Unsupported content type: {type(chunk)}')
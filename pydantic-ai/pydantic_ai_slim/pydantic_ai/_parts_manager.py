@@ -58,6 +58,13 @@ class ModelResponsePartsManager:
     """A list of parts (text or tool calls) that make up the current state of the model's response."""
     _vendor_id_to_part_index: dict[VendorId, int] = field(default_factory=dict, init=False)
     """Maps a vendor's "part" ID (if provided) to the index in `_parts` where that part resides."""
+    _pending_content: dict[int, list[str]] = field(default_factory=dict, init=False)
+    """Maps the index of a part in `_parts` to string deltas that haven't been applied to it yet.
+
+    These are content deltas for `TextPart`s and `ThinkingPart`s, and JSON args deltas for tool call parts.
+    Concatenating every delta onto the part as it comes in would make streaming a long response quadratic,
+    so the chunks are only joined when the parts are requested.
+    """
 
     def get_parts(self) -> list[ModelResponsePart]:
         """Return only model response parts that are complete (i.e., not ToolCallPartDelta's).
@@ -65,8 +72,25 @@ class ModelResponsePartsManager:
         Returns:
             A list of ModelResponsePart objects. ToolCallPartDelta objects are excluded.
         """
+        for part_index in list(self._pending_content):
+            self._apply_pending_content(part_index)
         return [p for p in self._parts if not isinstance(p, ToolCallPartDelta)]
 
+    def _apply_pending_content(self, part_index: int) -> None:
+        chunks = self._pending_content.pop(part_index, None)
+        if chunks is None:
+            return
+        part = self._parts[part_index]
+        if isinstance(part, TextPart | ThinkingPart):
+            self._parts[part_index] = replace(part, content=part.content + ''.join(chunks))
+        else:
+            assert isinstance(part, ToolCallPart | BuiltinToolCallPart) and isinstance(part.args, str)
+            self._parts[part_index] = replace(part, args=part.args + ''.join(chunks))
+
+    def _append_content(self, part_index: int, content: str) -> None:
+        if content:
+            self._pending_content.setdefault(part_index, []).append(content)
+
     def handle_text_delta(
         self,
         *,
@@ -147,9 +171,9 @@ class ModelResponsePartsManager:
             return PartStartEvent(index=new_part_index, part=part)
         else:
             # Update the existing TextPart with the new content delta
-            existing_text_part, part_index = existing_text_part_and_index
+            _, part_index = existing_text_part_and_index
             part_delta = TextPartDelta(content_delta=content)
-            self._parts[part_index] = part_delta.apply(existing_text_part)
+            self._append_content(part_index, content)
             return PartDeltaEvent(index=part_index, delta=part_delta)
 
     def handle_thinking_delta(
@@ -218,7 +242,10 @@ class ModelResponsePartsManager:
                 part_delta = ThinkingPartDelta(
                     content_delta=content, signature_delta=signature, provider_name=provider_name
                 )
-                self._parts[part_index] = part_delta.apply(existing_thinking_part)
+                if signature is not None or provider_name is not None:
+                    self._parts[part_index] = replace(part_delta, content_delta=None).apply(existing_thinking_part)
+                if content is not None:
+                    self._append_content(part_index, content)
                 return PartDeltaEvent(index=part_index, delta=part_delta)
             else:
                 raise UnexpectedModelBehavior('Cannot update a ThinkingPart with no content or signature')
@@ -293,6 +320,20 @@ class ModelResponsePartsManager:
             # Update the existing part or delta with the new information
             existing_part, part_index = existing_matching_part_and_index
             delta = ToolCallPartDelta(tool_name_delta=tool_name, args_delta=args, tool_call_id=tool_call_id)
+            if (
+                isinstance(existing_part, ToolCallPart | BuiltinToolCallPart)
+                and isinstance(existing_part.args, str)
+                and isinstance(args, str)
+                and tool_name is None
+                and tool_call_id is None
+            ):
+                # This only extends the JSON args, which we join lazily like text content
+                self._append_content(part_index, args)
+                return PartDeltaEvent(index=part_index, delta=replace(delta, tool_call_id=existing_part.tool_call_id))
+
+            self._apply_pending_content(part_index)
+            existing_part = self._parts[part_index]
+            assert isinstance(existing_part, ToolCallPartDelta | ToolCallPart | BuiltinToolCallPart)
             updated_part = delta.apply(existing_part)
             self._parts[part_index] = updated_part
             if isinstance(updated_part, ToolCallPart | BuiltinToolCallPart):
@@ -346,6 +387,7 @@ class ModelResponsePartsManager:
             if maybe_part_index is not None and isinstance(self._parts[maybe_part_index], ToolCallPart):
                 new_part_index = maybe_part_index
                 self._parts[new_part_index] = new_part
+                self._pending_content.pop(new_part_index, None)
             else:
                 new_part_index = len(self._parts)
                 self._parts.append(new_part)
@@ -379,6 +421,7 @@ class ModelResponsePartsManager:
             if maybe_part_index is not None and isinstance(self._parts[maybe_part_index], type(part)):
                 new_part_index = maybe_part_index
                 self._parts[new_part_index] = part
+                self._pending_content.pop(new_part_index, None)
             else:
                 new_part_index = len(self._parts)
                 self._parts.append(part)
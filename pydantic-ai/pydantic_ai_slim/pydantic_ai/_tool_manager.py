@@ -35,6 +35,8 @@ class ToolManager(Generic[AgentDepsT]):
     """The cached tools for this run step."""
     failed_tools: set[str] = field(default_factory=set)
     """Names of tools that failed in this run step."""
+    max_concurrency: int | None = None
+    """The maximum number of tool calls to run concurrently in this run step, or `None` for no limit."""
 
     @classmethod
     @contextmanager
@@ -62,6 +64,7 @@ class ToolManager(Generic[AgentDepsT]):
             toolset=self.toolset,
             ctx=ctx,
             tools=await self.toolset.get_tools(ctx),
+            max_concurrency=self.max_concurrency,
         )
 
     @property
@@ -0,0 +1,140 @@
+from __future__ import annotations as _annotations
+
+import hashlib
+import inspect
+import json
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, get_args
+
+import pydantic
+from pydantic._internal import _typing_extra
+from pydantic.json_schema import GenerateJsonSchema
+
+from ._utils import atomic_write
+
+if TYPE_CHECKING:
+    from .tools import DocstringFormat, ObjectJsonSchema
+
+__all__ = ('ToolSchemaCache',)
+
+
+class ToolSchemaCache:
+    """A persistent cache of the JSON schemas and descriptions generated for [function tools][pydantic_ai.tools.Tool].
+
+    Generating a tool's schema means building a Pydantic schema and validator for its parameters and parsing its
+    docstring, which adds up when an agent registers many tools at process start. With a cache set as
+    [`pydantic_ai.tools.tool_schema_cache`][pydantic_ai.tools.tool_schema_cache], a tool's definition is read from
+    the cache the first time it's sent to a model, and the validator for its arguments is only built once the model
+    calls it.
+
+    Entries are keyed by the function's qualified name, name and docstring, its signature and resolved type hints, the source files of the
+    modules defining the function and the types in its signature, the schema options, and the Pydantic and Pydantic AI
+    versions. Changes to types that are only referenced indirectly, e.g. by a field of a model defined in another
+    module, are not detected, so clear the cache when deploying changes like that.
+    """
+
+    def __init__(self, directory: Path | str):
+        """Create a tool schema cache.
+
+        Args:
+            directory: The directory to store cache entries in. It's created if it doesn't exist yet.
+        """
+        self.directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+        self._file_digests: dict[str, bytes] = {}
+
+    def key(
+        self,
+        function: Callable[..., Any],
+        *,
+        schema_generator: type[GenerateJsonSchema],
+        takes_ctx: bool,
+        docstring_format: DocstringFormat,
+        require_parameter_descriptions: bool,
+    ) -> str | None:
+        """Build the cache key for a tool function, or return `None` if it can't be cached reliably."""
+        qualname = getattr(function, '__qualname__', None)
+        module = sys.modules.get(getattr(function, '__module__', None) or '')
+        source_file = getattr(module, '__file__', None)
+        if qualname is None or source_file is None:
+            return None
+        try:
+            sig = inspect.signature(function)
+            type_hints = _typing_extra.get_function_type_hints(function)
+        except (ValueError, TypeError, NameError):
+            return None
+
+        from . import __version__
+
+        code = getattr(function, '__code__', None)
+        digest = hashlib.sha256()
+        header = [
+            __version__,
+            pydantic.VERSION,
+            function.__module__,
+            qualname,
+            getattr(function, '__name__', None),
+            inspect.getdoc(function),
+            getattr(code, 'co_firstlineno', None),
+            str(sig),
+            repr(type_hints),
+            f'{schema_generator.__module__}.{schema_generator.__qualname__}',
+            takes_ctx,
+            docstring_format,
+            require_parameter_descriptions,
+        ]
+        digest.update(json.dumps(header).encode())
+        for path in sorted({source_file, *_type_source_files(type_hints.values())}):
+            digest.update(self._file_digest(path))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> tuple[str | None, ObjectJsonSchema] | None:
+        """Return the cached description and parameters JSON schema for `key`, if any."""
+        try:
+            entry = json.loads((self.directory / f'{key}.json').read_bytes())
+            definition = entry['description'], entry['parameters_json_schema']
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return definition
+
+    def set(self, key: str, description: str | None, parameters_json_schema: ObjectJsonSchema) -> None:
+        """Store the description and parameters JSON schema generated for `key`."""
+        entry = {'description': description, 'parameters_json_schema': parameters_json_schema}
+        try:
+            atomic_write(self.directory / f'{key}.json', json.dumps(entry).encode())
+        except OSError:  # pragma: no cover
+            pass
+
+    def clear(self) -> None:
+        """Delete all cache entries and reset the statistics."""
+        for path in self.directory.glob('*.json'):
+            path.unlink(missing_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def _file_digest(self, path: str) -> bytes:
+        if (file_digest := self._file_digests.get(path)) is None:
+            try:
+                file_digest = hashlib.sha256(Path(path).read_bytes()).digest()
+            except OSError:  # pragma: no cover
+                file_digest = b''
+            self._file_digests[path] = file_digest
+        return file_digest
+
+
+def _type_source_files(types: Any) -> set[str]:
+    """The source files of the modules defining the given types and their type arguments."""
+    files: set[str] = set()
+    stack = list(types)
+    while stack:
+        tp = stack.pop()
+        stack.extend(get_args(tp))
+        module = sys.modules.get(getattr(tp, '__module__', None) or '')
+        if (file := getattr(module, '__file__', None)) is not None:
+            files.add(file)
+    return files
@@ -6,8 +6,11 @@ for building interactive AI applications with streaming event-based communicatio
 
 from __future__ import annotations
 
+import hashlib
 import json
 import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping, Sequence
 from dataclasses import Field, dataclass, field, replace
 from http import HTTPStatus
@@ -19,10 +22,12 @@ from typing import (
     Protocol,
     TypeAlias,
     TypeVar,
+    cast,
     runtime_checkable,
 )
 
-from pydantic import BaseModel, ValidationError
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from . import _utils
 from ._agent_graph import CallToolsNode, ModelRequestNode
@@ -114,6 +119,9 @@ __all__ = [
     'StateDeps',
     'StateHandler',
     'AGUIApp',
+    'AGUISession',
+    'AGUISessionStore',
+    'InMemoryAGUISessionStore',
     'OnCompleteFunc',
     'handle_ag_ui_request',
     'run_ag_ui',
@@ -127,6 +135,69 @@ OnCompleteFunc: TypeAlias = Callable[[AgentRunResult[Any]], None] | Callable[[Ag
 
 _BUILTIN_TOOL_CALL_ID_PREFIX: Final[str] = 'pyd_ai_builtin'
 
+_messages_ta: TypeAdapter[list[Message]] = TypeAdapter(list[Message])
+
+
+@dataclass
+class AGUISession:
+    """The message history of an AG-UI thread, converted to Pydantic AI messages and kept by an [`AGUISessionStore`][pydantic_ai.ag_ui.AGUISessionStore]."""
+
+    message_count: int
+    """The number of AG-UI messages that were converted."""
+    history_hash: str
+    """A rolling hash of the AG-UI messages that were converted, used to detect when the client's history diverges."""
+    messages: list[ModelMessage]
+    """The converted messages."""
+    tool_names: dict[str, str]
+    """The names of the tools called in the history by tool call ID, needed to convert tool results in later messages."""
+
+
+class AGUISessionStore(ABC):
+    """Storage for [`AGUISession`][pydantic_ai.ag_ui.AGUISession]s, keyed by AG-UI thread ID.
+
+    AG-UI clients send the entire message history with every request. With a session store, only the messages that
+    were added since the previous request in a thread are validated and converted, as long as the client's history
+    still starts with the messages that were converted before.
+
+    Implement this to keep sessions in a shared backend, like a database or cache server, when running multiple
+    server processes.
+    """
+
+    @abstractmethod
+    async def get(self, thread_id: str) -> AGUISession | None:
+        """Return the session for a thread, or `None` if there is none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, thread_id: str, session: AGUISession) -> None:
+        """Store the session for a thread, replacing any previous one."""
+        raise NotImplementedError
+
+
+class InMemoryAGUISessionStore(AGUISessionStore):
+    """An [`AGUISessionStore`][pydantic_ai.ag_ui.AGUISessionStore] that keeps the most recently used sessions in memory."""
+
+    def __init__(self, max_sessions: int = 1000):
+        """Create an in-memory session store.
+
+        Args:
+            max_sessions: The maximum number of sessions to keep. The least recently used session is evicted first.
+        """
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, AGUISession] = OrderedDict()
+
+    async def get(self, thread_id: str) -> AGUISession | None:
+        session = self._sessions.get(thread_id)
+        if session is not None:
+            self._sessions.move_to_end(thread_id)
+        return session
+
+    async def set(self, thread_id: str, session: AGUISession) -> None:
+        self._sessions[thread_id] = session
+        self._sessions.move_to_end(thread_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
 
 class AGUIApp(Generic[AgentDepsT, OutputDataT], Starlette):
     """ASGI application for running Pydantic AI agents with AG-UI protocol support."""
@@ -144,6 +215,8 @@ class AGUIApp(Generic[AgentDepsT, OutputDataT], Starlette):
         usage: RunUsage | None = None,
         infer_name: bool = True,
         toolsets: Sequence[AbstractToolset[AgentDepsT]] | None = None,
+        # AG-UI parameters.
+        session_store: AGUISessionStore | None = None,
         # Starlette parameters.
         debug: bool = False,
         routes: Sequence[BaseRoute] | None = None,
@@ -175,6 +248,9 @@ class AGUIApp(Generic[AgentDepsT, OutputDataT], Starlette):
             infer_name: Whether to try to infer the agent name from the call frame if it's not set.
             toolsets: Optional additional toolsets for this run.
 
+            session_store: Optional store for the converted message history of each AG-UI thread, so that only new
+                messages are validated and converted on each request.
+
             debug: Boolean indicating if debug tracebacks should be returned on errors.
             routes: A list of routes to serve incoming HTTP and WebSocket requests.
             middleware: A list of middleware to run for every request. A starlette application will always
@@ -216,6 +292,7 @@ class AGUIApp(Generic[AgentDepsT, OutputDataT], Starlette):
                 usage=usage,
                 infer_name=infer_name,
                 toolsets=toolsets,
+                session_store=session_store,
             )
 
         self.router.add_route('/', endpoint, methods=['POST'], name='run_agent')
@@ -234,6 +311,7 @@ async def handle_ag_ui_request(
     infer_name: bool = True,
     toolsets: Sequence[AbstractToolset[AgentDepsT]] | None = None,
     on_complete: OnCompleteFunc | None = None,
+    session_store: AGUISessionStore | None = None,
 ) -> Response:
     """Handle an AG-UI request by running the agent and returning a streaming response.
 
@@ -252,13 +330,19 @@ async def handle_ag_ui_request(
         toolsets: Optional additional toolsets for this run.
         on_complete: Optional callback function called when the agent run completes successfully.
             The callback receives the completed [`AgentRunResult`][pydantic_ai.agent.AgentRunResult] and can access `all_messages()` and other result data.
+        session_store: Optional store for the converted message history of each AG-UI thread, so that only messages
+            that are new since the previous request in the thread are validated and converted.
 
     Returns:
         A streaming Starlette response with AG-UI protocol events.
     """
     accept = request.headers.get('accept', SSE_CONTENT_TYPE)
     try:
-        input_data = RunAgentInput.model_validate(await request.json())
+        if session_store is None:
+            input_data = RunAgentInput.model_validate(await request.json())
+            history = None
+        else:
+            input_data, history = await _validate_with_session(await request.body(), session_store)
     except ValidationError as e:  # pragma: no cover
         return Response(
             content=json.dumps(e.json()),
@@ -267,9 +351,10 @@ async def handle_ag_ui_request(
         )
 
     return StreamingResponse(
-        run_ag_ui(
+        _run_ag_ui(
             agent,
             input_data,
+            history,
             accept,
             output_type=output_type,
             model=model,
@@ -280,6 +365,7 @@ async def handle_ag_ui_request(
             infer_name=infer_name,
             toolsets=toolsets,
             on_complete=on_complete,
+            session_store=session_store,
         ),
         media_type=accept,
     )
@@ -299,6 +385,7 @@ async def run_ag_ui(
     infer_name: bool = True,
     toolsets: Sequence[AbstractToolset[AgentDepsT]] | None = None,
     on_complete: OnCompleteFunc | None = None,
+    session_store: AGUISessionStore | None = None,
 ) -> AsyncIterator[str]:
     """Run the agent with the AG-UI run input and stream AG-UI protocol events.
 
@@ -318,10 +405,49 @@ async def run_ag_ui(
         toolsets: Optional additional toolsets for this run.
         on_complete: Optional callback function called when the agent run completes successfully.
             The callback receives the completed [`AgentRunResult`][pydantic_ai.agent.AgentRunResult] and can access `all_messages()` and other result data.
+        session_store: Optional store for the converted message history of each AG-UI thread, so that only messages
+            that are new since the previous request in the thread are converted.
 
     Yields:
         Streaming event chunks encoded as strings according to the accept header value.
     """
+    async for chunk in _run_ag_ui(
+        agent,
+        run_input,
+        None,
+        accept,
+        output_type=output_type,
+        model=model,
+        deps=deps,
+        model_settings=model_settings,
+        usage_limits=usage_limits,
+        usage=usage,
+        infer_name=infer_name,
+        toolsets=toolsets,
+        on_complete=on_complete,
+        session_store=session_store,
+    ):
+        yield chunk
+
+
+async def _run_ag_ui(
+    agent: AbstractAgent[AgentDepsT, Any],
+    run_input: RunAgentInput,
+    history: _SessionHistory | None,
+    accept: str,
+    *,
+    output_type: OutputSpec[Any] | None,
+    model: Model | KnownModelName | str | None,
+    deps: AgentDepsT,
+    model_settings: ModelSettings | None,
+    usage_limits: UsageLimits | None,
+    usage: RunUsage | None,
+    infer_name: bool,
+    toolsets: Sequence[AbstractToolset[AgentDepsT]] | None,
+    on_complete: OnCompleteFunc | None,
+    session_store: AGUISessionStore | None,
+) -> AsyncIterator[str]:
+    """Run the agent like `run_ag_ui`, with the messages already validated against the thread's session if `history` is provided."""
     encoder = EventEncoder(accept=accept)
     if run_input.tools:
         # AG-UI tools can't be prefixed as that would result in a mismatch between the tool names in the
@@ -338,7 +464,20 @@ async def run_ag_ui(
             ),
         )
 
-        if not run_input.messages:
+        if session_store is None:
+            messages = _messages_from_ag_ui(run_input.messages)
+        else:
+            if history is None:
+                session = await session_store.get(run_input.thread_id)
+                history = _SessionHistory.build(
+                    session,
+                    run_input.messages,
+                    lambda message: message.model_dump_json(by_alias=True, exclude_none=True).encode(),
+                    list,
+                )
+            messages = await history.convert(session_store, run_input.thread_id)
+
+        if not messages:
             raise _NoMessagesError
 
         raw_state: dict[str, Any] = run_input.state or {}
@@ -360,8 +499,6 @@ async def run_ag_ui(
             # `deps` not being a `StateHandler` is OK if there is no state.
             pass
 
-        messages = _messages_from_ag_ui(run_input.messages)
-
         async with agent.iter(
             user_prompt=None,
             output_type=[output_type or agent.output_type, DeferredToolRequests],
@@ -597,30 +734,50 @@ async def _handle_tool_result_event(
 
 def _messages_from_ag_ui(messages: list[Message]) -> list[ModelMessage]:
     """Convert a AG-UI history to a Pydantic AI one."""
-    result: list[ModelMessage] = []
-    tool_calls: dict[str, str] = {}  # Tool call ID to tool name mapping.
-    request_parts: list[ModelRequestPart] | None = None
-    response_parts: list[ModelResponsePart] | None = None
+    converter = _MessagesConverter()
     for msg in messages:
+        converter.add(msg)
+    return converter.messages
+
+
+class _MessagesConverter:
+    """Converts AG-UI messages to Pydantic AI ones, optionally continuing a previously converted history."""
+
+    def __init__(self, messages: Sequence[ModelMessage] = (), tool_names: Mapping[str, str] | None = None):
+        self.messages: list[ModelMessage] = list(messages)
+        self.tool_names: dict[str, str] = dict(tool_names or {})  # Tool call ID to tool name mapping.
+        self._request_parts: list[ModelRequestPart] | None = None
+        self._response_parts: list[ModelResponsePart] | None = None
+        if self.messages:
+            # Later messages may be merged into the last one, so work on a copy to leave the original untouched.
+            last_message = self.messages[-1]
+            if isinstance(last_message, ModelRequest):
+                self._request_parts = list(last_message.parts)
+                self.messages[-1] = replace(last_message, parts=self._request_parts)
+            else:
+                self._response_parts = list(last_message.parts)
+                self.messages[-1] = replace(last_message, parts=self._response_parts)
+
+    def add(self, msg: Message) -> None:
         if isinstance(msg, UserMessage | SystemMessage | DeveloperMessage) or (
             isinstance(msg, ToolMessage) and not msg.tool_call_id.startswith(_BUILTIN_TOOL_CALL_ID_PREFIX)
         ):
-            if request_parts is None:
-                request_parts = []
-                result.append(ModelRequest(parts=request_parts))
-                response_parts = None
+            if self._request_parts is None:
+                self._request_parts = []
+                self.messages.append(ModelRequest(parts=self._request_parts))
+                self._response_parts = None
 
             if isinstance(msg, UserMessage):
-                request_parts.append(UserPromptPart(content=msg.content))
+                self._request_parts.append(UserPromptPart(content=msg.content))
             elif isinstance(msg, SystemMessage | DeveloperMessage):
-                request_parts.append(SystemPromptPart(content=msg.content))
+                self._request_parts.append(SystemPromptPart(content=msg.content))
             else:
                 tool_call_id = msg.tool_call_id
-                tool_name = tool_calls.get(tool_call_id)
+                tool_name = self.tool_names.get(tool_call_id)
                 if tool_name is None:  # pragma: no cover
                     raise _ToolCallNotFoundError(tool_call_id=tool_call_id)
 
-                request_parts.append(
+                self._request_parts.append(
                     ToolReturnPart(
                         tool_name=tool_name,
                         content=msg.content,
@@ -631,24 +788,24 @@ def _messages_from_ag_ui(messages: list[Message]) -> list[ModelMessage]:
         elif isinstance(msg, AssistantMessage) or (  # pragma: no branch
             isinstance(msg, ToolMessage) and msg.tool_call_id.startswith(_BUILTIN_TOOL_CALL_ID_PREFIX)
         ):
-            if response_parts is None:
-                response_parts = []
-                result.append(ModelResponse(parts=response_parts))
-                request_parts = None
+            if self._response_parts is None:
+                self._response_parts = []
+                self.messages.append(ModelResponse(parts=self._response_parts))
+                self._request_parts = None
 
             if isinstance(msg, AssistantMessage):
                 if msg.content:
-                    response_parts.append(TextPart(content=msg.content))
+                    self._response_parts.append(TextPart(content=msg.content))
 
                 if msg.tool_calls:
                     for tool_call in msg.tool_calls:
                         tool_call_id = tool_call.id
                         tool_name = tool_call.function.name
-                        tool_calls[tool_call_id] = tool_name
+                        self.tool_names[tool_call_id] = tool_name
 
                         if tool_call_id.startswith(_BUILTIN_TOOL_CALL_ID_PREFIX):
                             _, provider_name, tool_call_id = tool_call_id.split('|', 2)
-                            response_parts.append(
+                            self._response_parts.append(
                                 BuiltinToolCallPart(
                                     tool_name=tool_name,
                                     args=tool_call.function.arguments,
@@ -657,7 +814,7 @@ def _messages_from_ag_ui(messages: list[Message]) -> list[ModelMessage]:
                                 )
                             )
                         else:
-                            response_parts.append(
+                            self._response_parts.append(
                                 ToolCallPart(
                                     tool_name=tool_name,
                                     tool_call_id=tool_call_id,
@@ -666,12 +823,12 @@ def _messages_from_ag_ui(messages: list[Message]) -> list[ModelMessage]:
                             )
             else:
                 tool_call_id = msg.tool_call_id
-                tool_name = tool_calls.get(tool_call_id)
+                tool_name = self.tool_names.get(tool_call_id)
                 if tool_name is None:  # pragma: no cover
                     raise _ToolCallNotFoundError(tool_call_id=tool_call_id)
                 _, provider_name, tool_call_id = tool_call_id.split('|', 2)
 
-                response_parts.append(
+                self._response_parts.append(
                     BuiltinToolReturnPart(
                         tool_name=tool_name,
                         content=msg.content,
@@ -680,7 +837,94 @@ def _messages_from_ag_ui(messages: list[Message]) -> list[ModelMessage]:
                     )
                 )
 
-    return result
+
+async def _validate_with_session(
+    body: bytes, session_store: AGUISessionStore
+) -> tuple[RunAgentInput, _SessionHistory | None]:
+    """Validate a run input, only validating the messages that aren't in the thread's session yet."""
+    data = pydantic_core.from_json(body)
+    raw_messages = cast(dict[str, Any], data).get('messages') if isinstance(data, dict) else None
+    if not isinstance(raw_messages, list):
+        return RunAgentInput.model_validate(data), None
+
+    run_input = RunAgentInput.model_validate({**cast(dict[str, Any], data), 'messages': []})
+    session = await session_store.get(run_input.thread_id)
+    history = _SessionHistory.build(
+        session, cast(list[Any], raw_messages), pydantic_core.to_json, _messages_ta.validate_python
+    )
+    return run_input, history
+
+
+_MessageT = TypeVar('_MessageT')
+
+
+@dataclass
+class _SessionHistory:
+    """The AG-UI messages of a run input, split into the ones already converted in the thread's session and new ones."""
+
+    session: AGUISession | None
+    """The session to continue from, or `None` if all messages need to be converted."""
+    new_messages: list[Message]
+    message_count: int
+    history_hash: str
+
+    @classmethod
+    def build(
+        cls,
+        session: AGUISession | None,
+        messages: Sequence[_MessageT],
+        dump: Callable[[_MessageT], bytes],
+        validate: Callable[[Sequence[_MessageT]], list[Message]],
+    ) -> _SessionHistory:
+        """Split AG-UI messages into the ones in `session` and new ones, only validating the new ones.
+
+        Every message is still hashed to check that the client's history starts with the messages in the session.
+        If the history diverged, e.g. because a message was edited, the session is discarded.
+        """
+        known_count = session.message_count if session is not None else 0
+        history_hash = hashlib.sha256()
+        known_hash: str | None = None
+        for i, message in enumerate(messages):
+            data = dump(message)
+            history_hash.update(len(data).to_bytes(8, 'big'))
+            history_hash.update(data)
+            if i + 1 == known_count:
+                known_hash = history_hash.hexdigest()
+
+        if session is not None and known_hash == session.history_hash:
+            new_messages = messages[known_count:]
+        else:
+            session = None
+            new_messages = messages
+        return cls(
+            session=session,
+            new_messages=validate(new_messages),
+            message_count=len(messages),
+            history_hash=history_hash.hexdigest(),
+        )
+
+    async def convert(self, session_store: AGUISessionStore, thread_id: str) -> list[ModelMessage]:
+        """Convert the new messages, continuing from the session, and store the result as the thread's new session."""
+        if self.session is not None:
+            if not self.new_messages:
+                return list(self.session.messages)
+            converter = _MessagesConverter(self.session.messages, self.session.tool_names)
+        else:
+            converter = _MessagesConverter()
+
+        for msg in self.new_messages:
+            converter.add(msg)
+
+        await session_store.set(
+            thread_id,
+            AGUISession(
+                message_count=self.message_count,
+                history_hash=self.history_hash,
+                messages=converter.messages,
+                tool_names=converter.tool_names,
+            ),
+        )
+        return list(converter.messages)
 
 
 @runtime_checkable
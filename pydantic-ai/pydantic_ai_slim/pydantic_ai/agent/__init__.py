@@ -32,6 +32,7 @@ from .._agent_graph import (
     HistoryProcessor,
     ModelRequestNode,
     UserPromptNode,
+    append_only_history_processor,
     capture_run_messages,
 )
 from .._output import OutputToolset
@@ -75,6 +76,7 @@ __all__ = (
     'AgentRun',
     'AgentRunResult',
     'capture_run_messages',
+    'append_only_history_processor',
     'EndStrategy',
     'CallToolsNode',
     'ModelRequestNode',
@@ -118,6 +120,9 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
     end_strategy: EndStrategy
     """Strategy for handling tool calls when a final result is found."""
 
+    max_concurrent_tool_calls: int | None
+    """The maximum number of tool calls from a single model response to run concurrently, or `None` for no limit."""
+
     model_settings: ModelSettings | None
     """Optional model request settings to use for this agents's runs, by default.
 
@@ -175,6 +180,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         toolsets: Sequence[AbstractToolset[AgentDepsT] | ToolsetFunc[AgentDepsT]] | None = None,
         defer_model_check: bool = False,
         end_strategy: EndStrategy = 'early',
+        max_concurrent_tool_calls: int | None = None,
         instrument: InstrumentationSettings | bool | None = None,
         history_processors: Sequence[HistoryProcessor[AgentDepsT]] | None = None,
         event_stream_handler: EventStreamHandler[AgentDepsT] | None = None,
@@ -201,6 +207,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         mcp_servers: Sequence[MCPServer] = (),
         defer_model_check: bool = False,
         end_strategy: EndStrategy = 'early',
+        max_concurrent_tool_calls: int | None = None,
         instrument: InstrumentationSettings | bool | None = None,
         history_processors: Sequence[HistoryProcessor[AgentDepsT]] | None = None,
         event_stream_handler: EventStreamHandler[AgentDepsT] | None = None,
@@ -225,6 +232,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         toolsets: Sequence[AbstractToolset[AgentDepsT] | ToolsetFunc[AgentDepsT]] | None = None,
         defer_model_check: bool = False,
         end_strategy: EndStrategy = 'early',
+        max_concurrent_tool_calls: int | None = None,
         instrument: InstrumentationSettings | bool | None = None,
         history_processors: Sequence[HistoryProcessor[AgentDepsT]] | None = None,
         event_stream_handler: EventStreamHandler[AgentDepsT] | None = None,
@@ -270,6 +278,9 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
                 [override the model][pydantic_ai.Agent.override] for testing.
             end_strategy: Strategy for handling tool calls that are requested alongside a final result.
                 See [`EndStrategy`][pydantic_ai.agent.EndStrategy] for more information.
+            max_concurrent_tool_calls: The maximum number of tool calls from a single model response to run concurrently.
+                Calls over the limit wait for a running call to finish before they start. Defaults to `None`, meaning no limit.
+                Individual tools can be limited further using the `max_concurrency` argument of [`Tool`][pydantic_ai.tools.Tool].
             instrument: Set to True to automatically instrument with OpenTelemetry,
                 which will use Logfire if it's configured.
                 Set to an instance of [`InstrumentationSettings`][pydantic_ai.agent.InstrumentationSettings] to customize.
@@ -289,6 +300,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
 
         self._name = name
         self.end_strategy = end_strategy
+        self.max_concurrent_tool_calls = max_concurrent_tool_calls
         self.model_settings = model_settings
 
         self._output_type = output_type
@@ -561,7 +573,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
                 output_toolset.max_retries = self._max_result_retries
                 output_toolset.output_validators = output_validators
         toolset = self._get_toolset(output_toolset=output_toolset, additional_toolsets=toolsets)
-        tool_manager = ToolManager[AgentDepsT](toolset)
+        tool_manager = ToolManager[AgentDepsT](toolset, max_concurrency=self.max_concurrent_tool_calls)
 
         # Build the graph
         graph = _agent_graph.build_agent_graph(self.name, self._deps_type, output_type_)
@@ -1025,6 +1037,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        max_concurrency: int | None = None,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
     ) -> Callable[[ToolFuncContext[AgentDepsT, ToolParams]], ToolFuncContext[AgentDepsT, ToolParams]]: ...
@@ -1043,6 +1056,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        max_concurrency: int | None = None,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
     ) -> Any:
@@ -1091,6 +1105,8 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
             strict: Whether to enforce JSON schema compliance (only affects OpenAI).
                 See [`ToolDefinition`][pydantic_ai.tools.ToolDefinition] for more info.
             sequential: Whether the function requires a sequential/serial execution environment. Defaults to False.
+            max_concurrency: The maximum number of calls to this tool that can run concurrently when the model requests
+                several at once. Defaults to `None`, meaning no limit.
             requires_approval: Whether this tool requires human-in-the-loop approval. Defaults to False.
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
             metadata: Optional metadata for the tool. This is not sent to the model but can be used for filtering and tool behavior customization.
@@ -1112,6 +1128,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
                 schema_generator=schema_generator,
                 strict=strict,
                 sequential=sequential,
+                max_concurrency=max_concurrency,
                 requires_approval=requires_approval,
                 metadata=metadata,
             )
@@ -1136,6 +1153,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        max_concurrency: int | None = None,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
     ) -> Callable[[ToolFuncPlain[ToolParams]], ToolFuncPlain[ToolParams]]: ...
@@ -1154,6 +1172,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        max_concurrency: int | None = None,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
     ) -> Any:
@@ -1202,6 +1221,8 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
             strict: Whether to enforce JSON schema compliance (only affects OpenAI).
                 See [`ToolDefinition`][pydantic_ai.tools.ToolDefinition] for more info.
             sequential: Whether the function requires a sequential/serial execution environment. Defaults to False.
+            max_concurrency: The maximum number of calls to this tool that can run concurrently when the model requests
+                several at once. Defaults to `None`, meaning no limit.
             requires_approval: Whether this tool requires human-in-the-loop approval. Defaults to False.
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
             metadata: Optional metadata for the tool. This is not sent to the model but can be used for filtering and tool behavior customization.
@@ -1221,6 +1242,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
                 schema_generator=schema_generator,
                 strict=strict,
                 sequential=sequential,
+                max_concurrency=max_concurrency,
                 requires_approval=requires_approval,
                 metadata=metadata,
             )
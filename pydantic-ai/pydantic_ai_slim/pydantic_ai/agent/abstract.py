@@ -49,7 +49,7 @@ if TYPE_CHECKING:
     from starlette.routing import BaseRoute, Route
     from starlette.types import ExceptionHandler, Lifespan
 
-    from ..ag_ui import AGUIApp
+    from ..ag_ui import AGUIApp, AGUISessionStore
 
 
 T = TypeVar('T')
@@ -1001,6 +1001,8 @@ class AbstractAgent(Generic[AgentDepsT, OutputDataT], ABC):
         usage: RunUsage | None = None,
         infer_name: bool = True,
         toolsets: Sequence[AbstractToolset[AgentDepsT]] | None = None,
+        # AG-UI
+        session_store: AGUISessionStore | None = None,
         # Starlette
         debug: bool = False,
         routes: Sequence[BaseRoute] | None = None,
@@ -1048,6 +1050,9 @@ class AbstractAgent(Generic[AgentDepsT, OutputDataT], ABC):
             infer_name: Whether to try to infer the agent name from the call frame if it's not set.
             toolsets: Optional additional toolsets for this run.
 
+            session_store: Optional store for the converted message history of each AG-UI thread, so that only new
+                messages are validated and converted on each request.
+
             debug: Boolean indicating if debug tracebacks should be returned on errors.
             routes: A list of routes to serve incoming HTTP and WebSocket requests.
             middleware: A list of middleware to run for every request. A starlette application will always
@@ -1082,6 +1087,8 @@ class AbstractAgent(Generic[AgentDepsT, OutputDataT], ABC):
             usage=usage,
             infer_name=infer_name,
             toolsets=toolsets,
+            # AG-UI
+            session_store=session_store,
             # Starlette
             debug=debug,
             routes=routes,
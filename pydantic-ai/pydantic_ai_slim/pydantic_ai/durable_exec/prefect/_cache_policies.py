@@ -1,12 +1,18 @@
+import hashlib
+import weakref
 from dataclasses import fields, is_dataclass
 from typing import Any, TypeGuard
 
 from prefect.cache_policies import INPUTS, RUN_ID, TASK_SOURCE, CachePolicy
 from prefect.context import TaskRunContext
+from prefect.utilities.hashing import hash_objects
 
-from pydantic_ai import ToolsetTool
+from pydantic_ai import ModelMessage, ModelRequest, ModelResponse, ToolsetTool
 from pydantic_ai.tools import RunContext
 
+_message_digests: dict[int, tuple[weakref.ref[Any], list[tuple[Any, int | None]], str]] = {}
+"""Digests of message objects, keyed by identity, along with the fingerprint of the message they were computed from."""
+
 
 def _is_dict(obj: Any) -> TypeGuard[dict[str, Any]]:
     return isinstance(obj, dict)
@@ -24,6 +30,10 @@ def _is_toolset_tool(obj: Any) -> TypeGuard[ToolsetTool]:
     return isinstance(obj, ToolsetTool)
 
 
+def _is_message_history(obj: Any) -> TypeGuard[list[ModelMessage]]:
+    return _is_list(obj) and bool(obj) and all(isinstance(item, ModelRequest | ModelResponse) for item in obj)
+
+
 def _replace_run_context(
     inputs: dict[str, Any],
 ) -> Any:
@@ -63,6 +73,61 @@ def _strip_timestamps(
     return obj
 
 
+def _message_fingerprint(message: ModelMessage) -> list[tuple[Any, int | None]]:
+    """The field values of a message and its parts, along with the lengths of those that are lists or dicts."""
+    values = [getattr(message, f.name) for f in fields(message)]
+    for part in message.parts:
+        values.extend(getattr(part, f.name) for f in fields(part))
+    return [(value, len(value) if _is_list(value) or _is_dict(value) else None) for value in values]
+
+
+def _message_digest(message: ModelMessage) -> str:
+    """Hash a message with timestamps removed, reusing the digest computed for the same message object before.
+
+    A digest is only reused while the fields of the message and its parts are still the same objects, with the same
+    lengths for lists and dicts, as when it was computed. This check is linear in the number of parts, like hashing,
+    but only compares references and lengths instead of serializing the message. Edits nested inside a list or dict
+    that keep its length, like replacing an item in a `UserPromptPart`'s content, are not picked up.
+    """
+    message_id = id(message)
+    fingerprint = _message_fingerprint(message)
+    entry = _message_digests.get(message_id)
+    if (
+        entry is not None
+        and entry[0]() is message
+        and len(entry[1]) == len(fingerprint)
+        and all(old is new and old_len == new_len for (old, old_len), (new, new_len) in zip(entry[1], fingerprint))
+    ):
+        return entry[2]
+
+    digest = hash_objects(_strip_timestamps(message), raise_on_failure=True)
+    assert digest is not None
+
+    def forget(ref: weakref.ref[Any]) -> None:
+        if (entry := _message_digests.get(message_id)) is not None and entry[0] is ref:
+            del _message_digests[message_id]
+
+    _message_digests[message_id] = (weakref.ref(message, forget), fingerprint, digest)
+    return digest
+
+
+def _replace_message_histories(
+    inputs: dict[str, Any],
+) -> Any:
+    """Replace message histories with a rolling hash over the digests of their messages.
+
+    Each message is only serialized and hashed the first time it's seen, so computing the cache key for the next
+    model request in an agent run only needs to hash the messages that were added since the previous one.
+    """
+    for key, value in inputs.items():
+        if _is_message_history(value):
+            chain = b''
+            for message in value:
+                chain = hashlib.sha256(chain + _message_digest(message).encode()).digest()
+            inputs[key] = {'message_history': chain.hex(), 'length': len(value)}
+    return inputs
+
+
 def _replace_toolsets(
     inputs: dict[str, Any],
 ) -> Any:
@@ -79,6 +144,7 @@ class PrefectAgentInputs(CachePolicy):
 
     Computes a cache key based on inputs, ignoring nested 'timestamp' fields
     and serializing RunContext objects to only include hashable fields.
+    Message histories are hashed incrementally, so each message is only hashed once.
     """
 
     def compute_key(
@@ -93,7 +159,8 @@ class PrefectAgentInputs(CachePolicy):
             return None
 
         inputs_without_toolsets = _replace_toolsets(inputs)
-        inputs_with_hashable_context = _replace_run_context(inputs_without_toolsets)
+        inputs_with_hashed_messages = _replace_message_histories(inputs_without_toolsets)
+        inputs_with_hashable_context = _replace_run_context(inputs_with_hashed_messages)
         filtered_inputs = _strip_timestamps(inputs_with_hashable_context)
 
         return INPUTS.compute_key(task_ctx, filtered_inputs, flow_parameters, **kwargs)
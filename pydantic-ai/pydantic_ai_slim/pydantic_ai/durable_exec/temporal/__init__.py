@@ -24,6 +24,7 @@ from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner
 from ...exceptions import UserError
 from ._agent import TemporalAgent
 from ._logfire import LogfirePlugin
+from ._message_store import FileMessageStore, MessageStore
 from ._run_context import TemporalRunContext
 from ._toolset import TemporalWrapperToolset
 
@@ -34,6 +35,8 @@ __all__ = [
     'AgentPlugin',
     'TemporalRunContext',
     'TemporalWrapperToolset',
+    'MessageStore',
+    'FileMessageStore',
 ]
 
 # We need eagerly import the anyio backends or it will happens inside workflow code and temporal has issues
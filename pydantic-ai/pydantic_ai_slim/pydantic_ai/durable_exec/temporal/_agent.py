@@ -39,6 +39,7 @@ from pydantic_ai.tools import (
     ToolFuncEither,
 )
 
+from ._message_store import MessageStore
 from ._model import TemporalModel
 from ._run_context import TemporalRunContext
 from ._toolset import TemporalWrapperToolset, temporalize_toolset
@@ -74,6 +75,7 @@ class TemporalAgent(WrapperAgent[AgentDepsT, OutputDataT]):
             ],
             AbstractToolset[AgentDepsT],
         ] = temporalize_toolset,
+        message_store: MessageStore | None = None,
     ):
         """Wrap an agent to enable it to be used inside a Temporal workflow, by automatically offloading model requests, tool calls, and MCP server communication to Temporal activities.
 
@@ -96,6 +98,8 @@ class TemporalAgent(WrapperAgent[AgentDepsT, OutputDataT]):
             temporalize_toolset_func: Optional function to use to prepare "leaf" toolsets (i.e. those that implement their own tool listing and calling) for Temporal by wrapping them in a `TemporalWrapperToolset` that moves methods that require IO to Temporal activities.
                 If not provided, only `FunctionToolset` and `MCPServer` will be prepared for Temporal.
                 The function takes the toolset, the activity name prefix, the toolset-specific activity config, the tool-specific activity configs and the run context type.
+            message_store: Optional store to offload the message history to, so that model request activities only receive the hashes of messages that were already sent in an earlier request, instead of the full history every time.
+                It needs to be reachable from every worker that runs the model request activities. See [`FileMessageStore`][pydantic_ai.durable_exec.temporal.FileMessageStore].
         """
         super().__init__(wrapped)
 
@@ -160,6 +164,7 @@ class TemporalAgent(WrapperAgent[AgentDepsT, OutputDataT]):
             deps_type=self.deps_type,
             run_context_type=self.run_context_type,
             event_stream_handler=self.event_stream_handler,
+            message_store=message_store,
         )
         activities.extend(temporal_model.temporal_activities)
 
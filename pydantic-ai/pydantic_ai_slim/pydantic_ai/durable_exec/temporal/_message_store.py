@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import anyio.to_thread
+from pydantic import ConfigDict, TypeAdapter
+
+from pydantic_ai import ModelMessage
+from pydantic_ai._utils import atomic_write
+
+__all__ = ('FileMessageStore', 'MessageStore')
+
+_message_ta: TypeAdapter[ModelMessage] = TypeAdapter(
+    ModelMessage, config=ConfigDict(defer_build=True, ser_json_bytes='base64', val_json_bytes='base64')
+)
+
+
+class MessageStore(ABC):
+    """Content-addressed storage for the messages that [`TemporalAgent`][pydantic_ai.durable_exec.temporal.TemporalAgent] offloads from model request activity payloads.
+
+    Each message is stored once under the SHA-256 hash of its serialized form, so model request activities only need
+    to receive the hashes of messages that were already sent in an earlier request. The store needs to be reachable
+    from every worker that runs the agent's model request activities.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the serialized message stored under `key`, or `None` if there is none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes) -> None:
+        """Store a serialized message under `key`, the hash of `data`."""
+        raise NotImplementedError
+
+
+class FileMessageStore(MessageStore):
+    """A [`MessageStore`][pydantic_ai.durable_exec.temporal.MessageStore] that keeps messages as files in a local directory.
+
+    To run model request activities on more than one machine, the directory needs to be on a shared filesystem.
+    The directory is not pruned automatically.
+    """
+
+    def __init__(self, directory: Path | str):
+        """Create a file message store.
+
+        Args:
+            directory: The directory to store messages in. It's created if it doesn't exist yet.
+        """
+        self.directory = Path(directory)
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return await anyio.to_thread.run_sync(self._path(key).read_bytes)
+        except FileNotFoundError:
+            return None
+
+    async def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        if not await anyio.to_thread.run_sync(path.exists):
+            await anyio.to_thread.run_sync(atomic_write, path, data)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+
+def dump_message(message: ModelMessage) -> bytes:
+    return _message_ta.dump_json(message)
+
+
+def load_message(data: bytes) -> ModelMessage:
+    return _message_ta.validate_json(data)
+
+
+def message_key(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Callable
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
@@ -8,6 +10,7 @@ from typing import Any, cast
 
 from pydantic import ConfigDict, with_config
 from temporalio import activity, workflow
+from temporalio.exceptions import ActivityError, ApplicationError
 from temporalio.workflow import ActivityConfig
 
 from pydantic_ai import (
@@ -23,17 +26,69 @@ from pydantic_ai.settings import ModelSettings
 from pydantic_ai.tools import AgentDepsT, RunContext
 from pydantic_ai.usage import RequestUsage
 
+from ._message_store import MessageStore, dump_message, load_message, message_key
 from ._run_context import TemporalRunContext
 
+_MISSING_MESSAGES_ERROR_TYPE = 'MessageStoreMissingMessages'
+
 
 @dataclass
 @with_config(ConfigDict(arbitrary_types_allowed=True))
 class _RequestParams:
-    messages: list[ModelMessage]
+    # When messages are offloaded to a `MessageStore`, messages the store already has are replaced by their keys.
+    messages: list[ModelMessage | str]
     # `model_settings` can't be a `ModelSettings` because Temporal would end up dropping fields only defined on its subclasses.
     model_settings: dict[str, Any] | None
     model_request_parameters: ModelRequestParameters
     serialized_run_context: Any
+    # The keys of the messages included in full, in order, or `None` if messages are not offloaded.
+    new_message_keys: list[str] | None = None
+
+
+class _StoredMessages:
+    """The keys under which message objects in a workflow were written to the message store.
+
+    Messages are tracked by identity, as the same objects are passed to every model request in an agent run, so that
+    entries are dropped along with the messages when the workflow completes. This is rebuilt the same way when a
+    workflow is replayed, as it only changes when a model request activity completes.
+    """
+
+    def __init__(self):
+        self._keys: dict[int, tuple[weakref.ref[Any], str]] = {}
+
+    def get(self, message: ModelMessage) -> str | None:
+        entry = self._keys.get(id(message))
+        if entry is not None and entry[0]() is message:
+            return entry[1]
+        return None
+
+    def add(self, message: ModelMessage, key: str) -> None:
+        message_id = id(message)
+        self._keys[message_id] = (weakref.ref(message, lambda _: self._keys.pop(message_id, None)), key)
+
+    def discard(self, message: ModelMessage) -> None:
+        if self.get(message) is not None:
+            del self._keys[id(message)]
+
+
+class _MessageCache:
+    """An LRU cache of the messages loaded from or written to the message store by model request activities."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._messages: OrderedDict[str, ModelMessage] = OrderedDict()
+
+    def get(self, key: str) -> ModelMessage | None:
+        message = self._messages.get(key)
+        if message is not None:
+            self._messages.move_to_end(key)
+        return message
+
+    def set(self, key: str, message: ModelMessage) -> None:
+        self._messages[key] = message
+        self._messages.move_to_end(key)
+        while len(self._messages) > self.max_size:
+            self._messages.popitem(last=False)
 
 
 class TemporalStreamedResponse(StreamedResponse):
@@ -75,16 +130,21 @@ class TemporalModel(WrapperModel):
         deps_type: type[AgentDepsT],
         run_context_type: type[TemporalRunContext[AgentDepsT]] = TemporalRunContext[AgentDepsT],
         event_stream_handler: EventStreamHandler[Any] | None = None,
+        message_store: MessageStore | None = None,
+        message_cache_size: int = 1000,
     ):
         super().__init__(model)
         self.activity_config = activity_config
         self.run_context_type = run_context_type
         self.event_stream_handler = event_stream_handler
+        self.message_store = message_store
+        self._stored_messages = _StoredMessages()
+        self._message_cache = _MessageCache(message_cache_size)
 
         @activity.defn(name=f'{activity_name_prefix}__model_request')
         async def request_activity(params: _RequestParams) -> ModelResponse:
             return await self.wrapped.request(
-                params.messages,
+                await self._load_messages(params),
                 cast(ModelSettings | None, params.model_settings),
                 params.model_request_parameters,
             )
@@ -97,7 +157,7 @@ class TemporalModel(WrapperModel):
 
             run_context = self.run_context_type.deserialize_run_context(params.serialized_run_context, deps=deps)
             async with self.wrapped.request_stream(
-                params.messages,
+                await self._load_messages(params),
                 cast(ModelSettings | None, params.model_settings),
                 params.model_request_parameters,
                 run_context,
@@ -130,15 +190,13 @@ class TemporalModel(WrapperModel):
 
         self._validate_model_request_parameters(model_request_parameters)
 
-        return await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
-            activity=self.request_activity,
-            arg=_RequestParams(
-                messages=messages,
-                model_settings=cast(dict[str, Any] | None, model_settings),
-                model_request_parameters=model_request_parameters,
-                serialized_run_context=None,
-            ),
-            **self.activity_config,
+        return await self._execute_request_activity(
+            self.request_activity,
+            messages,
+            lambda params: [params],
+            model_settings=model_settings,
+            model_request_parameters=model_request_parameters,
+            serialized_run_context=None,
         )
 
     @asynccontextmanager
@@ -167,22 +225,109 @@ class TemporalModel(WrapperModel):
 
         self._validate_model_request_parameters(model_request_parameters)
 
-        serialized_run_context = self.run_context_type.serialize_run_context(run_context)
-        response = await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
-            activity=self.request_stream_activity,
-            args=[
-                _RequestParams(
-                    messages=messages,
-                    model_settings=cast(dict[str, Any] | None, model_settings),
-                    model_request_parameters=model_request_parameters,
-                    serialized_run_context=serialized_run_context,
-                ),
-                run_context.deps,
-            ],
-            **self.activity_config,
+        response = await self._execute_request_activity(
+            self.request_stream_activity,
+            messages,
+            lambda params: [params, run_context.deps],
+            model_settings=model_settings,
+            model_request_parameters=model_request_parameters,
+            serialized_run_context=self.run_context_type.serialize_run_context(run_context),
         )
         yield TemporalStreamedResponse(model_request_parameters, response)
 
+    async def _execute_request_activity(
+        self,
+        request_activity: Callable[..., Any],
+        messages: list[ModelMessage],
+        build_args: Callable[[_RequestParams], Sequence[Any]],
+        *,
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        serialized_run_context: Any,
+    ) -> ModelResponse:
+        """Execute a model request activity, offloading messages to the message store if one is set."""
+        offloaded_messages: list[ModelMessage | str] = []
+        new_message_keys: list[str] = []
+        new_messages: list[tuple[ModelMessage, str]] = []
+        if self.message_store is not None:
+            for message in messages:
+                # The key is computed every time, as messages from a previous run can be modified when they're reused.
+                key = message_key(dump_message(message))
+                if self._stored_messages.get(message) == key:
+                    offloaded_messages.append(key)
+                else:
+                    offloaded_messages.append(message)
+                    new_message_keys.append(key)
+                    new_messages.append((message, key))
+
+        params = _RequestParams(
+            messages=offloaded_messages if self.message_store is not None else list(messages),
+            model_settings=cast(dict[str, Any] | None, model_settings),
+            model_request_parameters=model_request_parameters,
+            serialized_run_context=serialized_run_context,
+            new_message_keys=new_message_keys if self.message_store is not None else None,
+        )
+        try:
+            response = await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
+                activity=request_activity,
+                args=build_args(params),
+                **self.activity_config,
+            )
+        except ActivityError as e:
+            cause = e.cause
+            if not (isinstance(cause, ApplicationError) and cause.type == _MISSING_MESSAGES_ERROR_TYPE):
+                raise
+            # The store doesn't have messages an earlier activity wrote, e.g. because it ran on another machine
+            # without access to the same store, so send everything again in full.
+            for message in messages:
+                self._stored_messages.discard(message)
+            return await self._execute_request_activity(
+                request_activity,
+                messages,
+                build_args,
+                model_settings=model_settings,
+                model_request_parameters=model_request_parameters,
+                serialized_run_context=serialized_run_context,
+            )
+
+        for message, key in new_messages:
+            self._stored_messages.add(message, key)
+        return response
+
+    async def _load_messages(self, params: _RequestParams) -> list[ModelMessage]:
+        """Rehydrate the messages for a model request activity, storing the messages that were included in full."""
+        if params.new_message_keys is None:
+            return cast(list[ModelMessage], params.messages)
+        assert self.message_store is not None
+
+        new_message_keys = iter(params.new_message_keys)
+        messages: list[ModelMessage] = []
+        missing_keys: list[str] = []
+        for item in params.messages:
+            if isinstance(item, str):
+                message = self._message_cache.get(item)
+                if message is None:
+                    data = await self.message_store.get(item)
+                    if data is None:
+                        missing_keys.append(item)
+                        continue
+                    message = load_message(data)
+                    self._message_cache.set(item, message)
+            else:
+                message = item
+                key = next(new_message_keys)
+                await self.message_store.put(key, dump_message(message))
+                self._message_cache.set(key, message)
+            messages.append(message)
+
+        if missing_keys:
+            raise ApplicationError(
+                f'Messages are missing from the message store: {", ".join(missing_keys)}',
+                type=_MISSING_MESSAGES_ERROR_TYPE,
+                non_retryable=True,
+            )
+        return messages
+
     def _validate_model_request_parameters(self, model_request_parameters: ModelRequestParameters) -> None:
         if model_request_parameters.allow_image_output:
             raise UserError('Image output is not supported with Temporal because of the 2MB payload size limit.')
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 import functools
+import time
 import warnings
 from abc import ABC, abstractmethod
 from asyncio import Lock
@@ -10,7 +11,7 @@ from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontext
 from dataclasses import field, replace
 from datetime import timedelta
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, NamedTuple
 
 import anyio
 import httpx
@@ -34,6 +35,7 @@ try:
     from mcp.shared.context import RequestContext
     from mcp.shared.exceptions import McpError
     from mcp.shared.message import SessionMessage
+    from mcp.shared.session import RequestResponder
 except ImportError as _import_error:
     raise ImportError(
         'Please install the `mcp` package to use the MCP server, '
@@ -43,7 +45,15 @@ except ImportError as _import_error:
 # after mcp imports so any import error maps to this file, not _mcp.py
 from . import _mcp, _utils, exceptions, messages, models
 
-__all__ = 'MCPServer', 'MCPServerStdio', 'MCPServerHTTP', 'MCPServerSSE', 'MCPServerStreamableHTTP', 'load_mcp_servers'
+__all__ = (
+    'MCPServer',
+    'MCPServerStdio',
+    'MCPServerHTTP',
+    'MCPServerSSE',
+    'MCPServerStreamableHTTP',
+    'MCPToolsCacheInfo',
+    'load_mcp_servers',
+)
 
 TOOL_SCHEMA_VALIDATOR = pydantic_core.SchemaValidator(
     schema=pydantic_core.core_schema.dict_schema(
@@ -52,6 +62,17 @@ TOOL_SCHEMA_VALIDATOR = pydantic_core.SchemaValidator(
 )
 
 
+class MCPToolsCacheInfo(NamedTuple):
+    """Statistics about an MCP server's tool list cache, as returned by [`MCPServer.tools_cache_info()`][pydantic_ai.mcp.MCPServer.tools_cache_info]."""
+
+    hits: int
+    """The number of times the tool list was served from the cache."""
+    misses: int
+    """The number of times the tool list was requested from the server while caching was enabled."""
+    invalidations: int
+    """The number of times the cache was invalidated by the server, the TTL, or the connection being closed."""
+
+
 class MCPServer(AbstractToolset[Any], ABC):
     """Base class for attaching agents to MCP servers.
 
@@ -103,6 +124,17 @@ class MCPServer(AbstractToolset[Any], ABC):
     elicitation_callback: ElicitationFnT | None = None
     """Callback function to handle elicitation requests from the server."""
 
+    cache_tools: bool
+    """Whether to cache the list of tools provided by the server, instead of requesting it on every agent run step.
+
+    The cache is invalidated when the server sends a
+    [`notifications/tools/list_changed`](https://modelcontextprotocol.io/specification/2025-06-18/server/tools#list-changed-notification)
+    notification, when `cache_tools_ttl` expires, and when the connection to the server is closed.
+    """
+
+    cache_tools_ttl: float | None
+    """The maximum number of seconds to cache the list of tools for when `cache_tools` is enabled, or `None` to only rely on invalidation."""
+
     _id: str | None
 
     _enter_lock: Lock = field(compare=False)
@@ -114,6 +146,14 @@ class MCPServer(AbstractToolset[Any], ABC):
     _write_stream: MemoryObjectSendStream[SessionMessage]
     _server_info: mcp_types.Implementation
 
+    _cached_mcp_tools: list[mcp_types.Tool] | None
+    _cached_tools: dict[str, ToolsetTool[Any]] | None
+    _tools_cache_expires_at: float | None
+    _tools_cache_generation: int
+    _tools_cache_hits: int
+    _tools_cache_misses: int
+    _tools_cache_invalidations: int
+
     def __init__(
         self,
         tool_prefix: str | None = None,
@@ -128,6 +168,8 @@ class MCPServer(AbstractToolset[Any], ABC):
         elicitation_callback: ElicitationFnT | None = None,
         *,
         id: str | None = None,
+        cache_tools: bool = False,
+        cache_tools_ttl: float | None = None,
     ):
         self.tool_prefix = tool_prefix
         self.log_level = log_level
@@ -139,6 +181,8 @@ class MCPServer(AbstractToolset[Any], ABC):
         self.sampling_model = sampling_model
         self.max_retries = max_retries
         self.elicitation_callback = elicitation_callback
+        self.cache_tools = cache_tools
+        self.cache_tools_ttl = cache_tools_ttl
 
         self._id = id or tool_prefix
 
@@ -148,6 +192,13 @@ class MCPServer(AbstractToolset[Any], ABC):
         self._enter_lock = Lock()
         self._running_count = 0
         self._exit_stack = None
+        self._cached_mcp_tools = None
+        self._cached_tools = None
+        self._tools_cache_expires_at = None
+        self._tools_cache_generation = 0
+        self._tools_cache_hits = 0
+        self._tools_cache_misses = 0
+        self._tools_cache_invalidations = 0
 
     @abstractmethod
     @asynccontextmanager
@@ -195,13 +246,44 @@ class MCPServer(AbstractToolset[Any], ABC):
         """Retrieve tools that are currently active on the server.
 
         Note:
-        - We don't cache tools as they might change.
-        - We also don't subscribe to the server to avoid complexity.
+        - Tools are only cached if [`cache_tools`][pydantic_ai.mcp.MCPServer.cache_tools] is enabled, as they might change.
         """
+        if self.cache_tools and self._cached_mcp_tools is not None:
+            if self._tools_cache_expires_at is None or time.monotonic() < self._tools_cache_expires_at:
+                self._tools_cache_hits += 1
+                return self._cached_mcp_tools
+            self._invalidate_tools_cache()
+
+        generation = self._tools_cache_generation
         async with self:  # Ensure server is running
             result = await self._client.list_tools()
+
+        if self.cache_tools:
+            self._tools_cache_misses += 1
+            # Don't cache a list that may have been invalidated while the request was in flight
+            if generation == self._tools_cache_generation:
+                self._cached_mcp_tools = result.tools
+                self._cached_tools = None
+                if self.cache_tools_ttl is not None:
+                    self._tools_cache_expires_at = time.monotonic() + self.cache_tools_ttl
         return result.tools
 
+    def tools_cache_info(self) -> MCPToolsCacheInfo:
+        """Report statistics about the tool list cache, see [`cache_tools`][pydantic_ai.mcp.MCPServer.cache_tools]."""
+        return MCPToolsCacheInfo(
+            hits=self._tools_cache_hits,
+            misses=self._tools_cache_misses,
+            invalidations=self._tools_cache_invalidations,
+        )
+
+    def _invalidate_tools_cache(self) -> None:
+        self._tools_cache_generation += 1
+        if self._cached_mcp_tools is not None:
+            self._tools_cache_invalidations += 1
+        self._cached_mcp_tools = None
+        self._cached_tools = None
+        self._tools_cache_expires_at = None
+
     async def direct_call_tool(
         self,
         name: str,
@@ -278,6 +360,16 @@ class MCPServer(AbstractToolset[Any], ABC):
             return await self.direct_call_tool(name, tool_args)
 
     async def get_tools(self, ctx: RunContext[Any]) -> dict[str, ToolsetTool[Any]]:
+        mcp_tools = await self.list_tools()
+        if mcp_tools is not self._cached_mcp_tools:
+            return self._tools_from_mcp_tools(mcp_tools)
+
+        # the tool list came from the cache, so the tools converted from it can be reused as well
+        if self._cached_tools is None:
+            self._cached_tools = self._tools_from_mcp_tools(mcp_tools)
+        return dict(self._cached_tools)
+
+    def _tools_from_mcp_tools(self, mcp_tools: list[mcp_types.Tool]) -> dict[str, ToolsetTool[Any]]:
         return {
             name: self.tool_for_tool_def(
                 ToolDefinition(
@@ -291,7 +383,7 @@ class MCPServer(AbstractToolset[Any], ABC):
                     },
                 ),
             )
-            for mcp_tool in await self.list_tools()
+            for mcp_tool in mcp_tools
             if (name := f'{self.tool_prefix}_{mcp_tool.name}' if self.tool_prefix else mcp_tool.name)
         }
 
@@ -321,6 +413,7 @@ class MCPServer(AbstractToolset[Any], ABC):
                         sampling_callback=self._sampling_callback if self.allow_sampling else None,
                         elicitation_callback=self.elicitation_callback,
                         logging_callback=self.log_handler,
+                        message_handler=self._message_handler,
                         read_timeout_seconds=timedelta(seconds=self.read_timeout),
                     )
                     self._client = await exit_stack.enter_async_context(client)
@@ -343,12 +436,26 @@ class MCPServer(AbstractToolset[Any], ABC):
             if self._running_count == 0 and self._exit_stack is not None:
                 await self._exit_stack.aclose()
                 self._exit_stack = None
+                # We can't be notified of changes to the tool list while disconnected
+                self._invalidate_tools_cache()
 
     @property
     def is_running(self) -> bool:
         """Check if the MCP server is running."""
         return bool(self._running_count)
 
+    async def _message_handler(
+        self,
+        message: RequestResponder[mcp_types.ServerRequest, mcp_types.ClientResult]
+        | mcp_types.ServerNotification
+        | Exception,
+    ) -> None:
+        """MCP message handler, used to invalidate the tools cache when the server's tool list changes."""
+        if isinstance(message, mcp_types.ServerNotification) and isinstance(
+            message.root, mcp_types.ToolListChangedNotification
+        ):
+            self._invalidate_tools_cache()
+
     async def _sampling_callback(
         self, context: RequestContext[ClientSession, Any], params: mcp_types.CreateMessageRequestParams
     ) -> mcp_types.CreateMessageResult | mcp_types.ErrorData:
@@ -473,6 +580,8 @@ class MCPServerStdio(MCPServer):
     sampling_model: models.Model | None
     max_retries: int
     elicitation_callback: ElicitationFnT | None = None
+    cache_tools: bool
+    cache_tools_ttl: float | None
 
     def __init__(
         self,
@@ -492,6 +601,8 @@ class MCPServerStdio(MCPServer):
         max_retries: int = 1,
         elicitation_callback: ElicitationFnT | None = None,
         id: str | None = None,
+        cache_tools: bool = False,
+        cache_tools_ttl: float | None = None,
     ):
         """Build a new MCP server.
 
@@ -511,6 +622,8 @@ class MCPServerStdio(MCPServer):
             max_retries: The maximum number of times to retry a tool call.
             elicitation_callback: Callback function to handle elicitation requests from the server.
             id: An optional unique ID for the MCP server. An MCP server needs to have an ID in order to be used in a durable execution environment like Temporal, in which case the ID will be used to identify the server's activities within the workflow.
+            cache_tools: Whether to cache the list of tools provided by the server until it changes.
+            cache_tools_ttl: The maximum number of seconds to cache the list of tools for, or `None` to only rely on invalidation.
         """
         self.command = command
         self.args = args
@@ -529,6 +642,8 @@ class MCPServerStdio(MCPServer):
             max_retries,
             elicitation_callback,
             id=id,
+            cache_tools=cache_tools,
+            cache_tools_ttl=cache_tools_ttl,
         )
 
     @classmethod
@@ -627,6 +742,8 @@ class _MCPServerHTTP(MCPServer):
     sampling_model: models.Model | None
     max_retries: int
     elicitation_callback: ElicitationFnT | None = None
+    cache_tools: bool
+    cache_tools_ttl: float | None
 
     def __init__(
         self,
@@ -645,6 +762,8 @@ class _MCPServerHTTP(MCPServer):
         sampling_model: models.Model | None = None,
         max_retries: int = 1,
         elicitation_callback: ElicitationFnT | None = None,
+        cache_tools: bool = False,
+        cache_tools_ttl: float | None = None,
         **_deprecated_kwargs: Any,
     ):
         """Build a new MCP server.
@@ -664,6 +783,8 @@ class _MCPServerHTTP(MCPServer):
             sampling_model: The model to use for sampling.
             max_retries: The maximum number of times to retry a tool call.
             elicitation_callback: Callback function to handle elicitation requests from the server.
+            cache_tools: Whether to cache the list of tools provided by the server until it changes.
+            cache_tools_ttl: The maximum number of seconds to cache the list of tools for, or `None` to only rely on invalidation.
         """
         if 'sse_read_timeout' in _deprecated_kwargs:
             if read_timeout is not None:
@@ -695,6 +816,8 @@ class _MCPServerHTTP(MCPServer):
             max_retries,
             elicitation_callback,
             id=id,
+            cache_tools=cache_tools,
+            cache_tools_ttl=cache_tools_ttl,
         )
 
     @property
@@ -2,8 +2,9 @@ from __future__ import annotations as _annotations
 
 import base64
 import hashlib
+import mmap
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import KW_ONLY, dataclass, field, replace
 from datetime import datetime
 from mimetypes import guess_type
@@ -98,7 +99,7 @@ class SystemPromptPart:
     __repr__ = _utils.dataclasses_no_defaults_repr
 
 
-def _multi_modal_content_identifier(identifier: str | bytes) -> str:
+def _multi_modal_content_identifier(identifier: str | bytes | memoryview | mmap.mmap) -> str:
     """Generate stable identifier for multi-modal content to help LLM in finding a specific file in tool call responses."""
     if isinstance(identifier, str):
         identifier = identifier.encode('utf-8')
@@ -459,12 +460,32 @@ class DocumentUrl(FileUrl):
             raise ValueError(f'Unknown document media type: {media_type}') from e
 
 
+def _serialize_binary_data(
+    value: bytes | memoryview | mmap.mmap, handler: pydantic_core.core_schema.SerializerFunctionWrapHandler
+) -> Any:
+    return handler(value if isinstance(value, bytes) else bytes(value))
+
+
+_binary_data_schema = pydantic.GetPydanticSchema(
+    lambda _tp, _handler: pydantic_core.core_schema.bytes_schema(
+        serialization=pydantic_core.core_schema.wrap_serializer_function_ser_schema(
+            _serialize_binary_data, schema=pydantic_core.core_schema.bytes_schema()
+        )
+    )
+)
+
+
 @dataclass(init=False, repr=False)
 class BinaryContent:
     """Binary content, e.g. an audio or image file."""
 
-    data: bytes
-    """The binary data."""
+    data: Annotated[bytes | memoryview | mmap.mmap, _binary_data_schema]
+    """The binary data.
+
+    Pass a `memoryview` or `mmap.mmap` to avoid copying a large file into a `bytes` object. Encoding to base64 and
+    computing the identifier work on the buffer directly; it's only copied into `bytes` for model API clients that
+    require them, and when the message is serialized.
+    """
 
     _: KW_ONLY
 
@@ -488,7 +509,7 @@ class BinaryContent:
 
     def __init__(
         self,
-        data: bytes,
+        data: bytes | memoryview | mmap.mmap,
         *,
         media_type: AudioMediaType | ImageMediaType | DocumentMediaType | str,
         identifier: str | None = None,
@@ -540,12 +561,21 @@ class BinaryContent:
         It's also included in inline-text delimiters for providers that require inlining text documents, so the model can
         distinguish multiple files.
         """
-        return self._identifier or _multi_modal_content_identifier(self.data)
+        return self._identifier or self._memoize('identifier', lambda: _multi_modal_content_identifier(self.data))
+
+    @property
+    def base64(self) -> str:
+        """The base64-encoded data.
+
+        This is computed once and reused until `data` is replaced, as the same content is usually sent to the model
+        and recorded in instrumentation on every step of a run.
+        """
+        return self._memoize('base64', lambda: base64.b64encode(self.data).decode())
 
     @property
     def data_uri(self) -> str:
         """Convert the `BinaryContent` to a data URI."""
-        return f'data:{self.media_type};base64,{base64.b64encode(self.data).decode()}'
+        return self._memoize(f'data_uri:{self.media_type}', lambda: f'data:{self.media_type};base64,{self.base64}')
 
     @property
     def is_audio(self) -> bool:
@@ -582,6 +612,16 @@ class BinaryContent:
         except KeyError as e:
             raise ValueError(f'Unknown media type: {self.media_type}') from e
 
+    def _memoize(self, key: str, compute: Callable[[], str]) -> str:
+        # Stored in the instance `__dict__` rather than as fields, so cached values aren't compared, serialized or
+        # copied by `replace()`, and keyed on the `data` object so they're discarded when `data` is reassigned.
+        memo = cast(tuple[object, dict[str, str]] | None, self.__dict__.get('_memo'))
+        if memo is None or memo[0] is not self.data:
+            memo = self.__dict__['_memo'] = (self.data, dict[str, str]())
+        if (value := memo[1].get(key)) is None:
+            value = memo[1][key] = compute()
+        return value
+
     __repr__ = _utils.dataclasses_no_defaults_repr
 
 
@@ -590,7 +630,7 @@ class BinaryImage(BinaryContent):
 
     def __init__(
         self,
-        data: bytes,
+        data: bytes | memoryview | mmap.mmap,
         *,
         media_type: str,
         identifier: str | None = None,
@@ -607,8 +647,31 @@ class BinaryImage(BinaryContent):
             raise ValueError('`BinaryImage` must be have a media type that starts with "image/"')  # pragma: no cover
 
 
+@dataclass(repr=False)
+class CachePoint:
+    """A marker for the end of a prompt prefix that the model provider should cache.
+
+    Place it in the content of a [`UserPromptPart`][pydantic_ai.messages.UserPromptPart] after the content that
+    should be cached. Models that don't support prompt caching ignore it.
+
+    Supported by:
+
+    - Anthropic
+    """
+
+    _: KW_ONLY
+
+    ttl: Literal['5m', '1h'] = '5m'
+    """How long the cached prefix should be kept for."""
+
+    kind: Literal['cache-point'] = 'cache-point'
+    """Type identifier, this is available on all parts as a discriminator."""
+
+    __repr__ = _utils.dataclasses_no_defaults_repr
+
+
 MultiModalContent = ImageUrl | AudioUrl | DocumentUrl | VideoUrl | BinaryContent
-UserContent: TypeAlias = str | MultiModalContent
+UserContent: TypeAlias = str | MultiModalContent | CachePoint
 
 
 @dataclass(repr=False)
@@ -722,8 +785,11 @@ class UserPromptPart:
             elif isinstance(part, BinaryContent):
                 converted_part = _otel_messages.BinaryDataPart(type='binary', media_type=part.media_type)
                 if settings.include_content and settings.include_binary_content:
-                    converted_part['content'] = base64.b64encode(part.data).decode()
+                    converted_part['content'] = part.base64
                 parts.append(converted_part)
+            elif isinstance(part, CachePoint):
+                # Cache points are instructions for the model provider, not content
+                pass
             else:
                 parts.append({'type': part.kind})  # pragma: no cover
         return parts
@@ -1285,7 +1351,7 @@ class ModelResponse:
                         'kind': 'binary',
                         'media_type': part.content.media_type,
                         **(
-                            {'binary_content': base64.b64encode(part.content.data).decode()}
+                            {'binary_content': part.content.base64}
                             if settings.include_content and settings.include_binary_content
                             else {}
                         ),
@@ -1319,7 +1385,7 @@ class ModelResponse:
             elif isinstance(part, FilePart):
                 converted_part = _otel_messages.BinaryDataPart(type='binary', media_type=part.content.media_type)
                 if settings.include_content and settings.include_binary_content:
-                    converted_part['content'] = base64.b64encode(part.content.data).decode()
+                    converted_part['content'] = part.content.base64
                 parts.append(converted_part)
             elif isinstance(part, BaseToolCallPart):
                 call_part = _otel_messages.ToolCallPart(type='tool_call', id=part.tool_call_id, name=part.tool_name)
@@ -20,7 +20,12 @@ import httpx
 from typing_extensions import TypeAliasType, TypedDict
 
 from .. import _utils
-from .._json_schema import JsonSchemaTransformer
+from .._download_cache import (
+    CachedDownload as CachedDownload,
+    DownloadCache as DownloadCache,
+    DownloadCacheInfo as DownloadCacheInfo,
+)
+from .._json_schema import JsonSchemaTransformCache, JsonSchemaTransformer
 from .._output import OutputObjectDefinition
 from .._parts_manager import ModelResponsePartsManager
 from .._run_context import RunContext
@@ -811,6 +816,9 @@ async def download_item(
 ) -> DownloadedItem[str] | DownloadedItem[bytes]:
     """Download an item by URL and return the content as a bytes object or a (base64-encoded) string.
 
+    Downloads and their encoded forms are cached in [`download_cache`][pydantic_ai.models.download_cache], so the
+    same file isn't downloaded and encoded again every time the message history is sent to the model.
+
     Args:
         item: The item to download.
         data_format: The format to return the content in:
@@ -830,11 +838,9 @@ async def download_item(
     elif isinstance(item, VideoUrl) and item.is_youtube:
         raise UserError('Downloading YouTube videos is not supported.')
 
-    client = cached_async_http_client()
-    response = await client.get(item.url, follow_redirects=True)
-    response.raise_for_status()
+    content, content_type = await download_cache.download(cached_async_http_client(), item.url)
 
-    if content_type := response.headers.get('content-type'):
+    if content_type:
         content_type = content_type.split(';')[0]
         if content_type == 'application/octet-stream':
             content_type = None
@@ -845,16 +851,38 @@ async def download_item(
     if type_format == 'extension':
         data_type = item.format
 
-    data = response.content
-    if data_format in ('base64', 'base64_uri'):
-        data = base64.b64encode(data).decode('utf-8')
-        if data_format == 'base64_uri':
-            data = f'data:{media_type};base64,{data}'
+    if data_format == 'base64':
+        data = download_cache.encode(content, 'base64', _b64encode)
+        return DownloadedItem[str](data=data, data_type=data_type)
+    elif data_format == 'base64_uri':
+        data = download_cache.encode(
+            content, f'base64_uri:{media_type}', lambda d: f'data:{media_type};base64,{_b64encode(d)}'
+        )
         return DownloadedItem[str](data=data, data_type=data_type)
     elif data_format == 'text':
-        return DownloadedItem[str](data=data.decode('utf-8'), data_type=data_type)
+        data = download_cache.encode(content, 'text', lambda d: d.decode('utf-8'))
+        return DownloadedItem[str](data=data, data_type=data_type)
     else:
-        return DownloadedItem[bytes](data=data, data_type=data_type)
+        return DownloadedItem[bytes](data=content.data, data_type=data_type)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode('utf-8')
+
+
+download_cache = DownloadCache()
+"""Cache of files downloaded by [`download_item`][pydantic_ai.models.download_item], shared by all models.
+
+Use `download_cache.cache_info()` to inspect hits and misses, and `clear()` to reset it. To also cache downloads on
+disk, or to change the memory limit, replace it with your own
+[`DownloadCache`][pydantic_ai.models.DownloadCache]:
+
+```python {test="skip" lint="skip"}
+from pydantic_ai import models
+
+models.download_cache = models.DownloadCache(max_size_bytes=512 * 1024 * 1024, directory='.download_cache')
+```
+"""
 
 
 @cache
@@ -865,23 +893,32 @@ def get_user_agent() -> str:
     return f'pydantic-ai/{__version__}'
 
 
+json_schema_transform_cache = JsonSchemaTransformCache()
+"""Cache of tool and output JSON schemas transformed by the model profile's `json_schema_transformer`.
+
+Use `json_schema_transform_cache.cache_info()` to inspect hits and misses, and `clear()` to reset it.
+"""
+
+
 def _customize_tool_def(transformer: type[JsonSchemaTransformer], t: ToolDefinition):
-    schema_transformer = transformer(t.parameters_json_schema, strict=t.strict)
-    parameters_json_schema = schema_transformer.walk()
+    parameters_json_schema, is_strict_compatible = json_schema_transform_cache.transform(
+        transformer, t.parameters_json_schema, strict=t.strict
+    )
     return replace(
         t,
         parameters_json_schema=parameters_json_schema,
-        strict=schema_transformer.is_strict_compatible if t.strict is None else t.strict,
+        strict=is_strict_compatible if t.strict is None else t.strict,
     )
 
 
 def _customize_output_object(transformer: type[JsonSchemaTransformer], o: OutputObjectDefinition):
-    schema_transformer = transformer(o.json_schema, strict=o.strict)
-    json_schema = schema_transformer.walk()
+    json_schema, is_strict_compatible = json_schema_transform_cache.transform(
+        transformer, o.json_schema, strict=o.strict
+    )
     return replace(
         o,
         json_schema=json_schema,
-        strict=schema_transformer.is_strict_compatible if o.strict is None else o.strict,
+        strict=is_strict_compatible if o.strict is None else o.strict,
     )
 
 
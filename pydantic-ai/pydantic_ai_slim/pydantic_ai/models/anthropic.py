@@ -1,7 +1,6 @@
 from __future__ import annotations as _annotations
 
-import io
-from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field, replace
 from datetime import datetime
@@ -19,6 +18,7 @@ from ..messages import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     DocumentUrl,
     FilePart,
     FinishReason,
@@ -58,6 +58,7 @@ try:
     from anthropic.types.beta import (
         BetaBase64PDFBlockParam,
         BetaBase64PDFSourceParam,
+        BetaCacheControlEphemeralParam,
         BetaCitationsDelta,
         BetaCodeExecutionTool20250522Param,
         BetaCodeExecutionToolResultBlock,
@@ -148,6 +149,25 @@ class AnthropicModelSettings(ModelSettings, total=False):
     See [the Anthropic docs](https://docs.anthropic.com/en/docs/build-with-claude/extended-thinking) for more information.
     """
 
+    anthropic_cache_tool_definitions: bool | Literal['5m', '1h']
+    """Whether to add a prompt cache breakpoint after the tool definitions.
+
+    Pass `'1h'` to cache them for an hour instead of the default five minutes.
+    See [the Anthropic docs](https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching) for more information.
+    """
+
+    anthropic_cache_instructions: bool | Literal['5m', '1h']
+    """Whether to add a prompt cache breakpoint after the instructions and system prompts.
+
+    Pass `'1h'` to cache them for an hour instead of the default five minutes.
+    """
+
+    anthropic_cache_messages: bool | Literal['5m', '1h']
+    """Whether to add a prompt cache breakpoint after the last message, so the next request can read the conversation so far from the cache.
+
+    Pass `'1h'` to cache it for an hour instead of the default five minutes.
+    """
+
 
 @dataclass(init=False)
 class AnthropicModel(Model):
@@ -289,6 +309,7 @@ class AnthropicModel(Model):
                 tool_choice['disable_parallel_tool_use'] = not allow_parallel_tool_calls
 
         system_prompt, anthropic_messages = await self._map_message(messages)
+        system = _add_cache_breakpoints(system_prompt, anthropic_messages, tools, model_settings)
 
         try:
             extra_headers = model_settings.get('extra_headers', {})
@@ -300,7 +321,7 @@ class AnthropicModel(Model):
 
             return await self.client.beta.messages.create(
                 max_tokens=model_settings.get('max_tokens', 4096),
-                system=system_prompt or OMIT,
+                system=system or OMIT,
                 messages=anthropic_messages,
                 model=self._model_name,
                 tools=tools or OMIT,
@@ -458,7 +479,13 @@ class AnthropicModel(Model):
                         system_prompt_parts.append(request_part.content)
                     elif isinstance(request_part, UserPromptPart):
                         async for content in self._map_user_prompt(request_part):
-                            user_content_params.append(content)
+                            if isinstance(content, CachePoint):
+                                if not _set_cache_control(user_content_params, content.ttl):
+                                    raise UserError(
+                                        '`CachePoint` must follow other content in the same message, as it marks the end of the content to cache.'
+                                    )
+                            else:
+                                user_content_params.append(content)
                     elif isinstance(request_part, ToolReturnPart):
                         tool_result_block_param = BetaToolResultBlockParam(
                             tool_use_id=_guard_tool_call_id(t=request_part),
@@ -623,7 +650,7 @@ class AnthropicModel(Model):
     @staticmethod
     async def _map_user_prompt(
         part: UserPromptPart,
-    ) -> AsyncGenerator[BetaContentBlockParam]:
+    ) -> AsyncGenerator[BetaContentBlockParam | CachePoint]:
         if isinstance(part.content, str):
             if part.content:  # Only yield non-empty text
                 yield BetaTextBlockParam(text=part.content, type='text')
@@ -635,13 +662,13 @@ class AnthropicModel(Model):
                 elif isinstance(item, BinaryContent):
                     if item.is_image:
                         yield BetaImageBlockParam(
-                            source={'data': io.BytesIO(item.data), 'media_type': item.media_type, 'type': 'base64'},  # type: ignore
+                            source={'data': item.base64, 'media_type': item.media_type, 'type': 'base64'},  # type: ignore
                             type='image',
                         )
                     elif item.media_type == 'application/pdf':
                         yield BetaBase64PDFBlockParam(
                             source=BetaBase64PDFSourceParam(
-                                data=io.BytesIO(item.data),
+                                data=item.base64,
                                 media_type='application/pdf',
                                 type='base64',
                             ),
@@ -664,6 +691,8 @@ class AnthropicModel(Model):
                         )
                     else:  # pragma: no cover
                         raise RuntimeError(f'Unsupported media type: {item.media_type}')
+                elif isinstance(item, CachePoint):
+                    yield item
                 else:
                     raise RuntimeError(f'Unsupported content type: {type(item)}')  # pragma: no cover
 
@@ -676,6 +705,70 @@ class AnthropicModel(Model):
         }
 
 
+_MAX_CACHE_BREAKPOINTS = 4
+"""The maximum number of `cache_control` breakpoints Anthropic allows in a single request."""
+
+
+def _cache_ttl(setting: bool | Literal['5m', '1h'] | None) -> Literal['5m', '1h'] | None:
+    if setting is True:
+        return '5m'
+    return setting or None
+
+
+def _set_cache_control(blocks: Sequence[Any], ttl: Literal['5m', '1h']) -> bool:
+    """Mark the last block that can be cached with a `cache_control` breakpoint, returning whether one was found."""
+    for block in reversed(blocks):
+        if not isinstance(block, dict):
+            continue
+        block = cast(dict[str, Any], block)
+        # Thinking blocks can't be cached directly, they're cached along with the rest of the message.
+        if block.get('type') not in ('thinking', 'redacted_thinking'):
+            block['cache_control'] = BetaCacheControlEphemeralParam(type='ephemeral', ttl=ttl)
+            return True
+    return False
+
+
+def _add_cache_breakpoints(
+    system_prompt: str,
+    messages: list[BetaMessageParam],
+    tools: list[BetaToolUnionParam],
+    model_settings: AnthropicModelSettings,
+) -> str | list[BetaTextBlockParam]:
+    """Add the automatic prompt cache breakpoints requested in the model settings.
+
+    Anthropic reads the cache in prefix order (tools, then system prompt, then messages), so a breakpoint
+    after each of them lets later requests reuse as much of the prompt as is unchanged.
+
+    Returns the system prompt to send, as text blocks if it should be cached.
+    """
+    system: str | list[BetaTextBlockParam] = system_prompt
+    breakpoints = 0
+    if tools and (ttl := _cache_ttl(model_settings.get('anthropic_cache_tool_definitions'))):
+        breakpoints += _set_cache_control(tools, ttl)
+    if system_prompt and (ttl := _cache_ttl(model_settings.get('anthropic_cache_instructions'))):
+        system = [
+            BetaTextBlockParam(
+                type='text', text=system_prompt, cache_control=BetaCacheControlEphemeralParam(type='ephemeral', ttl=ttl)
+            )
+        ]
+        breakpoints += 1
+    if messages and (ttl := _cache_ttl(model_settings.get('anthropic_cache_messages'))):
+        _set_cache_control(cast(list[Any], messages[-1]['content']), ttl)
+
+    # Keep the most recent breakpoints in the conversation if there are too many, e.g. because
+    # every user prompt in the history has a `CachePoint`: earlier ones are covered by later ones.
+    message_blocks: list[dict[str, Any]] = [
+        cast(dict[str, Any], block)
+        for message in messages
+        if isinstance(content := message['content'], list)
+        for block in cast(list[Any], content)
+        if isinstance(block, dict) and 'cache_control' in block
+    ]
+    for block in message_blocks[: max(0, breakpoints + len(message_blocks) - _MAX_CACHE_BREAKPOINTS)]:
+        del block['cache_control']
+    return system
+
+
 def _map_usage(
     message: BetaMessage | BetaRawMessageStartEvent | BetaRawMessageDeltaEvent,
     provider: str,
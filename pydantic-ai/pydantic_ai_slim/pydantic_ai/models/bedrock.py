@@ -18,6 +18,7 @@ from pydantic_ai import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     DocumentUrl,
     FinishReason,
     ImageUrl,
@@ -580,13 +581,15 @@ class BedrockConverseModel(Model):
                     if item.is_document:
                         name = f'Document {next(document_count)}'
                         assert format in ('pdf', 'txt', 'csv', 'doc', 'docx', 'xls', 'xlsx', 'html', 'md')
-                        content.append({'document': {'name': name, 'format': format, 'source': {'bytes': item.data}}})
+                        content.append(
+                            {'document': {'name': name, 'format': format, 'source': {'bytes': bytes(item.data)}}}
+                        )
                     elif item.is_image:
                         assert format in ('jpeg', 'png', 'gif', 'webp')
-                        content.append({'image': {'format': format, 'source': {'bytes': item.data}}})
+                        content.append({'image': {'format': format, 'source': {'bytes': bytes(item.data)}}})
                     elif item.is_video:
                         assert format in ('mkv', 'mov', 'mp4', 'webm', 'flv', 'mpeg', 'mpg', 'wmv', 'three_gp')
-                        content.append({'video': {'format': format, 'source': {'bytes': item.data}}})
+                        content.append({'video': {'format': format, 'source': {'bytes': bytes(item.data)}}})
                     else:
                         raise NotImplementedError('Binary content is not supported yet.')
                 elif isinstance(item, ImageUrl | DocumentUrl | VideoUrl):
@@ -624,6 +627,9 @@ class BedrockConverseModel(Model):
                         content.append({'video': video})
                 elif isinstance(item, AudioUrl):  # pragma: no cover
                     raise NotImplementedError('Audio is not supported yet.')
+                elif isinstance(item, CachePoint):
+                    # Bedrock prompt caching via `CachePoint` is not supported yet, so we filter it out
+                    pass
                 else:
                     assert_never(item)
         return [{'role': 'user', 'content': content}]
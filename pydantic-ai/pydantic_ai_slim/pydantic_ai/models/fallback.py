@@ -1,16 +1,23 @@
 from __future__ import annotations as _annotations
 
-from collections.abc import AsyncIterator, Callable
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import AsyncExitStack, asynccontextmanager, suppress
-from dataclasses import dataclass, field
+from dataclasses import KW_ONLY, dataclass, field
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+import anyio
+from anyio.abc import TaskGroup
 from opentelemetry.trace import get_current_span
 
 from pydantic_ai._run_context import RunContext
 from pydantic_ai.models.instrumented import InstrumentedModel
 
 from ..exceptions import FallbackExceptionGroup, ModelHTTPError
+from ..messages import FinalResultEvent, ModelResponseStreamEvent
 from . import KnownModelName, Model, ModelRequestParameters, StreamedResponse, infer_model
 
 if TYPE_CHECKING:
@@ -18,6 +25,58 @@ if TYPE_CHECKING:
     from ..settings import ModelSettings
 
 
+@dataclass
+class FallbackRouting:
+    """Options for hedged, health-aware routing between the models of a [`FallbackModel`][pydantic_ai.models.fallback.FallbackModel].
+
+    Without routing, a `FallbackModel` only moves on to the next model once the current one has failed. With routing:
+
+    * If a model hasn't responded by the time a typical request to it would have finished, the request is _hedged_:
+      the next model is tried at the same time, the first successful response is used and the other request is
+      cancelled.
+    * Each model has a circuit breaker: after `failure_threshold` consecutive failures, the model is moved to the
+      back of the list for `recovery_time` seconds, after which it is tried again.
+    * Models are tried in order of their recent latency, so a model that has become slow is tried after faster ones.
+
+    Streamed requests follow the same policy, with latency measured until the model produces its first event.
+    """
+
+    _: KW_ONLY
+
+    hedge_percentile: float | None = 95
+    """Percentile of a model's recent latencies after which the request is hedged to the next model.
+
+    Set to `None` to only use `hedge_delay`.
+    """
+    hedge_delay: float | None = None
+    """Seconds after which to hedge to the next model when there aren't yet `min_latency_samples` latencies to take
+    the percentile from, or when `hedge_percentile` is `None`. If `None`, requests are not hedged in that case."""
+    max_hedged_requests: int = 1
+    """The maximum number of hedged requests running alongside the first one."""
+    latency_window: int = 100
+    """The number of recent latencies kept per model to take the hedging percentile from."""
+    min_latency_samples: int = 20
+    """The number of latencies needed before `hedge_percentile` is used."""
+    latency_slo: float | None = None
+    """Seconds after which a successful response (or for a streamed response, its first event) counts as a failure
+    for the circuit breaker. The response is still used."""
+    first_token_timeout: float | None = None
+    """Seconds to wait for the first event of a streamed response before cancelling it and falling back to the next
+    model, as if the request had failed."""
+    failure_threshold: int = 5
+    """The number of consecutive failures after which a model's circuit breaker opens."""
+    recovery_time: float = 30
+    """Seconds after which an open circuit breaker lets a request through again. If it succeeds, the breaker closes."""
+    reorder_by_latency: bool = True
+    """Whether to try models in order of their average recent latency, instead of the order they were given in.
+
+    Models that haven't completed a request yet keep their position after those that have.
+    """
+    ewma_alpha: float = 0.2
+    """The smoothing factor of the exponentially weighted moving average of each model's latency, between 0 and 1.
+    Higher values give more weight to recent latencies."""
+
+
 @dataclass(init=False)
 class FallbackModel(Model):
     """A model that uses one or more fallback models upon failure.
@@ -26,15 +85,18 @@ class FallbackModel(Model):
     """
 
     models: list[Model]
+    routing: FallbackRouting | None
 
     _model_name: str = field(repr=False)
     _fallback_on: Callable[[Exception], bool]
+    _health: list[_ModelHealth] = field(repr=False)
 
     def __init__(
         self,
         default_model: Model | KnownModelName | str,
         *fallback_models: Model | KnownModelName | str,
         fallback_on: Callable[[Exception], bool] | tuple[type[Exception], ...] = (ModelHTTPError,),
+        routing: FallbackRouting | None = None,
     ):
         """Initialize a fallback model instance.
 
@@ -42,9 +104,14 @@ class FallbackModel(Model):
             default_model: The name or instance of the default model to use.
             fallback_models: The names or instances of the fallback models to use upon failure.
             fallback_on: A callable or tuple of exceptions that should trigger a fallback.
+            routing: Options for hedging requests and routing them based on each model's latency and failures.
+                If `None`, the models are tried one at a time, in order.
         """
         super().__init__()
         self.models = [infer_model(default_model), *[infer_model(m) for m in fallback_models]]
+        self.routing = routing
+        window = routing.latency_window if routing else 0
+        self._health = [_ModelHealth(window) for _ in self.models]
 
         if isinstance(fallback_on, tuple):
             self._fallback_on = _default_fallback_condition_factory(fallback_on)
@@ -74,6 +141,9 @@ class FallbackModel(Model):
 
         In case of failure, raise a FallbackExceptionGroup with all exceptions.
         """
+        if self.routing is not None:
+            return await self._routed_request(messages, model_settings, model_request_parameters)
+
         exceptions: list[Exception] = []
 
         for model in self.models:
@@ -99,6 +169,13 @@ class FallbackModel(Model):
         run_context: RunContext[Any] | None = None,
     ) -> AsyncIterator[StreamedResponse]:
         """Try each model in sequence until one succeeds."""
+        if self.routing is not None:
+            async with self._routed_request_stream(
+                messages, model_settings, model_request_parameters, run_context
+            ) as response:
+                yield response
+            return
+
         exceptions: list[Exception] = []
 
         for model in self.models:
@@ -119,6 +196,183 @@ class FallbackModel(Model):
 
         raise FallbackExceptionGroup('All models from FallbackModel failed', exceptions)
 
+    async def _routed_request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        async def attempt(model: Model, report: Callable[[Any], None]) -> None:
+            report(await model.request(messages, model_settings, model_request_parameters))
+
+        async with anyio.create_task_group() as task_group:
+            outcome = await self._race(task_group, attempt, streaming=False)
+        # Errors are raised outside the task group, so they aren't wrapped in an exception group
+        if isinstance(outcome, Exception):
+            raise outcome
+        index, response = outcome
+        self._set_span_attributes(self.models[index])
+        return response
+
+    @asynccontextmanager
+    async def _routed_request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None,
+    ) -> AsyncIterator[StreamedResponse]:
+        # Each stream is opened and closed by its own task, which waits for the winning stream to be released
+        # once the caller is done with it, so the stream's context manager is exited in the task that entered it.
+        release = anyio.Event()
+
+        async def attempt(model: Model, report: Callable[[Any], None]) -> None:
+            async with model.request_stream(messages, model_settings, model_request_parameters, run_context) as stream:
+                events = aiter(stream)
+                first_event = await anext(events, None)
+                report(
+                    _PeekedStreamedResponse(
+                        model_request_parameters=stream.model_request_parameters,
+                        _wrapped=stream,
+                        _first_event=first_event,
+                        _events=events,
+                    )
+                )
+                await release.wait()
+
+        error: Exception | None = None
+        async with anyio.create_task_group() as task_group:
+            outcome = await self._race(task_group, attempt, streaming=True)
+            if not isinstance(outcome, Exception):
+                index, response = outcome
+                try:
+                    self._set_span_attributes(self.models[index])
+                    yield response
+                except Exception as exc:
+                    error = exc
+                finally:
+                    release.set()
+        # Errors are raised outside the task group, so they aren't wrapped in an exception group
+        if isinstance(outcome, Exception):
+            raise outcome
+        if error is not None:
+            raise error
+
+    async def _race(  # noqa: C901
+        self,
+        task_group: TaskGroup,
+        attempt: Callable[[Model, Callable[[Any], None]], Awaitable[None]],
+        *,
+        streaming: bool,
+    ) -> tuple[int, Any] | Exception:
+        """Run `attempt` against the models in routing order, hedging to the next model while a request is slow.
+
+        Returns the index of the first model whose attempt reported a result, along with that result, after
+        cancelling the attempts still running. If an attempt fails with an error that shouldn't trigger a fallback, or
+        every attempt fails, the error to raise is returned instead.
+        """
+        routing = self.routing
+        assert routing is not None
+        candidates = self._routing_order(routing)
+        send, receive = anyio.create_memory_object_stream[tuple[int, Any, Exception | None]](len(candidates))
+        running: dict[int, _Attempt] = {}
+        exceptions: list[Exception] = []
+
+        async def run_attempt(attempt_state: _Attempt) -> None:
+            reported = False
+
+            def report(result: Any) -> None:
+                nonlocal reported
+                reported = True
+                send.send_nowait((attempt_state.index, result, None))
+
+            with attempt_state.cancel_scope:
+                try:
+                    await attempt(self.models[attempt_state.index], report)
+                except Exception as exc:
+                    if reported:
+                        raise
+                    send.send_nowait((attempt_state.index, None, exc))
+
+        def launch() -> None:
+            index = candidates.pop(0)
+            running[index] = attempt_state = _Attempt(index, time.monotonic(), anyio.CancelScope())
+            task_group.start_soon(run_attempt, attempt_state)
+
+        def fail(index: int, exc: Exception) -> None:
+            del running[index]
+            exceptions.append(exc)
+            self._health[index].record_failure(time.monotonic(), routing)
+
+        def cancel_running() -> None:
+            for attempt_state in running.values():
+                attempt_state.cancel_scope.cancel()
+
+        with send, receive:
+            launch()
+            while running:
+                newest = max(running.values(), key=lambda a: a.started_at)
+                hedge_at: float | None = None
+                can_hedge = candidates and len(running) <= routing.max_hedged_requests
+                if can_hedge and (delay := self._hedge_delay(newest.index, routing, streaming)) is not None:
+                    hedge_at = newest.started_at + delay
+                deadlines = [hedge_at] if hedge_at is not None else []
+                if streaming and routing.first_token_timeout is not None:
+                    deadlines.extend(a.started_at + routing.first_token_timeout for a in running.values())
+
+                timeout = max(min(deadlines) - time.monotonic(), 0) if deadlines else math.inf
+                with anyio.move_on_after(timeout):
+                    index, result, error = await receive.receive()
+                    if index not in running:  # pragma: no cover
+                        continue  # the attempt already timed out
+                    if error is None:
+                        latency = time.monotonic() - running.pop(index).started_at
+                        self._health[index].record_success(latency, time.monotonic(), routing, streaming)
+                        cancel_running()
+                        return index, result
+                    if not self._fallback_on(error):
+                        cancel_running()
+                        return error
+                    fail(index, error)
+                    if not running and candidates:
+                        launch()
+                    continue
+
+                now = time.monotonic()
+                if streaming and routing.first_token_timeout is not None:
+                    for attempt_state in list(running.values()):
+                        if now - attempt_state.started_at >= routing.first_token_timeout:
+                            attempt_state.cancel_scope.cancel()
+                            model_name = self.models[attempt_state.index].model_name
+                            fail(
+                                attempt_state.index,
+                                TimeoutError(
+                                    f'Model {model_name!r} did not stream a response within '
+                                    f'{routing.first_token_timeout} seconds'
+                                ),
+                            )
+                if candidates and (not running or (hedge_at is not None and now >= hedge_at)):
+                    launch()
+
+        return FallbackExceptionGroup('All models from FallbackModel failed', exceptions)
+
+    def _routing_order(self, routing: FallbackRouting) -> list[int]:
+        """The order to try the models in: by latency if enabled, with models whose circuit breaker is open last."""
+        order = list(range(len(self.models)))
+        if routing.reorder_by_latency:
+            order.sort(key=lambda i: ewma if (ewma := self._health[i].latency_ewma) is not None else math.inf)
+        now = time.monotonic()
+        available = [i for i in order if self._health[i].allows_request(now, routing)]
+        # If a model's circuit is open, it's still tried as a last resort rather than failing outright.
+        return available + [i for i in order if i not in available]
+
+    def _hedge_delay(self, index: int, routing: FallbackRouting, streaming: bool) -> float | None:
+        health = self._health[index]
+        latencies = health.first_event_latencies if streaming else health.request_latencies
+        if routing.hedge_percentile is not None and len(latencies) >= routing.min_latency_samples:
+            return _percentile(latencies, routing.hedge_percentile)
+        return routing.hedge_delay
+
     def _set_span_attributes(self, model: Model):
         with suppress(Exception):
             span = get_current_span()
@@ -135,3 +389,86 @@ def _default_fallback_condition_factory(exceptions: tuple[type[Exception], ...])
         return isinstance(exception, exceptions)
 
     return fallback_condition
+
+
+class _ModelHealth:
+    """Recent latencies and the circuit breaker state of one of the models of a `FallbackModel`."""
+
+    def __init__(self, window: int):
+        self.request_latencies: deque[float] = deque(maxlen=window)
+        self.first_event_latencies: deque[float] = deque(maxlen=window)
+        self.latency_ewma: float | None = None
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+
+    def allows_request(self, now: float, routing: FallbackRouting) -> bool:
+        return self.opened_at is None or now - self.opened_at >= routing.recovery_time
+
+    def record_success(self, latency: float, now: float, routing: FallbackRouting, streaming: bool) -> None:
+        (self.first_event_latencies if streaming else self.request_latencies).append(latency)
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += routing.ewma_alpha * (latency - self.latency_ewma)
+        if routing.latency_slo is not None and latency > routing.latency_slo:
+            self.record_failure(now, routing)
+        else:
+            self.consecutive_failures = 0
+            self.opened_at = None
+
+    def record_failure(self, now: float, routing: FallbackRouting) -> None:
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= routing.failure_threshold:
+            # Also restarts the recovery time when a request let through by an open breaker fails again.
+            self.opened_at = now
+
+
+@dataclass
+class _Attempt:
+    index: int
+    started_at: float
+    cancel_scope: anyio.CancelScope
+
+
+def _percentile(values: deque[float], percentile: float) -> float:
+    """The nearest-rank percentile of `values`."""
+    ordered = sorted(values)
+    rank = math.ceil(percentile / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+@dataclass
+class _PeekedStreamedResponse(StreamedResponse):
+    """Passes through a wrapped stream whose first event has already been read."""
+
+    _wrapped: StreamedResponse
+    _first_event: ModelResponseStreamEvent | None
+    _events: AsyncIterator[ModelResponseStreamEvent]
+
+    async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
+        if self._first_event is None:
+            return
+        yield self._first_event
+        async for event in self._events:
+            # Final result events are derived from the other events, and are emitted again by this stream
+            if isinstance(event, FinalResultEvent):
+                continue
+            yield event
+
+    def get(self) -> ModelResponse:
+        return self._wrapped.get()
+
+    def usage(self):
+        return self._wrapped.usage()
+
+    @property
+    def model_name(self) -> str:
+        return self._wrapped.model_name
+
+    @property
+    def provider_name(self) -> str | None:
+        return self._wrapped.provider_name
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._wrapped.timestamp
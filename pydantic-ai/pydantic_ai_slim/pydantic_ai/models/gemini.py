@@ -1,6 +1,6 @@
 from __future__ import annotations as _annotations
 
-import base64
+import re
 from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
@@ -21,6 +21,7 @@ from ..messages import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     FilePart,
     FileUrl,
     ModelMessage,
@@ -304,28 +305,25 @@ class GeminiModel(Model):
     ) -> StreamedResponse:
         """Process a streamed response, and prepare a streaming response to return."""
         aiter_bytes = http_response.aiter_bytes()
-        start_response: _GeminiResponse | None = None
-        content = bytearray()
+        decoder = _GeminiStreamDecoder()
+        responses: list[_GeminiResponse] = []
+        has_content = False
 
         async for chunk in aiter_bytes:
-            content.extend(chunk)
-            responses = _gemini_streamed_response_ta.validate_json(
-                _ensure_decodeable(content),
-                experimental_allow_partial='trailing-strings',
-            )
-            if responses:  # pragma: no branch
-                last = responses[-1]
-                if last['candidates'] and last['candidates'][0].get('content', {}).get('parts'):
-                    start_response = last
-                    break
+            new_responses = decoder.feed(chunk)
+            responses.extend(new_responses)
+            if any(r['candidates'] and r['candidates'][0].get('content', {}).get('parts') for r in new_responses):
+                has_content = True
+                break
 
-        if start_response is None:
+        if not has_content:
             raise UnexpectedModelBehavior('Streamed response ended without content or tool calls')
 
         return GeminiStreamedResponse(
             model_request_parameters=model_request_parameters,
             _model_name=self._model_name,
-            _content=content,
+            _decoder=decoder,
+            _responses=responses,
             _stream=aiter_bytes,
             _provider_name=self._provider.name,
         )
@@ -374,9 +372,8 @@ class GeminiModel(Model):
                 if isinstance(item, str):
                     content.append({'text': item})
                 elif isinstance(item, BinaryContent):
-                    base64_encoded = base64.b64encode(item.data).decode('utf-8')
                     content.append(
-                        _GeminiInlineDataPart(inline_data={'data': base64_encoded, 'mime_type': item.media_type})
+                        _GeminiInlineDataPart(inline_data={'data': item.base64, 'mime_type': item.media_type})
                     )
                 elif isinstance(item, VideoUrl) and item.is_youtube:
                     file_data = _GeminiFileDataPart(file_data={'file_uri': item.url, 'mime_type': item.media_type})
@@ -391,6 +388,9 @@ class GeminiModel(Model):
                     else:  # pragma: lax no cover
                         file_data = _GeminiFileDataPart(file_data={'file_uri': item.url, 'mime_type': item.media_type})
                         content.append(file_data)
+                elif isinstance(item, CachePoint):
+                    # Gemini caches prompt prefixes implicitly, so we filter out `CachePoint`
+                    pass
                 else:
                     assert_never(item)  # pragma: lax no cover
         return content
@@ -446,7 +446,8 @@ class GeminiStreamedResponse(StreamedResponse):
     """Implementation of `StreamedResponse` for the Gemini model."""
 
     _model_name: GeminiModelName
-    _content: bytearray
+    _decoder: _GeminiStreamDecoder
+    _responses: list[_GeminiResponse]
     _stream: AsyncIterator[bytes]
     _provider_name: str
     _timestamp: datetime = field(default_factory=_utils.now_utc, init=False)
@@ -485,35 +486,18 @@ class GeminiStreamedResponse(StreamedResponse):
                         raise AssertionError(f'Unexpected part: {gemini_part}')  # pragma: no cover
 
     async def _get_gemini_responses(self) -> AsyncIterator[_GeminiResponse]:
-        # This method exists to ensure we only yield completed items, so we don't need to worry about
-        # partial gemini responses, which would make everything more complicated
+        # The decoder only returns completed items, so we don't need to worry about partial gemini responses,
+        # which would make everything more complicated. Each response is yielded as soon as its closing brace arrives.
+        for r in self._responses:
+            self._usage = _metadata_as_usage(r)
+            yield r
+        self._responses = []
 
-        gemini_responses: list[_GeminiResponse] = []
-        current_gemini_response_index = 0
-        # Right now, there are some circumstances where we will have information that could be yielded sooner than it is
-        # But changing that would make things a lot more complicated.
         async for chunk in self._stream:
-            self._content.extend(chunk)
-
-            gemini_responses = _gemini_streamed_response_ta.validate_json(
-                _ensure_decodeable(self._content),
-                experimental_allow_partial='trailing-strings',
-            )
-
-            # The idea: yield only up to the latest response, which might still be partial.
-            # Note that if the latest response is complete, we could yield it immediately, but there's not a good
-            # allow_partial API to determine if the last item in the list is complete.
-            responses_to_yield = gemini_responses[:-1]
-            for r in responses_to_yield[current_gemini_response_index:]:
-                current_gemini_response_index += 1
+            for r in self._decoder.feed(chunk):
+                self._usage = _metadata_as_usage(r)
                 yield r
 
-        # Now yield the final response, which should be complete
-        if gemini_responses:  # pragma: no branch
-            r = gemini_responses[-1]
-            self._usage = _metadata_as_usage(r)
-            yield r
-
     @property
     def model_name(self) -> GeminiModelName:
         """Get the model name of the response."""
@@ -949,17 +933,76 @@ _gemini_response_ta = pydantic.TypeAdapter(_GeminiResponse)
 _gemini_streamed_response_ta = pydantic.TypeAdapter(list[_GeminiResponse], config=pydantic.ConfigDict(defer_build=True))
 
 
-def _ensure_decodeable(content: bytearray) -> bytearray:
-    """Trim any invalid unicode point bytes off the end of a bytearray.
+_JSON_STRUCTURAL_RE = re.compile(rb'[\[\]{}"]')
+_JSON_STRING_SPECIAL_RE = re.compile(rb'["\\]')
+
 
-    This is necessary before attempting to parse streaming JSON bytes.
+class _GeminiStreamDecoder:
+    """Incrementally split a streamed JSON array of Gemini responses into its top-level elements.
 
-    This is a temporary workaround until https://github.com/pydantic/pydantic-core/issues/1633 is resolved
+    Each call to `feed` only scans the bytes that haven't been seen yet, and each response is validated exactly once,
+    as soon as its closing brace arrives. Consumed bytes are dropped from the buffer, so memory is bounded by the size
+    of the largest single response rather than the whole stream.
+
+    Only ASCII bytes are structural in JSON and UTF-8 continuation bytes are never ASCII, so chunks that split a
+    multi-byte character are handled without any decoding.
     """
-    try:
-        content.decode()
-    except UnicodeDecodeError as e:
-        # e.start marks the start of the invalid decoded bytes, so cut up to before the first invalid byte
-        return content[: e.start]
-    else:
-        return content
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._element_start: int | None = None
+
+    def feed(self, chunk: bytes) -> list[_GeminiResponse]:
+        """Add a chunk of the stream, and return any responses it completed."""
+        buffer = self._buffer
+        buffer.extend(chunk)
+        pos, depth, in_string, element_start = self._pos, self._depth, self._in_string, self._element_start
+        end = len(buffer)
+        responses: list[_GeminiResponse] = []
+
+        while pos < end:
+            if in_string:
+                match = _JSON_STRING_SPECIAL_RE.search(buffer, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.start()
+                if buffer[pos] == 0x5C:  # backslash
+                    if pos + 1 == end:
+                        # the escaped character hasn't arrived yet, so rescan from the backslash with the next chunk
+                        break
+                    pos += 2
+                    continue
+                in_string = False
+            else:
+                match = _JSON_STRUCTURAL_RE.search(buffer, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.start()
+                char = buffer[pos]
+                if char == 0x22:  # "
+                    in_string = True
+                elif char in (0x7B, 0x5B):  # { or [
+                    if depth == 1 and char == 0x7B:
+                        element_start = pos
+                    depth += 1
+                else:  # } or ]
+                    depth -= 1
+                    if depth == 1 and element_start is not None:
+                        responses.append(_gemini_response_ta.validate_json(buffer[element_start : pos + 1]))
+                        element_start = None
+            pos += 1
+
+        consumed = pos if element_start is None else element_start
+        if consumed:
+            del buffer[:consumed]
+            pos -= consumed
+            if element_start is not None:
+                element_start -= consumed
+
+        self._pos, self._depth, self._in_string, self._element_start = pos, depth, in_string, element_start
+        return responses
@@ -19,6 +19,7 @@ from ..messages import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     FilePart,
     FileUrl,
     FinishReason,
@@ -567,7 +568,7 @@ class GoogleModel(Model):
                 if isinstance(item, str):
                     content.append({'text': item})
                 elif isinstance(item, BinaryContent):
-                    inline_data_dict: BlobDict = {'data': item.data, 'mime_type': item.media_type}
+                    inline_data_dict: BlobDict = {'data': bytes(item.data), 'mime_type': item.media_type}
                     part_dict: PartDict = {'inline_data': inline_data_dict}
                     if item.vendor_metadata:
                         part_dict['video_metadata'] = cast(VideoMetadataDict, item.vendor_metadata)
@@ -594,6 +595,9 @@ class GoogleModel(Model):
                     else:
                         file_data_dict: FileDataDict = {'file_uri': item.url, 'mime_type': item.media_type}
                         content.append({'file_data': file_data_dict})  # pragma: lax no cover
+                elif isinstance(item, CachePoint):
+                    # Google caches prompt prefixes implicitly, so we filter out `CachePoint`
+                    pass
                 else:
                     assert_never(item)
         return content
@@ -772,7 +776,7 @@ def _content_model_response(m: ModelResponse, provider_name: str) -> ContentDict
                     pass
         elif isinstance(item, FilePart):
             content = item.content
-            inline_data_dict: BlobDict = {'data': content.data, 'mime_type': content.media_type}
+            inline_data_dict: BlobDict = {'data': bytes(content.data), 'mime_type': content.media_type}
             part['inline_data'] = inline_data_dict
         else:
             assert_never(item)
@@ -21,6 +21,7 @@ from ..messages import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     DocumentUrl,
     FilePart,
     FinishReason,
@@ -505,6 +506,9 @@ class GroqModel(Model):
                         raise RuntimeError('Only images are supported for binary content in Groq.')
                 elif isinstance(item, DocumentUrl):  # pragma: no cover
                     raise RuntimeError('DocumentUrl is not supported in Groq.')
+                elif isinstance(item, CachePoint):
+                    # Groq doesn't support prompt caching via `CachePoint`, so we filter it out
+                    pass
                 else:  # pragma: no cover
                     raise RuntimeError(f'Unsupported content type: {type(item)}')
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import itertools
 import json
 import warnings
+import weakref
 from collections.abc import AsyncIterator, Callable, Iterator, Mapping
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
@@ -17,7 +18,7 @@ from opentelemetry._events import (
     get_event_logger_provider,  # pyright: ignore[reportPrivateImportUsage]
 )
 from opentelemetry.metrics import MeterProvider, get_meter_provider
-from opentelemetry.trace import Span, Tracer, TracerProvider, get_tracer_provider
+from opentelemetry.trace import Link, Span, SpanContext, Tracer, TracerProvider, get_tracer_provider
 from opentelemetry.util.types import AttributeValue
 from pydantic import TypeAdapter
 
@@ -93,6 +94,9 @@ class InstrumentationSettings:
     include_binary_content: bool = True
     include_content: bool = True
     version: Literal[1, 2, 3] = DEFAULT_INSTRUMENTATION_VERSION
+    input_messages_mode: Literal['full', 'delta'] = 'full'
+    max_content_length: int | None = None
+    max_messages_bytes: int | None = None
 
     def __init__(
         self,
@@ -104,6 +108,9 @@ class InstrumentationSettings:
         version: Literal[1, 2, 3] = DEFAULT_INSTRUMENTATION_VERSION,
         event_mode: Literal['attributes', 'logs'] = 'attributes',
         event_logger_provider: EventLoggerProvider | None = None,
+        input_messages_mode: Literal['full', 'delta'] = 'full',
+        max_content_length: int | None = None,
+        max_messages_bytes: int | None = None,
     ):
         """Create instrumentation options.
 
@@ -132,6 +139,16 @@ class InstrumentationSettings:
                 If not provided, the global event logger provider is used.
                 Calling `logfire.configure()` sets the global event logger provider, so most users don't need this.
                 This is only used if `event_mode='logs'` and `version=1`.
+            input_messages_mode: Which input messages to record on model request spans in version 2 and above.
+                If `'full'`, the whole message history is recorded on every request.
+                If `'delta'`, only the messages added since the previous request in the same conversation are
+                recorded, along with a link to the previous request's span and the number of earlier messages in
+                the `pydantic_ai.input_messages_offset` attribute.
+            max_content_length: The maximum number of characters of each text content, tool call argument and
+                tool call result recorded in version 2 and above. Longer values are truncated.
+            max_messages_bytes: The maximum size in bytes of the JSON recorded for the input and output messages of
+                a model request span in version 2 and above. The oldest input messages are left out to stay within
+                the budget, and their number is recorded in the `pydantic_ai.input_messages_truncated` attribute.
         """
         from pydantic_ai import __version__
 
@@ -145,6 +162,9 @@ class InstrumentationSettings:
         self.event_mode = event_mode
         self.include_binary_content = include_binary_content
         self.include_content = include_content
+        self.input_messages_mode = input_messages_mode
+        self.max_content_length = max_content_length
+        self.max_messages_bytes = max_messages_bytes
 
         if event_mode == 'logs' and version != 1:
             warnings.warn(
@@ -235,7 +255,15 @@ class InstrumentationSettings:
                 result.append(otel_message)
         return result
 
-    def handle_messages(self, input_messages: list[ModelMessage], response: ModelResponse, system: str, span: Span):
+    def handle_messages(
+        self,
+        input_messages: list[ModelMessage],
+        response: ModelResponse,
+        system: str,
+        span: Span,
+        *,
+        input_messages_offset: int = 0,
+    ):
         if self.version == 1:
             events = self.messages_to_otel_events(input_messages)
             for event in self.messages_to_otel_events([response]):
@@ -257,12 +285,32 @@ class InstrumentationSettings:
         else:
             output_messages = self.messages_to_otel_messages([response])
             assert len(output_messages) == 1
-            output_message = output_messages[0]
+            otel_input_messages = self.messages_to_otel_messages(input_messages[input_messages_offset:])
+            if self.max_content_length is not None:
+                for message in (*otel_input_messages, *output_messages):
+                    _truncate_message_content(message, self.max_content_length)
+
+            output_messages_json = json.dumps(output_messages)
+            input_message_jsons = [json.dumps(message) for message in otel_input_messages]
+            truncated_count = 0
+            if self.max_messages_bytes is not None:
+                # Keep the newest input messages that fit in the budget left over by the output message
+                budget = self.max_messages_bytes - len(output_messages_json.encode())
+                keep = 0
+                for message_json in reversed(input_message_jsons):
+                    # Each message also takes up a separator, or the list's brackets for the first one
+                    budget -= len(message_json.encode()) + 2
+                    if budget < 0:
+                        break
+                    keep += 1
+                truncated_count = len(input_message_jsons) - keep
+                input_message_jsons = input_message_jsons[truncated_count:]
+
             instructions = InstrumentedModel._get_instructions(input_messages)  # pyright: ignore [reportPrivateUsage]
             system_instructions_attributes = self.system_instructions_attributes(instructions)
             attributes: dict[str, AttributeValue] = {
-                'gen_ai.input.messages': json.dumps(self.messages_to_otel_messages(input_messages)),
-                'gen_ai.output.messages': json.dumps([output_message]),
+                'gen_ai.input.messages': f'[{", ".join(input_message_jsons)}]',
+                'gen_ai.output.messages': output_messages_json,
                 **system_instructions_attributes,
                 'logfire.json_schema': json.dumps(
                     {
@@ -280,6 +328,10 @@ class InstrumentationSettings:
                     }
                 ),
             }
+            if input_messages_offset:
+                attributes['pydantic_ai.input_messages_offset'] = input_messages_offset
+            if truncated_count:
+                attributes['pydantic_ai.input_messages_truncated'] = truncated_count
             span.set_attributes(attributes)
 
     def system_instructions_attributes(self, instructions: str | None) -> dict[str, str]:
@@ -340,6 +392,9 @@ class InstrumentedModel(WrapperModel):
     instrumentation_settings: InstrumentationSettings
     """Instrumentation settings for this model."""
 
+    _recorded_requests: dict[int, _RecordedRequest] = field(repr=False)
+    """The last recorded request of each conversation, by the `id` of its first message, for `input_messages_mode='delta'`."""
+
     def __init__(
         self,
         wrapped: Model | KnownModelName,
@@ -347,6 +402,7 @@ class InstrumentedModel(WrapperModel):
     ) -> None:
         super().__init__(wrapped)
         self.instrumentation_settings = options or InstrumentationSettings()
+        self._recorded_requests = {}
 
     async def request(
         self,
@@ -415,9 +471,18 @@ class InstrumentedModel(WrapperModel):
                 if isinstance(value := model_settings.get(key), float | int):
                     attributes[f'gen_ai.request.{key}'] = value
 
+        input_messages_offset = 0
+        links: list[Link] = []
+        if (previous_request := self._get_previous_request(messages)) is not None:
+            input_messages_offset = previous_request.message_count
+            links.append(Link(previous_request.span_context))
+            attributes['pydantic_ai.previous_request_span_id'] = format(previous_request.span_context.span_id, '016x')
+
         record_metrics: Callable[[], None] | None = None
         try:
-            with self.instrumentation_settings.tracer.start_as_current_span(span_name, attributes=attributes) as span:
+            with self.instrumentation_settings.tracer.start_as_current_span(
+                span_name, attributes=attributes, links=links
+            ) as span:
 
                 def finish(response: ModelResponse):
                     # FallbackModel updates these span attributes.
@@ -443,7 +508,10 @@ class InstrumentedModel(WrapperModel):
                     if not span.is_recording():
                         return
 
-                    self.instrumentation_settings.handle_messages(messages, response, system, span)
+                    self.instrumentation_settings.handle_messages(
+                        messages, response, system, span, input_messages_offset=input_messages_offset
+                    )
+                    self._record_request(messages, span.get_span_context())
 
                     attributes_to_set = {
                         **response.usage.opentelemetry_attributes(),
@@ -475,6 +543,37 @@ class InstrumentedModel(WrapperModel):
                 # to prevent them from being redundantly recorded in the span itself by logfire.
                 record_metrics()
 
+    def _get_previous_request(self, messages: list[ModelMessage]) -> _RecordedRequest | None:
+        """Find the previous request in the same conversation, if only recording new input messages."""
+        settings = self.instrumentation_settings
+        if settings.input_messages_mode != 'delta' or settings.version == 1 or not messages:
+            return None
+        previous = self._recorded_requests.get(id(messages[0]))
+        # Messages are only appended to the history during a run, so if the previous request's first and last
+        # messages are in the same place, the messages between them were recorded on its span.
+        if (
+            previous is None
+            or previous.first_message() is not messages[0]
+            or len(messages) < previous.message_count
+            or previous.last_message() is not messages[previous.message_count - 1]
+        ):
+            return None
+        return previous
+
+    def _record_request(self, messages: list[ModelMessage], span_context: SpanContext) -> None:
+        if self.instrumentation_settings.input_messages_mode != 'delta' or not messages:
+            return
+        key = id(messages[0])
+        if key not in self._recorded_requests:
+            # Forget the conversation once its first message is garbage collected
+            weakref.finalize(messages[0], self._recorded_requests.pop, key, None)
+        self._recorded_requests[key] = _RecordedRequest(
+            first_message=weakref.ref(messages[0]),
+            last_message=weakref.ref(messages[-1]),
+            message_count=len(messages),
+            span_context=span_context,
+        )
+
     @staticmethod
     def model_attributes(model: Model):
         attributes: dict[str, AttributeValue] = {
@@ -515,5 +614,29 @@ class InstrumentedModel(WrapperModel):
                 return f'Unable to serialize: {e}'
 
 
+@dataclass
+class _RecordedRequest:
+    first_message: weakref.ref[ModelMessage]
+    last_message: weakref.ref[ModelMessage]
+    message_count: int
+    span_context: SpanContext
+
+
+def _truncate_message_content(message: _otel_messages.ChatMessage, max_length: int) -> None:
+    for part in message['parts']:
+        for key in ('content', 'arguments', 'result'):
+            value = part.get(key)
+            if value is None or part['type'] == 'binary':
+                continue
+            if not isinstance(value, str):
+                value = json.dumps(value)
+                if len(value) <= max_length:
+                    continue
+            if len(value) > max_length:
+                cast(dict[str, Any], part)[key] = (
+                    f'{value[:max_length]}... ({len(value) - max_length} characters truncated)'
+                )
+
+
 class CostCalculationFailedWarning(Warning):
     """Warning raised when cost calculation fails."""
@@ -0,0 +1,391 @@
+"""Record real model traffic and replay it later without network access.
+
+[`RecordingModel`][pydantic_ai.models.recording.RecordingModel] wraps a real model and appends every request it makes,
+together with the response and (for streamed requests) the stream events and their timings, to a JSON Lines file.
+[`ReplayModel`][pydantic_ai.models.recording.ReplayModel] serves those responses back for matching requests, optionally
+reproducing the original latencies, so agent runs can be benchmarked deterministically and offline.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+from collections import defaultdict
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, cast
+
+import anyio
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from .. import _utils
+from .._run_context import RunContext
+from ..exceptions import UserError
+from ..messages import (
+    FinalResultEvent,
+    ModelMessage,
+    ModelMessagesTypeAdapter,
+    ModelResponse,
+    ModelResponseStreamEvent,
+    PartDeltaEvent,
+    PartStartEvent,
+    TextPartDelta,
+    ThinkingPartDelta,
+    ToolCallPartDelta,
+)
+from ..profiles import ModelProfileSpec
+from ..settings import ModelSettings
+from . import KnownModelName, Model, ModelRequestParameters, StreamedResponse
+from .wrapper import WrapperModel
+
+__all__ = (
+    'RecordedResponse',
+    'RecordingModel',
+    'ReplayModel',
+    'load_recordings',
+    'request_fingerprint',
+)
+
+
+@dataclass(repr=False, kw_only=True)
+class RecordedResponse:
+    """A single recorded model request and the response it produced."""
+
+    fingerprint: str
+    """The [fingerprint][pydantic_ai.models.recording.request_fingerprint] of the request."""
+
+    response: ModelResponse
+    """The response returned by the model. For streamed requests, this is the response built from the consumed stream."""
+
+    duration: float
+    """Seconds from sending the request until the response was returned, or until the stream was opened."""
+
+    stream_events: list[ModelResponseStreamEvent] | None = None
+    """The events of a streamed response in the order they were received, or `None` if the request wasn't streamed."""
+
+    stream_event_offsets: list[float] | None = None
+    """Seconds from the stream being opened until each of `stream_events` was received."""
+
+    __repr__ = _utils.dataclasses_no_defaults_repr
+
+
+_recorded_response_ta = TypeAdapter(RecordedResponse)
+
+
+def request_fingerprint(
+    messages: Sequence[ModelMessage],
+    model_settings: ModelSettings | None,
+    model_request_parameters: ModelRequestParameters,
+) -> str:
+    """Compute a stable fingerprint for a model request.
+
+    Message timestamps are ignored, as they differ between otherwise identical runs.
+    """
+    dumped_messages = _strip_timestamps(ModelMessagesTypeAdapter.dump_python(list(messages), mode='json'))
+    payload = to_json(
+        {'messages': dumped_messages, 'model_settings': model_settings, 'parameters': model_request_parameters},
+        serialize_unknown=True,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def load_recordings(path: Path | str) -> list[RecordedResponse]:
+    """Load the responses recorded by a [`RecordingModel`][pydantic_ai.models.recording.RecordingModel]."""
+    with Path(path).open('rb') as f:
+        return [_recorded_response_ta.validate_json(line) for line in f if line.strip()]
+
+
+@dataclass(init=False)
+class RecordingModel(WrapperModel):
+    """Model which wraps another model and records its requests and responses to a file.
+
+    Each completed request is appended to `path` as one line of JSON, so a recording can be built up over several runs.
+    Replay it with [`ReplayModel`][pydantic_ai.models.recording.ReplayModel].
+    """
+
+    path: Path
+    """The JSON Lines file recordings are appended to."""
+
+    def __init__(self, wrapped: Model | KnownModelName, path: Path | str):
+        """Initialize a recording model.
+
+        Args:
+            wrapped: The model whose traffic should be recorded.
+            path: The JSON Lines file recordings are appended to. Parent directories are created if needed.
+        """
+        super().__init__(wrapped)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        fingerprint = request_fingerprint(messages, model_settings, model_request_parameters)
+        start = perf_counter()
+        response = await self.wrapped.request(messages, model_settings, model_request_parameters)
+        self._save(RecordedResponse(fingerprint=fingerprint, response=response, duration=perf_counter() - start))
+        return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        fingerprint = request_fingerprint(messages, model_settings, model_request_parameters)
+        start = perf_counter()
+        async with self.wrapped.request_stream(
+            messages, model_settings, model_request_parameters, run_context
+        ) as response_stream:
+            recording_stream = _RecordingStreamedResponse(
+                model_request_parameters=response_stream.model_request_parameters,
+                _wrapped=response_stream,
+                _opened_at=perf_counter(),
+            )
+            duration = recording_stream._opened_at - start  # pyright: ignore[reportPrivateUsage]
+            yield recording_stream
+            self._save(
+                RecordedResponse(
+                    fingerprint=fingerprint,
+                    response=response_stream.get(),
+                    duration=duration,
+                    stream_events=recording_stream.events,
+                    stream_event_offsets=recording_stream.event_offsets,
+                )
+            )
+
+    def _save(self, recorded: RecordedResponse) -> None:
+        with self.path.open('ab') as f:
+            f.write(_recorded_response_ta.dump_json(recorded) + b'\n')
+
+
+@dataclass(init=False)
+class ReplayModel(Model):
+    """Model which answers requests with responses recorded by a [`RecordingModel`][pydantic_ai.models.recording.RecordingModel].
+
+    Requests are matched to recordings by their [fingerprint][pydantic_ai.models.recording.request_fingerprint]. When
+    the same request was recorded several times, the recordings are replayed in order, and the last one is reused once
+    they run out. A request without a matching recording raises a [`UserError`][pydantic_ai.exceptions.UserError].
+
+    As request parameters are customized by the model's profile before they reach the model, pass the
+    profile of the recorded model (e.g. `openai_model_profile('gpt-4o')`) if it differs from the default.
+    """
+
+    path: Path
+    """The JSON Lines file recordings are read from."""
+    preserve_timing: bool
+    """Whether to wait as long as the recorded model did before returning a response or each stream event."""
+
+    _recordings: dict[str, list[RecordedResponse]] = field(repr=False)
+    _replay_counts: dict[str, int] = field(repr=False)
+    _model_name: str = field(repr=False)
+    _system: str = field(repr=False)
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        preserve_timing: bool = False,
+        model_name: str | None = None,
+        system: str | None = None,
+        profile: ModelProfileSpec | None = None,
+        settings: ModelSettings | None = None,
+    ):
+        """Initialize a replay model.
+
+        Args:
+            path: The JSON Lines file written by a `RecordingModel`.
+            preserve_timing: Whether to reproduce the recorded latency of each response and stream event.
+            model_name: The model name to report. Defaults to the model name of the first recorded response.
+            system: The model provider to report. Defaults to the provider name of the first recorded response.
+            profile: The model profile to use, which should match the profile of the recorded model.
+            settings: Model-specific settings that will be used as defaults for this model.
+        """
+        super().__init__(settings=settings, profile=profile)
+        self.path = Path(path)
+        self.preserve_timing = preserve_timing
+        recordings = load_recordings(self.path)
+        self._recordings = defaultdict(list)
+        for recorded in recordings:
+            self._recordings[recorded.fingerprint].append(recorded)
+        self._replay_counts = defaultdict(int)
+        first_response = recordings[0].response if recordings else None
+        self._model_name = model_name or (first_response and first_response.model_name) or 'replay'
+        self._system = system or (first_response and first_response.provider_name) or 'replay'
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        recorded = self._next_recording(messages, model_settings, model_request_parameters)
+        if self.preserve_timing:
+            await anyio.sleep(recorded.duration)
+        return replace(copy.deepcopy(recorded.response), timestamp=_utils.now_utc())
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        recorded = self._next_recording(messages, model_settings, model_request_parameters)
+        if self.preserve_timing:
+            await anyio.sleep(recorded.duration)
+        _, prepared_parameters = self.prepare_request(model_settings, model_request_parameters)
+        yield _ReplayStreamedResponse(
+            model_request_parameters=prepared_parameters,
+            _recorded=recorded,
+            _preserve_timing=self.preserve_timing,
+        )
+
+    @property
+    def model_name(self) -> str:
+        """The model name."""
+        return self._model_name
+
+    @property
+    def system(self) -> str:
+        """The model provider."""
+        return self._system
+
+    def _next_recording(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> RecordedResponse:
+        fingerprint = request_fingerprint(messages, model_settings, model_request_parameters)
+        recordings = self._recordings.get(fingerprint)
+        if not recordings:
+            raise UserError(
+                f'No recorded response in {str(self.path)!r} matches this request (fingerprint {fingerprint[:12]}). '
+                'Record it again with `RecordingModel`.'
+            )
+        index = self._replay_counts[fingerprint]
+        self._replay_counts[fingerprint] += 1
+        return recordings[min(index, len(recordings) - 1)]
+
+
+@dataclass
+class _RecordingStreamedResponse(StreamedResponse):
+    """Passes through a wrapped stream, recording its events and when they arrived."""
+
+    _wrapped: StreamedResponse
+    _opened_at: float
+    events: list[ModelResponseStreamEvent] = field(default_factory=list, init=False)
+    event_offsets: list[float] = field(default_factory=list, init=False)
+
+    async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
+        async for event in self._wrapped:
+            # Final result events are derived from the other events, and are emitted again by this stream
+            if isinstance(event, FinalResultEvent):
+                continue
+            self.events.append(event)
+            self.event_offsets.append(perf_counter() - self._opened_at)
+            yield event
+
+    def get(self) -> ModelResponse:
+        return self._wrapped.get()
+
+    def usage(self):
+        return self._wrapped.usage()
+
+    @property
+    def model_name(self) -> str:
+        return self._wrapped.model_name
+
+    @property
+    def provider_name(self) -> str | None:
+        return self._wrapped.provider_name
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._wrapped.timestamp
+
+
+@dataclass
+class _ReplayStreamedResponse(StreamedResponse):
+    """Replays recorded stream events through the parts manager, so partial responses match the original stream."""
+
+    _recorded: RecordedResponse
+    _preserve_timing: bool
+    _timestamp: datetime = field(default_factory=_utils.now_utc, init=False)
+
+    def __post_init__(self):
+        response = self._recorded.response
+        self._usage = copy.deepcopy(response.usage)
+        self.provider_response_id = response.provider_response_id
+        self.provider_details = copy.deepcopy(response.provider_details)
+        self.finish_reason = response.finish_reason
+
+    async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
+        events = self._recorded.stream_events
+        offsets = self._recorded.stream_event_offsets
+        if events is None:
+            # The request was recorded without streaming, so stream each part of the response in one go.
+            events = [PartStartEvent(index=i, part=part) for i, part in enumerate(self._recorded.response.parts)]
+            offsets = None
+
+        opened_at = perf_counter()
+        for i, event in enumerate(copy.deepcopy(events)):
+            if self._preserve_timing and offsets is not None:
+                await anyio.sleep(max(0.0, opened_at + offsets[i] - perf_counter()))
+            if (replayed := self._apply(event)) is not None:
+                yield replayed
+
+    def _apply(self, event: ModelResponseStreamEvent) -> ModelResponseStreamEvent | None:
+        if isinstance(event, PartStartEvent):
+            return self._parts_manager.handle_part(vendor_part_id=event.index, part=event.part)
+        elif isinstance(event, PartDeltaEvent):
+            delta = event.delta
+            if isinstance(delta, TextPartDelta):
+                return self._parts_manager.handle_text_delta(vendor_part_id=event.index, content=delta.content_delta)
+            elif isinstance(delta, ThinkingPartDelta):
+                return self._parts_manager.handle_thinking_delta(
+                    vendor_part_id=event.index,
+                    content=delta.content_delta,
+                    signature=delta.signature_delta,
+                    provider_name=delta.provider_name,
+                )
+            elif isinstance(delta, ToolCallPartDelta):  # pragma: no branch
+                return self._parts_manager.handle_tool_call_delta(
+                    vendor_part_id=event.index,
+                    tool_name=delta.tool_name_delta,
+                    args=delta.args_delta,
+                    tool_call_id=delta.tool_call_id,
+                )
+        return None  # pragma: no cover
+
+    @property
+    def model_name(self) -> str:
+        return self._recorded.response.model_name or 'replay'
+
+    @property
+    def provider_name(self) -> str | None:
+        return self._recorded.response.provider_name
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._timestamp
+
+
+def _strip_timestamps(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _strip_timestamps(v) for k, v in cast(dict[str, Any], value).items() if k != 'timestamp'}
+    elif isinstance(value, list):
+        return [_strip_timestamps(v) for v in cast(list[Any], value)]
+    return value
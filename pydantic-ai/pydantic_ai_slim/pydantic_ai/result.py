@@ -59,13 +59,26 @@ class AgentStream(Generic[AgentDepsT, OutputDataT]):
         self._initial_run_ctx_usage = deepcopy(self._run_ctx.usage)
 
     async def stream_output(self, *, debounce_by: float | None = 0.1) -> AsyncIterator[OutputDataT]:
-        """Asynchronously stream the (validated) agent outputs."""
+        """Asynchronously stream the (validated) agent outputs.
+
+        Partial outputs are only validated, and output validators only run, when the part(s) the output is read
+        from have changed since the previous response. Each validation still covers the whole output received so far.
+        """
+        # Validating a long structured output is expensive, so we don't do it again if the part(s) the output
+        # is read from haven't changed since the previous response, e.g. because only usage or other parts were updated
+        last_output_source: object = None
+        last_output: tuple[OutputDataT] | None = None
         async for response in self.stream_responses(debounce_by=debounce_by):
             if self._raw_stream_response.final_result_event is not None:
-                try:
-                    yield await self.validate_response_output(response, allow_partial=True)
-                except ValidationError:
-                    pass
+                output_source = self._output_source(response)
+                if last_output_source is None or output_source != last_output_source:
+                    last_output_source = output_source
+                    try:
+                        last_output = (await self.validate_response_output(response, allow_partial=True),)
+                    except ValidationError:
+                        last_output = None
+                if last_output is not None:
+                    yield last_output[0]
         if self._raw_stream_response.final_result_event is not None:  # pragma: no branch
             yield await self.validate_response_output(self.response)
 
@@ -189,6 +202,16 @@ class AgentStream(Generic[AgentDepsT, OutputDataT]):
                 'Invalid response, unable to process text output'
             )
 
+    def _output_source(self, message: _messages.ModelResponse) -> object:
+        """Return the part(s) of the response that `validate_response_output` reads the output from."""
+        final_result_event = self._raw_stream_response.final_result_event
+        if final_result_event is not None and final_result_event.tool_name is not None:
+            for part in message.parts:
+                if isinstance(part, _messages.ToolCallPart) and part.tool_name == final_result_event.tool_name:
+                    return (part.tool_name, part.args)
+        # The parts manager only creates new part objects when they change, so comparing is cheap
+        return list(message.parts)
+
     async def _stream_response_text(
         self, *, delta: bool = False, debounce_by: float | None = 0.1
     ) -> AsyncIterator[str]:
@@ -388,7 +411,9 @@ class StreamedRunResult(Generic[AgentDepsT, OutputDataT]):
 
         The pydantic validator for structured data will be called in
         [partial mode](https://docs.pydantic.dev/dev/concepts/experimental/#partial-validation)
-        on each iteration.
+        on each iteration in which the output has changed, validating everything received so far.
+        If the output hasn't changed since the previous iteration, the previous output is yielded again
+        without running the validator or any [output validators][pydantic_ai.Agent.output_validator].
 
         Args:
             debounce_by: by how much (if at all) to debounce/group the output chunks by. `None` means no debouncing.
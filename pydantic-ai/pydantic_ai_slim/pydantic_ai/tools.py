@@ -11,6 +11,7 @@ from typing_extensions import ParamSpec, Self, TypeVar
 
 from . import _function_schema, _utils
 from ._run_context import AgentDepsT, RunContext
+from ._tool_schema_cache import ToolSchemaCache
 from .exceptions import ModelRetry
 from .messages import RetryPromptPart, ToolCallPart, ToolReturn
 
@@ -32,6 +33,8 @@ __all__ = (
     'DeferredToolResults',
     'ToolApproved',
     'ToolDenied',
+    'ToolSchemaCache',
+    'tool_schema_cache',
 )
 
 
@@ -248,20 +251,14 @@ class Tool(Generic[AgentDepsT]):
     takes_ctx: bool
     max_retries: int | None
     name: str
-    description: str | None
     prepare: ToolPrepareFunc[AgentDepsT] | None
     docstring_format: DocstringFormat
     require_parameter_descriptions: bool
     strict: bool | None
     sequential: bool
+    max_concurrency: int | None
     requires_approval: bool
     metadata: dict[str, Any] | None
-    function_schema: _function_schema.FunctionSchema
-    """
-    The base JSON schema for the tool's parameters.
-
-    This schema may be modified by the `prepare` function or by the Model class prior to including it in an API request.
-    """
 
     def __init__(
         self,
@@ -277,6 +274,7 @@ class Tool(Generic[AgentDepsT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        max_concurrency: int | None = None,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
         function_schema: _function_schema.FunctionSchema | None = None,
@@ -332,28 +330,37 @@ class Tool(Generic[AgentDepsT]):
             strict: Whether to enforce JSON schema compliance (only affects OpenAI).
                 See [`ToolDefinition`][pydantic_ai.tools.ToolDefinition] for more info.
             sequential: Whether the function requires a sequential/serial execution environment. Defaults to False.
+            max_concurrency: The maximum number of calls to this tool that can run concurrently when the model requests
+                several at once. Defaults to `None`, meaning no limit.
             requires_approval: Whether this tool requires human-in-the-loop approval. Defaults to False.
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
             metadata: Optional metadata for the tool. This is not sent to the model but can be used for filtering and tool behavior customization.
-            function_schema: The function schema to use for the tool. If not provided, it will be generated.
+            function_schema: The function schema to use for the tool. If not provided, it will be generated when
+                it's first needed.
         """
         self.function = function
-        self.function_schema = function_schema or _function_schema.function_schema(
-            function,
-            schema_generator,
-            takes_ctx=takes_ctx,
-            docstring_format=docstring_format,
-            require_parameter_descriptions=require_parameter_descriptions,
-        )
-        self.takes_ctx = self.function_schema.takes_ctx
+        self._function_schema = function_schema
+        self._schema_generator = schema_generator
+        self._definition: tuple[str | None, ObjectJsonSchema] | None = None
+        if function_schema is None:
+            # Problems with the signature are reported right away, but the schema itself is only built when needed
+            self.takes_ctx = _function_schema.check_function(
+                function,
+                takes_ctx=takes_ctx,
+                docstring_format=docstring_format,
+                require_parameter_descriptions=require_parameter_descriptions,
+            )
+        else:
+            self.takes_ctx = function_schema.takes_ctx
         self.max_retries = max_retries
         self.name = name or function.__name__
-        self.description = description or self.function_schema.description
+        self._description = description
         self.prepare = prepare
         self.docstring_format = docstring_format
         self.require_parameter_descriptions = require_parameter_descriptions
         self.strict = strict
         self.sequential = sequential
+        self.max_concurrency = max_concurrency
         self.requires_approval = requires_approval
         self.metadata = metadata
 
@@ -402,14 +409,72 @@ class Tool(Generic[AgentDepsT]):
             sequential=sequential,
         )
 
+    @property
+    def function_schema(self) -> _function_schema.FunctionSchema:
+        """The base JSON schema for the tool's parameters, along with the validator for its arguments.
+
+        This is generated the first time it's needed rather than when the tool is created. The JSON schema may be
+        modified by the `prepare` function or by the Model class prior to including it in an API request.
+        """
+        if self._function_schema is None:
+            self._function_schema = _function_schema.function_schema(
+                self.function,
+                self._schema_generator,
+                takes_ctx=self.takes_ctx,
+                docstring_format=self.docstring_format,
+                require_parameter_descriptions=self.require_parameter_descriptions,
+            )
+        return self._function_schema
+
+    @function_schema.setter
+    def function_schema(self, value: _function_schema.FunctionSchema) -> None:
+        self._function_schema = value
+
+    @property
+    def description(self) -> str | None:
+        """Description of the tool, inferred from the function's docstring if not provided."""
+        return self._description or self._schema_definition()[0]
+
+    @description.setter
+    def description(self, value: str | None) -> None:
+        self._description = value
+
+    def _schema_definition(self) -> tuple[str | None, ObjectJsonSchema]:
+        """The description and parameters JSON schema, read from `tool_schema_cache` if set to avoid building the schema."""
+        if self._function_schema is not None:
+            return self._function_schema.description, self._function_schema.json_schema
+        if self._definition is None:
+            cache = tool_schema_cache
+            key = (
+                cache.key(
+                    self.function,
+                    schema_generator=self._schema_generator,
+                    takes_ctx=self.takes_ctx,
+                    docstring_format=self.docstring_format,
+                    require_parameter_descriptions=self.require_parameter_descriptions,
+                )
+                if cache is not None
+                else None
+            )
+            if cache is not None and key is not None and (definition := cache.get(key)) is not None:
+                self._definition = definition
+            else:
+                schema = self.function_schema
+                if cache is not None and key is not None:
+                    cache.set(key, schema.description, schema.json_schema)
+                return schema.description, schema.json_schema
+        return self._definition
+
     @property
     def tool_def(self):
+        description, parameters_json_schema = self._schema_definition()
         return ToolDefinition(
             name=self.name,
-            description=self.description,
-            parameters_json_schema=self.function_schema.json_schema,
+            description=self._description or description,
+            parameters_json_schema=parameters_json_schema,
             strict=self.strict,
             sequential=self.sequential,
+            max_concurrency=self.max_concurrency,
             metadata=self.metadata,
         )
 
@@ -433,6 +498,12 @@ class Tool(Generic[AgentDepsT]):
             return base_tool_def
 
 
+tool_schema_cache: ToolSchemaCache | None = None
+"""An optional persistent cache for the schemas generated for function tools, see [`ToolSchemaCache`][pydantic_ai.tools.ToolSchemaCache].
+
+Set this before registering tools, e.g. `pydantic_ai.tools.tool_schema_cache = ToolSchemaCache('.tool-schema-cache')`.
+"""
+
 ObjectJsonSchema: TypeAlias = dict[str, Any]
 """Type representing JSON schema of an object, e.g. where `"type": "object"`.
 
@@ -482,6 +553,12 @@ class ToolDefinition:
     sequential: bool = False
     """Whether this tool requires a sequential/serial execution environment."""
 
+    max_concurrency: int | None = None
+    """The maximum number of calls to this tool that can run concurrently when a model response contains several, or `None` for no limit.
+
+    Calls over the limit wait for a running call to finish before they start.
+    """
+
     kind: ToolKind = field(default='function')
     """The kind of tool:
 
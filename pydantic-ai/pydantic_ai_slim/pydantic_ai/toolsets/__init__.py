@@ -2,6 +2,7 @@ from ._dynamic import ToolsetFunc
 from .abstract import AbstractToolset, ToolsetTool
 from .approval_required import ApprovalRequiredToolset
 from .combined import CombinedToolset
+from .concurrency_limited import ConcurrencyLimitedToolset
 from .external import DeferredToolset, ExternalToolset  # pyright: ignore[reportDeprecated]
 from .filtered import FilteredToolset
 from .function import FunctionToolset
@@ -24,4 +25,5 @@ __all__ = (
     'PreparedToolset',
     'WrapperToolset',
     'ApprovalRequiredToolset',
+    'ConcurrencyLimitedToolset',
 )
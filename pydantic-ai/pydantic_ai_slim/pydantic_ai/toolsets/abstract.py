@@ -13,6 +13,7 @@ from ..tools import ToolDefinition, ToolsPrepareFunc
 
 if TYPE_CHECKING:
     from .approval_required import ApprovalRequiredToolset
+    from .concurrency_limited import ConcurrencyLimitedToolset
     from .filtered import FilteredToolset
     from .prefixed import PrefixedToolset
     from .prepared import PreparedToolset
@@ -189,3 +190,12 @@ class AbstractToolset(ABC, Generic[AgentDepsT]):
         from .approval_required import ApprovalRequiredToolset
 
         return ApprovalRequiredToolset(self, approval_required_func)
+
+    def concurrency_limited(self, max_concurrency: int) -> ConcurrencyLimitedToolset[AgentDepsT]:
+        """Returns a new toolset that limits the number of calls to this toolset's tools that can run concurrently.
+
+        See [toolset docs](../toolsets.md#limiting-concurrency) for more information.
+        """
+        from .concurrency_limited import ConcurrencyLimitedToolset
+
+        return ConcurrencyLimitedToolset(self, max_concurrency)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from .._run_context import AgentDepsT, RunContext
+from .abstract import AbstractToolset, ToolsetTool
+from .wrapper import WrapperToolset
+
+
+@dataclass
+class ConcurrencyLimitedToolset(WrapperToolset[AgentDepsT]):
+    """A toolset that limits the number of calls to the tools it contains that can run concurrently.
+
+    The limit is shared by all agent runs using this toolset, which makes it suitable for applying backpressure to a
+    rate-limited service. Calls over the limit wait for a running call to finish before they start.
+
+    See [toolset docs](../toolsets.md#limiting-concurrency) for more information.
+    """
+
+    max_concurrency: int
+
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.max_concurrency < 1:
+            raise ValueError('`max_concurrency` must be at least 1')
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def visit_and_replace(
+        self, visitor: Callable[[AbstractToolset[AgentDepsT]], AbstractToolset[AgentDepsT]]
+    ) -> AbstractToolset[AgentDepsT]:
+        # Agent runs use a copy of the toolset made by this method, which must keep sharing the same semaphore
+        toolset = replace(self, wrapped=self.wrapped.visit_and_replace(visitor))
+        toolset._semaphore = self._semaphore
+        return toolset
+
+    async def call_tool(
+        self, name: str, tool_args: dict[str, Any], ctx: RunContext[AgentDepsT], tool: ToolsetTool[AgentDepsT]
+    ) -> Any:
+        async with self._semaphore:
+            return await super().call_tool(name, tool_args, ctx, tool)
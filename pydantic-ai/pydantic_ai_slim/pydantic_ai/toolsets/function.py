@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, replace
-from typing import Any, overload
+from functools import partial
+from typing import Any, Literal, overload
 
 from pydantic.json_schema import GenerateJsonSchema
 
+from .. import _utils
 from .._run_context import AgentDepsT, RunContext
 from ..exceptions import UserError
 from ..tools import (
@@ -117,6 +119,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         schema_generator: type[GenerateJsonSchema] | None = None,
         strict: bool | None = None,
         sequential: bool | None = None,
+        max_concurrency: int | None = None,
         requires_approval: bool | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> Callable[[ToolFuncEither[AgentDepsT, ToolParams]], ToolFuncEither[AgentDepsT, ToolParams]]: ...
@@ -135,6 +138,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         schema_generator: type[GenerateJsonSchema] | None = None,
         strict: bool | None = None,
         sequential: bool | None = None,
+        max_concurrency: int | None = None,
         requires_approval: bool | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> Any:
@@ -188,6 +192,8 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
                 If `None`, the default value is determined by the toolset.
             sequential: Whether the function requires a sequential/serial execution environment. Defaults to False.
                 If `None`, the default value is determined by the toolset.
+            max_concurrency: The maximum number of calls to this tool that can run concurrently when the model requests
+                several at once. Defaults to `None`, meaning no limit.
             requires_approval: Whether this tool requires human-in-the-loop approval. Defaults to False.
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
                 If `None`, the default value is determined by the toolset.
@@ -211,6 +217,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
                 schema_generator=schema_generator,
                 strict=strict,
                 sequential=sequential,
+                max_concurrency=max_concurrency,
                 requires_approval=requires_approval,
                 metadata=metadata,
             )
@@ -231,6 +238,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         schema_generator: type[GenerateJsonSchema] | None = None,
         strict: bool | None = None,
         sequential: bool | None = None,
+        max_concurrency: int | None = None,
         requires_approval: bool | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> None:
@@ -262,6 +270,8 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
                 If `None`, the default value is determined by the toolset.
             sequential: Whether the function requires a sequential/serial execution environment. Defaults to False.
                 If `None`, the default value is determined by the toolset.
+            max_concurrency: The maximum number of calls to this tool that can run concurrently when the model requests
+                several at once. Defaults to `None`, meaning no limit.
             requires_approval: Whether this tool requires human-in-the-loop approval. Defaults to False.
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
                 If `None`, the default value is determined by the toolset.
@@ -293,6 +303,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
             schema_generator=schema_generator,
             strict=strict,
             sequential=sequential,
+            max_concurrency=max_concurrency,
             requires_approval=requires_approval,
             metadata=metadata,
         )
@@ -337,9 +348,9 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
                 toolset=self,
                 tool_def=tool_def,
                 max_retries=max_retries,
-                args_validator=tool.function_schema.validator,
-                call_func=tool.function_schema.call,
-                is_async=tool.function_schema.is_async,
+                args_validator=_DeferredArgsValidator(tool),
+                call_func=partial(_call_tool_function, tool),
+                is_async=_utils.is_async_callable(tool.function),
             )
         return tools
 
@@ -348,3 +359,28 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
     ) -> Any:
         assert isinstance(tool, FunctionToolsetTool)
         return await tool.call_func(tool_args, ctx)
+
+
+@dataclass
+class _DeferredArgsValidator:
+    """Validates a tool's arguments with the validator from its function schema, which is built on first use."""
+
+    tool: Tool[Any]
+
+    def validate_json(
+        self,
+        input: str | bytes | bytearray,
+        *,
+        allow_partial: bool | Literal['off', 'on', 'trailing-strings'] = False,
+        **kwargs: Any,
+    ) -> Any:
+        return self.tool.function_schema.validator.validate_json(input, allow_partial=allow_partial, **kwargs)
+
+    def validate_python(
+        self, input: Any, *, allow_partial: bool | Literal['off', 'on', 'trailing-strings'] = False, **kwargs: Any
+    ) -> Any:
+        return self.tool.function_schema.validator.validate_python(input, allow_partial=allow_partial, **kwargs)
+
+
+async def _call_tool_function(tool: Tool[Any], args: dict[str, Any], ctx: RunContext[Any]) -> Any:
+    return await tool.function_schema.call(args, ctx)
@@ -0,0 +1,159 @@
+"""Persistent caching of task outputs and evaluator results between evaluation runs.
+
+Pass an [`EvaluationCache`][pydantic_evals.cache.EvaluationCache] to
+[`Dataset.evaluate`][pydantic_evals.Dataset.evaluate] to skip re-running the task for cases whose inputs haven't
+changed, and to skip re-running evaluators whose configuration and inputs haven't changed.
+"""
+
+from __future__ import annotations as _annotations
+
+import hashlib
+import pickle
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic_core import to_json
+from typing_extensions import Self
+
+from ._utils import UNSET, Unset
+
+__all__ = (
+    'EvaluationCache',
+    'EvaluationCacheStats',
+)
+
+DEFAULT_MAX_SIZE_BYTES = 512 * 1024 * 1024
+"""Default maximum total size of the values stored in an [`EvaluationCache`][pydantic_evals.cache.EvaluationCache]."""
+
+
+@dataclass
+class EvaluationCacheStats:
+    """Cache hit and miss counts for a single evaluation run."""
+
+    task_hits: int = 0
+    """The number of cases whose task output was loaded from the cache."""
+    task_misses: int = 0
+    """The number of cases whose task had to be executed."""
+    evaluator_hits: int = 0
+    """The number of evaluator runs whose results were loaded from the cache."""
+    evaluator_misses: int = 0
+    """The number of evaluator runs that had to be executed."""
+
+
+class EvaluationCache:
+    """An on-disk cache of task outputs and evaluator results, backed by SQLite.
+
+    Task outputs are keyed by the task name, the `task_version` passed to
+    [`Dataset.evaluate`][pydantic_evals.Dataset.evaluate] and the case inputs. Bump `task_version` whenever the task's
+    behavior changes so stale outputs are not reused. Evaluator results are keyed by the serialized
+    [`EvaluatorSpec`][pydantic_evals.evaluators.EvaluatorSpec] and everything the evaluator can see: the case name,
+    inputs, output, expected output, metadata, metrics and attributes.
+
+    Cached task outputs don't come with a span tree. If the result of an evaluator that inspects spans (like
+    [`HasMatchingSpan`][pydantic_evals.evaluators.HasMatchingSpan]) isn't cached for a cached task output, the task is
+    run again, and all evaluators for that case are run against the fresh output.
+
+    Only successful task runs and evaluator runs are cached. Values are stored with `pickle`, so only open cache
+    files you created yourself.
+
+    When the total size of the stored values exceeds `max_size_bytes`, the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: Path | str, *, max_size_bytes: int | None = DEFAULT_MAX_SIZE_BYTES):
+        """Open (or create) a cache file.
+
+        Args:
+            path: Path to the SQLite database file. Parent directories are created if needed.
+            max_size_bytes: The maximum total size of cached values, or `None` for no limit.
+        """
+        self.path = Path(path)
+        self.max_size_bytes = max_size_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_access INTEGER NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)')
+        # A logical clock rather than wall time, so accesses within the same clock tick are still ordered.
+        self._clock: int = self._conn.execute('SELECT COALESCE(MAX(last_access), 0) FROM entries').fetchone()[0]
+
+    def get(self, key: str) -> Any | Unset:
+        """Look up a value, returning `UNSET` on a miss."""
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return UNSET
+            self._conn.execute('UPDATE entries SET last_access = ? WHERE key = ?', (self._tick(), key))
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if the cache grows beyond `max_size_bytes`.
+
+        Values that can't be pickled are not cached.
+        """
+        try:
+            data = pickle.dumps(value)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO entries (key, value, size, last_access) VALUES (?, ?, ?, ?)',
+                (key, data, len(data), self._tick()),
+            )
+            if self.max_size_bytes is not None:
+                self._evict(self.max_size_bytes)
+
+    def size_bytes(self) -> int:
+        """The total size of the values currently stored."""
+        with self._lock:
+            return self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._conn.execute('DELETE FROM entries')
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def _evict(self, max_size_bytes: int) -> None:
+        excess = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0] - max_size_bytes
+        if excess <= 0:
+            return
+        evicted: list[str] = []
+        for key, size in self._conn.execute('SELECT key, size FROM entries ORDER BY last_access'):
+            evicted.append(key)
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany('DELETE FROM entries WHERE key = ?', [(key,) for key in evicted])
+
+
+def cache_key(kind: str, *parts: Any) -> str:
+    """Build a stable cache key from JSON-serializable parts.
+
+    Values pydantic can't serialize fall back to their `str()` form.
+    """
+    digest = hashlib.sha256(kind.encode())
+    for part in parts:
+        digest.update(b'\0')
+        digest.update(to_json(part, serialize_unknown=True))
+    return f'{kind}:{digest.hexdigest()}'
@@ -15,10 +15,10 @@ import sys
 import time
 import traceback
 import warnings
-from collections.abc import Awaitable, Callable, Mapping, Sequence
-from contextlib import AsyncExitStack, nullcontext
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager, nullcontext
 from contextvars import ContextVar
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from inspect import iscoroutinefunction
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, Literal, Union, cast
@@ -27,6 +27,7 @@ import anyio
 import logfire_api
 import yaml
 from anyio import to_thread
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, model_serializer
 from pydantic._internal import _typing_extra
 from pydantic_core import to_json
@@ -36,7 +37,8 @@ from typing_extensions import NotRequired, Self, TypedDict, TypeVar
 
 from pydantic_evals._utils import get_event_loop
 
-from ._utils import get_unwrapped_function_name, logfire_span, task_group_gather
+from ._utils import get_unwrapped_function_name, is_set, logfire_span, task_group_gather
+from .cache import EvaluationCache, EvaluationCacheStats, cache_key
 from .evaluators import EvaluationResult, Evaluator
 from .evaluators._run_evaluator import run_evaluator
 from .evaluators.common import DEFAULT_EVALUATORS
@@ -45,7 +47,8 @@ from .evaluators.evaluator import EvaluatorFailure
 from .evaluators.spec import EvaluatorSpec
 from .otel import SpanTree
 from .otel._context_subtree import context_subtree
-from .reporting import EvaluationReport, ReportCase, ReportCaseAggregate, ReportCaseFailure
+from .otel._errors import SpanTreeRecordingError
+from .reporting import EvaluationReport, ReportCase, ReportCaseAggregate, ReportCaseAggregator, ReportCaseFailure
 
 if TYPE_CHECKING:
     from pydantic_ai.retries import RetryConfig
@@ -58,6 +61,7 @@ else:
 __all__ = (
     'Case',
     'Dataset',
+    'EvaluationRun',
     'increment_eval_metric',
     'set_eval_attribute',
 )
@@ -265,6 +269,8 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
         retry_evaluators: RetryConfig | None = None,
         *,
         task_name: str | None = None,
+        cache: EvaluationCache | None = None,
+        task_version: str | None = None,
     ) -> EvaluationReport[InputsT, OutputT, MetadataT]:
         """Evaluates the test cases in the dataset using the given task.
 
@@ -283,6 +289,10 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             retry_evaluators: Optional retry configuration for evaluator execution.
             task_name: Optional override to the name of the task being executed, otherwise the name of the task
                 function will be used.
+            cache: Optional [`EvaluationCache`][pydantic_evals.cache.EvaluationCache] used to reuse task outputs and
+                evaluator results from previous runs with the same inputs.
+            task_version: A version string for the task, included in the cache key. Change it whenever the task's
+                behavior changes so cached outputs from the old version are not reused.
 
         Returns:
             A report containing the results of the evaluation.
@@ -291,6 +301,7 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
         name = name or task_name
         total_cases = len(self.cases)
         progress_bar = Progress() if progress else None
+        cache_context = _CacheContext(cache, task_name, task_version) if cache is not None else None
 
         limiter = anyio.Semaphore(max_concurrency) if max_concurrency is not None else AsyncExitStack()
 
@@ -310,7 +321,7 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             async def _handle_case(case: Case[InputsT, OutputT, MetadataT], report_case_name: str):
                 async with limiter:
                     result = await _run_task_and_evaluators(
-                        task, case, report_case_name, self.evaluators, retry_task, retry_evaluators
+                        task, case, report_case_name, self.evaluators, retry_task, retry_evaluators, cache_context
                     )
                     if progress_bar and task_id is not None:  # pragma: no branch
                         progress_bar.update(task_id, advance=1)
@@ -341,6 +352,7 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
                 failures=failures,
                 span_id=span_id,
                 trace_id=trace_id,
+                cache_stats=cache_context.stats if cache_context is not None else None,
             )
             if (averages := report.averages()) is not None and averages.assertions is not None:
                 experiment_metadata = {'n_cases': len(self.cases), 'averages': averages}
@@ -356,6 +368,9 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
         progress: bool = True,
         retry_task: RetryConfig | None = None,
         retry_evaluators: RetryConfig | None = None,
+        *,
+        cache: EvaluationCache | None = None,
+        task_version: str | None = None,
     ) -> EvaluationReport[InputsT, OutputT, MetadataT]:
         """Evaluates the test cases in the dataset using the given task.
 
@@ -371,6 +386,9 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             progress: Whether to show a progress bar for the evaluation. Defaults to True.
             retry_task: Optional retry configuration for the task execution.
             retry_evaluators: Optional retry configuration for evaluator execution.
+            cache: Optional [`EvaluationCache`][pydantic_evals.cache.EvaluationCache] used to reuse task outputs and
+                evaluator results from previous runs with the same inputs.
+            task_version: A version string for the task, included in the cache key.
 
         Returns:
             A report containing the results of the evaluation.
@@ -383,9 +401,163 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
                 progress=progress,
                 retry_task=retry_task,
                 retry_evaluators=retry_evaluators,
+                cache=cache,
+                task_version=task_version,
             )
         )
 
+    @asynccontextmanager
+    async def evaluate_iter(
+        self,
+        task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+        cases: Iterable[Case[InputsT, OutputT, MetadataT]]
+        | AsyncIterable[Case[InputsT, OutputT, MetadataT]]
+        | None = None,
+        *,
+        name: str | None = None,
+        task_name: str | None = None,
+        max_concurrency: int = 10,
+        progress: bool = True,
+        retry_task: RetryConfig | None = None,
+        retry_evaluators: RetryConfig | None = None,
+        cache: EvaluationCache | None = None,
+        task_version: str | None = None,
+    ) -> AsyncIterator[EvaluationRun[InputsT, OutputT, MetadataT]]:
+        """Evaluate cases as a stream, yielding each result as soon as it completes.
+
+        Unlike [`evaluate`][pydantic_evals.Dataset.evaluate], which starts every case up front and keeps all results
+        until the report is built, this pulls cases lazily from `cases` and runs them on a fixed pool of
+        `max_concurrency` workers. Only running aggregates are retained, so memory use stays bounded however many
+        cases are evaluated.
+
+        ```python
+        from pydantic_evals import Case, Dataset
+
+
+        async def double(inputs: int) -> int:
+            return inputs * 2
+
+
+        async def main():
+            dataset = Dataset[int, int, None](cases=[])
+            cases = (Case(inputs=i, expected_output=i * 2) for i in range(1_000))
+            async with dataset.evaluate_iter(double, cases, max_concurrency=5, progress=False) as run:
+                async for result in run:
+                    ...
+            print(run.n_cases, run.n_failures)
+            #> 1000 0
+        ```
+
+        Args:
+            task: The task to evaluate. This should be a callable that takes the inputs of the case
+                and returns the output.
+            cases: The cases to evaluate, as a (sync or async) iterable that is consumed lazily, for example a
+                generator or [`iter_cases_from_jsonl`][pydantic_evals.Dataset.iter_cases_from_jsonl].
+                If omitted, the dataset's own cases are used. The dataset's evaluators are applied either way.
+            name: The name of the experiment being run.
+                If omitted, the task_name will be used; if that is not specified, the name of the task function is used.
+            task_name: Optional override to the name of the task being executed, otherwise the name of the task
+                function will be used.
+            max_concurrency: The number of workers evaluating cases concurrently.
+            progress: Whether to show a progress bar for the evaluation. Defaults to `True`.
+            retry_task: Optional retry configuration for the task execution.
+            retry_evaluators: Optional retry configuration for evaluator execution.
+            cache: Optional [`EvaluationCache`][pydantic_evals.cache.EvaluationCache] used to reuse task outputs and
+                evaluator results from previous runs with the same inputs.
+            task_version: A version string for the task, included in the cache key.
+
+        Yields:
+            An [`EvaluationRun`][pydantic_evals.dataset.EvaluationRun] to iterate over for results. Results are yielded
+            in completion order, not case order. Exiting the context early cancels any cases still running.
+        """
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        task_name = task_name or get_unwrapped_function_name(task)
+        name = name or task_name
+        source = self.cases if cases is None else cases
+        progress_bar = Progress() if progress else None
+        cache_context = _CacheContext(cache, task_name, task_version) if cache is not None else None
+
+        cases_send, cases_receive = anyio.create_memory_object_stream[tuple[int, Case[InputsT, OutputT, MetadataT]]](
+            max_concurrency
+        )
+        results_send, results_receive = anyio.create_memory_object_stream[
+            ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]
+        ](max_concurrency)
+
+        with (
+            logfire_span(
+                'evaluate {name}',
+                name=name,
+                task_name=task_name,
+                dataset_name=self.name,
+                **{'gen_ai.operation.name': 'experiment'},  # pyright: ignore[reportArgumentType]
+            ) as eval_span,
+            progress_bar or nullcontext(),
+        ):
+            task_id = progress_bar.add_task(f'Evaluating {task_name}', total=None) if progress_bar else None
+
+            if (context := eval_span.context) is None:  # pragma: no cover
+                trace_id = None
+                span_id = None
+            else:
+                trace_id = f'{context.trace_id:032x}'
+                span_id = f'{context.span_id:016x}'
+            run = EvaluationRun[InputsT, OutputT, MetadataT](
+                name=name,
+                trace_id=trace_id,
+                span_id=span_id,
+                cache_stats=cache_context.stats if cache_context is not None else None,
+                _results=results_receive,
+            )
+
+            async def _feed_cases() -> None:
+                async with cases_send:
+                    i = 0
+                    if isinstance(source, AsyncIterable):
+                        async for case in source:
+                            i += 1
+                            await cases_send.send((i, case))
+                    else:
+                        for case in source:
+                            i += 1
+                            await cases_send.send((i, case))
+
+            async def _worker(send: MemoryObjectSendStream[Any]) -> None:
+                async with send:
+                    async for i, case in cases_receive:
+                        result = await _run_task_and_evaluators(
+                            task,
+                            case,
+                            case.name or f'Case {i}',
+                            self.evaluators,
+                            retry_task,
+                            retry_evaluators,
+                            cache_context,
+                        )
+                        run._record(result)  # pyright: ignore[reportPrivateUsage]
+                        if progress_bar and task_id is not None:  # pragma: no branch
+                            progress_bar.update(task_id, advance=1)
+                        await send.send(result)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(_feed_cases)
+                async with results_send:
+                    for _ in range(max_concurrency):
+                        tg.start_soon(_worker, results_send.clone())
+                try:
+                    yield run
+                finally:
+                    tg.cancel_scope.cancel()
+                    cases_receive.close()
+                    results_receive.close()
+
+            eval_span.set_attribute('n_cases', run.n_cases + run.n_failures)
+            if (averages := run.averages()) is not None and averages.assertions is not None:
+                experiment_metadata = {'n_cases': run.n_cases + run.n_failures, 'averages': averages}
+                eval_span.set_attribute('logfire.experiment.metadata', experiment_metadata)
+                eval_span.set_attribute('assertion_pass_rate', averages.assertions)
+
     def add_case(
         self,
         *,
@@ -588,22 +760,7 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             dataset_evaluators.append(dataset_evaluator)
 
         for row in dataset_model.cases:
-            evaluators: list[Evaluator] = []
-            for spec in row.evaluators:
-                try:
-                    evaluator = _load_evaluator_from_registry(registry, row.name, spec)
-                except ValueError as e:
-                    errors.append(e)
-                    continue
-                evaluators.append(evaluator)
-            row = Case[InputsT, OutputT, MetadataT](
-                name=row.name,
-                inputs=row.inputs,
-                metadata=row.metadata,
-                expected_output=row.expected_output,
-            )
-            row.evaluators = evaluators
-            cases.append(row)
+            cases.append(_case_from_model(registry, row, errors))
         if errors:
             raise ExceptionGroup(f'{len(errors)} error(s) loading evaluators from registry', errors[:3])
         result = cls(name=dataset_model.name, cases=cases)
@@ -612,6 +769,44 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
         result.evaluators = dataset_evaluators
         return result
 
+    @classmethod
+    def iter_cases_from_jsonl(
+        cls,
+        path: Path | str,
+        custom_evaluator_types: Sequence[type[Evaluator[InputsT, OutputT, MetadataT]]] = (),
+    ) -> Iterator[Case[InputsT, OutputT, MetadataT]]:
+        """Lazily load cases from a JSON Lines file, for use with [`evaluate_iter`][pydantic_evals.Dataset.evaluate_iter].
+
+        Each non-empty line must be a single case in the same format used for cases in a serialized dataset.
+        The file is read one line at a time, so arbitrarily large files can be streamed.
+
+        Args:
+            path: Path to the JSONL file to read.
+            custom_evaluator_types: Custom evaluator classes to use when deserializing case-specific evaluators.
+                These are additional evaluators beyond the default ones.
+
+        Yields:
+            One [`Case`][pydantic_evals.Case] per line of the file.
+
+        Raises:
+            ValueError: If a line does not match the schema for a case of this dataset.
+        """
+        registry = _get_registry(custom_evaluator_types)
+        case_model_type = cls._case_serialization_type()
+        with Path(path).open(encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = case_model_type.model_validate_json(line)
+                except ValidationError as e:
+                    raise ValueError(f'{path}:{line_number} does not match the schema for a case:\n{e}.') from e
+                errors: list[ValueError] = []
+                case = _case_from_model(registry, row, errors)
+                if errors:
+                    raise ExceptionGroup(f'{len(errors)} error(s) loading evaluators from registry', errors[:3])
+                yield case
+
     def to_file(
         self,
         path: Path | str,
@@ -763,6 +958,13 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
         input_type, output_type, metadata_type = cls._params()
         return _DatasetModel[input_type, output_type, metadata_type]
 
+    @classmethod
+    @functools.cache
+    def _case_serialization_type(cls) -> type[_CaseModel[InputsT, OutputT, MetadataT]]:
+        """Get the serialization type for a single case of this dataset class."""
+        input_type, output_type, metadata_type = cls._params()
+        return _CaseModel[input_type, output_type, metadata_type]
+
     @classmethod
     def _infer_fmt(cls, path: Path, fmt: Literal['yaml', 'json'] | None) -> Literal['yaml', 'json']:
         """Infer the format to use for a file based on its extension.
@@ -832,6 +1034,83 @@ def _get_relative_path_reference(target: Path, source: Path, _prefix: str = '')
         return _get_relative_path_reference(target, source.parent, _prefix=f'{_prefix}../')
 
 
+@dataclass(kw_only=True)
+class EvaluationRun(Generic[InputsT, OutputT, MetadataT]):
+    """A streaming evaluation started by [`Dataset.evaluate_iter`][pydantic_evals.Dataset.evaluate_iter].
+
+    Iterate over it to receive each [`ReportCase`][pydantic_evals.reporting.ReportCase] or
+    [`ReportCaseFailure`][pydantic_evals.reporting.ReportCaseFailure] as soon as it completes.
+    Results are not retained; only counts and running averages are kept.
+    """
+
+    name: str
+    """The name of the experiment."""
+    trace_id: str | None = None
+    """The trace ID of the evaluation."""
+    span_id: str | None = None
+    """The span ID of the evaluation."""
+    n_failures: int = 0
+    """The number of cases whose task raised an exception so far."""
+    cache_stats: EvaluationCacheStats | None = None
+    """Cache hits and misses so far, if a cache was passed to `evaluate_iter`."""
+
+    _results: MemoryObjectReceiveStream[
+        ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]
+    ] = field(repr=False)
+    _aggregator: ReportCaseAggregator = field(default_factory=ReportCaseAggregator, repr=False)
+
+    @property
+    def n_cases(self) -> int:
+        """The number of cases that completed successfully so far."""
+        return self._aggregator.n_cases
+
+    def averages(self) -> ReportCaseAggregate | None:
+        """The averages over the successfully completed cases so far, or `None` if there are none yet."""
+        if self._aggregator.n_cases:
+            return self._aggregator.aggregate()
+        return None
+
+    async def __aiter__(
+        self,
+    ) -> AsyncIterator[ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]]:
+        async for result in self._results:
+            yield result
+
+    def _record(
+        self, result: ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]
+    ) -> None:
+        if isinstance(result, ReportCase):
+            self._aggregator.add(result)
+        else:
+            self.n_failures += 1
+
+
+@dataclass
+class _CacheContext:
+    """The cache and the task identity used to build cache keys during a single evaluation."""
+
+    cache: EvaluationCache
+    task_name: str
+    task_version: str | None
+    stats: EvaluationCacheStats = field(default_factory=EvaluationCacheStats)
+
+    def task_key(self, case: Case[Any, Any, Any]) -> str:
+        return cache_key('task', self.task_name, self.task_version, case.inputs)
+
+    def evaluator_key(self, evaluator: Evaluator[Any, Any, Any], ctx: EvaluatorContext) -> str:
+        return cache_key(
+            'evaluator',
+            evaluator.as_spec(),
+            ctx.name,
+            ctx.inputs,
+            ctx.output,
+            ctx.expected_output,
+            ctx.metadata,
+            ctx.metrics,
+            ctx.attributes,
+        )
+
+
 @dataclass
 class _TaskRun:
     """Internal class to track metrics and attributes for a task run."""
@@ -874,6 +1153,30 @@ class _TaskRun:
         self.attributes[name] = value
 
 
+def _case_from_model(
+    registry: Mapping[str, type[Evaluator[Any, Any, Any]]],
+    row: _CaseModel[InputsT, OutputT, MetadataT],
+    errors: list[ValueError],
+) -> Case[InputsT, OutputT, MetadataT]:
+    """Create a Case from a _CaseModel, appending any evaluator loading errors to `errors`."""
+    evaluators: list[Evaluator] = []
+    for spec in row.evaluators:
+        try:
+            evaluator = _load_evaluator_from_registry(registry, row.name, spec)
+        except ValueError as e:
+            errors.append(e)
+            continue
+        evaluators.append(evaluator)
+    case = Case[InputsT, OutputT, MetadataT](
+        name=row.name,
+        inputs=row.inputs,
+        metadata=row.metadata,
+        expected_output=row.expected_output,
+    )
+    case.evaluators = evaluators
+    return case
+
+
 async def _run_task(
     task: Callable[[InputsT], Awaitable[OutputT] | OutputT],
     case: Case[InputsT, OutputT, MetadataT],
@@ -961,6 +1264,7 @@ async def _run_task_and_evaluators(
     dataset_evaluators: list[Evaluator[InputsT, OutputT, MetadataT]],
     retry_task: RetryConfig | None,
     retry_evaluators: RetryConfig | None,
+    cache: _CacheContext | None = None,
 ) -> ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]:
     """Run a task on a case and evaluate the results.
 
@@ -971,6 +1275,7 @@ async def _run_task_and_evaluators(
         dataset_evaluators: Evaluators from the dataset to apply to this case.
         retry_task: The retry config to use for running the task.
         retry_evaluators: The retry config to use for running the evaluators.
+        cache: The cache to read task outputs and evaluator results from and write them to, if any.
 
     Returns:
         A ReportCase containing the evaluation results.
@@ -992,20 +1297,28 @@ async def _run_task_and_evaluators(
                 span_id = f'{context.span_id:016x}'
 
             t0 = time.time()
-            scoring_context = await _run_task(task, case, retry_task)
+            if cache is None:
+                scoring_context = await _run_task(task, case, retry_task)
+            else:
+                scoring_context = await _run_task_cached(task, case, retry_task, cache)
 
-            case_span.set_attribute('output', scoring_context.output)
-            case_span.set_attribute('task_duration', scoring_context.duration)
-            case_span.set_attribute('metrics', scoring_context.metrics)
-            case_span.set_attribute('attributes', scoring_context.attributes)
+            _set_task_span_attributes(case_span, scoring_context)
 
             evaluators = case.evaluators + dataset_evaluators
             evaluator_outputs: list[EvaluationResult] = []
             evaluator_failures: list[EvaluatorFailure] = []
             if evaluators:
-                evaluator_outputs_by_task = await task_group_gather(
-                    [lambda ev=ev: run_evaluator(ev, scoring_context, retry_evaluators) for ev in evaluators]
-                )
+                if cache is None:
+                    evaluator_outputs_by_task = await task_group_gather(
+                        [lambda ev=ev: run_evaluator(ev, scoring_context, retry_evaluators) for ev in evaluators]
+                    )
+                else:
+                    task_context = scoring_context
+                    scoring_context, evaluator_outputs_by_task = await _run_evaluators_cached(
+                        task, case, retry_task, evaluators, task_context, retry_evaluators, cache
+                    )
+                    if scoring_context is not task_context:
+                        _set_task_span_attributes(case_span, scoring_context)
                 for outputs in evaluator_outputs_by_task:
                     if isinstance(outputs, EvaluatorFailure):
                         evaluator_failures.append(outputs)
@@ -1048,6 +1361,126 @@ async def _run_task_and_evaluators(
         )
 
 
+def _set_task_span_attributes(span: logfire_api.LogfireSpan, ctx: EvaluatorContext[Any, Any, Any]) -> None:
+    span.set_attribute('output', ctx.output)
+    span.set_attribute('task_duration', ctx.duration)
+    span.set_attribute('metrics', ctx.metrics)
+    span.set_attribute('attributes', ctx.attributes)
+
+
+@dataclass(kw_only=True)
+class _CachedTaskContext(EvaluatorContext[InputsT, OutputT, MetadataT]):
+    """An evaluator context for a task output loaded from the cache, which has no span tree."""
+
+    span_tree_requested: bool = field(default=False, init=False)
+    """Whether an evaluator tried to access the span tree."""
+
+    @property
+    def span_tree(self) -> SpanTree:
+        self.span_tree_requested = True
+        return super().span_tree
+
+
+async def _run_task_cached(
+    task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+    case: Case[InputsT, OutputT, MetadataT],
+    retry: RetryConfig | None,
+    cache: _CacheContext,
+) -> EvaluatorContext[InputsT, OutputT, MetadataT]:
+    """Load the task output for a case from the cache, or run the task and cache its output."""
+    cached = cache.cache.get(cache.task_key(case))
+    if not is_set(cached):
+        cache.stats.task_misses += 1
+        return await _run_task_and_cache(task, case, retry, cache)
+
+    cache.stats.task_hits += 1
+    output, duration, attributes, metrics = cached
+    return _CachedTaskContext[InputsT, OutputT, MetadataT](
+        name=case.name,
+        inputs=case.inputs,
+        metadata=case.metadata,
+        expected_output=case.expected_output,
+        output=output,
+        duration=duration,
+        _span_tree=SpanTreeRecordingError('No spans were recorded because the task output was loaded from the cache.'),
+        attributes=attributes,
+        metrics=metrics,
+    )
+
+
+async def _run_task_and_cache(
+    task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+    case: Case[InputsT, OutputT, MetadataT],
+    retry: RetryConfig | None,
+    cache: _CacheContext,
+) -> EvaluatorContext[InputsT, OutputT, MetadataT]:
+    ctx = await _run_task(task, case, retry)
+    cache.cache.set(cache.task_key(case), (ctx.output, ctx.duration, ctx.attributes, ctx.metrics))
+    return ctx
+
+
+async def _run_evaluators_cached(
+    task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+    case: Case[InputsT, OutputT, MetadataT],
+    retry_task: RetryConfig | None,
+    evaluators: Sequence[Evaluator[InputsT, OutputT, MetadataT]],
+    ctx: EvaluatorContext[InputsT, OutputT, MetadataT],
+    retry_evaluators: RetryConfig | None,
+    cache: _CacheContext,
+) -> tuple[EvaluatorContext[InputsT, OutputT, MetadataT], list[list[EvaluationResult] | EvaluatorFailure]]:
+    """Run the evaluators for a case using the cache.
+
+    If the task output was loaded from the cache and an evaluator that isn't cached needs the span tree,
+    the task cache hit is treated as a miss: the task is run again and all evaluators are run against the fresh output.
+
+    Returns:
+        The evaluator context that was used, and the results of each evaluator.
+    """
+    outputs = await task_group_gather(
+        [lambda ev=ev: _run_evaluator_cached(ev, ctx, retry_evaluators, cache) for ev in evaluators]
+    )
+    results = [output for output in outputs if output is not None]
+    if len(results) == len(outputs):
+        return ctx, results
+
+    cache.stats.task_hits -= 1
+    cache.stats.task_misses += 1
+    task_ctx = await _run_task_and_cache(task, case, retry_task, cache)
+    outputs = await task_group_gather(
+        [lambda ev=ev: _run_evaluator_cached(ev, task_ctx, retry_evaluators, cache) for ev in evaluators]
+    )
+    return task_ctx, [output for output in outputs if output is not None]
+
+
+async def _run_evaluator_cached(
+    evaluator: Evaluator[InputsT, OutputT, MetadataT],
+    ctx: EvaluatorContext[InputsT, OutputT, MetadataT],
+    retry: RetryConfig | None,
+    cache: _CacheContext,
+) -> list[EvaluationResult] | EvaluatorFailure | None:
+    """Load an evaluator's results from the cache, or run it and cache its results if it succeeds.
+
+    Returns `None` if the task output was loaded from the cache and the evaluator needs the span tree,
+    which a cached task output doesn't have.
+    """
+    key = cache.evaluator_key(evaluator, ctx)
+    cached = cache.cache.get(key)
+    if is_set(cached):
+        cache.stats.evaluator_hits += 1
+        return cached
+
+    cache.stats.evaluator_misses += 1
+    if isinstance(ctx, _CachedTaskContext):
+        # Use a copy per evaluator, so we know which evaluator accessed the span tree
+        ctx = replace(ctx)
+    results = await run_evaluator(evaluator, ctx, retry)
+    if isinstance(ctx, _CachedTaskContext) and ctx.span_tree_requested:
+        return None
+    if not isinstance(results, EvaluatorFailure):
+        cache.cache.set(key, results)
+    return results
+
+
 _evaluation_results_adapter = TypeAdapter(Mapping[str, EvaluationResult])
 
 
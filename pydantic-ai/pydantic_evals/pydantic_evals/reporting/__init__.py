@@ -13,6 +13,7 @@ from typing_extensions import TypedDict, TypeVar
 
 from pydantic_evals._utils import UNSET, Unset
 
+from ..cache import EvaluationCacheStats
 from ..evaluators import EvaluationResult
 from .render_numbers import (
     default_render_duration,
@@ -33,6 +34,7 @@ __all__ = (
     'RenderValueConfig',
     'RenderNumberConfig',
     'ReportCaseAggregate',
+    'ReportCaseAggregator',
 )
 
 from ..evaluators.evaluator import EvaluatorFailure
@@ -122,10 +124,62 @@ class ReportCaseAggregate(BaseModel):
     @staticmethod
     def average(cases: list[ReportCase]) -> ReportCaseAggregate:
         """Produce a synthetic "summary" case by averaging quantitative attributes."""
-        num_cases = len(cases)
-        if num_cases == 0:
+        aggregator = ReportCaseAggregator()
+        for case in cases:
+            aggregator.add(case)
+        return aggregator.aggregate()
+
+
+@dataclass
+class ReportCaseAggregator:
+    """Running totals for building a [`ReportCaseAggregate`][pydantic_evals.reporting.ReportCaseAggregate].
+
+    Cases are folded in one at a time with [`add`][pydantic_evals.reporting.ReportCaseAggregator.add], so averages
+    can be computed over arbitrarily many cases without keeping the cases themselves in memory.
+    """
+
+    name: str = 'Averages'
+    """The name given to the aggregate case."""
+    n_cases: int = 0
+    """The number of cases added so far."""
+
+    _score_sums: dict[str, float] = field(default_factory=lambda: defaultdict(float), repr=False)
+    _score_counts: dict[str, int] = field(default_factory=lambda: defaultdict(int), repr=False)
+    _label_counts: dict[str, dict[str, int]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(int)), repr=False
+    )
+    _label_totals: dict[str, int] = field(default_factory=lambda: defaultdict(int), repr=False)
+    _metric_sums: dict[str, float] = field(default_factory=lambda: defaultdict(float), repr=False)
+    _metric_counts: dict[str, int] = field(default_factory=lambda: defaultdict(int), repr=False)
+    _n_assertions: int = field(default=0, repr=False)
+    _n_passing_assertions: int = field(default=0, repr=False)
+    _task_duration_sum: float = field(default=0.0, repr=False)
+    _total_duration_sum: float = field(default=0.0, repr=False)
+
+    def add(self, case: ReportCase) -> None:
+        """Fold a single case into the running totals."""
+        self.n_cases += 1
+        self._task_duration_sum += case.task_duration
+        self._total_duration_sum += case.total_duration
+        for name, score in case.scores.items():
+            self._score_counts[name] += 1
+            self._score_sums[name] += score.value
+        for name, label in case.labels.items():
+            self._label_totals[name] += 1
+            self._label_counts[name][label.value] += 1
+        for name, metric in case.metrics.items():
+            self._metric_counts[name] += 1
+            self._metric_sums[name] += metric
+        for assertion in case.assertions.values():
+            self._n_assertions += 1
+            if assertion.value:
+                self._n_passing_assertions += 1
+
+    def aggregate(self) -> ReportCaseAggregate:
+        """Build the aggregate case from the cases added so far."""
+        if self.n_cases == 0:
             return ReportCaseAggregate(
-                name='Averages',
+                name=self.name,
                 scores={},
                 labels={},
                 metrics={},
@@ -134,53 +188,17 @@ class ReportCaseAggregate(BaseModel):
                 total_duration=0.0,
             )
 
-        def _scores_averages(scores_by_name: list[dict[str, int | float | bool]]) -> dict[str, float]:
-            counts_by_name: dict[str, int] = defaultdict(int)
-            sums_by_name: dict[str, float] = defaultdict(float)
-            for sbn in scores_by_name:
-                for name, score in sbn.items():
-                    counts_by_name[name] += 1
-                    sums_by_name[name] += score
-            return {name: sums_by_name[name] / counts_by_name[name] for name in sums_by_name}
-
-        def _labels_averages(labels_by_name: list[dict[str, str]]) -> dict[str, dict[str, float]]:
-            counts_by_name: dict[str, int] = defaultdict(int)
-            sums_by_name: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
-            for lbn in labels_by_name:
-                for name, label in lbn.items():
-                    counts_by_name[name] += 1
-                    sums_by_name[name][label] += 1
-            return {
-                name: {value: count / counts_by_name[name] for value, count in sums_by_name[name].items()}
-                for name in sums_by_name
-            }
-
-        average_task_duration = sum(case.task_duration for case in cases) / num_cases
-        average_total_duration = sum(case.total_duration for case in cases) / num_cases
-
-        # average_assertions: dict[str, float] = _scores_averages([{k: v.value for k, v in case.scores.items()} for case in cases])
-        average_scores: dict[str, float] = _scores_averages(
-            [{k: v.value for k, v in case.scores.items()} for case in cases]
-        )
-        average_labels: dict[str, dict[str, float]] = _labels_averages(
-            [{k: v.value for k, v in case.labels.items()} for case in cases]
-        )
-        average_metrics: dict[str, float] = _scores_averages([case.metrics for case in cases])
-
-        average_assertions: float | None = None
-        n_assertions = sum(len(case.assertions) for case in cases)
-        if n_assertions > 0:
-            n_passing = sum(1 for case in cases for assertion in case.assertions.values() if assertion.value)
-            average_assertions = n_passing / n_assertions
-
         return ReportCaseAggregate(
-            name='Averages',
-            scores=average_scores,
-            labels=average_labels,
-            metrics=average_metrics,
-            assertions=average_assertions,
-            task_duration=average_task_duration,
-            total_duration=average_total_duration,
+            name=self.name,
+            scores={name: total / self._score_counts[name] for name, total in self._score_sums.items()},
+            labels={
+                name: {value: count / self._label_totals[name] for value, count in counts.items()}
+                for name, counts in self._label_counts.items()
+            },
+            metrics={name: total / self._metric_counts[name] for name, total in self._metric_sums.items()},
+            assertions=self._n_passing_assertions / self._n_assertions if self._n_assertions else None,
+            task_duration=self._task_duration_sum / self.n_cases,
+            total_duration=self._total_duration_sum / self.n_cases,
         )
 
 
@@ -200,6 +218,9 @@ class EvaluationReport(Generic[InputsT, OutputT, MetadataT]):
     """The trace ID of the evaluation."""
     span_id: str | None = None
     """The span ID of the evaluation."""
+    cache_stats: EvaluationCacheStats | None = None
+    """Cache hits and misses for the evaluation, if it was run with an
+    [`EvaluationCache`][pydantic_evals.cache.EvaluationCache]."""
 
     def averages(self) -> ReportCaseAggregate | None:
         if self.cases:
@@ -6,19 +6,17 @@ import types
 import warnings
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
-from functools import partial
+from functools import cache, partial
 from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, get_args, get_origin
 
-from logfire_api import Logfire, LogfireSpan
 from typing_extensions import ParamSpec, TypeIs
 from typing_inspection import typing_objects
 from typing_inspection.introspection import is_union_origin
 
 if TYPE_CHECKING:
+    from logfire_api import Logfire, LogfireSpan
     from opentelemetry.trace import Span
 
-_logfire = Logfire(otel_scope='pydantic-graph')
-
 AbstractSpan: TypeAlias = 'LogfireSpan | Span'
 
 try:
@@ -142,18 +140,29 @@ async def run_in_executor(func: Callable[_P, _R], *args: _P.args, **kwargs: _P.k
         return await asyncio.get_running_loop().run_in_executor(None, func, *args)  # type: ignore
 
 
-try:
-    from logfire._internal.config import (
-        LogfireNotConfiguredWarning,  # pyright: ignore[reportAssignmentType,reportPrivateImportUsage]
-    )
-except ImportError:  # pragma: lax no cover
+@cache
+def _get_logfire() -> Logfire:
+    # `logfire_api` imports `logfire` when it's installed, which is slow, so it's only imported once a span is needed
+    from logfire_api import Logfire
+
+    return Logfire(otel_scope='pydantic-graph')
+
 
-    class LogfireNotConfiguredWarning(UserWarning):
-        pass
+class _UnusedWarning(UserWarning):
+    pass
+
+
+@cache
+def _logfire_not_configured_warning() -> type[Warning]:
+    try:
+        from logfire._internal.config import LogfireNotConfiguredWarning  # pyright: ignore[reportPrivateImportUsage]
+    except ImportError:  # pragma: lax no cover
+        return _UnusedWarning
+    return LogfireNotConfiguredWarning
 
 
 if TYPE_CHECKING:
-    logfire_span = _logfire.span
+    logfire_span = Logfire(otel_scope='pydantic-graph').span
 else:
 
     @contextmanager
@@ -161,8 +170,8 @@ else:
         """Create a Logfire span without warning if logfire is not configured."""
         # TODO: Remove once Logfire has the ability to suppress this warning from non-user code
         with warnings.catch_warnings():
-            warnings.filterwarnings('ignore', category=LogfireNotConfiguredWarning)
-            with _logfire.span(*args, **kwargs) as span:
+            warnings.filterwarnings('ignore', category=_logfire_not_configured_warning())
+            with _get_logfire().span(*args, **kwargs) as span:
                 yield span
 
 
@@ -473,11 +473,20 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
     iter_stream_sender: MemoryObjectSendStream[_GraphTaskResult] = field(init=False)
     iter_stream_receiver: MemoryObjectReceiveStream[_GraphTaskResult] = field(init=False)
     _task_group: TaskGroup | None = field(init=False)
+    _joins_by_tracked_node: dict[NodeID, list[JoinID]] = field(init=False)
+    """The joins whose parent fork run can't complete while a task is in each node."""
+    _fork_run_task_counts: dict[tuple[JoinID, NodeRunID], int] = field(init=False)
+    """The number of active tasks that prevent each join's parent fork run from completing."""
 
     def __post_init__(self):
         self.cancel_scopes = {}
         self.active_tasks = {}
         self.active_reducers = {}
+        self._joins_by_tracked_node = {}
+        for join_id, parent_fork in self.graph.parent_forks.items():
+            for node_id in (*parent_fork.intermediate_nodes, join_id):
+                self._joins_by_tracked_node.setdefault(node_id, []).append(join_id)
+        self._fork_run_task_counts = {}
         self.iter_stream_sender, self.iter_stream_receiver = create_memory_object_stream[_GraphTaskResult]()
 
     @property
@@ -493,7 +502,7 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
             async with self.iter_stream_sender, create_task_group() as self._task_group:
                 try:
                     # Fire off the first task
-                    self.active_tasks[first_task.task_id] = first_task
+                    self._add_active_task(first_task)
                     self._handle_execution_request([first_task])
 
                     # Handle task results
@@ -534,16 +543,13 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
                                         await self._finish_task(task_result.source.task_id)
                                 else:
                                     for new_task in maybe_overridden_result:
-                                        self.active_tasks[new_task.task_id] = new_task
+                                        self._add_active_task(new_task)
                                     if task_result.source_is_finished:
                                         await self._finish_task(task_result.source.task_id)
 
-                                tasks_by_id_values = list(self.active_tasks.values())
                                 join_tasks: list[GraphTask] = []
 
-                                for join_id, fork_run_id in self._get_completed_fork_runs(
-                                    task_result.source, tasks_by_id_values
-                                ):
+                                for join_id, fork_run_id in self._get_completed_fork_runs(task_result.source):
                                     join_state = self.active_reducers.pop((join_id, fork_run_id))
                                     join_node = self.graph.nodes[join_id]
                                     assert isinstance(join_node, Join), f'Expected a `Join` but got {join_node}'
@@ -553,7 +559,7 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
                                     join_tasks.extend(new_tasks)
                                 if join_tasks:
                                     for new_task in join_tasks:
-                                        self.active_tasks[new_task.task_id] = new_task
+                                        self._add_active_task(new_task)
                                     self._handle_execution_request(join_tasks)
 
                                 if isinstance(maybe_overridden_result, Sequence):
@@ -599,7 +605,7 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
                                         self.task_group.cancel_scope.cancel()
                                         return
                                     for new_task in maybe_overridden_result:
-                                        self.active_tasks[new_task.task_id] = new_task
+                                        self._add_active_task(new_task)
                                     new_task_ids = {t.task_id for t in maybe_overridden_result}
                                     for t in new_tasks:
                                         # Same note as above about how this is theoretically reachable but we should
@@ -619,11 +625,39 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
         scope = self.cancel_scopes.pop(task_id, None)
         if scope is not None:
             scope.cancel()
-        self.active_tasks.pop(task_id, None)
+        self._remove_active_task(task_id)
+
+    def _add_active_task(self, task: GraphTask) -> None:
+        existing = self.active_tasks.get(task.task_id)
+        if existing is task:
+            return
+        if existing is not None:  # pragma: no cover
+            self._count_fork_run_task(existing, -1)
+        self.active_tasks[task.task_id] = task
+        self._count_fork_run_task(task, 1)
+
+    def _remove_active_task(self, task_id: TaskID) -> None:
+        task = self.active_tasks.pop(task_id, None)
+        if task is not None:
+            self._count_fork_run_task(task, -1)
+
+    def _count_fork_run_task(self, task: GraphTask, delta: int) -> None:
+        join_ids = self._joins_by_tracked_node.get(task.node_id)
+        if not join_ids:
+            return
+        counts = self._fork_run_task_counts
+        for item in task.fork_stack:
+            for join_id in join_ids:
+                key = (join_id, item.node_run_id)
+                count = counts.get(key, 0) + delta
+                if count:
+                    counts[key] = count
+                else:
+                    del counts[key]
 
     def _handle_execution_request(self, request: Sequence[GraphTask]) -> None:
         for new_task in request:
-            self.active_tasks[new_task.task_id] = new_task
+            self._add_active_task(new_task)
         for new_task in request:
             self.task_group.start_soon(self._run_tracked_task, new_task)
 
@@ -715,22 +749,16 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
         else:
             assert_never(next_node)
 
-    def _get_completed_fork_runs(
-        self,
-        t: GraphTask,
-        active_tasks: Iterable[GraphTask],
-    ) -> list[tuple[JoinID, NodeRunID]]:
+    def _get_completed_fork_runs(self, t: GraphTask) -> list[tuple[JoinID, NodeRunID]]:
         completed_fork_runs: list[tuple[JoinID, NodeRunID]] = []
 
-        fork_run_indices = {fsi.node_run_id: i for i, fsi in enumerate(t.fork_stack)}
-        for join_id, fork_run_id in self.active_reducers.keys():
-            fork_run_index = fork_run_indices.get(fork_run_id)
-            if fork_run_index is None:
-                continue  # The fork_run_id is not in the current task's fork stack, so this task didn't complete it.
-
-            # This reducer _may_ now be ready to finalize:
-            if self._is_fork_run_completed(active_tasks, join_id, fork_run_id):
-                completed_fork_runs.append((join_id, fork_run_id))
+        # Only reducers for fork runs in the current task's fork stack can have been completed by this task
+        for fsi in t.fork_stack:
+            for join_id in self.graph.parent_forks:
+                key = (join_id, fsi.node_run_id)
+                # This reducer _may_ now be ready to finalize:
+                if key in self.active_reducers and self._is_fork_run_completed(join_id, fsi.node_run_id):
+                    completed_fork_runs.append(key)
 
         return completed_fork_runs
 
@@ -810,17 +838,10 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
                 new_tasks += self._handle_path(path, inputs, fork_stack + (ForkStackItem(node.id, node_run_id, i),))
         return new_tasks
 
-    def _is_fork_run_completed(self, tasks: Iterable[GraphTask], join_id: JoinID, fork_run_id: NodeRunID) -> bool:
-        # Check if any of the tasks in the graph have this fork_run_id in their fork_stack
-        # If this is the case, then the fork run is not yet completed
-        parent_fork = self.graph.get_parent_fork(join_id)
-        for t in tasks:
-            if fork_run_id in {x.node_run_id for x in t.fork_stack}:
-                if t.node_id in parent_fork.intermediate_nodes or t.node_id == join_id:
-                    return False
-            else:
-                pass
-        return True
+    def _is_fork_run_completed(self, join_id: JoinID, fork_run_id: NodeRunID) -> bool:
+        # The fork run is not yet completed while any active task with this fork_run_id in its fork_stack
+        # is in one of the parent fork's intermediate nodes, or in the join itself
+        return (join_id, fork_run_id) not in self._fork_run_task_counts
 
     async def _cancel_sibling_tasks(self, parent_fork_id: ForkID, node_run_id: NodeRunID):
         task_ids_to_cancel = set[TaskID]()
@@ -0,0 +1,162 @@
+from __future__ import annotations as _annotations
+
+import os
+import secrets
+import sys
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+import anyio
+
+if sys.platform != 'win32':
+    import fcntl
+
+__all__ = 'FileLockStats', 'file_lock'
+
+
+@dataclass
+class FileLockStats:
+    """Statistics about how long a persistence instance has waited to acquire its file lock."""
+
+    acquisitions: int = 0
+    """Number of times the lock has been acquired."""
+    contended: int = 0
+    """Number of acquisitions that had to wait, either for another task in this process or for another process."""
+    timeouts: int = 0
+    """Number of attempts to acquire the lock that timed out."""
+    wait_time: float = 0.0
+    """Total time in seconds spent waiting to acquire the lock."""
+    max_wait_time: float = 0.0
+    """Longest time in seconds spent waiting for a single acquisition."""
+
+
+@dataclass
+class _ProcessLock:
+    # a semaphore rather than a lock, so a task trying to take a lock it already holds waits and times out
+    lock: anyio.Semaphore = field(default_factory=lambda: anyio.Semaphore(1))
+    users: int = 0
+
+
+_process_locks: dict[tuple[Path, int], _ProcessLock] = {}
+_process_locks_guard = threading.Lock()
+
+
+@asynccontextmanager
+async def file_lock(file: Path, *, timeout: float = 1.0, stats: FileLockStats | None = None) -> AsyncIterator[None]:
+    """Lock a file using an advisory lock on a `.pydantic-graph-persistence-lock` file next to it.
+
+    Tasks in the same thread wait on an in-process lock first, so only one of them at a time
+    takes the advisory lock and they never poll the filesystem to coordinate with each other.
+
+    Args:
+        file: the file to lock
+        timeout: how long to wait for the lock
+        stats: lock statistics to update
+
+    Returns: an async context manager that holds the lock
+    """
+    lock_file = file.absolute().parent / f'{file.name}.pydantic-graph-persistence-lock'
+    # event loops are per thread, and anyio locks can't be shared between them
+    key = lock_file, threading.get_ident()
+    with _process_locks_guard:
+        process_lock = _process_locks.setdefault(key, _ProcessLock())
+        process_lock.users += 1
+
+    start = perf_counter()
+    contended = False
+    fd: int | None = None
+    try:
+        try:
+            with anyio.fail_after(timeout):
+                if not (contended := process_lock.lock.value == 0):
+                    process_lock.lock.acquire_nowait()
+                else:
+                    await process_lock.lock.acquire()
+                try:
+                    fd, waited = await _acquire_file_lock(lock_file)
+                    contended = contended or waited
+                except BaseException:
+                    process_lock.lock.release()
+                    raise
+        except TimeoutError:
+            if stats is not None:
+                stats.timeouts += 1
+            raise
+
+        if stats is not None:
+            wait_time = perf_counter() - start
+            stats.acquisitions += 1
+            stats.contended += contended
+            stats.wait_time += wait_time
+            stats.max_wait_time = max(stats.max_wait_time, wait_time)
+
+        try:
+            yield
+        finally:
+            try:
+                _release_file_lock(lock_file, fd)
+            finally:
+                process_lock.lock.release()
+    finally:
+        with _process_locks_guard:
+            process_lock.users -= 1
+            if not process_lock.users:
+                del _process_locks[key]
+
+
+if sys.platform != 'win32':
+
+    async def _acquire_file_lock(lock_file: Path) -> tuple[int, bool]:
+        """Take an exclusive `flock` on the lock file, returning its file descriptor and whether we had to wait."""
+        fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            delay = 0.001
+            waited = False
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    waited = True
+                    await anyio.sleep(delay)
+                    delay = min(delay * 2, 0.05)
+                else:
+                    return fd, waited
+        except BaseException:
+            os.close(fd)
+            raise
+
+    def _release_file_lock(lock_file: Path, fd: int | None) -> None:
+        # the lock file is left in place, deleting it would let another process lock a different inode
+        assert fd is not None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+else:  # pragma: no cover
+
+    async def _acquire_file_lock(lock_file: Path) -> tuple[int, bool]:
+        """Create the lock file with a random token, waiting until no other process holds it."""
+        lock_id = secrets.token_urlsafe().encode()
+        waited = False
+        while not await _file_append_check(lock_file, lock_id):
+            waited = True
+            await anyio.sleep(0.01)
+        return -1, waited
+
+    def _release_file_lock(lock_file: Path, fd: int | None) -> None:
+        lock_file.unlink(missing_ok=True)
+
+    async def _file_append_check(file: Path, content: bytes) -> bool:
+        path = anyio.Path(file)
+        if await path.exists():
+            return False
+
+        async with await anyio.open_file(path, mode='ab') as f:
+            await f.write(content + b'\n')
+
+        return (await path.read_bytes()).startswith(content)
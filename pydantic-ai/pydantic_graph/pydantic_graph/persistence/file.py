@@ -1,6 +1,5 @@
 from __future__ import annotations as _annotations
 
-import secrets
 from collections.abc import AsyncIterator
 from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass, field
@@ -8,7 +7,6 @@ from pathlib import Path
 from time import perf_counter
 from typing import Any
 
-import anyio
 import pydantic
 
 from .. import _utils as _graph_utils, exceptions
@@ -24,6 +22,7 @@ from . import (
     _utils,
     build_snapshot_list_type_adapter,
 )
+from ._file_lock import FileLockStats, file_lock
 
 
 @dataclass
@@ -47,6 +46,8 @@ class FileStatePersistence(BaseStatePersistence[StateT, RunEndT]):
     persistence = FullStatePersistence(Path('runs') / f'{run_id}.json')
     ```
     """
+    lock_stats: FileLockStats = field(default_factory=lambda: FileLockStats(), init=False, repr=False)
+    """Statistics about time spent waiting for the lock on `json_file`."""
     _snapshots_type_adapter: pydantic.TypeAdapter[list[Snapshot[StateT, RunEndT]]] | None = field(
         default=None, init=False, repr=False
     )
@@ -146,32 +147,12 @@ class FileStatePersistence(BaseStatePersistence[StateT, RunEndT]):
 
     @asynccontextmanager
     async def _lock(self, *, timeout: float = 1.0) -> AsyncIterator[None]:
-        """Lock a file by checking and writing a `.pydantic-graph-persistence-lock` to it.
+        """Lock the JSON file using an advisory lock on a `.pydantic-graph-persistence-lock` file next to it.
 
         Args:
             timeout: how long to wait for the lock
 
         Returns: an async context manager that holds the lock
         """
-        lock_file = self.json_file.parent / f'{self.json_file.name}.pydantic-graph-persistence-lock'
-        lock_id = secrets.token_urlsafe().encode()
-
-        with anyio.fail_after(timeout):
-            while not await _file_append_check(lock_file, lock_id):
-                await anyio.sleep(0.01)
-
-        try:
+        async with file_lock(self.json_file, timeout=timeout, stats=self.lock_stats):
             yield
-        finally:
-            await _graph_utils.run_in_executor(lock_file.unlink, missing_ok=True)
-
-
-async def _file_append_check(file: Path, content: bytes) -> bool:
-    path = anyio.Path(file)
-    if await path.exists():
-        return False
-
-    async with await anyio.open_file(path, mode='ab') as f:
-        await f.write(content + b'\n')
-
-    return (await path.read_bytes()).startswith(content)
@@ -0,0 +1,335 @@
+from __future__ import annotations as _annotations
+
+import os
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Annotated, Any, Literal
+
+import pydantic
+from typing_extensions import NotRequired, TypedDict
+
+from .. import _utils as _graph_utils, exceptions
+from ..nodes import BaseNode, End
+from . import (
+    BaseStatePersistence,
+    EndSnapshot,
+    NodeSnapshot,
+    RunEndT,
+    Snapshot,
+    SnapshotStatus,
+    StateT,
+    _utils,
+)
+from ._file_lock import FileLockStats, file_lock
+
+__all__ = ('JournalStatePersistence',)
+
+
+@dataclass
+class JournalStatePersistence(BaseStatePersistence[StateT, RunEndT]):
+    """File based state persistence that appends snapshots and status changes to a JSON lines journal.
+
+    Unlike [`FileStatePersistence`][pydantic_graph.persistence.file.FileStatePersistence], which rewrites the whole
+    file on every change, each snapshot and each status change is appended to the journal as a single line, and
+    the journal is folded back into a list of snapshots when it's loaded. Only the lines appended since the journal
+    was last read are parsed, so the cost of persisting a step doesn't grow with the length of the run.
+    """
+
+    journal_file: Path
+    """Path to the JSON lines file where the journal is stored.
+
+    You should use a different file for each graph run, but a single file should be reused for multiple
+    steps of the same run.
+
+    For example if you have a run ID of the form `run_123abc`, you might create a `JournalStatePersistence` thus:
+
+    ```py
+    from pathlib import Path
+
+    from pydantic_graph.persistence.journal import JournalStatePersistence
+
+    run_id = 'run_123abc'
+    persistence = JournalStatePersistence(Path('runs') / f'{run_id}.jsonl')
+    ```
+    """
+    fsync_every: int | None = None
+    """Flush the journal to disk with `fsync` after this many records have been appended.
+
+    Records are always flushed when the run ends. If `None`, flushing is left to the operating system,
+    like with [`FileStatePersistence`][pydantic_graph.persistence.file.FileStatePersistence].
+    """
+    compact_after: int | None = None
+    """Compact the journal once it contains this many status change records, if set.
+
+    See [`compact`][pydantic_graph.persistence.journal.JournalStatePersistence.compact].
+    """
+
+    lock_stats: FileLockStats = field(default_factory=lambda: FileLockStats(), init=False, repr=False)
+    """Statistics about time spent waiting for the lock on `journal_file`."""
+    _snapshot_type_adapter: pydantic.TypeAdapter[Snapshot[StateT, RunEndT]] | None = field(
+        default=None, init=False, repr=False
+    )
+    _journal: _Journal = field(default_factory=lambda: _Journal(), init=False, repr=False)
+
+    async def snapshot_node(self, state: StateT, next_node: BaseNode[StateT, Any, RunEndT]) -> None:
+        await self._append_snapshot(NodeSnapshot(state=state, node=next_node))
+
+    async def snapshot_node_if_new(
+        self, snapshot_id: str, state: StateT, next_node: BaseNode[StateT, Any, RunEndT]
+    ) -> None:
+        await self._append_snapshot(NodeSnapshot(state=state, node=next_node), if_new_id=snapshot_id)
+
+    async def snapshot_end(self, state: StateT, end: End[RunEndT]) -> None:
+        await self._append_snapshot(EndSnapshot(state=state, result=end), fsync=True)
+
+    @asynccontextmanager
+    async def record_run(self, snapshot_id: str) -> AsyncIterator[None]:
+        async with self._lock():
+            await _graph_utils.run_in_executor(self._start_run_sync, snapshot_id)
+
+        start = perf_counter()
+        try:
+            yield
+        except Exception:
+            duration = perf_counter() - start
+            async with self._lock():
+                await _graph_utils.run_in_executor(self._append_status_sync, snapshot_id, 'error', duration=duration)
+            raise
+        else:
+            duration = perf_counter() - start
+            async with self._lock():
+                await _graph_utils.run_in_executor(self._append_status_sync, snapshot_id, 'success', duration=duration)
+
+    async def load_next(self) -> NodeSnapshot[StateT, RunEndT] | None:
+        async with self._lock():
+            return await _graph_utils.run_in_executor(self._load_next_sync)
+
+    def should_set_types(self) -> bool:
+        """Whether types need to be set."""
+        return self._snapshot_type_adapter is None
+
+    def set_types(self, state_type: type[StateT], run_end_type: type[RunEndT]) -> None:
+        self._snapshot_type_adapter = pydantic.TypeAdapter(
+            Annotated[Snapshot[state_type, run_end_type], pydantic.Discriminator('kind')]
+        )
+
+    async def load_all(self) -> list[Snapshot[StateT, RunEndT]]:
+        return await _graph_utils.run_in_executor(self._load_all_sync)
+
+    async def compact(self) -> None:
+        """Rewrite the journal with a single record for each snapshot, dropping the status change records.
+
+        The compacted journal is written to a temporary file which then replaces the journal, so readers in other
+        processes will either see the old journal or the compacted one.
+        """
+        async with self._lock():
+            await _graph_utils.run_in_executor(self._compact_sync)
+
+    def _load_all_sync(self) -> list[Snapshot[StateT, RunEndT]]:
+        with self._journal.lock:
+            self._refresh_sync()
+            return [self._build_snapshot(entry) for entry in self._journal.entries]
+
+    def _load_next_sync(self) -> NodeSnapshot[StateT, RunEndT] | None:
+        with self._journal.lock:
+            self._refresh_sync()
+            entry = next((e for e in self._journal.entries if e.status == 'created'), None)
+            if entry is None:
+                return None
+            self._append_sync(_dump_status_record(entry.id, 'pending'))
+            snapshot = self._build_snapshot(entry)
+            assert isinstance(snapshot, NodeSnapshot), 'Only NodeSnapshot can have a status'
+            return snapshot
+
+    def _start_run_sync(self, snapshot_id: str) -> None:
+        with self._journal.lock:
+            self._refresh_sync()
+            try:
+                entry = self._journal.entries_by_id[snapshot_id]
+            except KeyError as e:
+                raise LookupError(f'No snapshot found with id={snapshot_id!r}') from e
+
+            assert entry.status is not None, 'Only NodeSnapshot can be recorded'
+            exceptions.GraphNodeStatusError.check(entry.status)
+            self._append_sync(_dump_status_record(snapshot_id, 'running', start_ts=_utils.now_utc()))
+
+    def _append_status_sync(self, snapshot_id: str, status: SnapshotStatus, *, duration: float) -> None:
+        with self._journal.lock:
+            self._refresh_sync()
+            self._append_sync(_dump_status_record(snapshot_id, status, duration=duration))
+
+    async def _append_snapshot(
+        self, snapshot: Snapshot[StateT, RunEndT], *, if_new_id: str | None = None, fsync: bool = False
+    ) -> None:
+        assert self._snapshot_type_adapter is not None, 'snapshot type adapter must be set'
+        record = self._snapshot_type_adapter.dump_json(snapshot)
+        async with self._lock():
+            await _graph_utils.run_in_executor(self._append_snapshot_sync, record, if_new_id, fsync)
+
+    def _append_snapshot_sync(self, record: bytes, if_new_id: str | None, fsync: bool) -> None:
+        with self._journal.lock:
+            self._refresh_sync()
+            if if_new_id is None or if_new_id not in self._journal.entries_by_id:  # pragma: no branch
+                self._append_sync(record, fsync=fsync)
+
+    def _append_sync(self, record: bytes, *, fsync: bool = False) -> None:
+        """Append a record to the journal, which must have just been refreshed while holding the file lock."""
+        journal = self._journal
+        with self.journal_file.open('ab') as f:
+            f.write(record + b'\n')
+            f.flush()
+            journal.unsynced += 1
+            if self.fsync_every is not None and (fsync or journal.unsynced >= self.fsync_every):
+                os.fsync(f.fileno())
+                journal.unsynced = 0
+            stat = os.fstat(f.fileno())
+
+        # As the journal was up to date and we hold the lock, nobody else can have appended in the meantime
+        journal.file_id = (stat.st_dev, stat.st_ino)
+        journal.offset = stat.st_size
+        journal.apply(record)
+
+        if self.compact_after is not None and journal.status_records >= self.compact_after:
+            self._compact_sync()
+
+    def _refresh_sync(self) -> None:
+        """Fold any records appended to the journal since it was last read."""
+        journal = self._journal
+        try:
+            f = self.journal_file.open('rb')
+        except FileNotFoundError:
+            journal.reset(None)
+            return
+
+        with f:
+            stat = os.fstat(f.fileno())
+            file_id = (stat.st_dev, stat.st_ino)
+            if file_id != journal.file_id or stat.st_size < journal.offset:
+                # the journal has been compacted or replaced, so it needs to be read from the start
+                journal.reset(file_id)
+            if stat.st_size == journal.offset:
+                return
+            f.seek(journal.offset)
+            data = f.read()
+
+        # a final line without a newline is a record that's still being written, so it's left for the next refresh
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            if line:  # pragma: no branch
+                journal.apply(line)
+        journal.offset += end
+
+    def _compact_sync(self) -> None:
+        with self._journal.lock:
+            self._refresh_sync()
+            assert self._snapshot_type_adapter is not None, 'snapshot type adapter must be set'
+            tmp_file = self.journal_file.with_name(f'{self.journal_file.name}.compacting')
+            with tmp_file.open('wb') as f:
+                for entry in self._journal.entries:
+                    if entry.status is None:
+                        f.write(entry.record + b'\n')
+                    else:
+                        f.write(self._snapshot_type_adapter.dump_json(self._build_snapshot(entry)) + b'\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.journal_file)
+            self._journal.unsynced = 0
+            self._refresh_sync()
+
+    def _build_snapshot(self, entry: _JournalEntry) -> Snapshot[StateT, RunEndT]:
+        assert self._snapshot_type_adapter is not None, 'snapshot type adapter must be set'
+        snapshot = self._snapshot_type_adapter.validate_json(entry.record)
+        if isinstance(snapshot, NodeSnapshot):
+            assert entry.status is not None, 'NodeSnapshot must have a status'
+            snapshot.status = entry.status
+            snapshot.start_ts = entry.start_ts
+            snapshot.duration = entry.duration
+        return snapshot
+
+    @asynccontextmanager
+    async def _lock(self, *, timeout: float = 1.0) -> AsyncIterator[None]:
+        async with file_lock(self.journal_file, timeout=timeout, stats=self.lock_stats):
+            yield
+
+
+class _RecordHeader(TypedDict):
+    """The fields of a journal record needed to fold the journal, without validating the snapshot it may contain."""
+
+    kind: Literal['node', 'end', 'status']
+    id: str
+    status: NotRequired[SnapshotStatus]
+    start_ts: NotRequired[datetime | None]
+    duration: NotRequired[float | None]
+
+
+_record_header_ta = pydantic.TypeAdapter(_RecordHeader)
+
+
+def _dump_status_record(
+    snapshot_id: str, status: SnapshotStatus, *, start_ts: datetime | None = None, duration: float | None = None
+) -> bytes:
+    header = _RecordHeader(kind='status', id=snapshot_id, status=status)
+    if start_ts is not None:
+        header['start_ts'] = start_ts
+    if duration is not None:
+        header['duration'] = duration
+    return _record_header_ta.dump_json(header)
+
+
+@dataclass
+class _JournalEntry:
+    """A snapshot in the journal, with its status as of the last status change record."""
+
+    id: str
+    record: bytes
+    """The snapshot record as it was written, which is only validated when the snapshot is loaded."""
+    status: SnapshotStatus | None
+    """The status of the snapshot, `None` for end snapshots."""
+    start_ts: datetime | None
+    duration: float | None
+
+
+@dataclass
+class _Journal:
+    """The journal as folded from the records read so far."""
+
+    entries: list[_JournalEntry] = field(default_factory=list)
+    entries_by_id: dict[str, _JournalEntry] = field(default_factory=dict)
+    status_records: int = 0
+    file_id: tuple[int, int] | None = None
+    offset: int = 0
+    unsynced: int = 0
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+    def reset(self, file_id: tuple[int, int] | None) -> None:
+        self.entries = []
+        self.entries_by_id = {}
+        self.status_records = 0
+        self.file_id = file_id
+        self.offset = 0
+
+    def apply(self, record: bytes) -> None:
+        header = _record_header_ta.validate_json(record)
+        if header['kind'] == 'status':
+            self.status_records += 1
+            if entry := self.entries_by_id.get(header['id']):  # pragma: no branch
+                entry.status = header.get('status', entry.status)
+                if (start_ts := header.get('start_ts')) is not None:
+                    entry.start_ts = start_ts
+                if (duration := header.get('duration')) is not None:
+                    entry.duration = duration
+        else:
+            entry = _JournalEntry(
+                id=header['id'],
+                record=record,
+                status=header.get('status'),
+                start_ts=header.get('start_ts'),
+                duration=header.get('duration'),
+            )
+            self.entries.append(entry)
+            self.entries_by_id.setdefault(entry.id, entry)
@@ -246,6 +246,11 @@ def no_instrumentation_by_default():
     Agent.instrument_all(False)
 
 
+@pytest.fixture(autouse=True)
+def clear_download_cache():
+    pydantic_ai.models.download_cache.clear()
+
+
 try:
     import logfire
 
@@ -0,0 +1,152 @@
+from __future__ import annotations as _annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+from inline_snapshot import snapshot
+
+from ..conftest import try_import
+
+with try_import() as imports_successful:
+    import logfire
+    from logfire.testing import CaptureLogfire
+
+    from pydantic_evals import Case, Dataset
+    from pydantic_evals._utils import UNSET
+    from pydantic_evals.cache import EvaluationCache, EvaluationCacheStats
+    from pydantic_evals.evaluators import Evaluator, EvaluatorContext, HasMatchingSpan
+
+pytestmark = [pytest.mark.skipif(not imports_successful(), reason='pydantic-evals not installed'), pytest.mark.anyio]
+
+
+@pytest.fixture(autouse=True)
+def use_logfire(capfire: CaptureLogfire):
+    assert capfire
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    with EvaluationCache(tmp_path / 'cache' / 'evals.sqlite') as cache:
+        yield cache
+
+
+async def test_evaluate_with_cache(cache: EvaluationCache):
+    task_calls: list[str] = []
+    evaluator_calls: list[str] = []
+
+    @dataclass
+    class CountingEvaluator(Evaluator[str, str, Any]):
+        threshold: int = 3
+
+        def evaluate(self, ctx: EvaluatorContext[str, str, Any]) -> bool:
+            evaluator_calls.append(ctx.inputs)
+            return len(ctx.output) > self.threshold
+
+    async def upper(inputs: str) -> str:
+        task_calls.append(inputs)
+        return inputs.upper()
+
+    dataset = Dataset[str, str, Any](
+        cases=[Case(name='a', inputs='abc'), Case(name='b', inputs='abcdef')], evaluators=[CountingEvaluator()]
+    )
+
+    report = await dataset.evaluate(upper, cache=cache, task_version='1')
+    assert report.cache_stats == EvaluationCacheStats(task_misses=2, evaluator_misses=2)
+    assert len(task_calls) == 2 and len(evaluator_calls) == 2
+
+    # Same task, inputs and evaluator: nothing is re-run
+    report = await dataset.evaluate(upper, cache=cache, task_version='1')
+    assert report.cache_stats == EvaluationCacheStats(task_hits=2, evaluator_hits=2)
+    assert len(task_calls) == 2 and len(evaluator_calls) == 2
+    assert {case.name: (case.output, case.assertions['CountingEvaluator'].value) for case in report.cases} == snapshot(
+        {'a': ('ABC', False), 'b': ('ABCDEF', True)}
+    )
+
+    # Changing the evaluator's configuration re-runs only the evaluator
+    dataset.evaluators = [CountingEvaluator(threshold=5)]
+    report = await dataset.evaluate(upper, cache=cache, task_version='1')
+    assert report.cache_stats == EvaluationCacheStats(task_hits=2, evaluator_misses=2)
+    assert len(task_calls) == 2 and len(evaluator_calls) == 4
+
+    # Bumping the task version re-runs the task, but evaluators are reused when the output is unchanged
+    report = await dataset.evaluate(upper, cache=cache, task_version='2')
+    assert report.cache_stats == EvaluationCacheStats(task_misses=2, evaluator_hits=2)
+    assert len(task_calls) == 4 and len(evaluator_calls) == 4
+
+    report = await dataset.evaluate(upper)
+    assert report.cache_stats is None
+
+
+async def test_cached_task_reruns_for_span_based_evaluator(cache: EvaluationCache):
+    calls = 0
+
+    async def task(inputs: str) -> str:
+        nonlocal calls
+        calls += 1
+        with logfire.span('inner'):
+            return inputs
+
+    dataset = Dataset[str, str, Any](
+        cases=[Case(inputs='x')], evaluators=[HasMatchingSpan(query={'name_equals': 'inner'})]
+    )
+    report = await dataset.evaluate(task, cache=cache)
+    assert report.cases[0].assertions['HasMatchingSpan'].value is True
+
+    # The evaluator result is reused, even though the cached task output has no span tree
+    report = await dataset.evaluate(task, cache=cache)
+    assert report.cases[0].assertions['HasMatchingSpan'].value is True
+    assert report.cache_stats == EvaluationCacheStats(task_hits=1, evaluator_hits=1)
+    assert calls == 1
+
+    # A new span-based evaluator needs the span tree, so the task is run again
+    dataset.evaluators = [HasMatchingSpan(query={'name_contains': 'inn'})]
+    report = await dataset.evaluate(task, cache=cache)
+    assert report.cases[0].assertions['HasMatchingSpan'].value is True
+    assert report.cases[0].evaluator_failures == []
+    assert report.cache_stats == EvaluationCacheStats(task_misses=1, evaluator_misses=2)
+    assert calls == 2
+
+    report = await dataset.evaluate(task, cache=cache)
+    assert report.cases[0].assertions['HasMatchingSpan'].value is True
+    assert report.cache_stats == EvaluationCacheStats(task_hits=1, evaluator_hits=1)
+    assert calls == 2
+
+
+async def test_evaluate_iter_with_cache(cache: EvaluationCache):
+    async def task(inputs: int) -> int:
+        return inputs * 2
+
+    dataset = Dataset[int, int, Any](cases=[Case(inputs=i) for i in range(5)])
+    for expected in (EvaluationCacheStats(task_misses=5), EvaluationCacheStats(task_hits=5)):
+        async with dataset.evaluate_iter(task, cache=cache, progress=False) as run:
+            assert sorted([result.output async for result in run]) == [0, 2, 4, 6, 8]  # type: ignore[union-attr]
+        assert run.cache_stats == expected
+
+
+def test_cache_eviction(tmp_path: Path):
+    with EvaluationCache(tmp_path / 'evals.sqlite', max_size_bytes=3100) as cache:
+        for i in range(5):
+            cache.set(f'key-{i}', b'x' * 1000)
+            if i == 2:
+                assert cache.get('key-0') == b'x' * 1000
+        assert cache.size_bytes() <= 3100
+        assert cache.get('key-0') is not UNSET
+        assert cache.get('key-1') is UNSET
+        assert cache.get('key-2') is UNSET
+        assert cache.get('key-4') is not UNSET
+
+
+def test_cache_persists_and_skips_unpicklable(tmp_path: Path):
+    path = tmp_path / 'evals.sqlite'
+    with EvaluationCache(path, max_size_bytes=None) as cache:
+        cache.set('value', {'a': [1, 2]})
+        cache.set('none', None)
+        cache.set('unpicklable', lambda: None)
+        assert cache.get('unpicklable') is UNSET
+
+    with EvaluationCache(path) as cache:
+        assert cache.get('value') == {'a': [1, 2]}
+        assert cache.get('none') is None
+        assert cache.get('missing') is UNSET
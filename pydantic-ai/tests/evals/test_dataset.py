@@ -442,6 +442,105 @@ async def test_evaluate_with_concurrency(
     )
 
 
+async def test_evaluate_iter(simple_evaluator: type[Evaluator[TaskInput, TaskOutput, TaskMetadata]]):
+    """Test streaming evaluation over a lazily consumed case source."""
+    dataset = Dataset[TaskInput, TaskOutput, TaskMetadata](cases=[], evaluators=[simple_evaluator()])
+    pulled: list[int] = []
+
+    def case_source():
+        for i in range(50):
+            pulled.append(i)
+            yield Case(inputs=TaskInput(query=str(i)), expected_output=TaskOutput(answer=str(i % 2)))
+
+    async def mock_task(inputs: TaskInput) -> TaskOutput:
+        if inputs.query == '7':
+            raise ValueError('boom')
+        return TaskOutput(answer='0')
+
+    names: list[str] = []
+    async with dataset.evaluate_iter(mock_task, case_source(), max_concurrency=3, progress=False) as run:
+        async for result in run:
+            names.append(result.name)
+            # cases are pulled on demand, bounded by the worker pool and stream buffers
+            assert len(pulled) <= len(names) + 10
+
+    assert sorted(names) == sorted(f'Case {i}' for i in range(1, 51))
+    assert run.n_cases == 49
+    assert run.n_failures == 1
+    averages = run.averages()
+    assert averages is not None
+    assert averages.model_dump() == snapshot(
+        {
+            'name': 'Averages',
+            'scores': {'confidence': 1.0},
+            'labels': {},
+            'metrics': {},
+            'assertions': 0.5102040816326531,
+            'task_duration': 1.0,
+            'total_duration': IsNumber(),
+        }
+    )
+
+
+async def test_evaluate_iter_exit_early(example_dataset: Dataset[TaskInput, TaskOutput, TaskMetadata]):
+    """Test that leaving the context early cancels outstanding cases."""
+
+    async def mock_task(inputs: TaskInput) -> TaskOutput:
+        return TaskOutput(answer=inputs.query)
+
+    def case_source():
+        while True:
+            yield Case(inputs=TaskInput(query='again'))
+
+    async with example_dataset.evaluate_iter(mock_task, case_source(), max_concurrency=2, progress=False) as run:
+        async for _ in run:
+            if run.n_cases >= 5:
+                break
+
+    assert run.n_failures == 0
+    assert run.n_cases >= 5
+
+
+async def test_evaluate_iter_dataset_cases(example_dataset: Dataset[TaskInput, TaskOutput, TaskMetadata]):
+    """Test that `evaluate_iter` falls back to the dataset's own cases."""
+
+    async def mock_task(inputs: TaskInput) -> TaskOutput:
+        return TaskOutput(answer=inputs.query)
+
+    async def run_all() -> list[str]:
+        async with example_dataset.evaluate_iter(mock_task, max_concurrency=1, progress=False) as run:
+            return [result.name async for result in run]
+
+    assert await run_all() == ['case1', 'case2']
+
+    with pytest.raises(ValueError, match='max_concurrency must be at least 1'):
+        async with example_dataset.evaluate_iter(mock_task, max_concurrency=0):
+            pass  # pragma: no cover
+
+
+async def test_iter_cases_from_jsonl(tmp_path: Path):
+    path = tmp_path / 'cases.jsonl'
+    path.write_text(
+        '{"name": "a", "inputs": {"query": "q1"}, "evaluators": ["EqualsExpected"]}\n'
+        '\n'
+        '{"inputs": {"query": "q2"}, "expected_output": {"answer": "x"}}\n'
+    )
+    cases = list(Dataset[TaskInput, TaskOutput, TaskMetadata].iter_cases_from_jsonl(path))
+    assert [(case.name, case.inputs, case.expected_output) for case in cases] == [
+        ('a', TaskInput(query='q1'), None),
+        (None, TaskInput(query='q2'), TaskOutput(answer='x')),
+    ]
+    assert [type(e).__name__ for e in cases[0].evaluators] == ['EqualsExpected']
+
+    path.write_text('{"inputs": {"query": "q1"}}\n{"inputs": {}}\n')
+    with pytest.raises(ValueError, match=r'cases.jsonl:2 does not match the schema for a case'):
+        list(Dataset[TaskInput, TaskOutput, TaskMetadata].iter_cases_from_jsonl(path))
+
+    path.write_text('{"inputs": {"query": "q1"}, "evaluators": ["NotAnEvaluator"]}\n')
+    with pytest.raises(ExceptionGroup):
+        list(Dataset[TaskInput, TaskOutput, TaskMetadata].iter_cases_from_jsonl(path))
+
+
 async def test_evaluate_with_failing_task(
     example_dataset: Dataset[TaskInput, TaskOutput, TaskMetadata],
     simple_evaluator: type[Evaluator[TaskInput, TaskOutput, TaskMetadata]],
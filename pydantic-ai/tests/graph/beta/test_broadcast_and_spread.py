@@ -240,6 +240,37 @@ async def test_multiple_sequential_maps():
     assert sorted(result) == ['num:1', 'num:2', 'num:3', 'num:4']
 
 
+async def test_map_large_nested_lists():
+    """Test that joins complete correctly when mapping over many items with nested maps."""
+    g = GraphBuilder(state_type=CounterState, output_type=list[int])
+
+    @g.step
+    async def generate_batches(ctx: StepContext[CounterState, None, None]) -> list[list[int]]:
+        return [list(range(i * 100, (i + 1) * 100)) for i in range(20)]
+
+    @g.step
+    async def unpack_batch(ctx: StepContext[CounterState, None, list[int]]) -> list[int]:
+        return ctx.inputs
+
+    @g.step
+    async def double(ctx: StepContext[CounterState, None, int]) -> int:
+        return ctx.inputs * 2
+
+    collect = g.join(reduce_list_append, initial_factory=list[int])
+
+    g.add(
+        g.edge_from(g.start_node).to(generate_batches),
+        g.edge_from(generate_batches).map().to(unpack_batch),
+        g.edge_from(unpack_batch).map().to(double),
+        g.edge_from(double).to(collect),
+        g.edge_from(collect).to(g.end_node),
+    )
+
+    graph = g.build()
+    result = await graph.run(state=CounterState())
+    assert sorted(result) == [i * 2 for i in range(2000)]
+
+
 async def test_broadcast_with_different_outputs():
     """Test that broadcasts can produce different types of outputs."""
     g = GraphBuilder(state_type=CounterState, output_type=list[int | str])
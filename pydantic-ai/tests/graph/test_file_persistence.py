@@ -1,10 +1,13 @@
 from __future__ import annotations as _annotations
 
+import os
+import sys
 from dataclasses import dataclass
 from datetime import timezone
 from pathlib import Path
 from typing import Union
 
+import anyio
 import pytest
 from inline_snapshot import snapshot
 
@@ -16,7 +19,7 @@ from pydantic_graph import (
     GraphRunContext,
     NodeSnapshot,
 )
-from pydantic_graph.persistence.file import FileStatePersistence
+from pydantic_graph.persistence.file import FileLockStats, FileStatePersistence
 
 from ..conftest import IsFloat, IsNow
 
@@ -191,6 +194,65 @@ async def test_lock_timeout(tmp_path: Path):
                 pass
 
 
+async def test_lock_stats(tmp_path: Path):
+    p = tmp_path / 'test_graph.json'
+    persistence = FileStatePersistence(p)
+    order: list[str] = []
+
+    async def hold(name: str):
+        async with persistence._lock():  # type: ignore[reportPrivateUsage]
+            order.append(f'{name} start')
+            await anyio.sleep(0.05)
+            order.append(f'{name} end')
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(hold, 'a')
+        tg.start_soon(hold, 'b')
+
+    assert order == snapshot(['a start', 'a end', 'b start', 'b end'])
+    stats = persistence.lock_stats
+    assert stats == FileLockStats(
+        acquisitions=2, contended=1, timeouts=0, wait_time=IsFloat(), max_wait_time=IsFloat(ge=0.04)
+    )
+
+    async with persistence._lock():  # type: ignore[reportPrivateUsage]
+        with pytest.raises(TimeoutError):
+            async with persistence._lock(timeout=0.01):  # type: ignore[reportPrivateUsage]
+                pass
+    assert (stats.acquisitions, stats.contended, stats.timeouts) == (3, 1, 1)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='flock is not available on Windows')
+async def test_lock_other_process(tmp_path: Path):
+    import fcntl
+
+    p = tmp_path / 'test_graph.json'
+    persistence = FileStatePersistence(p)
+    async with persistence._lock():  # type: ignore[reportPrivateUsage]
+        pass
+
+    # another open file description behaves like another process holding the lock
+    fd = os.open(tmp_path / 'test_graph.json.pydantic-graph-persistence-lock', os.O_RDWR)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        with pytest.raises(TimeoutError):
+            async with persistence._lock(timeout=0.1):  # type: ignore[reportPrivateUsage]
+                pass
+
+        async def release():
+            await anyio.sleep(0.05)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(release)
+            async with persistence._lock():  # type: ignore[reportPrivateUsage]
+                pass
+    finally:
+        os.close(fd)
+
+    assert persistence.lock_stats.contended == 1
+
+
 async def test_record_lookup_error(tmp_path: Path):
     p = tmp_path / 'test_graph.json'
     persistence = FileStatePersistence(p)
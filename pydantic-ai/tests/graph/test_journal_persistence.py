@@ -0,0 +1,236 @@
+from __future__ import annotations as _annotations
+
+import json
+from dataclasses import dataclass
+from datetime import timezone
+from pathlib import Path
+from typing import Union
+
+import pytest
+from inline_snapshot import snapshot
+
+from pydantic_graph import (
+    BaseNode,
+    End,
+    EndSnapshot,
+    Graph,
+    GraphRunContext,
+    NodeSnapshot,
+)
+from pydantic_graph.persistence.journal import JournalStatePersistence
+
+from ..conftest import IsFloat, IsNow
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass
+class Float2String(BaseNode):
+    input_data: float
+
+    async def run(self, ctx: GraphRunContext) -> String2Length:
+        return String2Length(str(self.input_data))
+
+
+@dataclass
+class String2Length(BaseNode):
+    input_data: str
+
+    async def run(self, ctx: GraphRunContext) -> Double:
+        return Double(len(self.input_data))
+
+
+@dataclass
+class Double(BaseNode[None, None, int]):
+    input_data: int
+
+    async def run(self, ctx: GraphRunContext) -> Union[String2Length, End[int]]:  # noqa: UP007
+        if self.input_data == 7:  # pragma: no cover
+            return String2Length('x' * 21)
+        else:
+            return End(self.input_data * 2)
+
+
+def expected_snapshots() -> list[NodeSnapshot | EndSnapshot]:
+    return [
+        NodeSnapshot(
+            state=None,
+            node=Float2String(input_data=3.14),
+            start_ts=IsNow(tz=timezone.utc),
+            duration=IsFloat(),
+            status='success',
+            id='Float2String:1',
+        ),
+        NodeSnapshot(
+            state=None,
+            node=String2Length(input_data='3.14'),
+            start_ts=IsNow(tz=timezone.utc),
+            duration=IsFloat(),
+            status='success',
+            id='String2Length:2',
+        ),
+        NodeSnapshot(
+            state=None,
+            node=Double(input_data=4),
+            start_ts=IsNow(tz=timezone.utc),
+            duration=IsFloat(),
+            status='success',
+            id='Double:3',
+        ),
+        EndSnapshot(state=None, result=End(data=8), ts=IsNow(tz=timezone.utc), id='end:4'),
+    ]
+
+
+def journal_records(p: Path) -> list[tuple[str, str, str | None]]:
+    records = [json.loads(line) for line in p.read_text().splitlines()]
+    return [(r['kind'], r['id'], r.get('status')) for r in records]
+
+
+async def test_run(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JournalStatePersistence(p)
+    result = await my_graph.run(Float2String(3.14), persistence=persistence)
+    assert result.output == 8
+    assert await persistence.load_all() == expected_snapshots()
+
+    assert journal_records(p) == snapshot(
+        [
+            ('node', 'Float2String:1', 'created'),
+            ('status', 'Float2String:1', 'running'),
+            ('status', 'Float2String:1', 'success'),
+            ('node', 'String2Length:2', 'created'),
+            ('status', 'String2Length:2', 'running'),
+            ('status', 'String2Length:2', 'success'),
+            ('node', 'Double:3', 'created'),
+            ('status', 'Double:3', 'running'),
+            ('status', 'Double:3', 'success'),
+            ('end', 'end:4', None),
+        ]
+    )
+
+    # a new instance folds the journal from scratch
+    other = JournalStatePersistence(p)
+    other.set_graph_types(my_graph)
+    assert await other.load_all() == expected_snapshots()
+
+
+async def test_next_from_persistence(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JournalStatePersistence(p)
+
+    async with my_graph.iter(Float2String(3.14), persistence=persistence) as run:
+        node = await run.next()
+        assert node == snapshot(String2Length(input_data='3.14'))
+        assert node.get_snapshot_id() == snapshot('String2Length:2')
+
+    # resume from a different instance, e.g. in another process
+    persistence = JournalStatePersistence(p)
+    async with my_graph.iter_from_persistence(persistence) as run:
+        node = await run.next()
+        assert node == snapshot(Double(input_data=4))
+        assert node.get_snapshot_id() == snapshot('Double:3')
+
+        node = await run.next()
+        assert node == snapshot(End(data=8))
+        assert node.get_snapshot_id() == snapshot('end:4')
+
+    assert await persistence.load_all() == expected_snapshots()
+
+
+async def test_node_error(tmp_path: Path, mock_snapshot_id: object):
+    @dataclass
+    class Foo(BaseNode):
+        async def run(self, ctx: GraphRunContext) -> Bar:
+            return Bar()
+
+    @dataclass
+    class Bar(BaseNode[None, None, None]):
+        async def run(self, ctx: GraphRunContext) -> End[None]:
+            raise RuntimeError('test error')
+
+    g = Graph(nodes=(Foo, Bar))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JournalStatePersistence(p)
+    with pytest.raises(RuntimeError, match='test error'):
+        await g.run(Foo(), persistence=persistence)
+
+    assert await persistence.load_all() == snapshot(
+        [
+            NodeSnapshot(
+                state=None,
+                node=Foo(),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='Foo:1',
+            ),
+            NodeSnapshot(
+                state=None,
+                node=Bar(),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='error',
+                id='Bar:2',
+            ),
+        ]
+    )
+
+
+async def test_compact(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JournalStatePersistence(p, fsync_every=1)
+    await my_graph.run(Float2String(3.14), persistence=persistence)
+
+    reader = JournalStatePersistence(p)
+    reader.set_graph_types(my_graph)
+    assert len(await reader.load_all()) == 4
+
+    await persistence.compact()
+    assert journal_records(p) == snapshot(
+        [
+            ('node', 'Float2String:1', 'success'),
+            ('node', 'String2Length:2', 'success'),
+            ('node', 'Double:3', 'success'),
+            ('end', 'end:4', None),
+        ]
+    )
+    assert await persistence.load_all() == expected_snapshots()
+    # the other instance notices the journal was replaced
+    assert await reader.load_all() == expected_snapshots()
+
+
+async def test_compact_after(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JournalStatePersistence(p, compact_after=2)
+    await my_graph.run(Float2String(3.14), persistence=persistence)
+
+    assert sum(kind == 'status' for kind, _, _ in journal_records(p)) < 2
+    assert await persistence.load_all() == expected_snapshots()
+
+
+async def test_partial_record_ignored(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JournalStatePersistence(p)
+    await my_graph.run(Float2String(3.14), persistence=persistence)
+
+    with p.open('ab') as f:
+        f.write(b'{"kind": "status", "id": "Double:3", "sta')
+    assert await persistence.load_all() == expected_snapshots()
+
+
+async def test_record_lookup_error(tmp_path: Path):
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JournalStatePersistence(p)
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    persistence.set_graph_types(my_graph)
+    assert persistence.should_set_types() is False
+
+    with pytest.raises(LookupError, match="No snapshot found with id='foobar'"):
+        async with persistence.record_run('foobar'):
+            pass
+    assert await persistence.load_next() is None
@@ -20,6 +20,7 @@ from pydantic_ai import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     DocumentUrl,
     FinalResultEvent,
     ImageUrl,
@@ -282,6 +283,117 @@ async def test_async_request_prompt_caching(allow_model_requests: None):
     assert last_message.cost().total_price == snapshot(Decimal('0.00002688'))
 
 
+async def test_cache_point(allow_model_requests: None):
+    c = completion_message([BetaTextBlock(text='world', type='text')], BetaUsage(input_tokens=5, output_tokens=10))
+    mock_client = MockAnthropic.create_mock(c)
+    m = AnthropicModel('claude-3-5-haiku-latest', provider=AnthropicProvider(anthropic_client=mock_client))
+    agent = Agent(m)
+
+    await agent.run(['A long document', CachePoint(), 'A question', CachePoint(ttl='1h'), 'Another question'])
+    completion_kwargs = get_mock_chat_completion_kwargs(mock_client)[0]
+    assert completion_kwargs['messages'] == snapshot(
+        [
+            {
+                'role': 'user',
+                'content': [
+                    {'text': 'A long document', 'type': 'text', 'cache_control': {'type': 'ephemeral', 'ttl': '5m'}},
+                    {'text': 'A question', 'type': 'text', 'cache_control': {'type': 'ephemeral', 'ttl': '1h'}},
+                    {'text': 'Another question', 'type': 'text'},
+                ],
+            }
+        ]
+    )
+
+    with pytest.raises(UserError, match='`CachePoint` must follow other content in the same message'):
+        await agent.run([CachePoint(), 'hello'])
+
+
+async def test_cache_settings(allow_model_requests: None):
+    c = completion_message([BetaTextBlock(text='world', type='text')], BetaUsage(input_tokens=5, output_tokens=10))
+    mock_client = MockAnthropic.create_mock(c)
+    m = AnthropicModel('claude-3-5-haiku-latest', provider=AnthropicProvider(anthropic_client=mock_client))
+    agent = Agent(
+        m,
+        instructions='You are a helpful assistant.',
+        model_settings=AnthropicModelSettings(
+            anthropic_cache_tool_definitions=True,
+            anthropic_cache_instructions='1h',
+            anthropic_cache_messages=True,
+        ),
+    )
+
+    @agent.tool_plain
+    def first_tool() -> str:  # pragma: no cover
+        return 'first'
+
+    @agent.tool_plain
+    def second_tool() -> str:  # pragma: no cover
+        return 'second'
+
+    await agent.run('hello')
+    completion_kwargs = get_mock_chat_completion_kwargs(mock_client)[0]
+    assert completion_kwargs['tools'] == snapshot(
+        [
+            {
+                'name': 'first_tool',
+                'description': '',
+                'input_schema': {'additionalProperties': False, 'properties': {}, 'type': 'object'},
+            },
+            {
+                'name': 'second_tool',
+                'description': '',
+                'input_schema': {'additionalProperties': False, 'properties': {}, 'type': 'object'},
+                'cache_control': {'type': 'ephemeral', 'ttl': '5m'},
+            },
+        ]
+    )
+    assert completion_kwargs['system'] == snapshot(
+        [
+            {
+                'type': 'text',
+                'text': 'You are a helpful assistant.',
+                'cache_control': {'type': 'ephemeral', 'ttl': '1h'},
+            }
+        ]
+    )
+    assert completion_kwargs['messages'] == snapshot(
+        [
+            {
+                'role': 'user',
+                'content': [{'text': 'hello', 'type': 'text', 'cache_control': {'type': 'ephemeral', 'ttl': '5m'}}],
+            }
+        ]
+    )
+
+
+async def test_cache_breakpoint_limit(allow_model_requests: None):
+    c = completion_message([BetaTextBlock(text='world', type='text')], BetaUsage(input_tokens=5, output_tokens=10))
+    mock_client = MockAnthropic.create_mock(c)
+    m = AnthropicModel('claude-3-5-haiku-latest', provider=AnthropicProvider(anthropic_client=mock_client))
+    agent = Agent(
+        m,
+        instructions='You are a helpful assistant.',
+        model_settings=AnthropicModelSettings(anthropic_cache_instructions=True, anthropic_cache_messages=True),
+    )
+
+    await agent.run(['one', CachePoint(), 'two', CachePoint(), 'three', CachePoint(), 'four'])
+    completion_kwargs = get_mock_chat_completion_kwargs(mock_client)[0]
+    # the oldest breakpoint in the conversation is dropped to stay within Anthropic's limit of 4
+    assert completion_kwargs['messages'] == snapshot(
+        [
+            {
+                'role': 'user',
+                'content': [
+                    {'text': 'one', 'type': 'text'},
+                    {'text': 'two', 'type': 'text', 'cache_control': {'type': 'ephemeral', 'ttl': '5m'}},
+                    {'text': 'three', 'type': 'text', 'cache_control': {'type': 'ephemeral', 'ttl': '5m'}},
+                    {'text': 'four', 'type': 'text', 'cache_control': {'type': 'ephemeral', 'ttl': '5m'}},
+                ],
+            }
+        ]
+    )
+
+
 async def test_async_request_text_response(allow_model_requests: None):
     c = completion_message(
         [BetaTextBlock(text='world', type='text')],
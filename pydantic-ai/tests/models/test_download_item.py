@@ -1,7 +1,11 @@
+from pathlib import Path
+
+import httpx
 import pytest
+from inline_snapshot import snapshot
 
-from pydantic_ai import AudioUrl, DocumentUrl, ImageUrl, VideoUrl
-from pydantic_ai.models import UserError, download_item
+from pydantic_ai import AudioUrl, DocumentUrl, ImageUrl, VideoUrl, models
+from pydantic_ai.models import DownloadCache, DownloadCacheInfo, UserError, download_item
 
 from ..conftest import IsInstance, IsStr
 
@@ -59,3 +63,88 @@ async def test_download_item_no_content_type() -> None:
     )
     assert downloaded_item['data_type'] == 'text/markdown'
     assert downloaded_item['data'] == IsStr()
+
+
+def _file_server(
+    body: bytes, *, headers: dict[str, str] | None = None
+) -> tuple[httpx.AsyncClient, list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get('if-none-match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=body, headers={'content-type': 'application/pdf', **(headers or {})})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+
+async def test_download_item_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, requests = _file_server(b'%PDF-1.4 filing', headers={'etag': '"v1"'})
+    monkeypatch.setattr(models, 'cached_async_http_client', lambda: client)
+    item = DocumentUrl(url='https://example.com/filing.pdf')
+
+    first = await download_item(item, data_format='base64')
+    second = await download_item(item, data_format='base64')
+    assert first == snapshot({'data': 'JVBERi0xLjQgZmlsaW5n', 'data_type': 'application/pdf'})
+    assert second['data'] is first['data']
+    assert (await download_item(item, data_format='bytes'))['data'] == b'%PDF-1.4 filing'
+    assert (await download_item(item, data_format='base64_uri'))['data'] == snapshot(
+        'data:application/pdf;base64,JVBERi0xLjQgZmlsaW5n'
+    )
+
+    assert [r.headers.get('if-none-match') for r in requests] == snapshot([None, '"v1"', '"v1"', '"v1"'])
+    assert models.download_cache.cache_info() == snapshot(
+        DownloadCacheInfo(hits=0, revalidations=3, misses=1, max_size_bytes=134217728, currsize_bytes=83)
+    )
+
+
+async def test_download_cache_fresh_and_uncacheable() -> None:
+    cache = DownloadCache()
+
+    client, requests = _file_server(b'fresh', headers={'cache-control': 'public, max-age=3600'})
+    await cache.download(client, 'https://example.com/fresh')
+    content, content_type = await cache.download(client, 'https://example.com/fresh')
+    assert (content.data, content_type) == (b'fresh', 'application/pdf')
+    assert len(requests) == 1
+
+    client, requests = _file_server(b'secret', headers={'cache-control': 'no-store'})
+    await cache.download(client, 'https://example.com/secret')
+    await cache.download(client, 'https://example.com/secret')
+    assert len(requests) == 2
+
+    client, requests = _file_server(b'plain')
+    await cache.download(client, 'https://example.com/plain')
+    await cache.download(client, 'https://example.com/plain')
+    assert [r.headers.get('if-none-match') for r in requests] == [None, None]
+
+    assert cache.cache_info() == snapshot(
+        DownloadCacheInfo(hits=1, revalidations=0, misses=5, max_size_bytes=134217728, currsize_bytes=10)
+    )
+
+
+async def test_download_cache_content_addressed_and_evicted() -> None:
+    cache = DownloadCache(max_size_bytes=10)
+    client, _ = _file_server(b'same')
+    first, _ = await cache.download(client, 'https://example.com/a')
+    second, _ = await cache.download(client, 'https://example.com/b')
+    assert second is first
+
+    assert cache.encode(first, 'text', bytes.decode) == 'same'
+    assert cache.cache_info().currsize_bytes == 8
+
+    client, _ = _file_server(b'other')
+    await cache.download(client, 'https://example.com/c')
+    assert cache.cache_info().currsize_bytes == 5
+
+
+async def test_download_cache_directory(tmp_path: Path) -> None:
+    client, requests = _file_server(b'%PDF-1.4 filing', headers={'etag': '"v1"'})
+    await DownloadCache(directory=tmp_path).download(client, 'https://example.com/filing.pdf')
+
+    cache = DownloadCache(directory=tmp_path)
+    content, content_type = await cache.download(client, 'https://example.com/filing.pdf')
+    assert (content.data, content_type) == (b'%PDF-1.4 filing', 'application/pdf')
+    assert [r.headers.get('if-none-match') for r in requests] == [None, '"v1"']
+    assert cache.cache_info().revalidations == 1
+    assert len(list((tmp_path / 'contents').iterdir())) == 1
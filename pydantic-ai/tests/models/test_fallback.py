@@ -6,6 +6,7 @@ from collections.abc import AsyncIterator
 from datetime import timezone
 from typing import Any, cast
 
+import anyio
 import pytest
 from _pytest.python_api import RaisesContext
 from dirty_equals import IsJson
@@ -13,7 +14,7 @@ from inline_snapshot import snapshot
 from pydantic_core import to_json
 
 from pydantic_ai import Agent, ModelHTTPError, ModelMessage, ModelRequest, ModelResponse, TextPart, UserPromptPart
-from pydantic_ai.models.fallback import FallbackModel
+from pydantic_ai.models.fallback import FallbackModel, FallbackRouting
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 from pydantic_ai.settings import ModelSettings
 from pydantic_ai.usage import RequestUsage
@@ -588,3 +589,202 @@ async def test_fallback_model_settings_merge_streaming():
 
     expected = {'extra_headers': {'anthropic-beta': 'context-1m-2025-08-07'}, 'temperature': 0.5}
     assert json.loads(output) == expected
+
+
+def slow_function_model(delay: float, text: str, calls: list[str]) -> FunctionModel:
+    async def respond(_model_messages: list[ModelMessage], _agent_info: AgentInfo) -> ModelResponse:
+        calls.append(text)
+        try:
+            await anyio.sleep(delay)
+        except anyio.get_cancelled_exc_class():
+            calls.append(f'{text} cancelled')
+            raise
+        return ModelResponse(parts=[TextPart(text)])
+
+    return FunctionModel(respond)
+
+
+async def test_routing_hedges_slow_model() -> None:
+    calls: list[str] = []
+    fallback_model = FallbackModel(
+        slow_function_model(10, 'slow', calls),
+        slow_function_model(0, 'fast', calls),
+        routing=FallbackRouting(hedge_delay=0.05),
+    )
+    agent = Agent(model=fallback_model)
+
+    with anyio.fail_after(5):
+        result = await agent.run('hello')
+    assert result.output == 'fast'
+    assert calls == snapshot(['slow', 'fast', 'slow cancelled'])
+
+
+async def test_routing_hedges_after_latency_percentile() -> None:
+    delays = iter([0, 10])
+    calls: list[str] = []
+
+    async def primary(_model_messages: list[ModelMessage], _agent_info: AgentInfo) -> ModelResponse:
+        calls.append('primary')
+        await anyio.sleep(next(delays))
+        return ModelResponse(parts=[TextPart('primary')])
+
+    fallback_model = FallbackModel(
+        FunctionModel(primary),
+        slow_function_model(0, 'secondary', calls),
+        routing=FallbackRouting(hedge_percentile=50, min_latency_samples=1),
+    )
+    agent = Agent(model=fallback_model)
+
+    assert (await agent.run('hello')).output == 'primary'
+    with anyio.fail_after(5):
+        assert (await agent.run('hello')).output == 'secondary'
+    assert calls == snapshot(['primary', 'primary', 'secondary'])
+
+
+async def test_routing_circuit_breaker() -> None:
+    failures = 0
+
+    def failing(_model_messages: list[ModelMessage], _agent_info: AgentInfo) -> ModelResponse:
+        nonlocal failures
+        failures += 1
+        raise ModelHTTPError(status_code=500, model_name='test-function-model')
+
+    routing = FallbackRouting(failure_threshold=2, recovery_time=60, reorder_by_latency=False)
+    fallback_model = FallbackModel(FunctionModel(failing), success_model, routing=routing)
+    agent = Agent(model=fallback_model)
+
+    for _ in range(4):
+        assert (await agent.run('hello')).output == 'success'
+    # The breaker opened after two failures, so the failing model was skipped afterwards
+    assert failures == 2
+
+    routing.recovery_time = 0
+    assert (await agent.run('hello')).output == 'success'
+    assert failures == 3
+
+
+async def test_routing_circuit_breaker_open_models_are_last_resort() -> None:
+    fallback_model = FallbackModel(
+        failure_model, failure_model, routing=FallbackRouting(failure_threshold=1, recovery_time=60)
+    )
+    agent = Agent(model=fallback_model)
+
+    for _ in range(2):
+        with cast(RaisesContext[ExceptionGroup[Any]], pytest.raises(ExceptionGroup)) as exc_info:
+            await agent.run('hello')
+        assert 'All models from FallbackModel failed' in exc_info.value.args[0]
+        assert len(exc_info.value.exceptions) == 2
+
+
+async def test_routing_latency_slo() -> None:
+    calls: list[str] = []
+    fallback_model = FallbackModel(
+        slow_function_model(0.05, 'slow', calls),
+        slow_function_model(0, 'fast', calls),
+        routing=FallbackRouting(latency_slo=0.01, failure_threshold=1, recovery_time=60),
+    )
+    agent = Agent(model=fallback_model)
+
+    assert (await agent.run('hello')).output == 'slow'
+    # The slow response was used, but counted against the model, so the next request goes to the fast model first
+    assert (await agent.run('hello')).output == 'fast'
+    assert calls == snapshot(['slow', 'fast'])
+
+
+async def test_routing_reorders_by_latency() -> None:
+    calls: list[str] = []
+    fail_primary = False
+
+    async def primary(_model_messages: list[ModelMessage], _agent_info: AgentInfo) -> ModelResponse:
+        calls.append('primary')
+        if fail_primary:
+            raise ModelHTTPError(status_code=500, model_name='test-function-model')
+        await anyio.sleep(0.05)
+        return ModelResponse(parts=[TextPart('primary')])
+
+    fallback_model = FallbackModel(
+        FunctionModel(primary),
+        slow_function_model(0, 'secondary', calls),
+        routing=FallbackRouting(hedge_percentile=None),
+    )
+    agent = Agent(model=fallback_model)
+
+    assert (await agent.run('hello')).output == 'primary'
+    fail_primary = True
+    assert (await agent.run('hello')).output == 'secondary'
+    fail_primary = False
+    # The secondary model now has the lower average latency, so it's tried first
+    assert (await agent.run('hello')).output == 'secondary'
+    assert calls == snapshot(['primary', 'primary', 'secondary', 'secondary'])
+
+
+async def test_routing_non_fallback_error() -> None:
+    calls: list[str] = []
+    fallback_model = FallbackModel(
+        slow_function_model(10, 'slow', calls),
+        FunctionModel(potato_exception_response),
+        routing=FallbackRouting(hedge_delay=0),
+    )
+    agent = Agent(model=fallback_model)
+
+    with anyio.fail_after(5), pytest.raises(PotatoException):
+        await agent.run('hello')
+    assert calls == snapshot(['slow', 'slow cancelled'])
+
+
+async def slow_response_stream(_model_messages: list[ModelMessage], _agent_info: AgentInfo) -> AsyncIterator[str]:
+    await anyio.sleep(10)
+    yield 'too late'  # pragma: no cover
+
+
+async def test_routing_first_token_timeout_streaming() -> None:
+    fallback_model = FallbackModel(
+        FunctionModel(stream_function=slow_response_stream),
+        success_model_stream,
+        routing=FallbackRouting(first_token_timeout=0.05),
+    )
+    agent = Agent(model=fallback_model)
+
+    with anyio.fail_after(5):
+        async with agent.run_stream('input') as result:
+            assert [c async for c in result.stream_text(debounce_by=None)] == snapshot(['hello ', 'hello world'])
+    assert result.is_complete
+
+
+async def test_routing_first_token_timeout_all_failed_streaming() -> None:
+    slow_model_stream = FunctionModel(stream_function=slow_response_stream)
+    fallback_model = FallbackModel(
+        slow_model_stream, failure_model_stream, routing=FallbackRouting(first_token_timeout=0.05)
+    )
+    agent = Agent(model=fallback_model)
+
+    with cast(RaisesContext[ExceptionGroup[Any]], pytest.raises(ExceptionGroup)) as exc_info:
+        async with agent.run_stream('hello'):
+            pass  # pragma: no cover
+    exceptions = exc_info.value.exceptions
+    assert [type(exc) for exc in exceptions] == [TimeoutError, ModelHTTPError]
+    assert str(exceptions[0]) == snapshot(
+        "Model 'function::slow_response_stream' did not stream a response within 0.05 seconds"
+    )
+
+
+async def test_routing_hedges_streaming() -> None:
+    fallback_model = FallbackModel(
+        FunctionModel(stream_function=slow_response_stream),
+        success_model_stream,
+        routing=FallbackRouting(hedge_delay=0.05),
+    )
+    agent = Agent(model=fallback_model)
+
+    with anyio.fail_after(5):
+        async with agent.run_stream('input') as result:
+            assert await result.get_output() == 'hello world'
+        messages = result.all_messages()
+    assert messages[-1] == snapshot(
+        ModelResponse(
+            parts=[TextPart(content='hello world')],
+            usage=RequestUsage(input_tokens=50, output_tokens=2),
+            model_name='function::success_response_stream',
+            timestamp=IsNow(tz=timezone.utc),
+        )
+    )
@@ -15,6 +15,7 @@ import httpx
 import pytest
 from inline_snapshot import snapshot
 from pydantic import BaseModel, Field
+from pytest_mock import MockerFixture
 
 from pydantic_ai import (
     Agent,
@@ -52,6 +53,7 @@ from pydantic_ai.models.gemini import (
     _GeminiModalityTokenCount,
     _GeminiResponse,
     _GeminiSafetyRating,
+    _GeminiStreamDecoder,
     _GeminiTextPart,
     _GeminiThoughtPart,
     _GeminiToolConfig,
@@ -867,6 +869,47 @@ async def test_stream_invalid_unicode_text(get_gemini_client: GetGeminiClient):
     assert result.usage() == snapshot(RunUsage(requests=1, input_tokens=1, output_tokens=2))
 
 
+def test_stream_decoder_byte_by_byte():
+    responses = [
+        gemini_response(_content_model_response(ModelResponse(parts=[TextPart('a "quoted" {brace} [bracket] \\')]))),
+        gemini_response(_content_model_response(ModelResponse(parts=[TextPart('€ and \\"}')]))),
+        gemini_response(
+            _content_model_response(ModelResponse(parts=[ToolCallPart('final_result', {'response': [1, {'a': '}'}]})]))
+        ),
+    ]
+    json_data = _gemini_streamed_response_ta.dump_json(responses, by_alias=True, indent=2)
+
+    decoder = _GeminiStreamDecoder()
+    decoded: list[_GeminiResponse] = []
+    completed_at: list[int] = []
+    for i in range(len(json_data)):
+        new = decoder.feed(json_data[i : i + 1])
+        if new:
+            completed_at.append(i)
+        decoded.extend(new)
+
+    assert decoded == _gemini_streamed_response_ta.validate_json(json_data)
+    # each response is returned as soon as its closing brace arrives, not when the next one starts
+    assert [json_data[i : i + 1] for i in completed_at] == snapshot([b'}', b'}', b'}'])
+    # consumed bytes are dropped, only the closing bracket and whitespace are left
+    assert decoder._buffer.strip() == b''
+
+
+def test_stream_decoder_validates_each_response_once(mocker: MockerFixture):
+    responses = [
+        gemini_response(_content_model_response(ModelResponse(parts=[TextPart('Hello ')]))),
+        gemini_response(_content_model_response(ModelResponse(parts=[TextPart('world')]))),
+    ]
+    json_data = _gemini_streamed_response_ta.dump_json(responses, by_alias=True)
+    validate_json = mocker.spy(_gemini_response_ta, 'validate_json')
+
+    decoder = _GeminiStreamDecoder()
+    decoded = [r for i in range(0, len(json_data), 7) for r in decoder.feed(json_data[i : i + 7])]
+
+    assert decoded == responses
+    assert validate_json.call_count == 2
+
+
 async def test_stream_text_no_data(get_gemini_client: GetGeminiClient):
     responses = [_GeminiResponse(candidates=[], usage_metadata=example_usage())]
     json_data = _gemini_streamed_response_ta.dump_json(responses, by_alias=True)
@@ -974,6 +974,84 @@ Fix the errors and try again.\
     )
 
 
+async def test_instrumented_model_delta_messages(capfire: CaptureLogfire):
+    model = InstrumentedModel(MyModel(), InstrumentationSettings(input_messages_mode='delta'))
+    params = ModelRequestParameters()
+
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('user_prompt')])]
+    response = await model.request(messages, None, params)
+    messages = [*messages, response, ModelRequest(parts=[ToolReturnPart('tool1', 'tool_return', 'tool_call_1')])]
+    await model.request(messages, None, params)
+    # a new conversation is recorded in full
+    await model.request([ModelRequest(parts=[UserPromptPart('other')])], None, params)
+
+    spans = capfire.exporter.exported_spans_as_dict(parse_json_attributes=True)
+    assert [
+        (
+            [message['role'] for message in span['attributes']['gen_ai.input.messages']],
+            span['attributes'].get('pydantic_ai.input_messages_offset'),
+            span['attributes'].get('pydantic_ai.previous_request_span_id'),
+        )
+        for span in spans
+    ] == snapshot(
+        [
+            (['user'], None, None),
+            (['assistant', 'user'], 1, '0000000000000001'),
+            (['user'], None, None),
+        ]
+    )
+    assert spans[1]['attributes']['gen_ai.input.messages'][1] == snapshot(
+        {
+            'role': 'user',
+            'parts': [{'type': 'tool_call_response', 'id': 'tool_call_1', 'name': 'tool1', 'result': 'tool_return'}],
+        }
+    )
+    linked_span_ids = {
+        link.context.span_id
+        for span in capfire.exporter.exported_spans
+        if span.context and span.context.span_id == spans[1]['context']['span_id']
+        for link in span.links
+    }
+    assert linked_span_ids == {spans[0]['context']['span_id']}
+
+
+async def test_instrumented_model_messages_size_limits(capfire: CaptureLogfire):
+    model = InstrumentedModel(MyModel(), InstrumentationSettings(max_content_length=10, max_messages_bytes=500))
+    messages: list[ModelMessage] = [
+        ModelRequest(parts=[UserPromptPart('first ' * 50)]),
+        ModelResponse(parts=[TextPart('text3')]),
+        ModelRequest(parts=[UserPromptPart('second prompt')]),
+    ]
+    await model.request(messages, None, ModelRequestParameters())
+
+    attributes = capfire.exporter.exported_spans_as_dict(parse_json_attributes=True)[0]['attributes']
+    assert attributes['gen_ai.input.messages'] == snapshot(
+        [
+            {'role': 'assistant', 'parts': [{'type': 'text', 'content': 'text3'}]},
+            {'role': 'user', 'parts': [{'type': 'text', 'content': 'second pro... (3 characters truncated)'}]},
+        ]
+    )
+    assert attributes['pydantic_ai.input_messages_truncated'] == 1
+    assert attributes['gen_ai.output.messages'] == snapshot(
+        [
+            {
+                'role': 'assistant',
+                'parts': [
+                    {'type': 'text', 'content': 'text1'},
+                    {'type': 'tool_call', 'id': 'tool_call_1', 'name': 'tool1', 'arguments': 'args1'},
+                    {
+                        'type': 'tool_call',
+                        'id': 'tool_call_2',
+                        'name': 'tool2',
+                        'arguments': '{"args2": ... (2 characters truncated)',
+                    },
+                    {'type': 'text', 'content': 'text2'},
+                ],
+            }
+        ]
+    )
+
+
 def test_messages_to_otel_events_serialization_errors():
     class Foo:
         def __repr__(self):
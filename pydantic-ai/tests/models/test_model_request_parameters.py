@@ -1,6 +1,13 @@
+from copy import deepcopy
+
 from inline_snapshot import snapshot
 from pydantic import TypeAdapter
 
+from pydantic_ai._json_schema import (
+    InlineDefsJsonSchemaTransformer,
+    JsonSchemaTransformCache,
+    JsonSchemaTransformCacheInfo,
+)
 from pydantic_ai.builtin_tools import (
     CodeExecutionTool,
     ImageGenerationTool,
@@ -10,7 +17,9 @@ from pydantic_ai.builtin_tools import (
     WebSearchTool,
     WebSearchUserLocation,
 )
-from pydantic_ai.models import ModelRequestParameters, ToolDefinition
+from pydantic_ai.models import ModelRequestParameters, ToolDefinition, json_schema_transform_cache
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.profiles import ModelProfile
 
 ta = TypeAdapter(ModelRequestParameters)
 
@@ -65,6 +74,7 @@ def test_model_request_parameters_are_serializable():
                     'outer_typed_dict_key': None,
                     'strict': None,
                     'sequential': False,
+                    'max_concurrency': None,
                     'kind': 'function',
                     'metadata': None,
                 }
@@ -121,6 +131,7 @@ def test_model_request_parameters_are_serializable():
                     'outer_typed_dict_key': None,
                     'strict': None,
                     'sequential': False,
+                    'max_concurrency': None,
                     'kind': 'function',
                     'metadata': None,
                 }
@@ -130,3 +141,51 @@ def test_model_request_parameters_are_serializable():
         }
     )
     assert ta.validate_python(dumped) == params
+
+
+def test_json_schema_transform_cache():
+    cache = JsonSchemaTransformCache(maxsize=2)
+    schema_a = {
+        'type': 'object',
+        'properties': {'x': {'$ref': '#/$defs/X'}},
+        '$defs': {'X': {'type': 'object', 'properties': {'y': {'type': 'integer'}}}},
+    }
+    schema_b = {'type': 'object', 'properties': {'z': {'type': 'string'}}}
+
+    transformed, strict_compatible = cache.transform(InlineDefsJsonSchemaTransformer, schema_a, strict=None)
+    assert transformed == snapshot(
+        {'type': 'object', 'properties': {'x': {'type': 'object', 'properties': {'y': {'type': 'integer'}}}}}
+    )
+    assert strict_compatible
+    # An equal schema is a hit, and the input isn't modified
+    assert cache.transform(InlineDefsJsonSchemaTransformer, deepcopy(schema_a), strict=None)[0] is transformed
+    assert '$defs' in schema_a
+    # `strict` is part of the key
+    cache.transform(InlineDefsJsonSchemaTransformer, schema_a, strict=True)
+    assert cache.cache_info() == snapshot(JsonSchemaTransformCacheInfo(hits=1, misses=2, maxsize=2, currsize=2))
+
+    # The least recently used entry is evicted
+    cache.transform(InlineDefsJsonSchemaTransformer, schema_b, strict=None)
+    assert cache.transform(InlineDefsJsonSchemaTransformer, schema_a, strict=None)[0] is not transformed
+    assert cache.cache_info() == snapshot(JsonSchemaTransformCacheInfo(hits=1, misses=4, maxsize=2, currsize=2))
+
+    cache.clear()
+    assert cache.cache_info() == snapshot(JsonSchemaTransformCacheInfo(hits=0, misses=0, maxsize=2, currsize=0))
+
+
+def test_customize_request_parameters_uses_cache():
+    model = TestModel(profile=ModelProfile(json_schema_transformer=InlineDefsJsonSchemaTransformer))
+    params = ModelRequestParameters(
+        function_tools=[
+            ToolDefinition(
+                name='cached_tool',
+                parameters_json_schema={'type': 'object', 'properties': {'a': {'type': 'string', 'title': 'A'}}},
+            )
+        ]
+    )
+
+    json_schema_transform_cache.clear()
+    first = model.customize_request_parameters(params)
+    second = model.customize_request_parameters(params)
+    assert second.function_tools[0].parameters_json_schema is first.function_tools[0].parameters_json_schema
+    assert json_schema_transform_cache.cache_info().hits == 1
@@ -17,6 +17,7 @@ from pydantic_ai import (
     Agent,
     AudioUrl,
     BinaryContent,
+    CachePoint,
     DocumentUrl,
     ImageUrl,
     ModelHTTPError,
@@ -804,6 +805,24 @@ async def test_image_url_input(allow_model_requests: None):
     )
 
 
+async def test_cache_point_ignored(allow_model_requests: None):
+    c = completion_message(ChatCompletionMessage(content='world', role='assistant'))
+    mock_client = MockOpenAI.create_mock(c)
+    m = OpenAIChatModel('gpt-4o', provider=OpenAIProvider(openai_client=mock_client))
+    agent = Agent(m)
+
+    result = await agent.run(['A long document', CachePoint(), 'A question'])
+    assert result.output == 'world'
+    assert get_mock_chat_completion_kwargs(mock_client)[0]['messages'] == snapshot(
+        [
+            {
+                'role': 'user',
+                'content': [{'text': 'A long document', 'type': 'text'}, {'text': 'A question', 'type': 'text'}],
+            }
+        ]
+    )
+
+
 async def test_image_url_input_force_download(allow_model_requests: None, openai_api_key: str):
     provider = OpenAIProvider(api_key=openai_api_key)
     m = OpenAIChatModel('gpt-4.1-nano', provider=provider)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import anyio
+import pytest
+from inline_snapshot import snapshot
+
+from pydantic_ai import Agent, ModelMessage, ModelResponse, TextPart
+from pydantic_ai.exceptions import UserError
+from pydantic_ai.messages import ModelMessagesTypeAdapter, PartDeltaEvent, PartStartEvent, TextPartDelta
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, DeltaToolCalls, FunctionModel
+from pydantic_ai.models.recording import (
+    RecordingModel,
+    ReplayModel,
+    _strip_timestamps,  # pyright: ignore[reportPrivateUsage]
+    load_recordings,
+)
+from pydantic_ai.models.test import TestModel
+
+pytestmark = pytest.mark.anyio
+
+
+def _without_timestamps(messages: list[ModelMessage]) -> Any:
+    return _strip_timestamps(ModelMessagesTypeAdapter.dump_python(messages, mode='json'))
+
+
+async def test_record_and_replay(tmp_path: Path):
+    path = tmp_path / 'recordings' / 'run.jsonl'
+    agent = Agent()
+
+    @agent.tool_plain
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    recorded_result = await agent.run('What is 1 + 2?', model=RecordingModel(TestModel(), path))
+    recordings = load_recordings(path)
+    assert [len(r.response.parts) for r in recordings] == snapshot([1, 1])
+    assert all(r.stream_events is None for r in recordings)
+
+    replay_model = ReplayModel(path)
+    assert replay_model.model_name == 'test'
+    assert replay_model.system == 'replay'
+    replayed_result = await agent.run('What is 1 + 2?', model=replay_model)
+    assert replayed_result.output == recorded_result.output
+    assert _without_timestamps(replayed_result.all_messages()) == _without_timestamps(recorded_result.all_messages())
+
+    # Requests that were not recorded can't be replayed
+    with pytest.raises(UserError, match='No recorded response in .* matches this request'):
+        await agent.run('What is 2 + 2?', model=replay_model)
+
+
+async def test_record_and_replay_stream(tmp_path: Path):
+    path = tmp_path / 'run.jsonl'
+
+    async def stream_function(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str | DeltaToolCalls]:
+        if len(messages) == 1:
+            yield {0: DeltaToolCall(name='get_price', json_args='{"ticker": "ACME"}', tool_call_id='call-1')}
+        else:
+            for chunk in ['ACME ', 'trades ', 'at ', '42.']:
+                yield chunk
+
+    agent = Agent()
+
+    @agent.tool_plain
+    def get_price(ticker: str) -> float:
+        return 42.0
+
+    recording_model = RecordingModel(FunctionModel(stream_function=stream_function), path)
+    async with agent.run_stream('Price of ACME?', model=recording_model) as result:
+        recorded_chunks = [chunk async for chunk in result.stream_text(delta=True, debounce_by=None)]
+    recorded_messages = result.all_messages()
+
+    recordings = load_recordings(path)
+    assert [r.stream_events for r in recordings][1] == snapshot(
+        [
+            PartStartEvent(index=0, part=TextPart(content='ACME ')),
+            PartDeltaEvent(index=0, delta=TextPartDelta(content_delta='trades ')),
+            PartDeltaEvent(index=0, delta=TextPartDelta(content_delta='at ')),
+            PartDeltaEvent(index=0, delta=TextPartDelta(content_delta='42.')),
+        ]
+    )
+    assert all(r.stream_event_offsets is not None for r in recordings)
+
+    async with agent.run_stream('Price of ACME?', model=ReplayModel(path)) as result:
+        replayed_chunks = [chunk async for chunk in result.stream_text(delta=True, debounce_by=None)]
+    assert replayed_chunks == recorded_chunks == snapshot(['ACME ', 'trades ', 'at ', '42.'])
+    assert _without_timestamps(result.all_messages()) == _without_timestamps(recorded_messages)
+
+
+async def test_replay_non_streamed_recording_as_stream(tmp_path: Path):
+    path = tmp_path / 'run.jsonl'
+    agent = Agent(RecordingModel(FunctionModel(lambda messages, info: ModelResponse(parts=[TextPart('hello')])), path))
+    await agent.run('Hi')
+
+    async with agent.run_stream('Hi', model=ReplayModel(path)) as result:
+        assert await result.get_output() == 'hello'
+
+
+async def test_replay_preserve_timing(tmp_path: Path):
+    path = tmp_path / 'run.jsonl'
+
+    async def slow_stream(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+        yield 'a'
+        await anyio.sleep(0.05)
+        yield 'b'
+
+    agent = Agent(RecordingModel(FunctionModel(stream_function=slow_stream), path))
+    async with agent.run_stream('Hi') as result:
+        await result.get_output()
+
+    for preserve_timing, expect_slow in [(True, True), (False, False)]:
+        start = time.perf_counter()
+        async with agent.run_stream('Hi', model=ReplayModel(path, preserve_timing=preserve_timing)) as result:
+            assert await result.get_output() == 'ab'
+        assert (time.perf_counter() - start >= 0.05) is expect_slow
+
+
+async def test_replay_repeated_requests(tmp_path: Path):
+    path = tmp_path / 'run.jsonl'
+    responses = iter(['first', 'second'])
+    agent = Agent(
+        RecordingModel(FunctionModel(lambda messages, info: ModelResponse(parts=[TextPart(next(responses))])), path)
+    )
+    await agent.run('Hi')
+    await agent.run('Hi')
+
+    replay_agent = Agent(ReplayModel(path, model_name='my-model', system='my-system'))
+    assert replay_agent.model.model_name == 'my-model'  # type: ignore[union-attr]
+    assert [(await replay_agent.run('Hi')).output for _ in range(3)] == ['first', 'second', 'second']
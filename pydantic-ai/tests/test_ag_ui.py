@@ -69,8 +69,10 @@ with contextlib.suppress(ImportError):
     )
     from ag_ui.encoder import EventEncoder
 
+    from pydantic_ai import ag_ui
     from pydantic_ai.ag_ui import (
         SSE_CONTENT_TYPE,
+        InMemoryAGUISessionStore,
         OnCompleteFunc,
         StateDeps,
         _messages_from_ag_ui,  # type: ignore[reportPrivateUsage]
@@ -1522,6 +1524,140 @@ async def test_messages_from_ag_ui() -> None:
     )
 
 
+async def test_session_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    converted: list[str] = []
+    add = ag_ui._MessagesConverter.add  # pyright: ignore[reportPrivateUsage]
+
+    def counting_add(self: Any, msg: Message) -> None:
+        converted.append(msg.id)
+        add(self, msg)
+
+    monkeypatch.setattr(ag_ui._MessagesConverter, 'add', counting_add)  # pyright: ignore[reportPrivateUsage]
+
+    received: list[list[ModelMessage]] = []
+
+    async def stream_function(messages: list[ModelMessage], agent_info: AgentInfo) -> AsyncIterator[str]:
+        received.append(messages)
+        yield 'Done'
+
+    agent = Agent(model=FunctionModel(stream_function=stream_function))
+    session_store = InMemoryAGUISessionStore()
+    thread_id = uuid_str()
+
+    history = list[Message](
+        [
+            UserMessage(id='msg_1', content='Look up AAPL'),
+            AssistantMessage(
+                id='msg_2',
+                tool_calls=[
+                    ToolCall(id='call_1', function=FunctionCall(name='lookup', arguments='{"ticker": "AAPL"}'))
+                ],
+            ),
+            ToolMessage(id='msg_3', content='190', tool_call_id='call_1'),
+        ]
+    )
+    async for _ in run_ag_ui(agent, create_input(*history, thread_id=thread_id), session_store=session_store):
+        pass
+    assert converted == ['msg_1', 'msg_2', 'msg_3']
+    session = await session_store.get(thread_id)
+    assert session is not None
+    assert session.message_count == 3
+    assert session.tool_names == {'call_1': 'lookup'}
+    first_request = session.messages[-1]
+
+    # Only the new message is converted, and it's merged into the last request of the session without changing it.
+    converted.clear()
+    history.append(UserMessage(id='msg_4', content='And MSFT?'))
+    async for _ in run_ag_ui(agent, create_input(*history, thread_id=thread_id), session_store=session_store):
+        pass
+    assert converted == ['msg_4']
+    assert [type(part) for part in first_request.parts] == [ToolReturnPart]
+    assert received[-1][:3] == snapshot(
+        [
+            ModelRequest(parts=[UserPromptPart(content='Look up AAPL', timestamp=IsDatetime())]),
+            ModelResponse(
+                parts=[ToolCallPart(tool_name='lookup', args='{"ticker": "AAPL"}', tool_call_id='call_1')],
+                timestamp=IsDatetime(),
+            ),
+            ModelRequest(
+                parts=[
+                    ToolReturnPart(tool_name='lookup', content='190', tool_call_id='call_1', timestamp=IsDatetime()),
+                    UserPromptPart(content='And MSFT?', timestamp=IsDatetime()),
+                ]
+            ),
+        ]
+    )
+
+    # An edited message invalidates the session, so the whole history is converted again.
+    converted.clear()
+    history[0] = UserMessage(id='msg_1', content='Look up GOOG')
+    async for _ in run_ag_ui(agent, create_input(*history, thread_id=thread_id), session_store=session_store):
+        pass
+    assert converted == ['msg_1', 'msg_2', 'msg_3', 'msg_4']
+    assert received[-1][0] == snapshot(
+        ModelRequest(parts=[UserPromptPart(content='Look up GOOG', timestamp=IsDatetime())])
+    )
+
+    # The same history again is served from the session as is.
+    converted.clear()
+    async for _ in run_ag_ui(agent, create_input(*history, thread_id=thread_id), session_store=session_store):
+        pass
+    assert converted == []
+    assert len(received[-1]) == 3
+
+
+async def test_session_store_eviction() -> None:
+    agent = Agent(model=FunctionModel(stream_function=simple_stream))
+    session_store = InMemoryAGUISessionStore(max_sessions=2)
+
+    for thread_id in ['thread_1', 'thread_2']:
+        run_input = create_input(UserMessage(id='msg_1', content='Hello'), thread_id=thread_id)
+        async for _ in run_ag_ui(agent, run_input, session_store=session_store):
+            pass
+    assert await session_store.get('thread_1') is not None
+
+    run_input = create_input(UserMessage(id='msg_1', content='Hello'), thread_id='thread_3')
+    async for _ in run_ag_ui(agent, run_input, session_store=session_store):
+        pass
+    assert await session_store.get('thread_1') is not None
+    assert await session_store.get('thread_2') is None
+    assert await session_store.get('thread_3') is not None
+
+
+async def test_session_store_to_ag_ui(monkeypatch: pytest.MonkeyPatch) -> None:
+    validated: list[int] = []
+    validate_python = ag_ui._messages_ta.validate_python  # pyright: ignore[reportPrivateUsage]
+
+    def counting_validate_python(messages: Any) -> list[Message]:
+        validated.append(len(messages))
+        return validate_python(messages)
+
+    monkeypatch.setattr(ag_ui._messages_ta, 'validate_python', counting_validate_python)  # pyright: ignore[reportPrivateUsage]
+
+    agent = Agent(model=FunctionModel(stream_function=simple_stream))
+    app = agent.to_ag_ui(session_store=InMemoryAGUISessionStore())
+    thread_id = uuid_str()
+    history = list[Message]([UserMessage(id='msg_1', content='Hello, world!')])
+    async with LifespanManager(app):
+        transport = httpx.ASGITransport(app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://localhost:8000') as client:
+            for i in range(3):
+                if i:
+                    history.append(AssistantMessage(id=f'msg_{i}_assistant', content='success (no tool calls)'))
+                    history.append(UserMessage(id=f'msg_{i}_user', content='Again'))
+                run_input = create_input(*history, thread_id=thread_id)
+                response = await client.post(
+                    '/',
+                    content=run_input.model_dump_json(),
+                    headers={'Content-Type': 'application/json', 'Accept': SSE_CONTENT_TYPE},
+                )
+                assert response.status_code == HTTPStatus.OK
+                events = [json.loads(line.removeprefix('data: ')) for line in response.text.splitlines() if line]
+                assert events == simple_result()
+
+    assert validated == [1, 2, 2]
+
+
 async def test_builtin_tool_call() -> None:
     async def stream_function(
         messages: list[ModelMessage], agent_info: AgentInfo
@@ -4740,6 +4740,50 @@ def test_sequential_calls(mode: Literal['argument', 'contextmanager']):
     assert integer_holder == 2
 
 
+def test_tool_call_concurrency_limits():
+    """Test that the agent-wide and per-tool concurrency limits are respected, and results keep the call order."""
+
+    async def call_tools_parallel(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        if len(messages) == 1:
+            return ModelResponse(
+                parts=[ToolCallPart(tool_name='search', args={'i': i}) for i in range(8)]
+                + [ToolCallPart(tool_name='lookup', args={'i': i}) for i in range(8, 12)]
+            )
+        return ModelResponse(parts=[TextPart('done')])
+
+    running: dict[str, int] = defaultdict(int)
+    peak: dict[str, int] = defaultdict(int)
+
+    async def track(tool_name: str, i: int) -> int:
+        running[tool_name] += 1
+        running['total'] += 1
+        peak[tool_name] = max(peak[tool_name], running[tool_name])
+        peak['total'] = max(peak['total'], running['total'])
+        # finish in reverse order, to check the results are still returned in the order of the calls
+        await asyncio.sleep(0.001 * (12 - i))
+        running[tool_name] -= 1
+        running['total'] -= 1
+        return i
+
+    agent = Agent(FunctionModel(call_tools_parallel), max_concurrent_tool_calls=3)
+
+    @agent.tool_plain(max_concurrency=2)
+    async def search(i: int) -> int:
+        return await track('search', i)
+
+    @agent.tool_plain
+    async def lookup(i: int) -> int:
+        return await track('lookup', i)
+
+    result = agent.run_sync('Hello')
+    assert result.output == 'done'
+    assert peak['search'] == 2
+    assert peak['total'] == 3
+
+    tool_returns = [part for part in result.all_messages()[2].parts if isinstance(part, ToolReturnPart)]
+    assert [part.content for part in tool_returns] == list(range(12))
+
+
 def test_set_mcp_sampling_model():
     try:
         from pydantic_ai.mcp import MCPServerStdio
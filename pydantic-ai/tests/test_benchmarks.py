@@ -0,0 +1,82 @@
+from __future__ import annotations as _annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks import Benchmark, StepTimer, compare_reports, run_benchmark, run_benchmarks
+from benchmarks.__main__ import main
+from benchmarks.scenarios import all_benchmarks
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_run_benchmark():
+    async def op(timer: StepTimer) -> None:
+        with timer.step('first'):
+            pass
+        with timer.step('second'):
+            pass
+
+    result = await run_benchmark(Benchmark('noop', lambda: op, {'size': 1}), iterations=5, warmup=1)
+    assert result.name == 'noop[size=1]'
+    assert result.iterations == 5
+    assert result.total.count == 5
+    assert result.ops_per_sec > 0
+    assert result.total.p50_us <= result.total.p99_us <= result.total.max_us
+    assert list(result.steps) == ['first', 'second']
+    assert result.steps['first'].count == 5
+    assert result.allocations is not None
+
+
+def _smallest_parameterizations(benchmarks: list[Benchmark]) -> list[Benchmark]:
+    """Keep the parameterizations of each scenario with the smallest size parameters, to smoke test them quickly."""
+    smallest: dict[tuple[str, str], int] = {}
+    for b in benchmarks:
+        for key, value in b.params.items():
+            if isinstance(value, int) and not isinstance(value, bool):
+                smallest[b.group, key] = min(value, smallest.get((b.group, key), value))
+    benchmarks = [b for b in benchmarks if all(smallest.get((b.group, k), v) == v for k, v in b.params.items())]
+    # Every import time statement starts a fresh interpreter, one is enough to check the scenario works.
+    import_time = [b for b in benchmarks if b.group == 'import_time']
+    return [b for b in benchmarks if b.group != 'import_time' or b is import_time[0]]
+
+
+async def test_all_scenarios_run():
+    benchmarks = all_benchmarks()
+    assert len({b.name for b in benchmarks}) == len(benchmarks)
+
+    benchmarks = _smallest_parameterizations(benchmarks)
+    assert {b.group for b in benchmarks} == {b.group for b in all_benchmarks()}
+    assert 'graph.deep[depth=1000]' not in {b.name for b in benchmarks}
+
+    report = await run_benchmarks(benchmarks, iterations=1, warmup=0, measure_allocations=False)
+    assert [r['name'] for r in report['benchmarks']] == [b.name for b in benchmarks]
+    json.dumps(report)
+
+    history = next(r for r in report['benchmarks'] if r['group'] == 'agent_run.history')
+    assert set(history['steps']) == {'setup', 'UserPromptNode', 'ModelRequestNode', 'CallToolsNode', 'teardown'}
+
+    rows = compare_reports(report, report)
+    assert len(rows) == len(benchmarks)
+    assert all(change == 0 for *_, change in rows)
+
+
+def test_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    output = tmp_path / 'report.json'
+    assert main(['-k', 'clean_message_history[messages=10]', '-n', '2', '--warmup', '0', '-o', str(output)]) == 0
+    report = json.loads(output.read_text())
+    assert [r['name'] for r in report['benchmarks']] == ['clean_message_history[messages=10]']
+    assert report['benchmarks'][0]['allocations'].keys() == {'peak_bytes', 'net_bytes', 'net_blocks'}
+
+    assert main(['-k', 'clean_message_history', '-n', '2', '--warmup', '0', '--compare', str(output)]) == 0
+    captured = capsys.readouterr()
+    assert 'compared to' in captured.err
+
+    assert main(['--list', '-k', 'graph.deep']) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        'graph.deep[depth=10]',
+        'graph.deep[depth=100]',
+        'graph.deep[depth=1000]',
+    ]
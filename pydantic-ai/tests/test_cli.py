@@ -179,7 +179,7 @@ def test_chat(capfd: CaptureFixture[str], mocker: MockerFixture, env: TestEnv):
         inp.send_text('/cp\n')
         inp.send_text('/exit\n')
         session = PromptSession[Any](input=inp, output=DummyOutput())
-        m = mocker.patch('pydantic_ai._cli.PromptSession', return_value=session)
+        m = mocker.patch('prompt_toolkit.PromptSession', return_value=session)
         m.return_value = session
         m = TestModel(custom_output_text='goodbye')
         with cli_agent.override(model=m):
@@ -12,7 +12,10 @@ from pydantic_ai import (
     ModelResponse,
     SystemPromptPart,
     TextPart,
+    ToolCallPart,
+    ToolReturnPart,
     UserPromptPart,
+    append_only_history_processor,
     capture_run_messages,
 )
 from pydantic_ai.exceptions import UserError
@@ -801,3 +804,68 @@ async def test_callable_class_history_processor_with_ctx_no_op(
         ]
     )
     assert result.new_messages() == result.all_messages()[-2:]
+
+
+async def test_append_only_history_processor_only_sees_new_messages():
+    seen: list[list[ModelMessage]] = []
+
+    @append_only_history_processor
+    def redact_tool_returns(messages: list[ModelMessage]) -> list[ModelMessage]:
+        seen.append(messages)
+        for message in messages:
+            for part in message.parts:
+                if isinstance(part, ToolReturnPart):
+                    part.content = 'redacted'
+        return messages
+
+    def model_function(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        if len(messages) < 7:
+            return ModelResponse(parts=[ToolCallPart('get_secret', {}, tool_call_id=f'call_{len(messages)}')])
+        return ModelResponse(parts=[TextPart(content='done')])
+
+    agent = Agent(FunctionModel(model_function), history_processors=[redact_tool_returns])
+
+    @agent.tool_plain
+    def get_secret() -> str:
+        return 'secret'
+
+    message_history = [
+        ModelRequest(parts=[UserPromptPart(content='Previous question')]),
+        ModelResponse(parts=[TextPart(content='Previous answer')]),
+    ]
+    result = await agent.run('New question', message_history=message_history)
+
+    assert [len(messages) for messages in seen] == snapshot([3, 2, 2])
+    assert seen[1][0] is result.all_messages()[3]
+    assert [
+        part.content for message in result.all_messages() for part in message.parts if isinstance(part, ToolReturnPart)
+    ] == snapshot(['redacted', 'redacted'])
+    assert result.new_messages() == result.all_messages()[2:]
+
+
+async def test_append_only_history_processor_mixed_with_regular_processor():
+    seen: list[int] = []
+
+    @append_only_history_processor
+    def append_only(messages: list[ModelMessage]) -> list[ModelMessage]:
+        seen.append(len(messages))
+        return messages
+
+    def regular(messages: list[ModelMessage]) -> list[ModelMessage]:
+        return messages
+
+    def model_function(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        if len(messages) < 3:
+            return ModelResponse(parts=[ToolCallPart('get_value', {})])
+        return ModelResponse(parts=[TextPart(content='done')])
+
+    agent = Agent(FunctionModel(model_function), history_processors=[append_only, regular])
+
+    @agent.tool_plain
+    def get_value() -> int:
+        return 1
+
+    await agent.run('Question')
+
+    # Without every processor being append-only, the whole history is processed on each step
+    assert seen == snapshot([1, 3])
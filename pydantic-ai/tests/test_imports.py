@@ -0,0 +1,49 @@
+from __future__ import annotations as _annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import pydantic_ai
+
+
+def imported_modules(statement: str) -> set[str]:
+    """Run `statement` in a fresh interpreter and return the names of the modules it imported."""
+    code = f'import json, sys; {statement}; print(json.dumps(list(sys.modules)))'
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout))
+
+
+def test_import_is_lazy():
+    modules = imported_modules('import pydantic_ai')
+    assert modules.isdisjoint({'pydantic_ai.agent', 'pydantic_ai.messages', 'griffe', 'httpx', 'logfire_api'})
+
+
+def test_agent_import_defers_griffe():
+    modules = imported_modules('from pydantic_ai import Agent')
+    assert 'pydantic_ai.agent' in modules
+    assert 'griffe' not in modules
+
+
+def test_cli_import_defers_prompt_toolkit():
+    modules = imported_modules('import pydantic_ai._cli')
+    assert 'prompt_toolkit' not in modules
+
+
+@pytest.mark.parametrize('name', pydantic_ai.__all__)
+def test_public_names(name: str):
+    assert getattr(pydantic_ai, name) is not None
+    assert name in dir(pydantic_ai)
+
+
+def test_submodule_attribute():
+    from pydantic_ai import models
+
+    assert pydantic_ai.models is models
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="module 'pydantic_ai' has no attribute 'potato'"):
+        _ = pydantic_ai.potato
@@ -545,6 +545,7 @@ def test_logfire(
                                 'outer_typed_dict_key': None,
                                 'strict': None,
                                 'sequential': False,
+                                'max_concurrency': None,
                                 'kind': 'function',
                                 'metadata': None,
                             }
@@ -991,6 +992,7 @@ def test_instructions_with_structured_output_exclude_content_v2_v3(
                                 'outer_typed_dict_key': None,
                                 'strict': None,
                                 'sequential': False,
+                                'max_concurrency': None,
                                 'kind': 'output',
                                 'metadata': None,
                             }
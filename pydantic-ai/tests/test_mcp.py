@@ -37,10 +37,18 @@ with try_import() as imports_successful:
     from mcp import ErrorData, McpError, SamplingMessage
     from mcp.client.session import ClientSession
     from mcp.shared.context import RequestContext
-    from mcp.types import CreateMessageRequestParams, ElicitRequestParams, ElicitResult, ImageContent, TextContent
+    from mcp.types import (
+        CreateMessageRequestParams,
+        ElicitRequestParams,
+        ElicitResult,
+        ImageContent,
+        ServerNotification,
+        TextContent,
+        ToolListChangedNotification,
+    )
 
     from pydantic_ai._mcp import map_from_mcp_params, map_from_model_response
-    from pydantic_ai.mcp import CallToolFunc, MCPServerSSE, MCPServerStdio, ToolResult
+    from pydantic_ai.mcp import CallToolFunc, MCPServerSSE, MCPServerStdio, MCPToolsCacheInfo, ToolResult
     from pydantic_ai.models.google import GoogleModel
     from pydantic_ai.models.openai import OpenAIChatModel
     from pydantic_ai.providers.google import GoogleProvider
@@ -87,6 +95,36 @@ async def test_stdio_server(run_context: RunContext[int]):
         assert result == snapshot(32.0)
 
 
+async def test_stdio_server_cache_tools(run_context: RunContext[int]):
+    server = MCPServerStdio('python', ['-m', 'tests.mcp_server'], cache_tools=True)
+    async with server:
+        list_tools = AsyncMock(wraps=server._client.list_tools)  # pyright: ignore[reportPrivateUsage]
+        with patch.object(server._client, 'list_tools', list_tools):  # pyright: ignore[reportPrivateUsage]
+            tools = await server.get_tools(run_context)
+            assert len(tools) == snapshot(18)
+            assert await server.get_tools(run_context) == tools
+            assert list_tools.call_count == 1
+            assert server.tools_cache_info() == snapshot(MCPToolsCacheInfo(hits=1, misses=1, invalidations=0))
+
+            await server._message_handler(  # pyright: ignore[reportPrivateUsage]
+                ServerNotification(ToolListChangedNotification(method='notifications/tools/list_changed'))
+            )
+            assert await server.get_tools(run_context) == tools
+            assert list_tools.call_count == 2
+            assert server.tools_cache_info() == snapshot(MCPToolsCacheInfo(hits=1, misses=2, invalidations=1))
+
+    # the cache is invalidated when the connection is closed, as changes can't be received while disconnected
+    assert server.tools_cache_info() == snapshot(MCPToolsCacheInfo(hits=1, misses=2, invalidations=2))
+
+
+async def test_stdio_server_cache_tools_ttl(run_context: RunContext[int]):
+    server = MCPServerStdio('python', ['-m', 'tests.mcp_server'], cache_tools=True, cache_tools_ttl=0)
+    async with server:
+        await server.get_tools(run_context)
+        await server.get_tools(run_context)
+        assert server.tools_cache_info() == snapshot(MCPToolsCacheInfo(hits=0, misses=2, invalidations=1))
+
+
 async def test_reentrant_context_manager():
     server = MCPServerStdio('python', ['-m', 'tests.mcp_server'])
     async with server:
@@ -1,5 +1,7 @@
+import mmap
 import sys
 from datetime import datetime, timezone
+from pathlib import Path
 
 import pytest
 from inline_snapshot import snapshot
@@ -584,3 +586,51 @@ def test_binary_content_validation_with_optional_identifier():
             'identifier': 'foo',
         }
     )
+
+
+def test_binary_content_encoded_forms_are_cached():
+    content = BinaryContent(data=b'fake', media_type='image/jpeg')
+    assert content.base64 == snapshot('ZmFrZQ==')
+    assert content.base64 is content.base64
+    assert content.data_uri == snapshot('data:image/jpeg;base64,ZmFrZQ==')
+    assert content.data_uri is content.data_uri
+
+    content.media_type = 'image/png'
+    assert content.data_uri == snapshot('data:image/png;base64,ZmFrZQ==')
+
+    content.data = b'other'
+    assert content.base64 == snapshot('b3RoZXI=')
+    assert content.identifier == snapshot('d0941e')
+
+    # Cached values are not fields, so they don't affect equality or serialization
+    assert content == BinaryContent(data=b'other', media_type='image/png')
+    assert TypeAdapter(BinaryContent).dump_python(content) == snapshot(
+        {'data': b'other', 'vendor_metadata': None, 'kind': 'binary', 'media_type': 'image/png', 'identifier': 'd0941e'}
+    )
+
+
+def test_binary_content_buffer(tmp_path: Path):
+    path = tmp_path / 'image.jpg'
+    path.write_bytes(b'fake')
+    with path.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        content = BinaryContent(data=mapped, media_type='image/jpeg')
+        assert content.base64 == snapshot('ZmFrZQ==')
+        assert content.identifier == BinaryContent(data=b'fake', media_type='image/jpeg').identifier
+
+        messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart(content=[content])])]
+        assert ModelMessagesTypeAdapter.validate_json(ModelMessagesTypeAdapter.dump_json(messages)) == snapshot(
+            [
+                ModelRequest(
+                    parts=[
+                        UserPromptPart(
+                            content=[BinaryContent(data=b'fake', media_type='image/jpeg', identifier='c053ec')],
+                            timestamp=IsDatetime(),
+                        )
+                    ]
+                )
+            ]
+        )
+
+    content = BinaryContent(data=memoryview(b'xfakex')[1:-1], media_type='image/jpeg')
+    assert content.data_uri == snapshot('data:image/jpeg;base64,ZmFrZQ==')
+    assert TypeAdapter(BinaryContent).dump_python(content)['data'] == b'fake'
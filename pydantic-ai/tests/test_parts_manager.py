@@ -611,3 +611,60 @@ def test_handle_part():
     event = manager.handle_part(vendor_part_id=None, part=part3)
     assert event == snapshot(PartStartEvent(index=1, part=part3))
     assert manager.get_parts() == snapshot([part2, part3])
+
+
+def test_handle_text_and_thinking_deltas_are_joined_lazily():
+    manager = ModelResponsePartsManager()
+
+    start_event = manager.handle_thinking_delta(vendor_part_id='thinking', content='a')
+    for _ in range(3):
+        manager.handle_thinking_delta(vendor_part_id='thinking', content='b')
+    manager.handle_thinking_delta(vendor_part_id='thinking', signature='sig', provider_name='anthropic')
+    manager.handle_thinking_delta(vendor_part_id='thinking', content='c')
+    manager.handle_text_delta(vendor_part_id='text', content='hello')
+    manager.handle_text_delta(vendor_part_id='text', content='')
+    manager.handle_text_delta(vendor_part_id='text', content=' world')
+
+    # The part from the start event isn't modified by subsequent deltas
+    assert start_event == snapshot(PartStartEvent(index=0, part=ThinkingPart(content='a')))
+    assert manager.get_parts() == snapshot(
+        [
+            ThinkingPart(content='abbbc', signature='sig', provider_name='anthropic'),
+            TextPart(content='hello world'),
+        ]
+    )
+    # Getting the parts again doesn't apply the deltas twice
+    assert manager.get_parts() == snapshot(
+        [
+            ThinkingPart(content='abbbc', signature='sig', provider_name='anthropic'),
+            TextPart(content='hello world'),
+        ]
+    )
+
+
+def test_handle_part_discards_pending_text_deltas():
+    manager = ModelResponsePartsManager()
+
+    manager.handle_text_delta(vendor_part_id='text', content='hello')
+    manager.handle_text_delta(vendor_part_id='text', content=' world')
+    manager.handle_part(vendor_part_id='text', part=TextPart(content='replaced'))
+
+    assert manager.get_parts() == snapshot([TextPart(content='replaced')])
+
+
+def test_handle_tool_call_args_deltas_are_joined_lazily():
+    manager = ModelResponsePartsManager()
+
+    manager.handle_tool_call_delta(vendor_part_id='call', tool_name='tool', args='{"a": ', tool_call_id='call_1')
+    event = manager.handle_tool_call_delta(vendor_part_id='call', args='1, ')
+    assert event == snapshot(PartDeltaEvent(index=0, delta=ToolCallPartDelta(args_delta='1, ', tool_call_id='call_1')))
+    manager.handle_tool_call_delta(vendor_part_id='call', args='"b": 2}')
+    assert manager.get_parts() == snapshot(
+        [ToolCallPart(tool_name='tool', args='{"a": 1, "b": 2}', tool_call_id='call_1')]
+    )
+
+    # Deltas that don't just extend the args are applied on top of the pending ones
+    manager.handle_tool_call_delta(vendor_part_id='call', args='', tool_name='_suffix')
+    assert manager.get_parts() == snapshot(
+        [ToolCallPart(tool_name='tool_suffix', args='{"a": 1, "b": 2}', tool_call_id='call_1')]
+    )
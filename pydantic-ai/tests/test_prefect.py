@@ -6,7 +6,7 @@ from collections.abc import AsyncIterable, AsyncIterator, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Literal
+from typing import Any, Literal
 from unittest.mock import MagicMock
 
 import pytest
@@ -22,6 +22,7 @@ from pydantic_ai import (
     ModelMessage,
     ModelRequest,
     ModelResponse,
+    ModelResponsePart,
     ModelSettings,
     RunContext,
     TextPart,
@@ -44,6 +45,7 @@ try:
         PrefectFunctionToolset,
         PrefectMCPServer,
         PrefectModel,
+        _cache_policies,  # pyright: ignore[reportPrivateUsage]
     )
     from pydantic_ai.durable_exec.prefect._cache_policies import PrefectAgentInputs
 except ImportError:  # pragma: lax no cover
@@ -1135,6 +1137,75 @@ async def test_cache_policy_empty_inputs():
     assert result is None
 
 
+async def test_cache_policy_message_history(monkeypatch: pytest.MonkeyPatch):
+    """Test that each message in a history is only hashed once across model requests."""
+    cache_policy = PrefectAgentInputs()
+    mock_task_ctx = MagicMock()
+
+    hashed: list[object] = []
+    hash_objects = _cache_policies.hash_objects
+
+    def counting_hash_objects(*args: object, **kwargs: Any) -> str | None:
+        hashed.append(args[0])
+        return hash_objects(*args, **kwargs)
+
+    monkeypatch.setattr(_cache_policies, 'hash_objects', counting_hash_objects)
+
+    messages: list[ModelMessage] = [
+        ModelRequest(parts=[UserPromptPart(content='What is the capital of France?')]),
+        ModelResponse(parts=[TextPart(content='The capital of France is Paris.')]),
+    ]
+    key1 = cache_policy.compute_key(task_ctx=mock_task_ctx, inputs={'messages': messages}, flow_parameters={})
+    assert len(hashed) == 2
+
+    messages = [*messages, ModelRequest(parts=[UserPromptPart(content='And Spain?')])]
+    key2 = cache_policy.compute_key(task_ctx=mock_task_ctx, inputs={'messages': messages}, flow_parameters={})
+    assert len(hashed) == 3
+    assert key2 != key1
+
+    assert cache_policy.compute_key(task_ctx=mock_task_ctx, inputs={'messages': messages}, flow_parameters={}) == key2
+    assert len(hashed) == 3
+
+    # Reassigned attributes are picked up, as happens when a message history is reused for a new run.
+    request = messages[-1]
+    assert isinstance(request, ModelRequest)
+    request.instructions = 'Be concise.'
+    assert cache_policy.compute_key(task_ctx=mock_task_ctx, inputs={'messages': messages}, flow_parameters={}) != key2
+
+    # Parts edited in place are picked up too, rather than returning the digest of the old content.
+    part = request.parts[0]
+    assert isinstance(part, UserPromptPart)
+    key3 = cache_policy.compute_key(task_ctx=mock_task_ctx, inputs={'messages': messages}, flow_parameters={})
+    part.content = 'And Portugal?'
+    key4 = cache_policy.compute_key(task_ctx=mock_task_ctx, inputs={'messages': messages}, flow_parameters={})
+    assert key4 != key3
+    assert (
+        cache_policy.compute_key(
+            task_ctx=mock_task_ctx,
+            inputs={
+                'messages': [
+                    *messages[:-1],
+                    ModelRequest(parts=[UserPromptPart(content='And Portugal?')], instructions='Be concise.'),
+                ]
+            },
+            flow_parameters={},
+        )
+        == key4
+    )
+
+    # Lists that grow in place are picked up as well.
+    parts: list[ModelResponsePart] = [TextPart(content='Lisbon.')]
+    messages = [*messages, ModelResponse(parts=parts)]
+    key5 = cache_policy.compute_key(task_ctx=mock_task_ctx, inputs={'messages': messages}, flow_parameters={})
+    parts.append(TextPart(content='It is also its largest city.'))
+    assert cache_policy.compute_key(task_ctx=mock_task_ctx, inputs={'messages': messages}, flow_parameters={}) != key5
+
+    # The order of messages matters.
+    assert cache_policy.compute_key(
+        task_ctx=mock_task_ctx, inputs={'messages': messages[::-1]}, flow_parameters={}
+    ) != cache_policy.compute_key(task_ctx=mock_task_ctx, inputs={'messages': messages}, flow_parameters={})
+
+
 # Test custom model settings
 class CustomModelSettings(ModelSettings, total=False):
     custom_setting: str
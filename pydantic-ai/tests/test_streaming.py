@@ -188,6 +188,33 @@ async def test_structured_response_iter():
                 pass
 
 
+async def test_stream_output_skips_validation_of_unchanged_output():
+    async def stream_function(_messages: list[ModelMessage], agent_info: AgentInfo) -> AsyncIterator[DeltaToolCalls]:
+        assert agent_info.output_tools is not None
+        yield {0: DeltaToolCall(name=agent_info.output_tools[0].name)}
+        yield {0: DeltaToolCall(json_args='{"response": [1, ')}
+        # Deltas for another tool call don't change the output
+        yield {1: DeltaToolCall(name='other_tool')}
+        yield {1: DeltaToolCall(json_args='{}')}
+        yield {0: DeltaToolCall(json_args='2]}')}
+
+    agent = Agent(FunctionModel(stream_function=stream_function), output_type=list[int])
+
+    validated: list[list[int]] = []
+
+    @agent.output_validator
+    def record_output(output: list[int]) -> list[int]:
+        validated.append(output)
+        return output
+
+    async with agent.run_stream('') as result:
+        outputs = [output async for output in result.stream_output(debounce_by=None)]
+
+    assert outputs == snapshot([[1], [1], [1], [1, 2], [1, 2]])
+    # Without the cache there would be another 2 partial validations of `[1]`
+    assert validated == snapshot([[1], [1, 2], [1, 2], [1, 2]])
+
+
 async def test_streamed_text_stream():
     m = TestModel(custom_output_text='The cat sat on the mat.')
 
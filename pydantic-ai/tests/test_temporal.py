@@ -7,6 +7,7 @@ from collections.abc import AsyncIterable, AsyncIterator, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import timedelta
+from pathlib import Path
 from typing import Literal
 
 import pytest
@@ -41,7 +42,7 @@ from pydantic_ai import (
 )
 from pydantic_ai.direct import model_request_stream
 from pydantic_ai.exceptions import ApprovalRequired, CallDeferred, ModelRetry, UserError
-from pydantic_ai.models import Model, cached_async_http_client
+from pydantic_ai.models import Model, ModelRequestParameters, cached_async_http_client
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 from pydantic_ai.run import AgentRunResult
 from pydantic_ai.tools import DeferredToolRequests, DeferredToolResults, ToolDefinition
@@ -58,10 +59,21 @@ try:
     from temporalio.worker import Worker
     from temporalio.workflow import ActivityConfig
 
-    from pydantic_ai.durable_exec.temporal import AgentPlugin, LogfirePlugin, PydanticAIPlugin, TemporalAgent
+    from pydantic_ai.durable_exec.temporal import (
+        AgentPlugin,
+        FileMessageStore,
+        LogfirePlugin,
+        MessageStore,
+        PydanticAIPlugin,
+        TemporalAgent,
+    )
     from pydantic_ai.durable_exec.temporal._function_toolset import TemporalFunctionToolset
     from pydantic_ai.durable_exec.temporal._mcp_server import TemporalMCPServer
-    from pydantic_ai.durable_exec.temporal._model import TemporalModel
+    from pydantic_ai.durable_exec.temporal._message_store import dump_message, message_key
+    from pydantic_ai.durable_exec.temporal._model import (
+        TemporalModel,
+        _RequestParams,  # pyright: ignore[reportPrivateUsage]
+    )
 except ImportError:  # pragma: lax no cover
     pytest.skip('temporal not installed', allow_module_level=True)
 
@@ -2112,3 +2124,122 @@ async def test_web_search_agent_run_in_workflow(allow_model_requests: None, clie
         assert output == snapshot(
             'Severe floods and landslides across Veracruz, Hidalgo, and Puebla have cut off hundreds of communities and left dozens dead and many missing, prompting a major federal emergency response. ([apnews.com](https://apnews.com/article/5d036e18057361281e984b44402d3b1b?utm_source=openai))'
         )
+
+
+class InMemoryMessageStore(MessageStore):
+    def __init__(self):
+        self.messages: dict[str, bytes] = {}
+        self.gets: list[str] = []
+
+    async def get(self, key: str) -> bytes | None:
+        self.gets.append(key)
+        return self.messages.get(key)
+
+    async def put(self, key: str, data: bytes) -> None:
+        self.messages[key] = data
+
+
+def count_down(messages: list[ModelMessage], agent_info: AgentInfo) -> ModelResponse:
+    counted = sum(isinstance(part, ToolReturnPart) for message in messages for part in message.parts)
+    if counted < 3:
+        return ModelResponse(parts=[ToolCallPart('count', {'n': counted})])
+    return ModelResponse(parts=[TextPart(f'Counted to {counted} with {len(messages)} messages')])
+
+
+count_agent = Agent(FunctionModel(count_down), name='count_agent')
+
+
+@count_agent.tool_plain
+async def count(n: int) -> int:
+    return n + 1
+
+
+count_message_store = InMemoryMessageStore()
+
+# This needs to be done before the `TemporalAgent` is bound to the workflow.
+count_temporal_agent = TemporalAgent(
+    count_agent, activity_config=BASE_ACTIVITY_CONFIG, message_store=count_message_store
+)
+
+
+@workflow.defn
+class CountAgentWorkflow:
+    @workflow.run
+    async def run(self, prompt: str) -> str:
+        result = await count_temporal_agent.run(prompt)
+        return result.output
+
+
+async def test_message_store_in_workflow(allow_model_requests: None, client: Client):
+    async with Worker(
+        client,
+        task_queue=TASK_QUEUE,
+        workflows=[CountAgentWorkflow],
+        plugins=[AgentPlugin(count_temporal_agent)],
+    ):
+        output = await client.execute_workflow(  # pyright: ignore[reportUnknownMemberType]
+            CountAgentWorkflow.run,
+            args=['Count to 3'],
+            id=CountAgentWorkflow.__name__,
+            task_queue=TASK_QUEUE,
+        )
+        assert output == snapshot('Counted to 3 with 7 messages')
+
+    # Each message is written once, and as the activities ran in this process they were read from the local cache.
+    assert len(count_message_store.messages) == 7
+    assert count_message_store.gets == []
+
+
+async def test_message_store_request_activity(tmp_path: Path):
+    store = FileMessageStore(tmp_path)
+    model = TemporalModel(
+        FunctionModel(count_down),
+        activity_name_prefix='message_store',
+        activity_config=BASE_ACTIVITY_CONFIG,
+        deps_type=type(None),
+        message_store=store,
+    )
+    request = ModelRequest.user_text_prompt('Count to 3')
+    key = message_key(dump_message(request))
+
+    params = _RequestParams(
+        messages=[request],
+        model_settings=None,
+        model_request_parameters=ModelRequestParameters(),
+        serialized_run_context=None,
+        new_message_keys=[key],
+    )
+    response = await model.request_activity(params)
+    assert response.parts == snapshot([ToolCallPart(tool_name='count', args={'n': 0}, tool_call_id=IsStr())])
+    assert await store.get(key) == dump_message(request)
+    assert await store.get('missing') is None
+
+    # The message is now read from the store instead of the local cache.
+    model = TemporalModel(
+        FunctionModel(count_down),
+        activity_name_prefix='message_store',
+        activity_config=BASE_ACTIVITY_CONFIG,
+        deps_type=type(None),
+        message_store=store,
+    )
+    params = _RequestParams(
+        messages=[key],
+        model_settings=None,
+        model_request_parameters=ModelRequestParameters(),
+        serialized_run_context=None,
+        new_message_keys=[],
+    )
+    assert (await model.request_activity(params)).parts == snapshot(
+        [ToolCallPart(tool_name='count', args={'n': 0}, tool_call_id=IsStr())]
+    )
+
+    params = _RequestParams(
+        messages=[key, 'missing'],
+        model_settings=None,
+        model_request_parameters=ModelRequestParameters(),
+        serialized_run_context=None,
+        new_message_keys=[],
+    )
+    with pytest.raises(ApplicationError, match='Messages are missing from the message store: missing') as exc_info:
+        await model.request_activity(params)
+    assert exc_info.value.non_retryable
@@ -2,6 +2,7 @@ import json
 import re
 from collections.abc import Callable
 from dataclasses import dataclass, replace
+from pathlib import Path
 from typing import Annotated, Any, Literal
 
 import pydantic_core
@@ -13,6 +14,7 @@ from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
 from pydantic_core import PydanticSerializationError, core_schema
 from typing_extensions import TypedDict
 
+import pydantic_ai.tools
 from pydantic_ai import (
     Agent,
     ExternalToolset,
@@ -35,7 +37,14 @@ from pydantic_ai.exceptions import ApprovalRequired, CallDeferred, ModelRetry, U
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 from pydantic_ai.models.test import TestModel
 from pydantic_ai.output import ToolOutput
-from pydantic_ai.tools import DeferredToolRequests, DeferredToolResults, ToolApproved, ToolDefinition, ToolDenied
+from pydantic_ai.tools import (
+    DeferredToolRequests,
+    DeferredToolResults,
+    ToolApproved,
+    ToolDefinition,
+    ToolDenied,
+    ToolSchemaCache,
+)
 from pydantic_ai.usage import RequestUsage
 
 from .conftest import IsDatetime, IsStr
@@ -148,6 +157,7 @@ def test_docstring_google(docstring_format: Literal['google', 'auto']):
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -182,6 +192,7 @@ def test_docstring_sphinx(docstring_format: Literal['sphinx', 'auto']):
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -224,6 +235,7 @@ def test_docstring_numpy(docstring_format: Literal['numpy', 'auto']):
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -266,6 +278,7 @@ def test_google_style_with_returns():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -306,6 +319,7 @@ def test_sphinx_style_with_returns():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -352,6 +366,7 @@ def test_numpy_style_with_returns():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -386,6 +401,7 @@ def test_only_returns_type():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -411,6 +427,7 @@ def test_docstring_unknown():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -454,6 +471,7 @@ def test_docstring_google_no_body(docstring_format: Literal['google', 'auto']):
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -490,6 +508,7 @@ def test_takes_just_model():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -535,6 +554,7 @@ def test_takes_model_and_int():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -900,6 +920,7 @@ def test_suppress_griffe_logging(caplog: LogCaptureFixture):
             'parameters_json_schema': {'additionalProperties': False, 'properties': {}, 'type': 'object'},
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -972,6 +993,7 @@ def test_json_schema_required_parameters():
                 },
                 'strict': None,
                 'kind': 'function',
+                'max_concurrency': None,
                 'sequential': False,
                 'metadata': None,
             },
@@ -987,6 +1009,7 @@ def test_json_schema_required_parameters():
                 },
                 'strict': None,
                 'kind': 'function',
+                'max_concurrency': None,
                 'sequential': False,
                 'metadata': None,
             },
@@ -1075,6 +1098,7 @@ def test_schema_generator():
                 },
                 'strict': None,
                 'kind': 'function',
+                'max_concurrency': None,
                 'sequential': False,
                 'metadata': None,
             },
@@ -1088,6 +1112,7 @@ def test_schema_generator():
                 },
                 'strict': None,
                 'kind': 'function',
+                'max_concurrency': None,
                 'sequential': False,
                 'metadata': None,
             },
@@ -1125,6 +1150,7 @@ def test_tool_parameters_with_attribute_docstrings():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'max_concurrency': None,
             'sequential': False,
             'metadata': None,
         }
@@ -2191,3 +2217,75 @@ def test_retry_tool_until_last_attempt():
             ),
         ]
     )
+
+
+def test_tool_schema_built_lazily():
+    def my_tool(x: int, y: str) -> str:
+        """Do a thing."""
+        return f'{x} {y}'
+
+    tool = Tool(my_tool)
+    assert tool._function_schema is None
+    assert tool.takes_ctx is False
+
+    assert tool.description == 'Do a thing.'
+    assert tool._function_schema is not None
+
+    with pytest.raises(UserError, match='First parameter of tools that take context must be annotated with RunContext'):
+        Tool(my_tool, takes_ctx=True)
+
+
+def test_tool_schema_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cache = ToolSchemaCache(tmp_path)
+    monkeypatch.setattr(pydantic_ai.tools, 'tool_schema_cache', cache)
+
+    def my_tool(ctx: RunContext[None], x: int, y: str = 'a') -> str:
+        """Do a thing.
+
+        Args:
+            ctx: The run context.
+            x: The number.
+            y: The string.
+        """
+        return f'{x} {y}'
+
+    tool_def = Tool(my_tool).tool_def
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert len(list(tmp_path.glob('*.json'))) == 1
+
+    tool = Tool(my_tool)
+    assert tool.tool_def == tool_def
+    assert tool.description == 'Do a thing.'
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert tool._function_schema is None
+
+    agent = Agent(TestModel(), tools=[tool])
+    result = agent.run_sync('Hello')
+    assert result.output == snapshot('{"my_tool":"0 a"}')
+    assert tool._function_schema is not None
+
+    assert Tool(my_tool, docstring_format='google').tool_def == tool_def
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.clear()
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert list(tmp_path.glob('*.json')) == []
+
+
+def test_tool_schema_cache_factory_tools(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cache = ToolSchemaCache(tmp_path)
+    monkeypatch.setattr(pydantic_ai.tools, 'tool_schema_cache', cache)
+
+    def make_tool(name: str, description: str) -> Callable[[int], str]:
+        def tool(x: int) -> str:
+            return f'{name} {x}'
+
+        tool.__name__ = name
+        tool.__doc__ = description
+        return tool
+
+    # Tools made by the same factory share a qualified name and source location, but not their name and docstring
+    for _ in range(2):
+        assert Tool(make_tool('add', 'Add a thing.')).description == 'Add a thing.'
+        assert Tool(make_tool('remove', 'Remove a thing.')).description == 'Remove a thing.'
+    assert (cache.hits, cache.misses) == (2, 2)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from collections import defaultdict
 from dataclasses import dataclass, replace
@@ -12,7 +13,9 @@ from typing_extensions import Self
 
 from pydantic_ai import (
     AbstractToolset,
+    Agent,
     CombinedToolset,
+    ConcurrencyLimitedToolset,
     FilteredToolset,
     FunctionToolset,
     PrefixedToolset,
@@ -703,6 +706,60 @@ async def test_tool_manager_sequential_tool_call():
     )
 
 
+async def test_concurrency_limited_toolset():
+    toolset = FunctionToolset[None]()
+    running = 0
+    peak = 0
+
+    @toolset.tool
+    async def slow(x: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return x
+
+    limited_toolset = toolset.concurrency_limited(2)
+    assert isinstance(limited_toolset, ConcurrencyLimitedToolset)
+
+    tool_manager = await ToolManager[None](limited_toolset).for_run_step(build_run_context(None))
+    results = await asyncio.gather(
+        *(tool_manager.handle_call(ToolCallPart(tool_name='slow', args={'x': i})) for i in range(6))
+    )
+    assert results == [0, 1, 2, 3, 4, 5]
+    assert peak == 2
+
+    with pytest.raises(ValueError, match='`max_concurrency` must be at least 1'):
+        toolset.concurrency_limited(0)
+
+
+async def test_concurrency_limited_toolset_shared_across_runs():
+    toolset = FunctionToolset[None]()
+    running = 0
+    peak = 0
+
+    @toolset.tool
+    async def slow(x: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return x
+
+    limited_toolset = toolset.concurrency_limited(1)
+    copy = limited_toolset.visit_and_replace(lambda t: t)
+    assert isinstance(copy, ConcurrencyLimitedToolset)
+    assert copy is not limited_toolset
+    assert copy._semaphore is limited_toolset._semaphore  # pyright: ignore[reportPrivateUsage]
+
+    agent = Agent(TestModel(call_tools=['slow']), toolsets=[limited_toolset])
+    results = await asyncio.gather(*(agent.run('Hello') for _ in range(4)))
+    assert len(results) == 4
+    assert peak == 1
+
+
 async def test_visit_and_replace():
     toolset1 = FunctionToolset(id='toolset1')
     toolset2 = FunctionToolset(id='toolset2')